@@ -0,0 +1,65 @@
+"""add_claims_site_aggregates
+
+Revision ID: 3b7c9d2e4f10
+Revises: 8e286a231a3a
+Create Date: 2026-10-18 09:12:44.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7c9d2e4f10'
+down_revision: Union[str, None] = '8e286a231a3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('claims_site_aggregates',
+    sa.Column('site_id', sa.UUID(), nullable=False),
+    sa.Column('total_visits', sa.Integer(), nullable=False),
+    sa.Column('provider_count', sa.Integer(), nullable=False),
+    sa.Column('oncology_visits', sa.Integer(), nullable=False),
+    sa.Column('surgery_visits', sa.Integer(), nullable=False),
+    sa.Column('inpatient_visits', sa.Integer(), nullable=False),
+    sa.Column('has_oncology', sa.Boolean(), nullable=False),
+    sa.Column('has_surgery', sa.Boolean(), nullable=False),
+    sa.Column('has_inpatient', sa.Boolean(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['site_id'], ['claims_sites_of_service.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('site_id')
+    )
+    op.create_index('idx_claims_site_aggregates_visits', 'claims_site_aggregates', ['total_visits'], unique=False)
+    op.create_index('idx_claims_site_aggregates_providers', 'claims_site_aggregates', ['provider_count'], unique=False)
+
+    # Populate from existing visits so the endpoints have data before the next import
+    op.execute("""
+        INSERT INTO claims_site_aggregates (
+            site_id, total_visits, provider_count,
+            oncology_visits, surgery_visits, inpatient_visits,
+            has_oncology, has_surgery, has_inpatient, refreshed_at
+        )
+        SELECT
+            site_id,
+            COALESCE(SUM(visits), 0),
+            COUNT(DISTINCT provider_id),
+            COALESCE(SUM(CASE WHEN has_oncology THEN visits ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN has_surgery THEN visits ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN has_inpatient THEN visits ELSE 0 END), 0),
+            COALESCE(BOOL_OR(has_oncology), FALSE),
+            COALESCE(BOOL_OR(has_surgery), FALSE),
+            COALESCE(BOOL_OR(has_inpatient), FALSE),
+            NOW()
+        FROM claims_visits
+        GROUP BY site_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_claims_site_aggregates_providers', table_name='claims_site_aggregates')
+    op.drop_index('idx_claims_site_aggregates_visits', table_name='claims_site_aggregates')
+    op.drop_table('claims_site_aggregates')
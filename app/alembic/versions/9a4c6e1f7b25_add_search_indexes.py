@@ -0,0 +1,48 @@
+"""add_search_indexes
+
+Revision ID: 9a4c6e1f7b25
+Revises: 5d1e8a9c2b47
+Create Date: 2026-10-18 14:26:41.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c6e1f7b25'
+down_revision: Union[str, None] = '5d1e8a9c2b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# GIN indexes on the full-text search documents built by services.search_service.
+# The expressions must match search_document() exactly for the planner to use them.
+SEARCH_INDEXES = {
+    'idx_sf_contact_search': (
+        'sf_contacts',
+        ['name', 'first_name', 'last_name', 'specialty', 'email', 'npi'],
+    ),
+    'idx_claims_providers_name_search': ('claims_providers', ['name']),
+    'idx_claims_providers_group_search': ('claims_providers', ['provider_group']),
+    'idx_sites_of_service_name_search': ('claims_sites_of_service', ['name']),
+}
+
+
+def search_document(columns):
+    text = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+    return f"to_tsvector('simple'::regconfig, {text})"
+
+
+def upgrade() -> None:
+    for index_name, (table_name, columns) in SEARCH_INDEXES.items():
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} "
+            f"USING gin ({search_document(columns)})"
+        )
+
+
+def downgrade() -> None:
+    for index_name in SEARCH_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
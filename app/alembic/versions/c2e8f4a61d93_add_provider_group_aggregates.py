@@ -0,0 +1,96 @@
+"""add_provider_group_aggregates
+
+Revision ID: c2e8f4a61d93
+Revises: 9a4c6e1f7b25
+Create Date: 2026-10-18 16:03:52.771046
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2e8f4a61d93'
+down_revision: Union[str, None] = '9a4c6e1f7b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('claims_provider_group_aggregates',
+    sa.Column('provider_group', sa.String(length=300), nullable=False),
+    sa.Column('provider_count', sa.Integer(), nullable=False),
+    sa.Column('total_visits', sa.Integer(), nullable=False),
+    sa.Column('site_count', sa.Integer(), nullable=False),
+    sa.Column('specialties', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('geomarkets', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('provider_group')
+    )
+    op.create_index('idx_claims_provider_group_aggregates_visits', 'claims_provider_group_aggregates', ['total_visits', 'provider_group'], unique=False)
+    op.create_table('claims_site_provider_group_aggregates',
+    sa.Column('site_id', sa.UUID(), nullable=False),
+    sa.Column('provider_group', sa.String(length=300), nullable=False),
+    sa.Column('provider_count', sa.Integer(), nullable=False),
+    sa.Column('total_visits', sa.Integer(), nullable=False),
+    sa.Column('specialties', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('geomarkets', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['site_id'], ['claims_sites_of_service.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('site_id', 'provider_group')
+    )
+    op.create_index('idx_claims_site_provider_group_aggregates_visits', 'claims_site_provider_group_aggregates', ['site_id', 'total_visits'], unique=False)
+
+    # Populate from existing claims so the endpoints have data before the next import
+    op.execute("""
+        INSERT INTO claims_provider_group_aggregates (
+            provider_group, provider_count, total_visits, site_count,
+            specialties, geomarkets, refreshed_at
+        )
+        SELECT
+            p.provider_group,
+            COUNT(p.id),
+            COALESCE(SUM(p.total_visits), 0),
+            COALESCE(MAX(s.site_count), 0),
+            ARRAY_REMOVE(ARRAY_AGG(DISTINCT p.specialty), NULL),
+            ARRAY_REMOVE(ARRAY_AGG(DISTINCT p.geomarket), NULL),
+            NOW()
+        FROM claims_providers p
+        LEFT JOIN (
+            SELECT cp.provider_group, COUNT(DISTINCT v.site_id) AS site_count
+            FROM claims_providers cp
+            JOIN claims_visits v ON v.provider_id = cp.id
+            WHERE cp.provider_group IS NOT NULL
+            GROUP BY cp.provider_group
+        ) s ON s.provider_group = p.provider_group
+        WHERE p.provider_group IS NOT NULL
+        GROUP BY p.provider_group
+    """)
+    op.execute("""
+        INSERT INTO claims_site_provider_group_aggregates (
+            site_id, provider_group, provider_count, total_visits,
+            specialties, geomarkets, refreshed_at
+        )
+        SELECT
+            v.site_id,
+            p.provider_group,
+            COUNT(DISTINCT p.id),
+            COALESCE(SUM(v.visits), 0),
+            ARRAY_REMOVE(ARRAY_AGG(DISTINCT p.specialty), NULL),
+            ARRAY_REMOVE(ARRAY_AGG(DISTINCT p.geomarket), NULL),
+            NOW()
+        FROM claims_visits v
+        JOIN claims_providers p ON p.id = v.provider_id
+        WHERE p.provider_group IS NOT NULL
+        GROUP BY v.site_id, p.provider_group
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_claims_site_provider_group_aggregates_visits', table_name='claims_site_provider_group_aggregates')
+    op.drop_table('claims_site_provider_group_aggregates')
+    op.drop_index('idx_claims_provider_group_aggregates_visits', table_name='claims_provider_group_aggregates')
+    op.drop_table('claims_provider_group_aggregates')
@@ -0,0 +1,26 @@
+"""add_sf_contact_is_deleted
+
+Revision ID: e7b3d5a1c924
+Revises: c2e8f4a61d93
+Create Date: 2026-10-18 12:14:06.318270
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d5a1c924'
+down_revision: Union[str, None] = 'c2e8f4a61d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sf_contacts', sa.Column('is_deleted', sa.Boolean(), server_default='false', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('sf_contacts', 'is_deleted')
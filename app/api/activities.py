@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import select, func, and_, or_, any_
 from sqlalchemy.orm import Session
 import tiktoken
@@ -8,6 +8,8 @@ import json
 from database.session import db_session
 from database.data_models.salesforce_data import SfActivityStructured
 from database.data_models.activity_bundles import ActivityBundle
+from services.filter_options_cache import FilterOptionsCache, filter_options_response
+from services.pagination import COUNT_MODE_PATTERN, InvalidCursorError, SortKey, paginate
 from schemas.activity_api_schema import (
     ActivityListItem,
     ActivityDetail,
@@ -20,6 +22,14 @@ from schemas.bundle_schema import BundleStatsResponse
 
 router = APIRouter()
 
+# Sortable fields exposed by the list endpoint and the columns behind them
+SORT_COLUMNS = {
+    "activity_date": SfActivityStructured.activity_date,
+    "subject": SfActivityStructured.subject,
+    "owner_name": SfActivityStructured.user_name,
+    "created_at": SfActivityStructured.structured_at,
+}
+
 
 @router.get("/", response_model=ActivityListResponse)
 async def list_activities(
@@ -30,6 +40,8 @@ async def list_activities(
         "activity_date", pattern="^(activity_date|subject|owner_name|created_at)$"
     ),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor; replaces page"),
+    count_mode: str = Query("exact", pattern=COUNT_MODE_PATTERN),
     # Filter parameters
     owner_ids: Optional[List[str]] = Query(None),
     start_date: Optional[str] = Query(None),
@@ -118,23 +130,28 @@ async def list_activities(
     if filters:
         query = query.where(and_(*filters))
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_count = session.scalar(count_query)
-
-    # Apply sorting
-    sort_column = getattr(SfActivityStructured, sort_by)
-    if sort_order == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
-
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
-
-    # Execute query
-    activities = session.scalars(query).all()
+    # Sort on the requested column with id as tie-breaker, then page by offset or cursor
+    descending = sort_order == "desc"
+    sort_column = SORT_COLUMNS[sort_by]
+    try:
+        result = paginate(
+            session,
+            query,
+            keys=[
+                SortKey(sort_column, descending=descending),
+                SortKey(SfActivityStructured.id, descending=descending),
+            ],
+            signature=f"activities:{sort_by}:{sort_order}",
+            row_key=lambda activity: (getattr(activity, sort_column.key), activity.id),
+            page=page,
+            per_page=page_size,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    activities = result.items
+    total_count = result.total
 
     # Convert to response model
     activity_items = []
@@ -163,7 +180,9 @@ async def list_activities(
             )
         )
 
-    total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 0
+    total_pages = None
+    if total_count is not None:
+        total_pages = (total_count + page_size - 1) // page_size if total_count > 0 else 0
 
     return ActivityListResponse(
         activities=activity_items,
@@ -171,17 +190,13 @@ async def list_activities(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        total_is_estimate=result.total_is_estimate,
+        next_cursor=result.next_cursor,
     )
 
 
-@router.get("/filter-options", response_model=FilterOptionsResponse)
-async def get_filter_options(session: Session = Depends(db_session)):
-    """
-    Get available filter options for the activity list.
-
-    Returns distinct values for various filter fields to populate
-    dropdown menus and filter controls in the UI.
-    """
+def load_filter_options(session: Session) -> FilterOptionsResponse:
+    """Query the distinct values behind the activity filter controls."""
     # Get distinct owners
     owner_query = (
         select(SfActivityStructured.owner_id, SfActivityStructured.user_name)
@@ -247,6 +262,19 @@ async def get_filter_options(session: Session = Depends(db_session)):
     )
 
 
+@router.get("/filter-options", response_model=FilterOptionsResponse)
+async def get_filter_options(request: Request, session: Session = Depends(db_session)):
+    """
+    Get available filter options for the activity list.
+
+    Returns distinct values for various filter fields to populate
+    dropdown menus and filter controls in the UI. Values are cached until
+    activities are restructured and revalidated with ETag/If-None-Match.
+    """
+    options = FilterOptionsCache.get(FilterOptionsCache.ACTIVITIES, session, load_filter_options)
+    return filter_options_response(request, options)
+
+
 @router.get("/{activity_id}", response_model=ActivityDetail)
 async def get_activity(activity_id: str, session: Session = Depends(db_session)):
     """
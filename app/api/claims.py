@@ -5,15 +5,53 @@ This module provides FastAPI endpoints for the Market Explorer 2.0 claims data.
 It includes endpoints for providers, sites of service, visits, and map data.
 """
 
-from typing import List, Optional, Dict, Any
+from operator import attrgetter
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, distinct
+from sqlalchemy import and_, or_, func, distinct, select
 
 from database.session import db_session
-from database.data_models.claims_data import ClaimsProvider, SiteOfService, ClaimsVisit
+from database.data_models.claims_data import (
+    ClaimsProvider,
+    SiteOfService,
+    ClaimsVisit,
+    ClaimsSiteAggregate,
+    ClaimsProviderGroupAggregate,
+    ClaimsSiteProviderGroupAggregate
+)
+from services.geo_index import (
+    Cluster,
+    GeoIndexManager,
+    SitePoint,
+    bbox_id_filter,
+    cluster_points,
+    MAX_CLUSTER_ZOOM
+)
+from services.claims_statistics_service import (
+    ClaimsStatisticsCache,
+    load_provider_statistics,
+    load_site_statistics
+)
+from services.columnar_response import columnar_response, negotiate_columnar_format
+from services.filter_options_cache import FilterOptionsCache, filter_options_response
+from services.search_service import (
+    PROVIDER_GROUP_SEARCH_COLUMNS,
+    PROVIDER_SEARCH_COLUMNS,
+    SITE_SEARCH_COLUMNS,
+    TYPEAHEAD_DEFAULT_LIMIT,
+    TYPEAHEAD_MAX_LIMIT,
+    search_condition,
+    search_rank
+)
+from services.pagination import (
+    COUNT_MODE_PATTERN,
+    InvalidCursorError,
+    SortKey,
+    paginate
+)
 from schemas.claims_schema import (
     ClaimsProviderDetail,
     ClaimsProviderListItem,
@@ -24,14 +62,16 @@ from schemas.claims_schema import (
     ProviderGroup,
     ProviderGroupsResponse,
     MapMarker,
+    MapCluster,
     MapMarkersResponse,
     ClaimsFilters,
     PaginationMeta,
     FilterOptions,
     SiteStatistics,
     ProviderStatistics,
-    VisitStatistics,
-    ClaimsStatistics
+    ClaimsStatistics,
+    ClaimsSearchResult,
+    ClaimsSearchResponse
 )
 
 router = APIRouter(prefix="/claims", tags=["claims"])
@@ -53,12 +93,24 @@ def apply_filters(query, filters: ClaimsFilters, model_class):
     # Bounding box filter for sites with coordinates
     if filters.north and filters.south and filters.east and filters.west:
         if hasattr(model_class, 'latitude') and hasattr(model_class, 'longitude'):
-            query = query.filter(
-                and_(
-                    model_class.latitude.between(filters.south, filters.north),
-                    model_class.longitude.between(filters.west, filters.east)
+            # Resolve the box to site IDs in memory; fall back to a range scan
+            # when the box is too large for an ID list to pay off
+            id_filter = None
+            if model_class is SiteOfService:
+                id_filter = bbox_id_filter(
+                    SiteOfService.id,
+                    GeoIndexManager.get_site_index(query.session),
+                    (filters.south, filters.west, filters.north, filters.east)
+                )
+            if id_filter is not None:
+                query = query.filter(id_filter)
+            else:
+                query = query.filter(
+                    and_(
+                        model_class.latitude.between(filters.south, filters.north),
+                        model_class.longitude.between(filters.west, filters.east)
+                    )
                 )
-            )
     
     # Provider-specific filters
     if hasattr(model_class, 'specialty') and filters.specialty:
@@ -83,10 +135,73 @@ def apply_filters(query, filters: ClaimsFilters, model_class):
             )
         )
     
-    # Search filter
+    # Search filter (served by the name search index, see services.search_service)
     if filters.search:
         if hasattr(model_class, 'name'):
-            query = query.filter(model_class.name.ilike(f"%{filters.search}%"))
+            query = query.filter(search_condition((model_class.name,), filters.search))
+    
+    return query
+
+
+def paginate_list_query(
+    session: Session,
+    query,
+    keys: List[SortKey],
+    signature: str,
+    row_key,
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+    count_mode: str,
+    having: bool = False
+):
+    """Fetch one page of a list query and build its PaginationMeta"""
+    try:
+        result = paginate(
+            session, query, keys, signature, row_key,
+            page=page, per_page=per_page, cursor=cursor,
+            count_mode=count_mode, having=having
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    total = result.total
+    meta = PaginationMeta(
+        page=page,
+        per_page=per_page,
+        total_items=total,
+        total_pages=(total + per_page - 1) // per_page if total is not None else None,
+        has_next=result.has_next,
+        has_prev=page > 1 or cursor is not None,
+        total_is_estimate=result.total_is_estimate,
+        next_cursor=result.next_cursor
+    )
+    return result.items, meta
+
+
+def has_provider_filters(filters: ClaimsFilters) -> bool:
+    """Whether filters reference provider columns, which site aggregates cannot serve"""
+    return bool(
+        filters.specialty or filters.service_line or filters.provider_group or
+        filters.min_provider_visits is not None
+    )
+
+
+def apply_site_aggregate_filters(query, filters: ClaimsFilters):
+    """Apply visit/provider/service filters against claims_site_aggregates"""
+    
+    if filters.has_oncology:
+        query = query.filter(ClaimsSiteAggregate.has_oncology == True)
+    if filters.has_surgery:
+        query = query.filter(ClaimsSiteAggregate.has_surgery == True)
+    if filters.has_inpatient:
+        query = query.filter(ClaimsSiteAggregate.has_inpatient == True)
+    
+    if filters.min_site_visits:
+        query = query.filter(ClaimsSiteAggregate.total_visits >= filters.min_site_visits)
+    
+    if filters.min_providers:
+        query = query.filter(ClaimsSiteAggregate.provider_count >= filters.min_providers)
     
     return query
 
@@ -107,6 +222,8 @@ async def get_providers(
     has_surgery: Optional[bool] = Query(None, description="Has surgical services"),
     has_inpatient: Optional[bool] = Query(None, description="Has inpatient services"),
     search: Optional[str] = Query(None, description="Search by provider name"),
+    cursor: Optional[str] = Query(None, description="Cursor from meta.next_cursor; replaces page"),
+    count_mode: str = Query("exact", pattern=COUNT_MODE_PATTERN, description="Total count: exact, estimate or none"),
     session: Session = Depends(db_session)
 ):
     """Get list of providers with filtering and pagination"""
@@ -166,12 +283,14 @@ async def get_providers(
     if filters.min_provider_visits is not None:
         query = query.filter(ClaimsProvider.total_visits >= filters.min_provider_visits)
     
-    # Get total count
-    total_count = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * per_page
-    providers = query.offset(offset).limit(per_page).all()
+    # Paginate by name, offset or keyset
+    providers, meta = paginate_list_query(
+        session, query,
+        keys=[SortKey(ClaimsProvider.name), SortKey(ClaimsProvider.id)],
+        signature="providers:name",
+        row_key=lambda p: (p.name, p.id),
+        page=page, per_page=per_page, cursor=cursor, count_mode=count_mode
+    )
     
     # Create response
     items = [
@@ -193,15 +312,6 @@ async def get_providers(
         for p in providers
     ]
     
-    meta = PaginationMeta(
-        page=page,
-        per_page=per_page,
-        total_items=total_count,
-        total_pages=(total_count + per_page - 1) // per_page,
-        has_next=page * per_page < total_count,
-        has_prev=page > 1
-    )
-    
     # Calculate statistics
     stats_query = session.query(
         func.sum(ClaimsProvider.total_visits).label('total_visits'),
@@ -260,6 +370,8 @@ async def get_sites(
     east: Optional[float] = Query(None, description="Eastern boundary"),
     west: Optional[float] = Query(None, description="Western boundary"),
     search: Optional[str] = Query(None, description="Search by site name"),
+    cursor: Optional[str] = Query(None, description="Cursor from meta.next_cursor; replaces page"),
+    count_mode: str = Query("exact", pattern=COUNT_MODE_PATTERN, description="Total count: exact, estimate or none"),
     session: Session = Depends(db_session)
 ):
     """Get list of sites of service with filtering and pagination"""
@@ -286,57 +398,65 @@ async def get_sites(
         search=search
     )
     
-    # Base query with visit aggregation
-    query = session.query(
-        SiteOfService,
-        func.coalesce(func.sum(ClaimsVisit.visits), 0).label('total_visits'),
-        func.count(distinct(ClaimsVisit.provider_id)).label('provider_count')
-    ).outerjoin(ClaimsVisit)
-    
-    # Join with provider table if provider filters are specified
-    if filters.specialty or filters.service_line or filters.provider_group:
-        query = query.join(
+    if not has_provider_filters(filters):
+        # Read visit rollups from the precomputed site aggregates
+        query = session.query(
+            SiteOfService,
+            func.coalesce(ClaimsSiteAggregate.total_visits, 0).label('total_visits'),
+            func.coalesce(ClaimsSiteAggregate.provider_count, 0).label('provider_count')
+        ).outerjoin(ClaimsSiteAggregate, ClaimsSiteAggregate.site_id == SiteOfService.id)
+        
+        query = apply_filters(query, filters, SiteOfService)
+        query = apply_site_aggregate_filters(query, filters)
+    else:
+        # Provider filters need the live visit join
+        query = session.query(
+            SiteOfService,
+            func.coalesce(func.sum(ClaimsVisit.visits), 0).label('total_visits'),
+            func.count(distinct(ClaimsVisit.provider_id)).label('provider_count')
+        ).outerjoin(ClaimsVisit).join(
             ClaimsProvider,
             ClaimsVisit.provider_id == ClaimsProvider.id
         )
-    
-    # Apply filters
-    query = apply_filters(query, filters, SiteOfService)
-    
-    # Apply provider filters if provider join was added
-    if filters.specialty or filters.service_line or filters.provider_group:
+        
+        # Apply filters
+        query = apply_filters(query, filters, SiteOfService)
+        
+        # Apply provider filters
         if filters.specialty:
             query = query.filter(ClaimsProvider.specialty.in_(filters.specialty))
         if filters.service_line:
             query = query.filter(ClaimsProvider.service_line.in_(filters.service_line))
         if filters.provider_group:
             query = query.filter(ClaimsProvider.provider_group.in_(filters.provider_group))
-    
-    # Group by site
-    query = query.group_by(SiteOfService.id)
-    
-    # Apply site visit count filter
-    if filters.min_site_visits is not None:
-        query = query.having(func.coalesce(func.sum(ClaimsVisit.visits), 0) >= filters.min_site_visits)
-    
-    # Apply service filters
-    if filters.has_oncology:
-        query = query.having(func.bool_or(ClaimsVisit.has_oncology) == True)
-    if filters.has_surgery:
-        query = query.having(func.bool_or(ClaimsVisit.has_surgery) == True)
-    if filters.has_inpatient:
-        query = query.having(func.bool_or(ClaimsVisit.has_inpatient) == True)
-    
-    # Apply minimum providers filter
-    if filters.min_providers:
-        query = query.having(func.count(distinct(ClaimsVisit.provider_id)) >= filters.min_providers)
-    
-    # Get total count
-    total_count = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * per_page
-    results = query.offset(offset).limit(per_page).all()
+        
+        # Group by site
+        query = query.group_by(SiteOfService.id)
+        
+        # Apply site visit count filter
+        if filters.min_site_visits is not None:
+            query = query.having(func.coalesce(func.sum(ClaimsVisit.visits), 0) >= filters.min_site_visits)
+        
+        # Apply service filters
+        if filters.has_oncology:
+            query = query.having(func.bool_or(ClaimsVisit.has_oncology) == True)
+        if filters.has_surgery:
+            query = query.having(func.bool_or(ClaimsVisit.has_surgery) == True)
+        if filters.has_inpatient:
+            query = query.having(func.bool_or(ClaimsVisit.has_inpatient) == True)
+        
+        # Apply minimum providers filter
+        if filters.min_providers:
+            query = query.having(func.count(distinct(ClaimsVisit.provider_id)) >= filters.min_providers)
+    
+    # Paginate by name, offset or keyset
+    results, meta = paginate_list_query(
+        session, query,
+        keys=[SortKey(SiteOfService.name), SortKey(SiteOfService.id)],
+        signature="sites:name",
+        row_key=lambda row: (row[0].name, row[0].id),
+        page=page, per_page=per_page, cursor=cursor, count_mode=count_mode
+    )
     
     # Create response
     items = [
@@ -354,32 +474,44 @@ async def get_sites(
         for site, total_visits, provider_count in results
     ]
     
-    meta = PaginationMeta(
-        page=page,
-        per_page=per_page,
-        total_items=total_count,
-        total_pages=(total_count + per_page - 1) // per_page,
-        has_next=page * per_page < total_count,
-        has_prev=page > 1
-    )
-    
     # Calculate statistics for filtered data
-    stats_query = session.query(
-        func.sum(ClaimsVisit.visits).label('total_visits'),
-        func.count(distinct(ClaimsVisit.provider_id)).label('total_providers'),
-        func.count(distinct(ClaimsVisit.site_id)).label('total_sites')
-    ).join(SiteOfService)
-    
-    # Apply same filters
-    stats_query = apply_filters(stats_query, filters, SiteOfService)
-    stats = stats_query.first()
+    if not has_provider_filters(filters):
+        # Summarize the aggregates of the sites the list matched; sites
+        # without visits have no aggregate row, so they are not counted
+        matched_sites = session.query(
+            SiteOfService.id,
+            ClaimsSiteAggregate.total_visits
+        ).join(ClaimsSiteAggregate, ClaimsSiteAggregate.site_id == SiteOfService.id)
+        matched_sites = apply_filters(matched_sites, filters, SiteOfService)
+        matched_sites = apply_site_aggregate_filters(matched_sites, filters).subquery()
+        
+        total_visits, total_sites = session.query(
+            func.sum(matched_sites.c.total_visits),
+            func.count(matched_sites.c.id)
+        ).one()
+        
+        # Providers work at several sites, so the distinct count cannot be
+        # summed from the aggregates; count it over the matched sites' visits
+        total_providers = session.query(
+            func.count(distinct(ClaimsVisit.provider_id))
+        ).filter(ClaimsVisit.site_id.in_(select(matched_sites.c.id))).scalar()
+    else:
+        stats_query = session.query(
+            func.sum(ClaimsVisit.visits).label('total_visits'),
+            func.count(distinct(ClaimsVisit.provider_id)).label('total_providers'),
+            func.count(distinct(ClaimsVisit.site_id)).label('total_sites')
+        ).join(SiteOfService)
+        
+        # Apply same filters
+        stats_query = apply_filters(stats_query, filters, SiteOfService)
+        total_visits, total_providers, total_sites = stats_query.one()
     
     statistics = ClaimsStatistics(
-        total_visits=int(stats.total_visits or 0),
-        total_providers=int(stats.total_providers or 0),
-        total_sites=int(stats.total_sites or 0),
-        average_visits_per_site=float(stats.total_visits or 0) / int(stats.total_sites or 1),
-        average_visits_per_provider=float(stats.total_visits or 0) / int(stats.total_providers or 1)
+        total_visits=int(total_visits or 0),
+        total_providers=int(total_providers or 0),
+        total_sites=int(total_sites or 0),
+        average_visits_per_site=float(total_visits or 0) / int(total_sites or 1),
+        average_visits_per_provider=float(total_visits or 0) / int(total_providers or 1)
     )
     
     return SitesOfServiceResponse(items=items, meta=meta, statistics=statistics)
@@ -400,8 +532,295 @@ async def get_site(
     return SiteOfServiceDetail.from_orm(site)
 
 
+def build_map_markers_query(session: Session, filters: ClaimsFilters):
+    """Build the per-site marker query, from aggregates when filters allow"""
+    
+    if not has_provider_filters(filters):
+        # Read visit rollups from the precomputed site aggregates
+        query = session.query(
+            SiteOfService.id,
+            SiteOfService.name,
+            SiteOfService.latitude,
+            SiteOfService.longitude,
+            SiteOfService.site_type,
+            SiteOfService.city,
+            SiteOfService.geomarket,
+            func.coalesce(ClaimsSiteAggregate.total_visits, 0).label('total_visits'),
+            func.coalesce(ClaimsSiteAggregate.provider_count, 0).label('provider_count')
+        ).outerjoin(ClaimsSiteAggregate, ClaimsSiteAggregate.site_id == SiteOfService.id)
+        
+        query = apply_filters(query, filters, SiteOfService)
+        query = apply_site_aggregate_filters(query, filters)
+    else:
+        # Provider filters need the live visit join
+        query = session.query(
+            SiteOfService.id,
+            SiteOfService.name,
+            SiteOfService.latitude,
+            SiteOfService.longitude,
+            SiteOfService.site_type,
+            SiteOfService.city,
+            SiteOfService.geomarket,
+            func.coalesce(func.sum(ClaimsVisit.visits), 0).label('total_visits'),
+            func.count(distinct(ClaimsVisit.provider_id)).label('provider_count')
+        ).outerjoin(ClaimsVisit).join(
+            ClaimsProvider,
+            ClaimsVisit.provider_id == ClaimsProvider.id
+        )
+        
+        # Apply basic filters
+        query = apply_filters(query, filters, SiteOfService)
+        
+        # Apply provider-specific filters
+        if filters.specialty:
+            query = query.filter(ClaimsProvider.specialty.in_(filters.specialty))
+        if filters.service_line:
+            query = query.filter(ClaimsProvider.service_line.in_(filters.service_line))
+        if filters.provider_group:
+            query = query.filter(ClaimsProvider.provider_group.in_(filters.provider_group))
+        if filters.min_provider_visits is not None:
+            query = query.filter(ClaimsProvider.total_visits >= filters.min_provider_visits)
+        
+        # Group by site
+        query = query.group_by(
+            SiteOfService.id,
+            SiteOfService.name,
+            SiteOfService.latitude,
+            SiteOfService.longitude,
+            SiteOfService.site_type,
+            SiteOfService.city,
+            SiteOfService.geomarket
+        )
+        
+        # Apply service filters
+        if filters.has_oncology:
+            query = query.having(func.bool_or(ClaimsVisit.has_oncology) == True)
+        
+        if filters.has_surgery:
+            query = query.having(func.bool_or(ClaimsVisit.has_surgery) == True)
+        
+        if filters.has_inpatient:
+            query = query.having(func.bool_or(ClaimsVisit.has_inpatient) == True)
+        
+        # Apply visit count filter (using min_site_visits for map markers)
+        if filters.min_site_visits:
+            query = query.having(func.sum(ClaimsVisit.visits) >= filters.min_site_visits)
+        
+        # Apply minimum providers filter
+        if filters.min_providers:
+            query = query.having(func.count(distinct(ClaimsVisit.provider_id)) >= filters.min_providers)
+    
+    return query
+
+
+def has_site_filters(filters: ClaimsFilters) -> bool:
+    """Whether filters narrow sites beyond the bounding box"""
+    return bool(
+        filters.geomarket or filters.city or filters.county or filters.site_type or
+        filters.min_site_visits or filters.min_providers or
+        filters.has_oncology or filters.has_surgery or filters.has_inpatient
+    )
+
+
+def site_point_matches(point: SitePoint, filters: ClaimsFilters) -> bool:
+    """In-memory equivalent of apply_filters/apply_site_aggregate_filters for indexed sites"""
+    if filters.geomarket and point.geomarket not in filters.geomarket:
+        return False
+    if filters.city and point.city not in filters.city:
+        return False
+    if filters.county and point.county not in filters.county:
+        return False
+    if filters.site_type and point.site_type not in filters.site_type:
+        return False
+    if filters.has_oncology and not point.has_oncology:
+        return False
+    if filters.has_surgery and not point.has_surgery:
+        return False
+    if filters.has_inpatient and not point.has_inpatient:
+        return False
+    if filters.min_site_visits and point.total_visits < filters.min_site_visits:
+        return False
+    if filters.min_providers and point.provider_count < filters.min_providers:
+        return False
+    return True
+
+
+def marker_from_point(point: SitePoint) -> MapMarker:
+    """Convert an indexed site into a map marker"""
+    return MapMarker(
+        id=point.id,
+        name=point.name,
+        latitude=point.latitude,
+        longitude=point.longitude,
+        total_visits=point.total_visits,
+        provider_count=point.provider_count,
+        site_type=point.site_type,
+        city=point.city,
+        geomarket=point.geomarket
+    )
+
+
+def collect_map_sites(
+    session: Session,
+    filters: ClaimsFilters,
+    zoom: int
+) -> Tuple[List[SitePoint], Optional[List[Cluster]]]:
+    """
+    Resolve the sites and clusters for a zoom-aware map response.
+    
+    Below MAX_CLUSTER_ZOOM, sites are grouped into screen-space grid clusters
+    and the returned cluster list is set; at or above it every site in the
+    viewport is returned as a point. Unfiltered viewports read precomputed
+    clusters from the in-process geo index, site-level filters are evaluated
+    against the indexed sites, and provider-level filters fall back to the
+    SQL marker query.
+    """
+    bbox = None
+    if None not in (filters.south, filters.west, filters.north, filters.east):
+        bbox = (filters.south, filters.west, filters.north, filters.east)
+    
+    points: List[SitePoint] = []
+    clusters = None
+    if has_provider_filters(filters):
+        points = [
+            SitePoint(
+                id=site_id,
+                name=name,
+                latitude=latitude,
+                longitude=longitude,
+                site_type=site_type,
+                city=city,
+                geomarket=geomarket,
+                total_visits=int(total_visits or 0),
+                provider_count=int(provider_count or 0)
+            )
+            for (site_id, name, latitude, longitude, site_type, city, geomarket,
+                 total_visits, provider_count) in build_map_markers_query(session, filters).all()
+            if latitude is not None and longitude is not None
+        ]
+        if zoom < MAX_CLUSTER_ZOOM:
+            clusters = cluster_points(points, zoom)
+    else:
+        index = GeoIndexManager.get_site_index(session)
+        if has_site_filters(filters):
+            points = [p for p in index.query_bbox(bbox) if site_point_matches(p, filters)]
+            if zoom < MAX_CLUSTER_ZOOM:
+                clusters = cluster_points(points, zoom)
+        elif zoom < MAX_CLUSTER_ZOOM:
+            clusters = index.clusters(zoom, bbox)
+        else:
+            points = index.query_bbox(bbox)
+    
+    return points, clusters
+
+
+def get_clustered_map_markers(session: Session, filters: ClaimsFilters, zoom: int) -> MapMarkersResponse:
+    """Build a zoom-aware map response; see collect_map_sites for the clustering rules"""
+    points, clusters = collect_map_sites(session, filters, zoom)
+    
+    if clusters is None:
+        markers = [marker_from_point(p) for p in points]
+        map_clusters = []
+    else:
+        markers = [marker_from_point(c.point) for c in clusters if c.site_count == 1]
+        map_clusters = [
+            MapCluster(
+                latitude=c.latitude,
+                longitude=c.longitude,
+                site_count=c.site_count,
+                total_visits=c.total_visits,
+                provider_count=c.provider_count,
+                bounds={"north": c.north, "south": c.south, "east": c.east, "west": c.west}
+            )
+            for c in clusters if c.site_count > 1
+        ]
+    
+    # Calculate bounds
+    bounds = None
+    if markers or map_clusters:
+        bounds = {
+            "north": max([m.latitude for m in markers] + [c.bounds["north"] for c in map_clusters]),
+            "south": min([m.latitude for m in markers] + [c.bounds["south"] for c in map_clusters]),
+            "east": max([m.longitude for m in markers] + [c.bounds["east"] for c in map_clusters]),
+            "west": min([m.longitude for m in markers] + [c.bounds["west"] for c in map_clusters])
+        }
+    
+    return MapMarkersResponse(
+        markers=markers,
+        clusters=map_clusters,
+        total_count=len(markers) + sum(c.site_count for c in map_clusters),
+        bounds=bounds,
+        zoom=zoom
+    )
+
+
+# Site point fields in the column order of build_map_markers_query rows
+site_point_row = attrgetter(
+    "id", "name", "latitude", "longitude", "site_type", "city", "geomarket",
+    "total_visits", "provider_count"
+)
+
+
+def map_marker_columns(rows: Sequence[Tuple], clusters: Optional[List[Cluster]] = None) -> Dict[str, list]:
+    """
+    Transpose marker rows into parallel arrays for the columnar map formats.
+    
+    Rows use the build_map_markers_query column order. When clusters are
+    given, multi-site clusters are appended as extra rows with a null id and
+    name and a site_count above one, and north/south/east/west columns carry
+    each row's bounds (a single site's bounds are its own coordinates).
+    """
+    (ids, names, lats, lngs, site_types, cities, geomarkets,
+     total_visits, provider_counts) = (list(column) for column in zip(*rows)) if rows else ([] for _ in range(9))
+    columns = {
+        "id": [str(site_id) for site_id in ids],
+        "name": names,
+        "latitude": lats,
+        "longitude": lngs,
+        "total_visits": [int(v or 0) for v in total_visits],
+        "provider_count": [int(v or 0) for v in provider_counts],
+        "site_type": site_types,
+        "city": cities,
+        "geomarket": geomarkets,
+        "site_count": [1] * len(ids),
+    }
+    if clusters is None:
+        return columns
+    
+    columns.update(north=list(lats), south=list(lats), east=list(lngs), west=list(lngs))
+    for c in clusters:
+        if c.site_count == 1:
+            continue
+        for name, value in (
+            ("id", None), ("name", None), ("latitude", c.latitude), ("longitude", c.longitude),
+            ("total_visits", c.total_visits), ("provider_count", c.provider_count),
+            ("site_type", None), ("city", None), ("geomarket", None), ("site_count", c.site_count),
+            ("north", c.north), ("south", c.south), ("east", c.east), ("west", c.west)
+        ):
+            columns[name].append(value)
+    return columns
+
+
+def map_markers_columnar(media_type: str, columns: Dict[str, list], zoom: Optional[int] = None):
+    """Build a columnar map-markers response with the same metadata as MapMarkersResponse"""
+    bounds = None
+    if columns["site_count"]:
+        bounds = {
+            "north": max(columns.get("north", columns["latitude"])),
+            "south": min(columns.get("south", columns["latitude"])),
+            "east": max(columns.get("east", columns["longitude"])),
+            "west": min(columns.get("west", columns["longitude"]))
+        }
+    return columnar_response(media_type, columns, {
+        "total_count": sum(columns["site_count"]),
+        "bounds": bounds,
+        "zoom": zoom
+    })
+
+
 @router.get("/map-markers", response_model=MapMarkersResponse)
 async def get_map_markers(
+    request: Request,
     geomarket: Optional[List[str]] = Query(None, description="Filter by geomarket"),
     city: Optional[List[str]] = Query(None, description="Filter by city"),
     site_type: Optional[List[str]] = Query(None, description="Filter by site type"),
@@ -418,9 +837,18 @@ async def get_map_markers(
     has_oncology: Optional[bool] = Query(None, description="Has oncology services"),
     has_surgery: Optional[bool] = Query(None, description="Has surgical services"),
     has_inpatient: Optional[bool] = Query(None, description="Has inpatient services"),
+    zoom: Optional[int] = Query(None, ge=0, le=22, description="Map zoom level; enables server-side clustering"),
     session: Session = Depends(db_session)
 ):
-    """Get optimized map markers for sites of service"""
+    """
+    Get optimized map markers for sites of service.
+    
+    When zoom is given, nearby sites are returned as clusters below the
+    clustering threshold so the payload stays bounded by viewport size.
+    Clients that send an Accept header for Arrow or columnar JSON (see
+    services.columnar_response) get parallel arrays instead of marker objects.
+    """
+    columnar = negotiate_columnar_format(request)
     
     # Create filters object
     filters = ClaimsFilters(
@@ -443,75 +871,25 @@ async def get_map_markers(
         has_coordinates=True  # Only show sites with coordinates on map
     )
     
-    # Query with visit aggregation and service flags
-    query = session.query(
-        SiteOfService.id,
-        SiteOfService.name,
-        SiteOfService.latitude,
-        SiteOfService.longitude,
-        SiteOfService.site_type,
-        SiteOfService.city,
-        SiteOfService.geomarket,
-        func.coalesce(func.sum(ClaimsVisit.visits), 0).label('total_visits'),
-        func.count(distinct(ClaimsVisit.provider_id)).label('provider_count'),
-        func.bool_or(ClaimsVisit.has_oncology).label('site_has_oncology'),
-        func.bool_or(ClaimsVisit.has_surgery).label('site_has_surgery'),
-        func.bool_or(ClaimsVisit.has_inpatient).label('site_has_inpatient')
-    ).outerjoin(ClaimsVisit)
-    
-    # Join with provider table if provider filters are specified
-    if filters.specialty or filters.service_line or filters.provider_group or filters.min_provider_visits is not None:
-        query = query.join(
-            ClaimsProvider,
-            ClaimsVisit.provider_id == ClaimsProvider.id
-        )
-    
-    # Apply basic filters
-    query = apply_filters(query, filters, SiteOfService)
-    
-    # Apply provider filters if provider join was added
-    if filters.specialty or filters.service_line or filters.provider_group or filters.min_provider_visits is not None:
-        # Apply provider-specific filters
-        if filters.specialty:
-            query = query.filter(ClaimsProvider.specialty.in_(filters.specialty))
-        if filters.service_line:
-            query = query.filter(ClaimsProvider.service_line.in_(filters.service_line))
-        if filters.provider_group:
-            query = query.filter(ClaimsProvider.provider_group.in_(filters.provider_group))
-        if filters.min_provider_visits is not None:
-            query = query.filter(ClaimsProvider.total_visits >= filters.min_provider_visits)
-    
-    # Group by site
-    query = query.group_by(
-        SiteOfService.id,
-        SiteOfService.name,
-        SiteOfService.latitude,
-        SiteOfService.longitude,
-        SiteOfService.site_type,
-        SiteOfService.city,
-        SiteOfService.geomarket
-    )
-    
-    # Apply service filters
-    if filters.has_oncology:
-        query = query.having(func.bool_or(ClaimsVisit.has_oncology) == True)
-    
-    if filters.has_surgery:
-        query = query.having(func.bool_or(ClaimsVisit.has_surgery) == True)
-    
-    if filters.has_inpatient:
-        query = query.having(func.bool_or(ClaimsVisit.has_inpatient) == True)
-    
-    # Apply visit count filter (using min_site_visits for map markers)
-    if filters.min_site_visits:
-        query = query.having(func.sum(ClaimsVisit.visits) >= filters.min_site_visits)
-    
-    # Apply minimum providers filter
-    if filters.min_providers:
-        query = query.having(func.count(distinct(ClaimsVisit.provider_id)) >= filters.min_providers)
+    if zoom is not None:
+        if columnar:
+            points, clusters = collect_map_sites(session, filters, zoom)
+            if clusters is not None:
+                points = [c.point for c in clusters if c.site_count == 1]
+            return map_markers_columnar(
+                columnar,
+                map_marker_columns([site_point_row(p) for p in points], clusters),
+                zoom
+            )
+        return get_clustered_map_markers(session, filters, zoom)
     
     # Execute query
-    results = query.all()
+    results = build_map_markers_query(session, filters).all()
+    
+    if columnar:
+        return map_markers_columnar(columnar, map_marker_columns([
+            row for row in results if row[2] is not None and row[3] is not None
+        ]))
     
     # Create markers
     markers = [
@@ -527,7 +905,7 @@ async def get_map_markers(
             geomarket=geomarket
         )
         for (site_id, name, latitude, longitude, site_type, city, geomarket,
-             total_visits, provider_count, _, _, _) in results
+             total_visits, provider_count) in results
         if latitude is not None and longitude is not None
     ]
     
@@ -567,83 +945,125 @@ async def get_provider_groups(
     has_surgery: Optional[bool] = Query(None, description="Has surgical services"),
     has_inpatient: Optional[bool] = Query(None, description="Has inpatient services"),
     search: Optional[str] = Query(None, description="Search by group name"),
+    cursor: Optional[str] = Query(None, description="Cursor from meta.next_cursor; replaces page"),
+    count_mode: str = Query("exact", pattern=COUNT_MODE_PATTERN, description="Total count: exact, estimate or none"),
     session: Session = Depends(db_session)
 ):
-    """Get aggregated provider group data"""
+    """
+    Get aggregated provider group data.
     
-    # Base query with site count aggregation
-    query = session.query(
-        ClaimsProvider.provider_group,
-        func.count(distinct(ClaimsProvider.id)).label('provider_count'),
-        func.sum(ClaimsProvider.total_visits).label('total_visits'),
-        func.array_agg(distinct(ClaimsProvider.specialty)).label('specialties'),
-        func.array_agg(distinct(ClaimsProvider.geomarket)).label('geomarkets'),
-        func.count(distinct(ClaimsVisit.site_id)).label('site_count')
-    ).outerjoin(
-        ClaimsVisit,
-        ClaimsVisit.provider_id == ClaimsProvider.id
+    Unfiltered, searched and threshold-filtered requests read the precomputed
+    provider group rollup; provider- and site-level filters change which
+    providers count towards a group, so those fall back to live aggregation.
+    """
+    
+    site_filtered = bool(city or county or site_type) or any(
+        flag is not None for flag in (has_oncology, has_surgery, has_inpatient)
     )
     
-    # Join with sites if site filters are specified
-    if city or county or site_type or has_oncology is not None or has_surgery is not None or has_inpatient is not None:
-        query = query.join(
-            SiteOfService,
-            ClaimsVisit.site_id == SiteOfService.id
+    if not (geomarket or specialty or service_line or site_filtered):
+        # Read group rollups from the precomputed provider group aggregates
+        query = session.query(
+            ClaimsProviderGroupAggregate.provider_group,
+            ClaimsProviderGroupAggregate.provider_count,
+            ClaimsProviderGroupAggregate.total_visits,
+            ClaimsProviderGroupAggregate.specialties,
+            ClaimsProviderGroupAggregate.geomarkets,
+            ClaimsProviderGroupAggregate.site_count
         )
-    
-    query = query.filter(ClaimsProvider.provider_group.isnot(None))
-    
-    # Apply filters
-    if geomarket:
-        query = query.filter(ClaimsProvider.geomarket.in_(geomarket))
-    
-    if specialty:
-        query = query.filter(ClaimsProvider.specialty.in_(specialty))
-    
-    if service_line:
-        query = query.filter(ClaimsProvider.service_line.in_(service_line))
-    
-    if search:
-        query = query.filter(ClaimsProvider.provider_group.ilike(f"%{search}%"))
-    
-    # Apply site filters if site join was added
-    if city:
-        query = query.filter(SiteOfService.city.in_(city))
-    if county:
-        query = query.filter(SiteOfService.county.in_(county))
-    if site_type:
-        query = query.filter(SiteOfService.site_type.in_(site_type))
-    
-    # Apply service filters if needed
-    if has_oncology is not None:
-        query = query.filter(ClaimsVisit.has_oncology == has_oncology)
-    if has_surgery is not None:
-        query = query.filter(ClaimsVisit.has_surgery == has_surgery)
-    if has_inpatient is not None:
-        query = query.filter(ClaimsVisit.has_inpatient == has_inpatient)
-    
-    # Group by provider group
-    query = query.group_by(ClaimsProvider.provider_group)
-    
-    # Apply aggregation filters
-    if min_providers:
-        query = query.having(func.count(distinct(ClaimsProvider.id)) >= min_providers)
-    
-    if min_group_visits:
-        query = query.having(func.sum(ClaimsProvider.total_visits) >= min_group_visits)
-    
-    if min_group_sites:
-        query = query.having(func.count(distinct(ClaimsVisit.site_id)) >= min_group_sites)
-    
-    # Order by total visits
-    query = query.order_by(func.sum(ClaimsProvider.total_visits).desc())
-    
-    # Get total count
-    total_count = query.count()
-    
-    # Apply pagination
-    offset = (page - 1) * per_page
-    results = query.offset(offset).limit(per_page).all()
+        
+        if search:
+            query = query.filter(search_condition((ClaimsProviderGroupAggregate.provider_group,), search))
+        if min_providers:
+            query = query.filter(ClaimsProviderGroupAggregate.provider_count >= min_providers)
+        if min_group_visits:
+            query = query.filter(ClaimsProviderGroupAggregate.total_visits >= min_group_visits)
+        if min_group_sites:
+            query = query.filter(ClaimsProviderGroupAggregate.site_count >= min_group_sites)
+        
+        total_visits_key = ClaimsProviderGroupAggregate.total_visits
+        group_key = ClaimsProviderGroupAggregate.provider_group
+        having = False
+    else:
+        # Visits at the sites matching the site-level filters
+        visits = session.query(ClaimsVisit.provider_id, ClaimsVisit.site_id)
+        if city or county or site_type:
+            visits = visits.join(SiteOfService, ClaimsVisit.site_id == SiteOfService.id)
+        if city:
+            visits = visits.filter(SiteOfService.city.in_(city))
+        if county:
+            visits = visits.filter(SiteOfService.county.in_(county))
+        if site_type:
+            visits = visits.filter(SiteOfService.site_type.in_(site_type))
+        if has_oncology is not None:
+            visits = visits.filter(ClaimsVisit.has_oncology == has_oncology)
+        if has_surgery is not None:
+            visits = visits.filter(ClaimsVisit.has_surgery == has_surgery)
+        if has_inpatient is not None:
+            visits = visits.filter(ClaimsVisit.has_inpatient == has_inpatient)
+        visits = visits.subquery()
+        
+        # Matching providers, one row each so provider totals are not multiplied by visit rows
+        providers = session.query(
+            ClaimsProvider.id,
+            ClaimsProvider.provider_group,
+            ClaimsProvider.total_visits,
+            ClaimsProvider.specialty,
+            ClaimsProvider.geomarket
+        ).filter(ClaimsProvider.provider_group.isnot(None))
+        if geomarket:
+            providers = providers.filter(ClaimsProvider.geomarket.in_(geomarket))
+        if specialty:
+            providers = providers.filter(ClaimsProvider.specialty.in_(specialty))
+        if service_line:
+            providers = providers.filter(ClaimsProvider.service_line.in_(service_line))
+        if search:
+            providers = providers.filter(search_condition(PROVIDER_GROUP_SEARCH_COLUMNS, search))
+        if site_filtered:
+            providers = providers.filter(ClaimsProvider.id.in_(select(visits.c.provider_id)))
+        providers = providers.subquery()
+        
+        site_counts = session.query(
+            providers.c.provider_group,
+            func.count(distinct(visits.c.site_id)).label('site_count')
+        ).join(
+            visits, visits.c.provider_id == providers.c.id
+        ).group_by(providers.c.provider_group).subquery()
+        
+        provider_count = func.count(providers.c.id)
+        total_visits_key = func.coalesce(func.sum(providers.c.total_visits), 0)
+        site_count = func.coalesce(func.max(site_counts.c.site_count), 0)
+        group_key = providers.c.provider_group
+        
+        query = session.query(
+            providers.c.provider_group,
+            provider_count.label('provider_count'),
+            total_visits_key.label('total_visits'),
+            func.array_agg(distinct(providers.c.specialty)).label('specialties'),
+            func.array_agg(distinct(providers.c.geomarket)).label('geomarkets'),
+            site_count.label('site_count')
+        ).outerjoin(
+            site_counts, site_counts.c.provider_group == providers.c.provider_group
+        ).group_by(providers.c.provider_group)
+        
+        # Apply aggregation filters
+        if min_providers:
+            query = query.having(provider_count >= min_providers)
+        if min_group_visits:
+            query = query.having(total_visits_key >= min_group_visits)
+        if min_group_sites:
+            query = query.having(site_count >= min_group_sites)
+        having = True
+    
+    # Paginate by total visits, offset or keyset (on the live aggregate via HAVING)
+    results, meta = paginate_list_query(
+        session, query,
+        keys=[SortKey(total_visits_key, descending=True), SortKey(group_key)],
+        signature="provider-groups:total_visits",
+        row_key=lambda row: (row.total_visits, row.provider_group),
+        page=page, per_page=per_page, cursor=cursor, count_mode=count_mode,
+        having=having
+    )
     
     # Create response
     items = [
@@ -659,15 +1079,6 @@ async def get_provider_groups(
         for (group_name, provider_count, total_visits, specialties, geomarkets, site_count) in results
     ]
     
-    meta = PaginationMeta(
-        page=page,
-        per_page=per_page,
-        total_items=total_count,
-        total_pages=(total_count + per_page - 1) // per_page,
-        has_next=page * per_page < total_count,
-        has_prev=page > 1
-    )
-    
     # Calculate overall statistics
     total_visits = sum(item.total_visits for item in items)
     total_providers = sum(item.provider_count for item in items)
@@ -684,9 +1095,8 @@ async def get_provider_groups(
     return ProviderGroupsResponse(items=items, meta=meta, statistics=statistics)
 
 
-@router.get("/filter-options", response_model=FilterOptions)
-async def get_filter_options(session: Session = Depends(db_session)):
-    """Get available filter options for dropdowns"""
+def load_filter_options(session: Session) -> FilterOptions:
+    """Query the distinct values behind the filter dropdowns"""
     
     # Get distinct values for filters
     geomarkets = session.query(distinct(ClaimsProvider.geomarket)).filter(
@@ -733,71 +1143,73 @@ async def get_filter_options(session: Session = Depends(db_session)):
     )
 
 
+@router.get("/filter-options", response_model=FilterOptions)
+async def get_filter_options(request: Request, session: Session = Depends(db_session)):
+    """Get available filter options for dropdowns (cached until the next claims import)"""
+    options = FilterOptionsCache.get(FilterOptionsCache.CLAIMS, session, load_filter_options)
+    return filter_options_response(request, options)
+
+
+@router.get("/search", response_model=ClaimsSearchResponse)
+async def search_claims(
+    q: str = Query(..., min_length=2, description="Search term; each word matches as a prefix"),
+    limit: int = Query(TYPEAHEAD_DEFAULT_LIMIT, ge=1, le=TYPEAHEAD_MAX_LIMIT, description="Maximum number of results"),
+    session: Session = Depends(db_session)
+):
+    """
+    Ranked typeahead search across provider names, provider groups and sites.
+    
+    Each source is matched through its name search index and limited on its
+    own; the hits are then merged by relevance.
+    """
+    provider_score = search_rank(PROVIDER_SEARCH_COLUMNS, q).label('score')
+    providers = session.query(
+        ClaimsProvider.id, ClaimsProvider.name, ClaimsProvider.specialty, provider_score
+    ).filter(search_condition(PROVIDER_SEARCH_COLUMNS, q)).order_by(
+        provider_score.desc(), ClaimsProvider.name, ClaimsProvider.id
+    ).limit(limit).all()
+    
+    site_score = search_rank(SITE_SEARCH_COLUMNS, q).label('score')
+    sites = session.query(
+        SiteOfService.id, SiteOfService.name, SiteOfService.city, site_score
+    ).filter(search_condition(SITE_SEARCH_COLUMNS, q)).order_by(
+        site_score.desc(), SiteOfService.name, SiteOfService.id
+    ).limit(limit).all()
+    
+    group_score = func.max(search_rank(PROVIDER_GROUP_SEARCH_COLUMNS, q)).label('score')
+    groups = session.query(
+        ClaimsProvider.provider_group, func.count(ClaimsProvider.id), group_score
+    ).filter(search_condition(PROVIDER_GROUP_SEARCH_COLUMNS, q)).group_by(
+        ClaimsProvider.provider_group
+    ).order_by(group_score.desc(), ClaimsProvider.provider_group).limit(limit).all()
+    
+    results = [
+        ClaimsSearchResult(type="provider", id=id, name=name, detail=specialty, score=score)
+        for id, name, specialty, score in providers
+    ] + [
+        ClaimsSearchResult(type="site", id=id, name=name, detail=city, score=score)
+        for id, name, city, score in sites
+    ] + [
+        ClaimsSearchResult(type="provider_group", name=name, detail=f"{count} providers", score=score)
+        for name, count, score in groups
+    ]
+    results.sort(key=lambda result: (-result.score, result.name))
+    
+    return ClaimsSearchResponse(query=q, results=results[:limit])
+
+
 @router.get("/sites/{site_id}/statistics", response_model=SiteStatistics)
 async def get_site_statistics(
     site_id: UUID,
     session: Session = Depends(db_session)
 ):
-    """Get detailed statistics for a specific site"""
-    
-    # Verify site exists
-    site = session.query(SiteOfService).filter(SiteOfService.id == site_id).first()
-    if not site:
-        raise HTTPException(status_code=404, detail="Site not found")
-    
-    # Get visit statistics
-    visit_stats = session.query(
-        func.sum(ClaimsVisit.visits).label('total_visits'),
-        func.sum(func.case([(ClaimsVisit.has_oncology, ClaimsVisit.visits)], else_=0)).label('oncology_visits'),
-        func.sum(func.case([(ClaimsVisit.has_surgery, ClaimsVisit.visits)], else_=0)).label('surgery_visits'),
-        func.sum(func.case([(ClaimsVisit.has_inpatient, ClaimsVisit.visits)], else_=0)).label('inpatient_visits')
-    ).filter(ClaimsVisit.site_id == site_id).first()
-    
-    # Get provider count
-    provider_count = session.query(func.count(distinct(ClaimsVisit.provider_id))).filter(
-        ClaimsVisit.site_id == site_id
-    ).scalar() or 0
-    
-    # Get top specialties
-    top_specialties = session.query(
-        ClaimsProvider.specialty,
-        func.sum(ClaimsVisit.visits).label('visits')
-    ).join(ClaimsVisit).filter(
-        ClaimsVisit.site_id == site_id
-    ).group_by(ClaimsProvider.specialty).order_by(
-        func.sum(ClaimsVisit.visits).desc()
-    ).limit(5).all()
-    
-    # Get top providers
-    top_providers = session.query(
-        ClaimsProvider.name,
-        ClaimsProvider.specialty,
-        func.sum(ClaimsVisit.visits).label('visits')
-    ).join(ClaimsVisit).filter(
-        ClaimsVisit.site_id == site_id
-    ).group_by(ClaimsProvider.id, ClaimsProvider.name, ClaimsProvider.specialty).order_by(
-        func.sum(ClaimsVisit.visits).desc()
-    ).limit(10).all()
-    
-    return SiteStatistics(
-        site_id=site_id,
-        visit_stats=VisitStatistics(
-            total_visits=int(visit_stats.total_visits or 0),
-            oncology_visits=int(visit_stats.oncology_visits or 0),
-            surgery_visits=int(visit_stats.surgery_visits or 0),
-            inpatient_visits=int(visit_stats.inpatient_visits or 0),
-            outpatient_visits=int((visit_stats.total_visits or 0) - (visit_stats.inpatient_visits or 0))
-        ),
-        provider_count=provider_count,
-        top_specialties=[
-            {"specialty": specialty, "visits": int(visits)}
-            for specialty, visits in top_specialties
-        ],
-        top_providers=[
-            {"name": name, "specialty": specialty, "visits": int(visits)}
-            for name, specialty, visits in top_providers
-        ]
+    """Get detailed statistics for a specific site (cached until the next claims import)"""
+    statistics = ClaimsStatisticsCache.get(
+        session, ("site", site_id), lambda: load_site_statistics(session, site_id)
     )
+    if statistics is None:
+        raise HTTPException(status_code=404, detail="Site not found")
+    return statistics
 
 
 @router.get("/providers/{provider_id}/statistics", response_model=ProviderStatistics)
@@ -805,52 +1217,13 @@ async def get_provider_statistics(
     provider_id: UUID,
     session: Session = Depends(db_session)
 ):
-    """Get detailed statistics for a specific provider"""
-    
-    # Verify provider exists
-    provider = session.query(ClaimsProvider).filter(ClaimsProvider.id == provider_id).first()
-    if not provider:
-        raise HTTPException(status_code=404, detail="Provider not found")
-    
-    # Get visit statistics
-    visit_stats = session.query(
-        func.sum(ClaimsVisit.visits).label('total_visits'),
-        func.sum(func.case([(ClaimsVisit.has_oncology, ClaimsVisit.visits)], else_=0)).label('oncology_visits'),
-        func.sum(func.case([(ClaimsVisit.has_surgery, ClaimsVisit.visits)], else_=0)).label('surgery_visits'),
-        func.sum(func.case([(ClaimsVisit.has_inpatient, ClaimsVisit.visits)], else_=0)).label('inpatient_visits')
-    ).filter(ClaimsVisit.provider_id == provider_id).first()
-    
-    # Get site count
-    site_count = session.query(func.count(distinct(ClaimsVisit.site_id))).filter(
-        ClaimsVisit.provider_id == provider_id
-    ).scalar() or 0
-    
-    # Get top sites
-    top_sites = session.query(
-        SiteOfService.name,
-        SiteOfService.city,
-        func.sum(ClaimsVisit.visits).label('visits')
-    ).join(ClaimsVisit).filter(
-        ClaimsVisit.provider_id == provider_id
-    ).group_by(SiteOfService.id, SiteOfService.name, SiteOfService.city).order_by(
-        func.sum(ClaimsVisit.visits).desc()
-    ).limit(10).all()
-    
-    return ProviderStatistics(
-        provider_id=provider_id,
-        visit_stats=VisitStatistics(
-            total_visits=int(visit_stats.total_visits or 0),
-            oncology_visits=int(visit_stats.oncology_visits or 0),
-            surgery_visits=int(visit_stats.surgery_visits or 0),
-            inpatient_visits=int(visit_stats.inpatient_visits or 0),
-            outpatient_visits=int((visit_stats.total_visits or 0) - (visit_stats.inpatient_visits or 0))
-        ),
-        site_count=site_count,
-        top_sites=[
-            {"name": name, "city": city, "visits": int(visits)}
-            for name, city, visits in top_sites
-        ]
+    """Get detailed statistics for a specific provider (cached until the next claims import)"""
+    statistics = ClaimsStatisticsCache.get(
+        session, ("provider", provider_id), lambda: load_provider_statistics(session, provider_id)
     )
+    if statistics is None:
+        raise HTTPException(status_code=404, detail="Provider not found")
+    return statistics
 
 
 @router.get("/sites/{site_id}/providers", response_model=ClaimsProvidersResponse)
@@ -867,30 +1240,38 @@ async def get_site_providers(
     if not site:
         raise HTTPException(status_code=404, detail="Site not found")
     
-    # Get all visits for this site
-    visits_query = session.query(ClaimsVisit).filter(ClaimsVisit.site_id == site_id)
-    
-    # Get unique provider IDs
-    provider_ids = [visit.provider_id for visit in visits_query.all()]
-    unique_provider_ids = list(set(provider_ids))
-    
-    # Get provider details
-    providers_query = session.query(ClaimsProvider).filter(
-        ClaimsProvider.id.in_(unique_provider_ids)
-    ).order_by(ClaimsProvider.name)
+    # Visits per provider at this site, grouped in the database
+    site_visits = (
+        session.query(
+            ClaimsVisit.provider_id.label("provider_id"),
+            func.sum(ClaimsVisit.visits).label("visit_count"),
+            # Number of providers at the site, counted over the groups
+            func.count().over().label("total")
+        )
+        .filter(ClaimsVisit.site_id == site_id)
+        .group_by(ClaimsVisit.provider_id)
+        .subquery()
+    )
     
-    # Pagination
-    total = providers_query.count()
-    providers = providers_query.offset((page - 1) * per_page).limit(per_page).all()
+    # Pagination; the total comes with the page rows
+    rows = (
+        session.query(ClaimsProvider, site_visits.c.visit_count, site_visits.c.total)
+        .join(site_visits, ClaimsProvider.id == site_visits.c.provider_id)
+        .order_by(ClaimsProvider.name, ClaimsProvider.id)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+        .all()
+    )
+    if rows:
+        total = rows[0].total
+    elif page > 1:
+        # Past the last page: no row to read the total from
+        total = session.query(func.count()).select_from(site_visits).scalar() or 0
+    else:
+        total = 0
     
     items = []
-    for provider in providers:
-        # Get visit count for this provider at this site
-        visit_count = session.query(func.sum(ClaimsVisit.visits)).filter(
-            ClaimsVisit.provider_id == provider.id,
-            ClaimsVisit.site_id == site_id
-        ).scalar() or 0
-        
+    for provider, visit_count, _ in rows:
         items.append(ClaimsProviderListItem(
             id=provider.id,
             npi=provider.npi,
@@ -899,7 +1280,7 @@ async def get_site_providers(
             provider_group=provider.provider_group,
             geomarket=provider.geomarket,
             city=site.city,  # Use site's city
-            total_visits=visit_count,
+            total_visits=visit_count or 0,
             # Additional detail fields
             top_site_name=site.name,  # This is the current site for quick view
             top_site_id=site.id,
@@ -934,25 +1315,15 @@ async def get_site_provider_groups(
     if not site:
         raise HTTPException(status_code=404, detail="Site not found")
     
-    # Get provider groups that have providers at this site
+    # Provider groups with providers at this site, from the precomputed rollup
     groups_query = session.query(
-        ClaimsProvider.provider_group,
-        func.count(distinct(ClaimsProvider.id)).label('provider_count'),
-        func.sum(ClaimsVisit.visits).label('total_visits'),
-        func.array_agg(distinct(ClaimsProvider.specialty)).label('specialties'),
-        func.array_agg(distinct(ClaimsProvider.geomarket)).label('geomarkets')
-    ).join(
-        ClaimsVisit,
-        and_(
-            ClaimsVisit.provider_id == ClaimsProvider.id,
-            ClaimsVisit.site_id == site_id
-        )
+        ClaimsSiteProviderGroupAggregate.provider_group,
+        ClaimsSiteProviderGroupAggregate.provider_count,
+        ClaimsSiteProviderGroupAggregate.total_visits,
+        ClaimsSiteProviderGroupAggregate.specialties,
+        ClaimsSiteProviderGroupAggregate.geomarkets
     ).filter(
-        ClaimsProvider.provider_group.isnot(None)
-    ).group_by(
-        ClaimsProvider.provider_group
-    ).order_by(
-        func.sum(ClaimsVisit.visits).desc()
+        ClaimsSiteProviderGroupAggregate.site_id == site_id
     )
     
     # Get total count
@@ -960,7 +1331,10 @@ async def get_site_provider_groups(
     
     # Apply pagination
     offset = (page - 1) * per_page
-    results = groups_query.offset(offset).limit(per_page).all()
+    results = groups_query.order_by(
+        ClaimsSiteProviderGroupAggregate.total_visits.desc(),
+        ClaimsSiteProviderGroupAggregate.provider_group
+    ).offset(offset).limit(per_page).all()
     
     # Create response
     items = [
@@ -1006,14 +1380,17 @@ async def get_site_quick_view(
 ):
     """Get a single site for Quick View in Sites mode"""
     
-    # Get the site with aggregated visit data
+    # Get the site with its precomputed visit aggregate
     result = session.query(
         SiteOfService,
-        func.coalesce(func.sum(ClaimsVisit.visits), 0).label('total_visits'),
-        func.count(distinct(ClaimsVisit.provider_id)).label('provider_count')
-    ).outerjoin(ClaimsVisit).filter(
+        func.coalesce(ClaimsSiteAggregate.total_visits, 0).label('total_visits'),
+        func.coalesce(ClaimsSiteAggregate.provider_count, 0).label('provider_count')
+    ).outerjoin(
+        ClaimsSiteAggregate,
+        ClaimsSiteAggregate.site_id == SiteOfService.id
+    ).filter(
         SiteOfService.id == site_id
-    ).group_by(SiteOfService.id).first()
+    ).first()
     
     if not result:
         raise HTTPException(status_code=404, detail="Site not found")
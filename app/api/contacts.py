@@ -1,10 +1,22 @@
 from typing import List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import select, func, and_, or_, distinct
 from sqlalchemy.orm import Session
 
 from database.session import db_session
 from database.data_models.salesforce_data import SfContact
+from services.search_service import (
+    CONTACT_LIST_SEARCH_COLUMNS,
+    CONTACT_MAP_SEARCH_COLUMNS,
+    CONTACT_SEARCH_COLUMNS,
+    TYPEAHEAD_DEFAULT_LIMIT,
+    TYPEAHEAD_MAX_LIMIT,
+    search_condition,
+    search_rank,
+)
+from services.geo_index import GeoIndexManager, bbox_id_filter
+from services.columnar_response import columnar_response, negotiate_columnar_format
+from services.filter_options_cache import FilterOptionsCache, filter_options_response
 from schemas.contact_schema import (
     ContactMapMarker,
     ContactListItem,
@@ -13,6 +25,8 @@ from schemas.contact_schema import (
     ContactFilters,
     ContactListResponse,
     ContactMapResponse,
+    ContactSearchResponse,
+    ContactSearchResult,
 )
 
 router = APIRouter()
@@ -20,6 +34,7 @@ router = APIRouter()
 
 @router.get("/map-data", response_model=ContactMapResponse)
 async def get_map_data(
+    request: Request,
     # Geographic bounds
     north: Optional[float] = Query(None),
     south: Optional[float] = Query(None),
@@ -39,8 +54,12 @@ async def get_map_data(
     Get contact data optimized for map markers.
     
     This endpoint returns minimal contact data for displaying on a map,
-    with contacts grouped by address to show density.
+    with contacts grouped by address to show density. Clients that send an
+    Accept header for Arrow or columnar JSON (see services.columnar_response)
+    get parallel arrays instead of marker objects.
     """
+    columnar = negotiate_columnar_format(request)
+    
     # Build base query
     query = select(
         SfContact.id,
@@ -59,15 +78,25 @@ async def get_map_data(
     # Apply filters
     filters = []
     
-    # Geographic bounds filter
+    # Geographic bounds filter, resolved to contact IDs by the in-memory
+    # geo index unless the box is too large for an ID list to pay off
     if all([north, south, east, west]):
-        filters.extend([
-            SfContact.mailing_latitude.between(south, north),
-            SfContact.mailing_longitude.between(west, east),
-        ])
-    
-    # Only include contacts with valid coordinates
+        id_filter = bbox_id_filter(
+            SfContact.id,
+            GeoIndexManager.get_contact_index(session),
+            (south, west, north, east),
+        )
+        if id_filter is not None:
+            filters.append(id_filter)
+        else:
+            filters.extend([
+                SfContact.mailing_latitude.between(south, north),
+                SfContact.mailing_longitude.between(west, east),
+            ])
+    
+    # Only include live contacts with valid coordinates
     filters.extend([
+        SfContact.is_deleted.is_(False),
         SfContact.mailing_latitude.isnot(None),
         SfContact.mailing_longitude.isnot(None),
     ])
@@ -91,14 +120,8 @@ async def get_map_data(
         filters.append(SfContact.active == active)
     
     if search:
-        search_pattern = f"%{search}%"
         filters.append(
-            or_(
-                SfContact.name.ilike(search_pattern),
-                SfContact.first_name.ilike(search_pattern),
-                SfContact.last_name.ilike(search_pattern),
-                SfContact.specialty.ilike(search_pattern),
-            )
+            search_condition(CONTACT_MAP_SEARCH_COLUMNS, search, CONTACT_SEARCH_COLUMNS)
         )
     
     if filters:
@@ -107,33 +130,20 @@ async def get_map_data(
     # Execute query
     results = session.execute(query).all()
     
-    # Transform to map markers (deduplicate by location)
+    # Deduplicate by location, keeping the first contact at each address
     seen_locations = set()
-    markers = []
-    
+    rows = []
     for row in results:
         location_key = (row.mailing_latitude, row.mailing_longitude)
         if location_key not in seen_locations:
             seen_locations.add(location_key)
-            markers.append(
-                ContactMapMarker(
-                    id=str(row.id),
-                    salesforce_id=row.salesforce_id,
-                    name=row.name,
-                    latitude=row.mailing_latitude,
-                    longitude=row.mailing_longitude,
-                    mailing_address=row.mailing_address_compound,
-                    contact_count=row.contact_count,
-                    specialty=row.specialty,
-                    organization=row.contact_account_name,
-                )
-            )
+            rows.append(row)
     
     # Calculate bounds if not provided
     bounds = None
-    if markers and not all([north, south, east, west]):
-        lats = [m.latitude for m in markers if m.latitude]
-        lngs = [m.longitude for m in markers if m.longitude]
+    if rows and not all([north, south, east, west]):
+        lats = [row.mailing_latitude for row in rows if row.mailing_latitude]
+        lngs = [row.mailing_longitude for row in rows if row.mailing_longitude]
         if lats and lngs:
             bounds = {
                 "north": max(lats),
@@ -142,6 +152,38 @@ async def get_map_data(
                 "west": min(lngs),
             }
     
+    if columnar:
+        return columnar_response(
+            columnar,
+            {
+                "id": [str(row.id) for row in rows],
+                "salesforce_id": [row.salesforce_id for row in rows],
+                "name": [row.name for row in rows],
+                "latitude": [row.mailing_latitude for row in rows],
+                "longitude": [row.mailing_longitude for row in rows],
+                "mailing_address": [row.mailing_address_compound for row in rows],
+                "contact_count": [row.contact_count for row in rows],
+                "specialty": [row.specialty for row in rows],
+                "organization": [row.contact_account_name for row in rows],
+            },
+            {"total": len(rows), "clustered": False, "bounds": bounds},
+        )
+    
+    markers = [
+        ContactMapMarker(
+            id=str(row.id),
+            salesforce_id=row.salesforce_id,
+            name=row.name,
+            latitude=row.mailing_latitude,
+            longitude=row.mailing_longitude,
+            mailing_address=row.mailing_address_compound,
+            contact_count=row.contact_count,
+            specialty=row.specialty,
+            organization=row.contact_account_name,
+        )
+        for row in rows
+    ]
+    
     return ContactMapResponse(
         markers=markers,
         total=len(markers),
@@ -177,19 +219,12 @@ async def list_contacts(
     # Build base query
     query = select(SfContact)
     
-    # Apply filters
-    filters = []
+    # Apply filters; contacts deleted in Salesforce are never listed
+    filters = [SfContact.is_deleted.is_(False)]
     
     if search:
-        search_pattern = f"%{search}%"
         filters.append(
-            or_(
-                SfContact.name.ilike(search_pattern),
-                SfContact.first_name.ilike(search_pattern),
-                SfContact.last_name.ilike(search_pattern),
-                SfContact.email.ilike(search_pattern),
-                SfContact.npi.ilike(search_pattern),
-            )
+            search_condition(CONTACT_LIST_SEARCH_COLUMNS, search, CONTACT_SEARCH_COLUMNS)
         )
     
     if specialty:
@@ -216,8 +251,7 @@ async def list_contacts(
     if panel_status:
         filters.append(SfContact.panel_status == panel_status)
     
-    if filters:
-        query = query.where(and_(*filters))
+    query = query.where(and_(*filters))
     
     # Count total
     count_query = select(func.count()).select_from(query.subquery())
@@ -268,6 +302,128 @@ async def list_contacts(
     )
 
 
+def load_filter_options(session: Session) -> ContactFilterOptions:
+    """Query the distinct values behind the contact filter dropdowns."""
+    # Get distinct specialties
+    specialty_query = (
+        select(distinct(SfContact.specialty))
+        .where(SfContact.specialty.isnot(None), SfContact.is_deleted.is_(False))
+        .order_by(SfContact.specialty)
+    )
+    specialties = [s for s in session.execute(specialty_query).scalars().all() if s]
+    
+    # Get distinct organizations
+    org_query = (
+        select(distinct(SfContact.contact_account_name))
+        .where(SfContact.contact_account_name.isnot(None), SfContact.is_deleted.is_(False))
+        .order_by(SfContact.contact_account_name)
+    )
+    organizations = [o for o in session.execute(org_query).scalars().all() if o]
+    
+    # Get distinct cities
+    city_query = (
+        select(distinct(SfContact.mailing_city))
+        .where(SfContact.mailing_city.isnot(None), SfContact.is_deleted.is_(False))
+        .order_by(SfContact.mailing_city)
+    )
+    cities = [c for c in session.execute(city_query).scalars().all() if c]
+    
+    # Get distinct states
+    state_query = (
+        select(distinct(SfContact.mailing_state))
+        .where(SfContact.mailing_state.isnot(None), SfContact.is_deleted.is_(False))
+        .order_by(SfContact.mailing_state)
+    )
+    states = [s for s in session.execute(state_query).scalars().all() if s]
+    
+    # Get distinct geographies
+    geo_query = (
+        select(distinct(SfContact.geography))
+        .where(SfContact.geography.isnot(None), SfContact.is_deleted.is_(False))
+        .order_by(SfContact.geography)
+    )
+    geographies = [g for g in session.execute(geo_query).scalars().all() if g]
+    
+    # Get distinct panel statuses
+    panel_query = (
+        select(distinct(SfContact.panel_status))
+        .where(SfContact.panel_status.isnot(None), SfContact.is_deleted.is_(False))
+        .order_by(SfContact.panel_status)
+    )
+    panel_statuses = [p for p in session.execute(panel_query).scalars().all() if p]
+    
+    return ContactFilterOptions(
+        specialties=specialties,
+        organizations=organizations,
+        cities=cities,
+        states=states,
+        geographies=geographies,
+        panel_statuses=panel_statuses,
+    )
+
+
+@router.get("/search", response_model=ContactSearchResponse)
+async def search_contacts(
+    q: str = Query(..., min_length=2, description="Search term; each word matches as a prefix"),
+    limit: int = Query(TYPEAHEAD_DEFAULT_LIMIT, ge=1, le=TYPEAHEAD_MAX_LIMIT),
+    active: Optional[bool] = Query(True),
+    session: Session = Depends(db_session),
+):
+    """
+    Ranked typeahead search over contact names, specialty, email and NPI.
+    
+    Served by the contact search index; contacts whose name starts with the
+    whole term rank first.
+    """
+    score = search_rank(CONTACT_SEARCH_COLUMNS, q).label("score")
+    query = select(
+        SfContact.id,
+        SfContact.salesforce_id,
+        SfContact.name,
+        SfContact.specialty,
+        SfContact.contact_account_name,
+        score,
+    ).where(
+        search_condition(CONTACT_SEARCH_COLUMNS, q),
+        SfContact.is_deleted.is_(False),
+    )
+    
+    if active is not None:
+        query = query.where(SfContact.active == active)
+    
+    query = query.order_by(score.desc(), SfContact.name, SfContact.id).limit(limit)
+    
+    return ContactSearchResponse(
+        query=q,
+        items=[
+            ContactSearchResult(
+                id=str(row.id),
+                salesforce_id=row.salesforce_id,
+                name=row.name,
+                specialty=row.specialty,
+                organization=row.contact_account_name,
+                score=row.score,
+            )
+            for row in session.execute(query)
+        ],
+    )
+
+
+@router.get("/filter-options", response_model=ContactFilterOptions)
+async def get_filter_options(
+    request: Request,
+    session: Session = Depends(db_session),
+):
+    """
+    Get available filter options for contacts.
+    
+    Returns distinct values for various filter fields. Values are cached
+    until the next contact sync and revalidated with ETag/If-None-Match.
+    """
+    options = FilterOptionsCache.get(FilterOptionsCache.CONTACTS, session, load_filter_options)
+    return filter_options_response(request, options)
+
+
 @router.get("/{contact_id}", response_model=ContactDetail)
 async def get_contact_detail(
     contact_id: str,
@@ -280,7 +436,8 @@ async def get_contact_detail(
         or_(
             SfContact.id == contact_id,
             SfContact.salesforce_id == contact_id,
-        )
+        ),
+        SfContact.is_deleted.is_(False),
     )
     
     contact = session.execute(query).scalar_one_or_none()
@@ -328,70 +485,3 @@ async def get_contact_detail(
         network_picklist=contact.network_picklist,
         panel_status=contact.panel_status,
     )
-
-
-@router.get("/filter-options", response_model=ContactFilterOptions)
-async def get_filter_options(
-    session: Session = Depends(db_session),
-):
-    """
-    Get available filter options for contacts.
-    
-    Returns distinct values for various filter fields.
-    """
-    # Get distinct specialties
-    specialty_query = (
-        select(distinct(SfContact.specialty))
-        .where(SfContact.specialty.isnot(None))
-        .order_by(SfContact.specialty)
-    )
-    specialties = [s for s in session.execute(specialty_query).scalars().all() if s]
-    
-    # Get distinct organizations
-    org_query = (
-        select(distinct(SfContact.contact_account_name))
-        .where(SfContact.contact_account_name.isnot(None))
-        .order_by(SfContact.contact_account_name)
-    )
-    organizations = [o for o in session.execute(org_query).scalars().all() if o]
-    
-    # Get distinct cities
-    city_query = (
-        select(distinct(SfContact.mailing_city))
-        .where(SfContact.mailing_city.isnot(None))
-        .order_by(SfContact.mailing_city)
-    )
-    cities = [c for c in session.execute(city_query).scalars().all() if c]
-    
-    # Get distinct states
-    state_query = (
-        select(distinct(SfContact.mailing_state))
-        .where(SfContact.mailing_state.isnot(None))
-        .order_by(SfContact.mailing_state)
-    )
-    states = [s for s in session.execute(state_query).scalars().all() if s]
-    
-    # Get distinct geographies
-    geo_query = (
-        select(distinct(SfContact.geography))
-        .where(SfContact.geography.isnot(None))
-        .order_by(SfContact.geography)
-    )
-    geographies = [g for g in session.execute(geo_query).scalars().all() if g]
-    
-    # Get distinct panel statuses
-    panel_query = (
-        select(distinct(SfContact.panel_status))
-        .where(SfContact.panel_status.isnot(None))
-        .order_by(SfContact.panel_status)
-    )
-    panel_statuses = [p for p in session.execute(panel_query).scalars().all() if p]
-    
-    return ContactFilterOptions(
-        specialties=specialties,
-        organizations=organizations,
-        cities=cities,
-        states=states,
-        geographies=geographies,
-        panel_statuses=panel_statuses,
-    )
\ No newline at end of file
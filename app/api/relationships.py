@@ -8,11 +8,13 @@ and contacts/providers/sites.
 from typing import List, Optional
 from uuid import UUID
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Request
 from sqlalchemy.orm import Session
 
 from database.session import db_session
 from services.relationship_service import RelationshipService
+from services.filter_options_cache import FilterOptionsCache, filter_options_response
+from services.pagination import COUNT_MODE_PATTERN, InvalidCursorError
 from schemas.relationship_schema import (
     RelationshipListResponse,
     RelationshipDetail,
@@ -40,6 +42,8 @@ async def list_relationships(
         pattern="^(last_activity_date|entity_name|relationship_status|lead_score|created_at)$"
     ),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor; replaces page"),
+    count_mode: str = Query("exact", pattern=COUNT_MODE_PATTERN, description="Total count: exact, estimate or none"),
     
     # User filters
     user_ids: Optional[List[int]] = Query(None, description="Filter by user IDs"),
@@ -98,39 +102,51 @@ async def list_relationships(
     )
     
     service = RelationshipService(session)
-    items, total_count = service.list_relationships(
-        filters=filters,
-        page=page,
-        page_size=page_size,
-        sort_by=sort_by,
-        sort_order=sort_order
-    )
+    try:
+        result = service.list_relationships(
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    total_pages = (total_count + page_size - 1) // page_size
+    total_count = result.total
+    total_pages = (total_count + page_size - 1) // page_size if total_count is not None else None
     
     return RelationshipListResponse(
-        items=items,
+        items=result.items,
         total_count=total_count,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        total_is_estimate=result.total_is_estimate,
+        next_cursor=result.next_cursor
     )
 
 
 @router.get("/filter-options", response_model=FilterOptionsResponse)
 async def get_filter_options(
+    request: Request,
     session: Session = Depends(db_session)
 ):
     """
     Get available filter options for dropdowns.
     
     Returns lists of users, entity types, statuses, campaigns, etc.
-    that can be used to populate filter dropdowns in the UI.
+    that can be used to populate filter dropdowns in the UI. Values are
+    cached and revalidated with ETag/If-None-Match.
     """
-    service = RelationshipService(session)
-    options = service.get_filter_options()
-    
-    return FilterOptionsResponse(**options)
+    options = FilterOptionsCache.get(
+        FilterOptionsCache.RELATIONSHIPS,
+        session,
+        lambda db: FilterOptionsResponse(**RelationshipService(db).get_filter_options())
+    )
+    return filter_options_response(request, options)
 
 
 @router.get("/{relationship_id}", response_model=RelationshipDetail)
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+"""
+Event Loop Module
+
+This module runs one asyncio event loop per process in a daemon thread.
+Synchronous code (Celery tasks, Workflow.run, the sync shim of async nodes)
+hands coroutines to it and blocks until they finish, so any number of
+threads can wait on LLM calls while a single loop interleaves them, and
+async HTTP clients always keep their connections on the same loop.
+"""
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Returns the process-wide event loop, starting its thread on first use."""
+    global _loop
+    with _lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="workflow-event-loop", daemon=True
+            )
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine on the process-wide event loop and waits for its result.
+
+    Args:
+        coroutine: The coroutine to run
+
+    Returns:
+        Whatever the coroutine returns
+
+    Raises:
+        RuntimeError: If called from the event loop's own thread, where
+            waiting would deadlock; await the coroutine there instead
+        Exception: Any exception raised by the coroutine
+    """
+    loop = get_event_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coroutine.close()
+        raise RuntimeError(
+            "run_coroutine cannot wait on the shared event loop from its own thread"
+        )
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
@@ -0,0 +1,59 @@
+from typing import Dict, FrozenSet, Optional, Type
+
+from core.nodes.base import Node
+from core.schema import NodeConfig, WorkflowSchema
+from core.validate import WorkflowValidator
+
+"""
+Workflow Graph Module
+
+This module compiles a WorkflowSchema into the indexes a workflow needs at
+run time: the configuration of every node and, for every node, the node that
+follows it (or whether a router decides). A schema is compiled and validated
+once per workflow class (see Workflow.compile), so constructing a workflow
+and moving from one node to the next are dictionary lookups however many
+nodes the workflow has.
+"""
+
+
+class WorkflowGraph:
+    """Compiled, validated form of a WorkflowSchema.
+
+    Attributes:
+        schema: The schema the graph was compiled from
+        node_configs: Configuration of every node, including nodes that only
+            appear as connections (with an empty configuration)
+        routers: The node classes whose next node is chosen by routing
+        transitions: The next node of every node that is not a router, or
+            None where the workflow ends
+    """
+
+    def __init__(self, schema: WorkflowSchema):
+        """Validates a workflow schema and compiles its indexes.
+
+        Args:
+            schema: The WorkflowSchema to compile
+
+        Raises:
+            ValueError: If the schema is not a valid workflow
+        """
+        validator = WorkflowValidator(schema)
+        validator.validate()
+
+        self.schema = schema
+        self.node_configs: Dict[Type[Node], NodeConfig] = dict(validator.node_configs)
+        for node_config in schema.nodes:
+            for connected_node in node_config.connections:
+                if connected_node not in self.node_configs:
+                    self.node_configs[connected_node] = NodeConfig(node=connected_node)
+
+        self.routers: FrozenSet[Type[Node]] = frozenset(
+            node_config.node
+            for node_config in schema.nodes
+            if node_config.is_router and node_config.connections
+        )
+        self.transitions: Dict[Type[Node], Optional[Type[Node]]] = {
+            node: (node_config.connections[0] if node_config.connections else None)
+            for node, node_config in self.node_configs.items()
+            if node not in self.routers
+        }
@@ -1,18 +1,62 @@
 import base64
 import os
+import threading
+from typing import Any, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.trace import TracerProvider, Tracer
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace import Tracer
+from pydantic import BaseModel
+from pydantic_core import to_json
 
 load_dotenv()
 
+"""
+Langfuse Tracing Configuration Module
+
+Workflows and agents trace through logfire's OpenTelemetry provider, which
+is configured once per process. Spans are exported to Langfuse over OTLP
+(when OTEL_EXPORTER_OTLP_ENDPOINT is set) by a BatchSpanProcessor, in the
+background. Settings, read from the environment:
+
+- WORKFLOW_TRACE_SAMPLE_RATE: share of workflow runs traced (head
+  sampling, 0.0 to 1.0); the spans of a run that is not sampled, including
+  its agents' spans, cost next to nothing,
+- WORKFLOW_SPAN_ATTRIBUTE_MAX_BYTES: the most a span attribute (such as
+  the serialized task context) may hold; longer values are truncated,
+- WORKFLOW_TRACE_SCRUBBING: whether logfire redacts values that look like
+  secrets from span attributes; it searches every attribute when a span
+  ends, which makes it the largest per-span cost of tracing.
+
+Span attributes are only serialized for spans that record, and a task
+context is serialized only as far as the byte cap, so tracing a run costs
+the same whether its event holds ten activities or ten thousand.
+"""
+
+WORKFLOW_TRACE_SAMPLE_RATE = float(os.getenv("WORKFLOW_TRACE_SAMPLE_RATE", "1.0"))
+WORKFLOW_SPAN_ATTRIBUTE_MAX_BYTES = int(
+    os.getenv("WORKFLOW_SPAN_ATTRIBUTE_MAX_BYTES", "4096")
+)
+WORKFLOW_TRACE_SCRUBBING = os.getenv("WORKFLOW_TRACE_SCRUBBING", "true").lower() == "true"
+
+_tracer: Optional[Tracer] = None
+_lock = threading.Lock()
+
 
 class LangfuseConfig:
     @staticmethod
     def get_tracer() -> Tracer:
+        """Returns the process-wide workflow tracer, configuring tracing on first use."""
+        global _tracer
+        if _tracer is None:
+            with _lock:
+                if _tracer is None:
+                    LangfuseConfig._configure()
+                    _tracer = trace.get_tracer("workflow-tracer")
+        return _tracer
+
+    @staticmethod
+    def _configure():
         LANGFUSE_AUTH = base64.b64encode(
             f"{os.getenv('LANGFUSE_PUBLIC_KEY')}:{os.getenv('LANGFUSE_SECRET_KEY')}".encode()
         ).decode()
@@ -25,8 +69,111 @@ class LangfuseConfig:
 
         logfire.configure(
             send_to_logfire=False,
+            sampling=logfire.SamplingOptions(head=WORKFLOW_TRACE_SAMPLE_RATE),
+            scrubbing=None if WORKFLOW_TRACE_SCRUBBING else False,
         )
 
-        trace_provider = TracerProvider()
-        trace_provider.add_span_processor(SimpleSpanProcessor(OTLPSpanExporter()))
-        return trace.get_tracer("workflow-tracer")
+
+def truncate_attribute(
+    value: str, max_bytes: int = WORKFLOW_SPAN_ATTRIBUTE_MAX_BYTES
+) -> str:
+    """Truncates a span attribute value to max_bytes of UTF-8.
+
+    Args:
+        value: The attribute value
+        max_bytes: The size limit
+
+    Returns:
+        The value, or its first max_bytes followed by a note of how much was cut
+    """
+    # A character takes at most 4 bytes, so short values need no encoding
+    if len(value) * 4 <= max_bytes:
+        return value
+    encoded = value.encode()
+    if len(encoded) <= max_bytes:
+        return value
+    kept = encoded[:max_bytes].decode(errors="ignore")
+    return f"{kept}... [truncated {len(encoded) - max_bytes} bytes]"
+
+
+def serialize_attribute(
+    value: Any, max_bytes: int = WORKFLOW_SPAN_ATTRIBUTE_MAX_BYTES
+) -> str:
+    """Serializes a value to JSON for a span attribute, up to about max_bytes.
+
+    Models and dictionaries are walked field by field and lists element by
+    element, and serialization stops once max_bytes is reached: the lists
+    and dictionaries cut short end with a note of what was left out, long
+    strings are shortened, and the result is still valid JSON (so it can be
+    displayed and scrubbed as such). The cost does not grow with the size of
+    the value. List elements are serialized whole, so a single element may
+    go over the cap; if the result is then more than twice max_bytes, it is
+    truncated as by truncate_attribute().
+
+    Args:
+        value: The value to serialize
+        max_bytes: The size limit
+
+    Returns:
+        The JSON
+    """
+    parts: List[bytes] = []
+    size = 0
+
+    def emit(data: bytes):
+        nonlocal size
+        parts.append(data)
+        size += len(data)
+
+    def leaf(item: Any):
+        room = max(max_bytes - size, 0)
+        if isinstance(item, str) and len(item) > room:
+            item = f"{item[:room]}... [truncated {len(item) - room} characters]"
+        emit(to_json(item, fallback=str))
+
+    def walk(item: Any) -> bool:
+        """Serializes item and returns whether it fit in full."""
+        if isinstance(item, BaseModel):
+            return walk_items(
+                [(name, getattr(item, name)) for name in type(item).model_fields]
+            )
+        if isinstance(item, dict):
+            return walk_items(list(item.items()))
+        if isinstance(item, (list, tuple)):
+            emit(b"[")
+            for index, element in enumerate(item):
+                if index:
+                    emit(b",")
+                if size >= max_bytes:
+                    emit(to_json(f"... [{len(item) - index} more]") + b"]")
+                    return False
+                # Elements (say, one activity each) are serialized whole, by
+                # pydantic, which is much faster than walking them
+                if isinstance(element, (list, tuple)):
+                    if not walk(element):
+                        emit(b"]")
+                        return False
+                else:
+                    leaf(element)
+            emit(b"]")
+            return True
+        leaf(item)
+        return True
+
+    def walk_items(items: List[Tuple[Any, Any]]) -> bool:
+        emit(b"{")
+        for index, (key, element) in enumerate(items):
+            if index:
+                emit(b",")
+            if size >= max_bytes:
+                emit(b'"...":' + to_json(f"[{len(items) - index} more]") + b"}")
+                return False
+            emit(to_json(str(key)) + b":")
+            if not walk(element):
+                emit(b"}")
+                return False
+        emit(b"}")
+        return True
+
+    walk(value)
+    return truncate_attribute(b"".join(parts).decode(), 2 * max_bytes)
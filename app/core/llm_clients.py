@@ -0,0 +1,149 @@
+import asyncio
+import os
+import threading
+import weakref
+from enum import Enum
+from functools import lru_cache
+
+import boto3
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncAzureOpenAI
+from pydantic_ai.models import Model
+from pydantic_ai.models.anthropic import AnthropicModel
+from pydantic_ai.models.bedrock import BedrockConverseModel
+from pydantic_ai.models.gemini import GeminiModel
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers import Provider
+from pydantic_ai.providers.anthropic import AnthropicProvider
+from pydantic_ai.providers.bedrock import BedrockProvider
+from pydantic_ai.providers.google_gla import GoogleGLAProvider
+from pydantic_ai.providers.openai import OpenAIProvider
+
+load_dotenv()
+
+"""
+LLM Clients Module
+
+This module owns the LLM clients shared by every AgentNode in the process.
+Each model provider gets one provider object, and with it one HTTP client
+and connection pool (or one boto3 client for Bedrock); each provider and
+model name pair gets one model. They are created on first use and live for
+the rest of the process, so a workflow run pays for none of them.
+"""
+
+# Seconds an LLM response may take, and to establish a connection (the
+# defaults of pydantic-ai's own shared client)
+LLM_HTTP_TIMEOUT = float(os.getenv("LLM_HTTP_TIMEOUT", "600"))
+LLM_HTTP_CONNECT_TIMEOUT = float(os.getenv("LLM_HTTP_CONNECT_TIMEOUT", "5"))
+
+_lock = threading.Lock()
+
+
+class ModelProvider(str, Enum):
+    OPENAI = "openai"
+    AZURE_OPENAI = "azure_openai"
+    ANTHROPIC = "anthropic"
+    GEMINI = "gemini"
+    OLLAMA = "ollama"
+    BEDROCK = "bedrock"
+
+
+class LoopLocalTransport(httpx.AsyncBaseTransport):
+    """HTTP transport that keeps one connection pool per event loop.
+
+    Pooled connections belong to the loop that opened them. Workflows run on
+    the process-wide loop (see core.event_loop), so normally there is one
+    pool; a client shared with code running on another loop (agent.run_sync
+    in a worker thread, asyncio.run in a script) gets a pool of its own there
+    instead of reusing connections it cannot use.
+    """
+
+    def __init__(self):
+        self._transports = weakref.WeakKeyDictionary()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            transport = self._transports[loop] = httpx.AsyncHTTPTransport()
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+@lru_cache(maxsize=None)
+def get_http_client(provider: ModelProvider) -> httpx.AsyncClient:
+    """Returns the HTTP client shared by all calls to a model provider."""
+    return httpx.AsyncClient(
+        transport=LoopLocalTransport(),
+        timeout=httpx.Timeout(LLM_HTTP_TIMEOUT, connect=LLM_HTTP_CONNECT_TIMEOUT),
+    )
+
+
+def get_model(provider: ModelProvider, model_name: str) -> Model:
+    """Returns the shared model instance for a provider and model name.
+
+    Args:
+        provider: The provider serving the model
+        model_name: The provider's name for the model
+
+    Returns:
+        A pydantic-ai model, created on first use
+    """
+    # Providers read credentials from the environment when created; create
+    # each one once even when several threads build their nodes at once
+    with _lock:
+        return _get_model(provider, model_name)
+
+
+@lru_cache(maxsize=None)
+def _get_model(provider: ModelProvider, model_name: str) -> Model:
+    match provider:
+        case ModelProvider.OPENAI:
+            return OpenAIModel(model_name, provider=_get_provider(provider))
+        case ModelProvider.AZURE_OPENAI:
+            return OpenAIModel(model_name, provider=_get_provider(provider))
+        case ModelProvider.ANTHROPIC:
+            return AnthropicModel(model_name=model_name, provider=_get_provider(provider))
+        case ModelProvider.GEMINI:
+            return GeminiModel(model_name=model_name, provider=_get_provider(provider))
+        case ModelProvider.OLLAMA:
+            return OpenAIModel(model_name=model_name, provider=_get_provider(provider))
+        case ModelProvider.BEDROCK:
+            return BedrockConverseModel(
+                model_name=model_name, provider=_get_provider(provider)
+            )
+        case _:
+            return _get_model(ModelProvider.OPENAI, "gpt-4.1")
+
+
+@lru_cache(maxsize=None)
+def _get_provider(provider: ModelProvider) -> Provider:
+    match provider:
+        case ModelProvider.OPENAI:
+            return OpenAIProvider(http_client=get_http_client(provider))
+        case ModelProvider.AZURE_OPENAI:
+            return OpenAIProvider(
+                openai_client=AsyncAzureOpenAI(http_client=get_http_client(provider))
+            )
+        case ModelProvider.ANTHROPIC:
+            return AnthropicProvider(http_client=get_http_client(provider))
+        case ModelProvider.GEMINI:
+            return GoogleGLAProvider(http_client=get_http_client(provider))
+        case ModelProvider.OLLAMA:
+            base_url = os.getenv("OLLAMA_BASE_URL")
+            if not base_url:
+                raise KeyError("OLLAMA_BASE_URL not set in .env")
+            return OpenAIProvider(base_url=base_url, http_client=get_http_client(provider))
+        case ModelProvider.BEDROCK:
+            bedrock_client = boto3.client(
+                "bedrock-runtime",
+                region_name=os.getenv("BEDROCK_AWS_REGION"),
+                aws_access_key_id=os.getenv("BEDROCK_AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("BEDROCK_AWS_SECRET_ACCESS_KEY"),
+            )
+            return BedrockProvider(bedrock_client=bedrock_client)
@@ -1,4 +1,8 @@
+import asyncio
+import threading
 from abc import ABC, abstractmethod
+from typing import ClassVar, Dict, Type
+
 from core.task import TaskContext
 
 """
@@ -9,6 +13,10 @@ It implements the Chain of Responsibility pattern, allowing nodes to process tas
 sequentially and pass results to the next node in the chain.
 """
 
+_instances: Dict[Type["Node"], "Node"] = {}
+# Reentrant: constructing a node may get the instances of others (routers)
+_instances_lock = threading.RLock()
+
 
 class Node(ABC):
     """Abstract base class for all workflow processing nodes.
@@ -23,10 +31,42 @@ class Node(ABC):
     2. Perform its specific processing
     3. Pass the updated context to the next node
 
+    Workflow.arun calls aprocess() instead. Its default runs process() in a
+    worker thread, so nodes written against the synchronous contract keep
+    working without blocking the event loop; nodes that wait on I/O (LLM
+    calls, HTTP) override aprocess() to await it natively.
+
+    One instance of each node class serves every run in the process (see
+    get_instance), including runs going on at the same time. Everything that
+    belongs to a single run lives in the TaskContext; attributes set in
+    __init__ are configuration and clients shared by all runs.
+
     Attributes:
         node_name: Auto-generated name based on the class name
+        reuse_instance: Set to False on nodes that keep run state on the
+            instance, to get a fresh instance for every run instead
     """
 
+    reuse_instance: ClassVar[bool] = True
+
+    @classmethod
+    def get_instance(cls) -> "Node":
+        """Gets the instance of this node class to run.
+
+        Returns:
+            The process-wide instance, created on first use, or a new
+            instance if reuse_instance is False
+        """
+        if not cls.reuse_instance:
+            return cls()
+        instance = _instances.get(cls)
+        if instance is None:
+            with _instances_lock:
+                instance = _instances.get(cls)
+                if instance is None:
+                    instance = _instances[cls] = cls()
+        return instance
+
     @property
     def node_name(self) -> str:
         """Gets the name of the node.
@@ -56,3 +96,18 @@ class Node(ABC):
             2. Store results in task_context.nodes[self.node_name]
         """
         pass
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        """Processes the task context without blocking the event loop.
+
+        This is the asynchronous counterpart of process(), used by
+        Workflow.arun. The default implementation is a shim that runs
+        process() in a worker thread.
+
+        Args:
+            task_context: The shared context object passed through the workflow
+
+        Returns:
+            Updated TaskContext with this node's processing results
+        """
+        return await asyncio.to_thread(self.process, task_context)
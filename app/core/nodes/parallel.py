@@ -1,9 +1,9 @@
-import asyncio
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, List
+from typing import List
 
+from core.event_loop import run_coroutine
 from core.nodes.base import Node
+from core.scheduler import run_branches
 from core.schema import NodeConfig
 from core.task import TaskContext
 
@@ -13,21 +13,43 @@ class ParallelNode(Node, ABC):
     Represents a node capable of executing other nodes in parallel.
 
     This abstract class serves as the base class for implementing nodes
-    that process tasks concurrently using multithreading. Subclasses
-    must implement the `process` method to define specific processing
-    logic.
+    that run the nodes listed in their parallel_nodes concurrently, such as
+    a set of guardrail checks, and then act on the combined results.
+    Subclasses must implement the `process` method to define specific
+    processing logic.
+
+    Branches are scheduled by core.scheduler: independent branches run at
+    the same time (synchronous ones on a thread pool shared by all runs,
+    async ones on the event loop), each on its own copy of the task context,
+    and their results are merged back into the task context in a fixed
+    order once all of them have finished. A branch whose NodeConfig connects
+    to another branch runs first and its results are visible to that branch.
+
+    A ParallelNode can itself be a branch only if it overrides aprocess() to
+    await aexecute_nodes_in_parallel(); a synchronous one would hold a pool
+    thread while its branches wait for another, so the validator rejects it.
     """
 
-    def execute_nodes_in_parallel(self, task_context: TaskContext):
+    def execute_nodes_in_parallel(self, task_context: TaskContext) -> List[TaskContext]:
+        """Runs the parallel nodes and merges their results into the context.
+
+        Must not be called from the event loop's own thread; async code
+        awaits aexecute_nodes_in_parallel() instead.
+
+        Args:
+            task_context: The context of the run, updated in place
+
+        Returns:
+            The context each branch returned, in the order they are listed
+        """
+        return run_coroutine(self.aexecute_nodes_in_parallel(task_context))
+
+    async def aexecute_nodes_in_parallel(
+        self, task_context: TaskContext
+    ) -> List[TaskContext]:
+        """Asynchronous counterpart of execute_nodes_in_parallel()."""
         node_config: NodeConfig = task_context.metadata["nodes"][self.__class__]
-        future_list = []
-        with ThreadPoolExecutor() as executor:
-            for node in node_config.parallel_nodes:
-                future = executor.submit(node().process, task_context)
-                future_list.append(future)
-
-            results = [future.result() for future in future_list]
-        return results
+        return await run_branches(node_config.parallel_nodes or [], task_context)
 
     @abstractmethod
     def process(self, task_context: TaskContext) -> TaskContext:
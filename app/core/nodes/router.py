@@ -20,6 +20,10 @@ class BaseRouter(Node):
     task flow between workflow nodes. It processes routing rules in sequence
     and falls back to a default node if no rules match.
 
+    Routers are shared by every run like other nodes. Routing only needs
+    the class of the node chosen, so rules and fallbacks should return
+    NodeClass.get_instance() rather than constructing a node each time.
+
     Attributes:
         routes: List of RouterNode instances defining routing rules
         fallback: Optional default node to route to if no rules match
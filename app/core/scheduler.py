@@ -0,0 +1,125 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple, Type
+
+from core.nodes.base import Node
+from core.schema import NodeConfig
+from core.task import TaskContext
+
+"""
+Branch Scheduler Module
+
+This module runs the branches of a ParallelNode. Branches are scheduled in
+topological order: a branch starts as soon as the branches it depends on
+(those whose NodeConfig connects to it) have finished, so independent
+branches run at the same time and a fan-out takes as long as its slowest
+branch. Every branch works on its own copy of the task context; once all of
+them have finished, their results are merged back in a fixed order, so the
+merged context does not depend on which branch happened to finish first.
+"""
+
+# Threads shared by every run in the process for branches written against
+# the synchronous contract; branches with a native aprocess() run on the
+# event loop and take none
+WORKFLOW_BRANCH_WORKERS = int(os.getenv("WORKFLOW_BRANCH_WORKERS", "32"))
+
+
+@lru_cache(maxsize=None)
+def get_branch_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool shared by the synchronous branches of all runs."""
+    return ThreadPoolExecutor(
+        max_workers=WORKFLOW_BRANCH_WORKERS, thread_name_prefix="workflow-branch"
+    )
+
+
+def topological_order(
+    branches: Sequence[Type[Node]], node_configs: Dict[Type[Node], NodeConfig]
+) -> Tuple[List[Type[Node]], Dict[Type[Node], List[Type[Node]]]]:
+    """Orders branches so that each one comes after the branches it depends on.
+
+    Branches that do not depend on each other keep the order they are
+    listed in.
+
+    Args:
+        branches: The branch node classes, as listed in parallel_nodes
+        node_configs: The workflow's node configurations by node class
+
+    Returns:
+        The ordered branches, and the branches each one depends on
+
+    Raises:
+        ValueError: If the branches depend on each other in a cycle
+    """
+    dependencies: Dict[Type[Node], List[Type[Node]]] = {node: [] for node in branches}
+    for node in branches:
+        node_config = node_configs.get(node)
+        for connection in node_config.connections if node_config else []:
+            if connection in dependencies and node not in dependencies[connection]:
+                dependencies[connection].append(node)
+
+    order: List[Type[Node]] = []
+    pending = list(dependencies)
+    while pending:
+        placed = set(order)
+        ready = [node for node in pending if placed.issuperset(dependencies[node])]
+        if not ready:
+            raise ValueError(f"Parallel nodes depend on each other in a cycle: {pending}")
+        order.extend(ready)
+        pending = [node for node in pending if node not in ready]
+    return order, dependencies
+
+
+async def run_branches(
+    branches: Sequence[Type[Node]], task_context: TaskContext
+) -> List[TaskContext]:
+    """Runs branch nodes concurrently and merges their results into the context.
+
+    Each branch gets a copy of the task context holding the results of the
+    branches it depends on. When every branch has finished, the nodes and
+    metadata each branch changed are merged into task_context in topological
+    order; if independent branches write the same key, the one listed last
+    wins. If a branch fails, the branches still pending are cancelled and the
+    error is raised without merging anything.
+
+    Args:
+        branches: The branch node classes, as listed in parallel_nodes
+        task_context: The context of the run, updated in place
+
+    Returns:
+        The context each branch returned, in the order the branches are listed
+    """
+    order, dependencies = topological_order(
+        branches, task_context.metadata.get("nodes", {})
+    )
+
+    async def run_branch(node_class: Type[Node]) -> Tuple[TaskContext, TaskContext]:
+        inputs = await asyncio.gather(*(tasks[node] for node in dependencies[node_class]))
+        branch_input = task_context.fork()
+        for dependency_input, dependency_output in inputs:
+            branch_input.merge(dependency_output, since=dependency_input)
+        return branch_input, await _process(node_class.get_instance(), branch_input.fork())
+
+    tasks: Dict[Type[Node], asyncio.Future] = {}
+    for node_class in order:
+        tasks[node_class] = asyncio.ensure_future(run_branch(node_class))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    for node_class in order:
+        branch_input, branch_output = tasks[node_class].result()
+        task_context.merge(branch_output, since=branch_input)
+    return [tasks[node_class].result()[1] for node_class in branches]
+
+
+async def _process(node: Node, task_context: TaskContext) -> TaskContext:
+    if type(node).aprocess is Node.aprocess:
+        # Synchronous node: run it on the shared, bounded branch pool
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_branch_executor(), node.process, task_context)
+    return await node.aprocess(task_context)
@@ -42,3 +42,37 @@ class TaskContext(BaseModel):
 
     def update_node(self, node_name: str, **kwargs):
         self.nodes[node_name] = {**self.nodes.get(node_name, {}), **kwargs}
+
+    def fork(self) -> "TaskContext":
+        """Copies the context for a branch that runs alongside others.
+
+        The nodes and metadata dictionaries (and each node's own dictionary)
+        are copied, so a branch can update them freely; the event and the
+        values stored in them are shared.
+
+        Returns:
+            A new TaskContext with the same state
+        """
+        return self.model_copy(
+            update={
+                "nodes": {
+                    name: dict(state) if isinstance(state, dict) else state
+                    for name, state in self.nodes.items()
+                },
+                "metadata": dict(self.metadata),
+            }
+        )
+
+    def merge(self, branch: "TaskContext", since: "TaskContext"):
+        """Applies the changes a branch made to its copy of the context.
+
+        Args:
+            branch: The context the branch returned
+            since: The context the branch started from
+        """
+        for name, state in branch.nodes.items():
+            if name not in since.nodes or since.nodes[name] != state:
+                self.nodes[name] = state
+        for key, value in branch.metadata.items():
+            if key not in since.metadata or since.metadata[key] is not value:
+                self.metadata[key] = value
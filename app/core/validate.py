@@ -2,7 +2,8 @@ from collections import deque
 from typing import Dict, Any, List, Set, Type
 
 from core.nodes.base import Node
-from core.schema import WorkflowSchema
+from core.nodes.parallel import ParallelNode
+from core.schema import NodeConfig, WorkflowSchema
 
 """
 Workflow Validator Module
@@ -36,6 +37,11 @@ class WorkflowValidator:
             workflow_schema: The WorkflowSchema to validate
         """
         self.workflow_schema = workflow_schema
+        # Index the configurations once, so walking the graph is linear in
+        # its size (the first configuration of a node wins, as it always has)
+        self.node_configs: Dict[Type[Node], NodeConfig] = {}
+        for node_config in workflow_schema.nodes:
+            self.node_configs.setdefault(node_config.node, node_config)
 
     def validate(self):
         """Validates all aspects of the workflow schema.
@@ -48,12 +54,14 @@ class WorkflowValidator:
         """
         self._validate_dag()
         self._validate_connections()
+        self._validate_parallel_nodes()
 
     def _validate_dag(self):
         """Validates that the workflow schema forms a proper DAG.
 
         Checks for cycles and ensures all nodes are reachable
-        from the start node.
+        from the start node. The parallel nodes of a node count as
+        reachable from it, and may connect to each other.
 
         Raises:
             ValueError: If the workflow contains cycles or unreachable nodes
@@ -62,44 +70,50 @@ class WorkflowValidator:
             raise ValueError("Workflow schema contains a cycle")
 
         reachable_nodes = self._get_reachable_nodes()
-        all_nodes = set(nc.node for nc in self.workflow_schema.nodes)
+        all_nodes = set(self.node_configs)
         unreachable_nodes = all_nodes - reachable_nodes
         if unreachable_nodes:
             raise ValueError(
                 f"The following nodes are unreachable: {unreachable_nodes}"
             )
 
+    def _neighbors(self, node: Type[Node]) -> List[Type[Node]]:
+        node_config = self.node_configs.get(node)
+        if not node_config:
+            return []
+        return node_config.connections + (node_config.parallel_nodes or [])
+
     def _has_cycle(self) -> bool:
         """Detects cycles in the workflow graph using DFS.
 
+        The search keeps its own stack rather than recursing, so generated
+        workflows with long chains of nodes do not hit the recursion limit.
+
         Returns:
             bool: True if a cycle is detected, False otherwise
         """
         visited = set()
         rec_stack = set()
 
-        def dfs(node: Type[Node]) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-
-            node_config = next(
-                (nc for nc in self.workflow_schema.nodes if nc.node == node), None
-            )
-            if node_config:
-                for neighbor in node_config.connections:
-                    if neighbor not in visited:
-                        if dfs(neighbor):
-                            return True
-                    elif neighbor in rec_stack:
+        for root in self.node_configs:
+            if root in visited:
+                continue
+            visited.add(root)
+            rec_stack.add(root)
+            stack = [(root, iter(self._neighbors(root)))]
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor in rec_stack:
                         return True
-
-            rec_stack.remove(node)
-            return False
-
-        for node_config in self.workflow_schema.nodes:
-            if node_config.node not in visited:
-                if dfs(node_config.node):
-                    return True
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        rec_stack.add(neighbor)
+                        stack.append((neighbor, iter(self._neighbors(neighbor))))
+                        break
+                else:
+                    stack.pop()
+                    rec_stack.remove(node)
 
         return False
 
@@ -116,11 +130,7 @@ class WorkflowValidator:
             node = queue.popleft()
             if node not in reachable:
                 reachable.add(node)
-                node_config = next(
-                    (nc for nc in self.workflow_schema.nodes if nc.node == node), None
-                )
-                if node_config:
-                    queue.extend(node_config.connections)
+                queue.extend(self._neighbors(node))
 
         return reachable
 
@@ -137,3 +147,24 @@ class WorkflowValidator:
                 raise ValueError(
                     f"Node {node_config.node.__name__} has multiple connections but is not marked as a router."
                 )
+
+    def _validate_parallel_nodes(self):
+        """Validates that parallel nodes do not nest synchronous fan-outs.
+
+        Synchronous branches run on the shared branch pool, so a synchronous
+        ParallelNode used as a branch would hold a pool thread while waiting
+        on branches that need pool threads of their own; enough of them at
+        once deadlock the pool. A nested ParallelNode must override aprocess()
+        to await aexecute_nodes_in_parallel() on the event loop instead.
+
+        Raises:
+            ValueError: If a synchronous ParallelNode is a parallel node
+        """
+        for node_config in self.workflow_schema.nodes:
+            for branch in node_config.parallel_nodes or []:
+                if issubclass(branch, ParallelNode) and branch.aprocess is Node.aprocess:
+                    raise ValueError(
+                        f"Parallel node {branch.__name__} of {node_config.node.__name__} is a "
+                        f"synchronous ParallelNode; override aprocess() to await "
+                        f"aexecute_nodes_in_parallel()."
+                    )
@@ -6,12 +6,16 @@ from typing import Dict, Optional, ClassVar, Type, Any
 from dotenv import load_dotenv
 from opentelemetry.sdk.trace import Span
 
-from core.langfuse_config import LangfuseConfig
+from core.graph import WorkflowGraph
+from core.langfuse_config import (
+    LangfuseConfig,
+    serialize_attribute,
+    truncate_attribute,
+)
 from core.nodes.base import Node
 from core.nodes.router import BaseRouter
 from core.schema import WorkflowSchema, NodeConfig
 from core.task import TaskContext
-from core.validate import WorkflowValidator
 
 load_dotenv()
 
@@ -31,10 +35,13 @@ class Workflow(ABC):
     with multiple nodes and routing logic. Each workflow must define its structure
     using a WorkflowSchema.
 
+    The schema is validated and compiled into a WorkflowGraph once per
+    class, on first construction; later workflows of the class reuse it.
+
     Attributes:
         workflow_schema: Class variable defining the workflow's structure and flow
-        validator: Validates the workflow schema
-        nodes: Dictionary mapping node classes to their instances
+        graph: The compiled, validated workflow schema
+        nodes: Dictionary mapping node classes to their configurations
 
     Example:
         class SupportWorkflow(Workflow):
@@ -50,12 +57,31 @@ class Workflow(ABC):
     workflow_schema: ClassVar[WorkflowSchema]
 
     def __init__(self):
-        """Initializes the workflow by validating schema and creating nodes."""
-        self.validator = WorkflowValidator(self.workflow_schema)
-        self.validator.validate()
-        self.nodes: Dict[Type[Node], NodeConfig] = self._initialize_nodes()
+        """Initializes the workflow from its compiled schema."""
+        self.graph = self.compile()
+        self.nodes: Dict[Type[Node], NodeConfig] = self.graph.node_configs
         self.tracer = LangfuseConfig.get_tracer()
 
+    @classmethod
+    def compile(cls) -> WorkflowGraph:
+        """Gets the compiled graph of the workflow's schema.
+
+        The schema is validated and compiled the first time, and again only
+        if workflow_schema is replaced.
+
+        Returns:
+            The WorkflowGraph of the workflow class
+
+        Raises:
+            ValueError: If the schema is not a valid workflow
+        """
+        graph = cls.__dict__.get("_graph")
+        if graph is None or graph.schema is not cls.workflow_schema:
+            graph = WorkflowGraph(cls.workflow_schema)
+            # Set on this class, not inherited by subclasses with schemas of their own
+            cls._graph = graph
+        return graph
+
     @contextmanager
     def node_context(self, node_name: str):
         """Context manager for logging node execution and handling errors.
@@ -78,24 +104,12 @@ class Workflow(ABC):
         finally:
             logging.info(f"Finished node: {node_name}")
 
-    def _initialize_nodes(self) -> Dict[Type[Node], NodeConfig]:
-        """Initializes all nodes defined in the workflow schema.
-
-        Returns:
-            Dictionary mapping node classes to their instances
-        """
-        nodes = {}
-        for node_config in self.workflow_schema.nodes:
-            nodes[node_config.node] = node_config
-            for connected_node in node_config.connections:
-                if connected_node not in nodes:
-                    connected_node_config = NodeConfig(node=connected_node)
-                    nodes[connected_node] = connected_node_config
-        return nodes
-
     @staticmethod
     def _instantiate_node(node_class: Type[Node]) -> Node:
-        """Creates an instance of a node class.
+        """Gets the instance of a node class to run.
+
+        Node instances are shared by every run in the process (see
+        Node.get_instance); per-run state lives in the TaskContext.
 
         Args:
             node_class: The class of the node to instantiate
@@ -103,7 +117,7 @@ class Workflow(ABC):
         Returns:
             An instance of the specified node class
         """
-        return node_class()
+        return node_class.get_instance()
 
     def run(self, event: Any) -> TaskContext:
         """Executes the workflow for a given event.
@@ -121,72 +135,146 @@ class Workflow(ABC):
         with self.tracer.start_as_current_span(
             self.__class__.__name__
         ) as workflow_span:
-            task_context = TaskContext(event=event)
-            task_context.metadata["nodes"] = self.nodes
+            task_context = self._start_run(workflow_span, event)
 
-            # Parse the raw event to the Pydantic schema defined in the WorkflowSchema
-            task_context.event = self.workflow_schema.event_schema(**event)
+            current_node_class = self.graph.schema.start
+            while current_node_class:
+                with self._node_span(current_node_class, task_context) as node_span:
+                    with self.node_context(current_node_class.__name__):
+                        # Process the node
+                        current_node = self._instantiate_node(current_node_class)
+                        task_context = current_node.process(task_context)
 
-            self._set_span_input(workflow_span, task_context)
+                        # Capture the node's output and any model parameters added during processing
+                        self._set_span_output(node_span, task_context, current_node_class)
 
-            current_node_class = self.workflow_schema.start
-            while current_node_class:
-                with self.tracer.start_as_current_span(
-                    current_node_class.__name__
-                ) as node_span:
-                    self._set_span_input(node_span, task_context)
+                    current_node_class = self._get_next_node_class(current_node_class, task_context)
+
+            return self._finish_run(workflow_span, task_context)
+
+    async def arun(self, event: Any) -> TaskContext:
+        """Executes the workflow for a given event on the running event loop.
 
-                    current_node = self.nodes[current_node_class].node
+        Works like run(), but awaits each node's aprocess(), so while a node
+        waits on an LLM call the loop is free to drive other workflows.
+        Synchronous nodes run in worker threads (see Node.aprocess).
+
+        Args:
+            event: The event to process through the workflow
+
+        Returns:
+            TaskContext containing the results of workflow execution
+
+        Raises:
+            Exception: Any exception that occurs during workflow execution
+        """
+
+        with self.tracer.start_as_current_span(
+            self.__class__.__name__
+        ) as workflow_span:
+            task_context = self._start_run(workflow_span, event)
+
+            current_node_class = self.graph.schema.start
+            while current_node_class:
+                with self._node_span(current_node_class, task_context) as node_span:
                     with self.node_context(current_node_class.__name__):
                         # Process the node
-                        task_context = current_node().process(task_context)
+                        current_node = self._instantiate_node(current_node_class)
+                        task_context = await current_node.aprocess(task_context)
+
+                        # Capture the node's output and any model parameters added during processing
+                        self._set_span_output(node_span, task_context, current_node_class)
+
+                    current_node_class = self._get_next_node_class(current_node_class, task_context)
 
-                        # Capture any prompts or model parameters that were added during processing
-                        self._set_span_output(node_span, task_context)
+            return self._finish_run(workflow_span, task_context)
 
-                    # Set node-specific output
-                    node_span.set_attribute(
-                        "output",
-                        task_context.model_dump_json(
-                            include={"nodes": {current_node_class.__name__}}
-                        ),
-                    )
+    def _start_run(self, workflow_span: Span, event: Any) -> TaskContext:
+        """Creates the task context for a run and records the workflow input."""
+        task_context = TaskContext(event=event)
+        task_context.metadata["nodes"] = self.nodes
 
-                    current_node_class = self._get_next_node_class(
-                        current_node_class, task_context
-                    )
+        # Parse the raw event to the Pydantic schema defined in the WorkflowSchema
+        task_context.event = self.graph.schema.event_schema(**event)
 
-            self._set_span_output(workflow_span, task_context)
+        self._set_span_input(workflow_span, task_context)
+        return task_context
 
-            task_context.metadata.pop("nodes")
+    @contextmanager
+    def _node_span(self, node_class: Type[Node], task_context: TaskContext):
+        """Opens the span of one node and records its input."""
+        with self.tracer.start_as_current_span(node_class.__name__) as node_span:
+            self._set_span_input(node_span, task_context)
+            yield node_span
+
+    def _finish_run(self, workflow_span: Span, task_context: TaskContext) -> TaskContext:
+        """Records the workflow output and detaches the run's node registry."""
+        self._set_span_output(workflow_span, task_context)
+
+        task_context.metadata.pop("nodes")
 
-            return task_context
+        return task_context
 
     def _set_span_input(self, span: Span, task_context: TaskContext):
+        # Spans of runs that are not sampled record nothing: skip serializing
+        if not span.is_recording():
+            return
+
         # Capture the basic input
-        span.set_attribute(
-            "input", task_context.model_dump_json(exclude={"metadata": {"nodes"}})
-        )
+        span.set_attribute("input", serialize_attribute(self._traced_context(task_context)))
 
         # Add prompt details if available in the task context
         if hasattr(task_context, "prompts"):
-            span.set_attribute("prompts", str(task_context.prompts))
+            span.set_attribute("prompts", truncate_attribute(str(task_context.prompts)))
         if hasattr(task_context, "system_prompt"):
-            span.set_attribute("system_prompt", str(task_context.system_prompt))
+            span.set_attribute(
+                "system_prompt", truncate_attribute(str(task_context.system_prompt))
+            )
         if hasattr(task_context, "user_prompt"):
-            span.set_attribute("user_prompt", str(task_context.user_prompt))
+            span.set_attribute(
+                "user_prompt", truncate_attribute(str(task_context.user_prompt))
+            )
 
-    def _set_span_output(self, span: Span, task_context: TaskContext):
-        # Capture the basic output
-        span.set_attribute(
-            "output", task_context.model_dump_json(exclude={"metadata": {"nodes"}})
-        )
+    def _set_span_output(
+        self,
+        span: Span,
+        task_context: TaskContext,
+        node_class: Optional[Type[Node]] = None,
+    ):
+        if not span.is_recording():
+            return
+
+        # Capture the basic output: a node's span only needs that node's
+        # results, the rest of the context is on its input
+        if node_class:
+            node_name = node_class.__name__
+            output = {"nodes": {node_name: task_context.nodes.get(node_name)}}
+        else:
+            output = self._traced_context(task_context)
+        span.set_attribute("output", serialize_attribute(output))
 
         # Add model parameters and completion details if available
         if hasattr(task_context, "model_params"):
-            span.set_attribute("model_params", str(task_context.model_params))
+            span.set_attribute(
+                "model_params", truncate_attribute(str(task_context.model_params))
+            )
         if hasattr(task_context, "completion"):
-            span.set_attribute("completion", str(task_context.completion))
+            span.set_attribute(
+                "completion", truncate_attribute(str(task_context.completion))
+            )
+
+    @staticmethod
+    def _traced_context(task_context: TaskContext) -> Dict[str, Any]:
+        """The task context as recorded on spans, without the node registry."""
+        return {
+            "event": task_context.event,
+            "nodes": task_context.nodes,
+            "metadata": {
+                key: value
+                for key, value in task_context.metadata.items()
+                if key != "nodes"
+            },
+        }
 
     def _get_next_node_class(
         self, current_node_class: Type[Node], task_context: TaskContext
@@ -200,19 +288,11 @@ class Workflow(ABC):
         Returns:
             The class of the next node to execute, or None if at the end
         """
-        node_config = next(
-            (nc for nc in self.workflow_schema.nodes if nc.node == current_node_class),
-            None,
-        )
-
-        if not node_config or not node_config.connections:
-            return None
-
-        if node_config.is_router:
-            router: BaseRouter = self.nodes[current_node_class].node()
+        if current_node_class in self.graph.routers:
+            router: BaseRouter = self._instantiate_node(current_node_class)
             return self._handle_router(router, task_context)
 
-        return node_config.connections[0]
+        return self.graph.transitions.get(current_node_class)
 
     def _handle_router(
         self, router: BaseRouter, task_context: TaskContext
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from database.session import Base
+
+"""
+Cache Versions
+
+This module defines the table that lets separate processes (API workers,
+import scripts, Salesforce syncs) agree on when a cached read model is stale.
+Writers bump the version for a cache name; readers compare it against the
+version their in-process copy was built from.
+"""
+
+
+class CacheVersion(Base):
+    """Version counter for a named application cache."""
+
+    __tablename__ = "cache_versions"
+
+    name = Column(
+        String(100),
+        primary_key=True,
+        doc="Cache name, e.g. 'filter_options:claims'"
+    )
+    version = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Incremented every time the cached data is invalidated"
+    )
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        doc="When the cache was last invalidated"
+    )
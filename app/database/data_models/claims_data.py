@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    ARRAY,
     JSON,
     Boolean,
     Column,
@@ -30,6 +31,9 @@ It includes models for:
 3. ClaimsVisit: Individual visit records linking providers to sites
 4. MarketNotes: User-generated notes for market intelligence
 5. LeadClassifications: Provider/site classification for lead management
+6. ClaimsSiteAggregate: Precomputed per-site visit rollups for map and list views
+7. ClaimsProviderGroupAggregate: Precomputed per-provider-group rollups
+8. ClaimsSiteProviderGroupAggregate: Precomputed provider-group rollups per site
 
 These models support the claims-based market exploration functionality.
 """
@@ -225,6 +229,7 @@ class SiteOfService(Base):
     
     # Relationships
     visits = relationship("ClaimsVisit", back_populates="site")
+    aggregate = relationship("ClaimsSiteAggregate", back_populates="site", uselist=False)
     notes = relationship("MarketNotes",
                         foreign_keys="MarketNotes.site_id",
                         back_populates="site")
@@ -318,6 +323,202 @@ class ClaimsVisit(Base):
     )
 
 
+class ClaimsSiteAggregate(Base):
+    """SQLAlchemy model for precomputed per-site visit aggregates.
+    
+    This table materializes the SUM/COUNT DISTINCT/bool_or rollups over
+    claims_visits that the map and site endpoints would otherwise compute on
+    every request. It is rebuilt by ClaimsAggregateService after each claims
+    import and is only valid for queries without provider-level filters.
+    """
+    
+    __tablename__ = "claims_site_aggregates"
+    
+    site_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("claims_sites_of_service.id", ondelete="CASCADE"),
+        primary_key=True,
+        doc="Foreign key reference to the site of service"
+    )
+    total_visits = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Sum of visits across all providers at this site"
+    )
+    provider_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Number of distinct providers with visits at this site"
+    )
+    oncology_visits = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Visits flagged as including oncology services"
+    )
+    surgery_visits = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Visits flagged as including surgical services"
+    )
+    inpatient_visits = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Visits flagged as including inpatient services"
+    )
+    has_oncology = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        doc="Whether any visit at this site includes oncology services"
+    )
+    has_surgery = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        doc="Whether any visit at this site includes surgical services"
+    )
+    has_inpatient = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        doc="Whether any visit at this site includes inpatient services"
+    )
+    refreshed_at = Column(
+        DateTime,
+        default=datetime.now,
+        doc="Timestamp when the aggregate row was last rebuilt"
+    )
+    
+    # Relationships
+    site = relationship("SiteOfService", back_populates="aggregate")
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("idx_claims_site_aggregates_visits", "total_visits"),
+        Index("idx_claims_site_aggregates_providers", "provider_count"),
+    )
+
+
+class ClaimsProviderGroupAggregate(Base):
+    """SQLAlchemy model for precomputed per-provider-group rollups.
+    
+    Backs /claims/provider-groups when no provider- or site-level filters are
+    given. Each provider is counted once, so total_visits is the sum of the
+    group's provider totals rather than a per-visit-row multiple of it.
+    Rebuilt by ClaimsAggregateService after each claims import.
+    """
+    
+    __tablename__ = "claims_provider_group_aggregates"
+    
+    provider_group = Column(
+        String(300),
+        primary_key=True,
+        doc="Provider group name"
+    )
+    provider_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Number of providers in the group"
+    )
+    total_visits = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Sum of the total visits of the group's providers"
+    )
+    site_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Number of distinct sites where the group's providers have visits"
+    )
+    specialties = Column(
+        ARRAY(String),
+        nullable=False,
+        default=list,
+        doc="Distinct specialties of the group's providers"
+    )
+    geomarkets = Column(
+        ARRAY(String),
+        nullable=False,
+        default=list,
+        doc="Distinct geomarkets of the group's providers"
+    )
+    refreshed_at = Column(
+        DateTime,
+        default=datetime.now,
+        doc="Timestamp when the aggregate row was last rebuilt"
+    )
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("idx_claims_provider_group_aggregates_visits", "total_visits", "provider_group"),
+    )
+
+
+class ClaimsSiteProviderGroupAggregate(Base):
+    """SQLAlchemy model for precomputed provider-group rollups at each site.
+    
+    Backs /claims/sites/{site_id}/provider-groups. Visits are the group's
+    visits at that site only. Rebuilt by ClaimsAggregateService after each
+    claims import.
+    """
+    
+    __tablename__ = "claims_site_provider_group_aggregates"
+    
+    site_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("claims_sites_of_service.id", ondelete="CASCADE"),
+        primary_key=True,
+        doc="Foreign key reference to the site of service"
+    )
+    provider_group = Column(
+        String(300),
+        primary_key=True,
+        doc="Provider group name"
+    )
+    provider_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Number of the group's providers with visits at this site"
+    )
+    total_visits = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Sum of the group's visits at this site"
+    )
+    specialties = Column(
+        ARRAY(String),
+        nullable=False,
+        default=list,
+        doc="Distinct specialties of the group's providers at this site"
+    )
+    geomarkets = Column(
+        ARRAY(String),
+        nullable=False,
+        default=list,
+        doc="Distinct geomarkets of the group's providers at this site"
+    )
+    refreshed_at = Column(
+        DateTime,
+        default=datetime.now,
+        doc="Timestamp when the aggregate row was last rebuilt"
+    )
+    
+    # Indexes for common queries
+    __table_args__ = (
+        Index("idx_claims_site_provider_group_aggregates_visits", "site_id", "total_visits"),
+    )
+
+
 class MarketNotes(Base):
     """SQLAlchemy model for storing user-generated notes for market intelligence.
     
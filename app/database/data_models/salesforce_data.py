@@ -136,6 +136,7 @@ class SfContact(Base):
     sf_last_modified_date = Column(DateTime)
     sf_system_modstamp = Column(DateTime)
     sf_last_modified_by_id = Column(String(18))  # Reference to User
+    is_deleted = Column(Boolean, nullable=False, default=False, server_default="false")
 
     # Local metadata
     last_synced_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
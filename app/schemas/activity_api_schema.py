@@ -80,10 +80,12 @@ class PaginationParams(BaseModel):
 
 class ActivityListResponse(BaseModel):
     activities: List[ActivityListItem]
-    total_count: int
+    total_count: Optional[int]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
 
 
 class ActivitySelectionRequest(BaseModel):
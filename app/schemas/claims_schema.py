@@ -124,11 +124,23 @@ class MapMarker(BaseModel):
     geomarket: Optional[str] = Field(None, description="Geographic market")
 
 
+class MapCluster(BaseModel):
+    """Schema for a server-side cluster of nearby sites at low zoom levels"""
+    latitude: float = Field(..., description="Centroid latitude of clustered sites")
+    longitude: float = Field(..., description="Centroid longitude of clustered sites")
+    site_count: int = Field(..., description="Number of sites in the cluster")
+    total_visits: int = Field(0, description="Summed visits across clustered sites")
+    provider_count: int = Field(0, description="Summed provider counts across clustered sites")
+    bounds: Dict[str, float] = Field(..., description="Geographic bounds of the clustered sites")
+
+
 class MapMarkersResponse(BaseModel):
     """Response schema for map markers endpoint"""
     markers: List[MapMarker] = Field(..., description="List of map markers")
-    total_count: int = Field(..., description="Total number of markers")
+    clusters: List[MapCluster] = Field([], description="Site clusters (only when zoom is given)")
+    total_count: int = Field(..., description="Total number of sites represented")
     bounds: Optional[Dict[str, float]] = Field(None, description="Geographic bounds of markers")
+    zoom: Optional[int] = Field(None, description="Zoom level used for clustering")
 
 
 # Provider group schemas
@@ -185,10 +197,12 @@ class PaginationMeta(BaseModel):
     """Pagination metadata"""
     page: int = Field(..., description="Current page number")
     per_page: int = Field(..., description="Items per page")
-    total_items: int = Field(..., description="Total number of items")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_items: Optional[int] = Field(..., description="Total number of items (null when count_mode=none)")
+    total_pages: Optional[int] = Field(..., description="Total number of pages (null when count_mode=none)")
     has_next: bool = Field(..., description="Has next page")
     has_prev: bool = Field(..., description="Has previous page")
+    total_is_estimate: bool = Field(False, description="total_items is a planner estimate")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page")
 
 
 class ClaimsStatistics(BaseModel):
@@ -295,4 +309,19 @@ class FilterOptions(BaseModel):
     provider_groups: List[str] = Field([], description="Available provider groups")
     site_types: List[str] = Field([], description="Available site types")
     specialty_grandparents: List[str] = Field([], description="Available specialty categories")
-    service_lines: List[str] = Field([], description="Available service lines")
\ No newline at end of file
+    service_lines: List[str] = Field([], description="Available service lines")
+
+# Search schemas
+class ClaimsSearchResult(BaseModel):
+    """Schema for one typeahead search hit"""
+    type: str = Field(..., description="Result type: provider, site or provider_group")
+    id: Optional[UUID] = Field(None, description="Provider or site identifier (None for provider groups)")
+    name: str = Field(..., description="Matched name")
+    detail: Optional[str] = Field(None, description="Specialty for providers, city for sites")
+    score: float = Field(..., description="Relevance score, higher is better")
+
+
+class ClaimsSearchResponse(BaseModel):
+    """Response schema for claims typeahead search"""
+    query: str = Field(..., description="Search term as received")
+    results: List[ClaimsSearchResult] = Field([], description="Hits ordered by relevance")
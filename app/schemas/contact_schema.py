@@ -130,6 +130,22 @@ class ContactListResponse(BaseModel):
     has_more: bool
 
 
+class ContactSearchResult(BaseModel):
+    """Typeahead search hit for a contact"""
+    id: str
+    salesforce_id: str
+    name: str
+    specialty: Optional[str] = None
+    organization: Optional[str] = None
+    score: float  # Relevance, higher is better
+
+
+class ContactSearchResponse(BaseModel):
+    """Response for contact typeahead search"""
+    query: str
+    items: List[ContactSearchResult]
+
+
 class ContactMapResponse(BaseModel):
     """Response for map marker data"""
     markers: List[ContactMapMarker]
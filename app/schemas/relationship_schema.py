@@ -65,10 +65,12 @@ class RelationshipListItem(BaseModel):
 class RelationshipListResponse(BaseModel):
     """Response for relationship list endpoint."""
     items: List[RelationshipListItem]
-    total_count: int
+    total_count: Optional[int]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page")
 
 
 # Detail schemas
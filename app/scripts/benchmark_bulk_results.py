@@ -0,0 +1,110 @@
+"""
+Bulk Result Download Benchmark
+
+Runs BulkSalesforceService.execute_bulk_query_batches against the local
+Bulk API stand-in (scripts/bulk_api_standin.py) and compares:
+
+- serial page downloads with a new connection per request (the old
+  behaviour of bare ``requests`` calls),
+- serial page downloads over the pooled session,
+- BulkResultFetcher at several concurrency levels over the pooled session.
+
+Every batch is handed to a simulated database write (--write-ms per batch)
+so the numbers show how much of the download and parsing is hidden behind
+the writes. Nothing touches Salesforce or the database.
+
+Usage:
+    python scripts/benchmark_bulk_results.py
+    python scripts/benchmark_bulk_results.py --records 600000 --latency-ms 300 --bandwidth-mbps 200
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+# Add app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.bulk_api_standin import start_standin
+from services.salesforce_files.bulk_salesforce_service import BulkSalesforceService
+from services.salesforce_files.http_session import create_http_session
+
+
+class UnpooledSession:
+    """Sends every request on a new connection, like bare requests.get/post."""
+
+    get = staticmethod(requests.get)
+    post = staticmethod(requests.post)
+
+
+def run_once(server, http_session, concurrency: int, args) -> tuple:
+    """Return (seconds, records, connections opened) for one full download."""
+    sf_bulk = BulkSalesforceService(
+        username="standin", password="standin", client_id="standin", client_secret="standin",
+        http_session=http_session,
+    )
+    sf_bulk.login_url = f"{server.base_url}/services/oauth2/token"
+    connections_before = server.connections
+
+    records = 0
+    started = time.perf_counter()
+    # The service reports progress with print(); keep the table readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        batches = sf_bulk.execute_bulk_query_batches(
+            "SELECT Id FROM Contact",
+            batch_size=args.batch_size,
+            max_records=args.page_size,
+            concurrency=concurrency,
+        )
+        for batch in batches:
+            records += len(batch)
+            time.sleep(args.write_ms / 1000)
+    return time.perf_counter() - started, records, server.connections - connections_before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk result downloads against a local Bulk API stand-in")
+    parser.add_argument("--records", type=int, default=600_000, help="Records in the query job")
+    parser.add_argument("--page-size", type=int, default=50_000, help="maxRecords per result page")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Records per yielded batch")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Stand-in delay before each result page")
+    parser.add_argument("--bandwidth-mbps", type=float, default=200, help="Stand-in result bandwidth per connection")
+    parser.add_argument("--write-ms", type=float, default=8, help="Simulated database write per batch")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    server = start_standin(args.records, args.latency_ms, args.bandwidth_mbps)
+    print(f"# {args.records:,} records in pages of {args.page_size:,}, "
+          f"{args.latency_ms:.0f} ms page latency, {args.bandwidth_mbps} Mbit/s, "
+          f"{args.write_ms} ms write per {args.batch_size:,}-record batch")
+
+    runs = [("serial, new connections", UnpooledSession(), 1)]
+    runs.append(("serial, pooled", create_http_session(), 1))
+    for concurrency in args.concurrency:
+        runs.append((f"fetcher x{concurrency}, pooled", create_http_session(), concurrency))
+
+    # The service writes its API call log under ./logs
+    os.chdir(tempfile.mkdtemp(prefix="bulk-benchmark-"))
+
+    print(f"{'mode':<26} {'seconds':>8} {'records/s':>10} {'connections':>12}")
+    baseline = None
+    for label, http_session, concurrency in runs:
+        seconds, records, connections = run_once(server, http_session, concurrency, args)
+        if records != args.records:
+            raise SystemExit(f"{label}: expected {args.records:,} records, got {records:,}")
+        baseline = baseline or seconds
+        print(f"{label:<26} {seconds:>8.2f} {records / seconds:>10,.0f} {connections:>12} "
+              f"({baseline / seconds:.1f}x)")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
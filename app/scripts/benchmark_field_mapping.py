@@ -0,0 +1,85 @@
+"""
+Contact Field Mapping Benchmark
+
+Maps generated Bulk API contact pages with the contact sync's CONTACT_FIELDS
+map and compares the CPU time of:
+
+- per record: FieldMap.map_record on every record, converting field by
+  field and row by row (how _map_contact_data used to work),
+- row dicts: FieldMap.map_records, columnar conversion zipped back into one
+  dict per row (the executemany path),
+- columns: FieldMap.map_columns, what the COPY staging path consumes.
+
+Every record carries every mapped field, as a Bulk CSV row does; fields the
+generator has no value for are None, like empty CSV cells. Nothing touches
+Salesforce or the database.
+
+Usage:
+    python scripts/benchmark_field_mapping.py
+    python scripts/benchmark_field_mapping.py --records 600000 --batch-size 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add app directory (for the services' own imports) and the repository root
+# (for their app.-prefixed imports) to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Same model imports and app.-prefix alias as the COPY benchmark, plus its
+# contact generator
+from scripts.benchmark_contact_copy import contact
+from app.services.salesforce_files.contact_sync.bulk_contact_sync_service import (
+    CONTACT_FIELDS,
+)
+from app.services.salesforce_files.field_mapping import RECORD
+
+
+def bulk_page(start: int, size: int) -> list:
+    """A page of contacts holding every field the map reads."""
+    sources = [
+        field.source for field in CONTACT_FIELDS.fields if field.source not in (None, RECORD)
+    ]
+    page = []
+    for i in range(start, start + size):
+        record = dict.fromkeys(sources)
+        record.update(contact(i))
+        page.append(record)
+    return page
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark columnar contact field mapping")
+    parser.add_argument("--records", type=int, default=100_000, help="Contacts to map")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Records per Bulk API batch")
+    args = parser.parse_args()
+
+    pages = [
+        bulk_page(start, min(args.batch_size, args.records - start))
+        for start in range(0, args.records, args.batch_size)
+    ]
+    modes = [
+        ("per record", lambda page: [CONTACT_FIELDS.map_record(r) for r in page]),
+        ("row dicts", CONTACT_FIELDS.map_records),
+        ("columns", CONTACT_FIELDS.map_columns),
+    ]
+
+    print(f"# {args.records:,} contacts in batches of {args.batch_size:,}, "
+          f"{len(CONTACT_FIELDS.fields)} mapped fields")
+    print(f"{'mode':<12} {'cpu seconds':>12} {'records/s':>12}")
+    baseline = None
+    for label, map_page in modes:
+        started = time.process_time()
+        for page in pages:
+            map_page(page)
+        seconds = time.process_time() - started
+        baseline = baseline or seconds
+        print(f"{label:<12} {seconds:>12.2f} {args.records / seconds:>12,.0f} "
+              f"({baseline / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Geo Index Benchmark
+
+Compares bounding-box lookups through the in-memory GeoGridIndex with the
+current SQL path (latitude/longitude BETWEEN predicates served by a composite
+B-tree, as on claims_sites_of_service) at 10k, 100k and 1M points.
+
+The SQL side runs against a TEMP table in the configured PostgreSQL database,
+so nothing persistent is created. Use --skip-sql to time the index alone.
+
+Usage:
+    python scripts/benchmark_geo_index.py
+    python scripts/benchmark_geo_index.py --sizes 10000 100000 --queries 200
+    python scripts/benchmark_geo_index.py --skip-sql
+"""
+
+import argparse
+import io
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import List, Tuple
+
+from sqlalchemy import create_engine, text
+
+# Add app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.database_utils import DatabaseUtils
+from services.geo_index import BBox, ContactPoint, GeoGridIndex
+
+# Points are spread over a California-sized region
+REGION = (32.0, -124.0, 42.0, -114.0)
+
+# Viewport sizes in degrees: metro, city and neighborhood
+BOX_SIZES = [1.0, 0.2, 0.02]
+
+
+def random_boxes(count: int, size: float, rng: random.Random) -> List[BBox]:
+    south, west, north, east = REGION
+    boxes = []
+    for _ in range(count):
+        lat = rng.uniform(south, north - size)
+        lng = rng.uniform(west, east - size)
+        boxes.append((lat, lng, lat + size, lng + size))
+    return boxes
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def time_queries(fn, boxes: List[BBox]) -> Tuple[float, float, float]:
+    """Return (median ms, p95 ms, mean result size) for a query function."""
+    timings = []
+    sizes = []
+    for box in boxes:
+        started = time.perf_counter()
+        sizes.append(len(fn(box)))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), percentile(timings, 0.95), statistics.mean(sizes)
+
+
+def generate_points(size: int, rng: random.Random) -> List[ContactPoint]:
+    south, west, north, east = REGION
+    return [
+        ContactPoint(uuid.uuid4(), rng.uniform(south, north), rng.uniform(west, east))
+        for _ in range(size)
+    ]
+
+
+def load_sql_points(connection, points: List[ContactPoint]) -> None:
+    """Load points into a TEMP table indexed like idx_sites_of_service_coordinates."""
+    connection.execute(text("DROP TABLE IF EXISTS geo_benchmark_points"))
+    connection.execute(text(
+        "CREATE TEMP TABLE geo_benchmark_points "
+        "(id uuid PRIMARY KEY, latitude double precision, longitude double precision)"
+    ))
+    raw = connection.connection.dbapi_connection
+    with raw.cursor() as cursor:
+        rows = "\n".join(f"{p.id}\t{p.latitude}\t{p.longitude}" for p in points)
+        cursor.copy_expert(
+            "COPY geo_benchmark_points (id, latitude, longitude) FROM STDIN",
+            io.StringIO(rows)
+        )
+    connection.execute(text(
+        "CREATE INDEX geo_benchmark_points_coordinates "
+        "ON geo_benchmark_points (latitude, longitude)"
+    ))
+    connection.execute(text("ANALYZE geo_benchmark_points"))
+
+
+def run_benchmark(sizes: List[int], query_count: int, skip_sql: bool, database_url: str) -> None:
+    rng = random.Random(42)
+    engine = None if skip_sql else create_engine(database_url)
+
+    print(f"{'points':>9} {'box':>6} {'avg hits':>9} "
+          f"{'index p50':>10} {'index p95':>10} {'sql p50':>9} {'sql p95':>9} {'speedup':>8}")
+
+    for size in sizes:
+        points = generate_points(size, rng)
+
+        started = time.perf_counter()
+        index = GeoGridIndex(points, build_clusters=False)
+        build_ms = (time.perf_counter() - started) * 1000
+        print(f"# {size:,} points: index built in {build_ms:,.0f} ms")
+
+        connection = None
+        if engine is not None:
+            connection = engine.connect()
+            load_sql_points(connection, points)
+
+        for box_size in BOX_SIZES:
+            boxes = random_boxes(query_count, box_size, rng)
+            index_p50, index_p95, hits = time_queries(index.ids_in_bbox, boxes)
+
+            sql_p50 = sql_p95 = None
+            if connection is not None:
+                def sql_query(box: BBox):
+                    south, west, north, east = box
+                    return connection.execute(
+                        text(
+                            "SELECT id FROM geo_benchmark_points "
+                            "WHERE latitude BETWEEN :south AND :north "
+                            "AND longitude BETWEEN :west AND :east"
+                        ),
+                        {"south": south, "west": west, "north": north, "east": east}
+                    ).all()
+                sql_p50, sql_p95, _ = time_queries(sql_query, boxes)
+
+            print(
+                f"{size:>9,} {box_size:>6} {hits:>9,.0f} "
+                f"{index_p50:>9.3f}m {index_p95:>9.3f}m "
+                + (f"{sql_p50:>8.3f}m {sql_p95:>8.3f}m {sql_p50 / max(index_p50, 1e-6):>7.1f}x"
+                   if sql_p50 is not None else f"{'-':>9} {'-':>9} {'-':>8}")
+            )
+
+        if connection is not None:
+            connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the in-memory geo index against SQL bbox queries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=100, help="Random boxes per box size")
+    parser.add_argument("--skip-sql", action="store_true", help="Only time the in-memory index")
+    parser.add_argument("--database-url", default=DatabaseUtils.get_connection_string())
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.queries, args.skip_sql, args.database_url)
+
+
+if __name__ == "__main__":
+    main()
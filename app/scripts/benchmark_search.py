@@ -0,0 +1,179 @@
+"""
+Contact Search Benchmark
+
+Compares the old contact search predicate (ILIKE '%term%' OR-ed over name,
+first name, last name and specialty, which forces a sequential scan) with the
+full-text search used by services.search_service (a prefix tsquery against a
+GIN-indexed to_tsvector expression), plus the ranked typeahead query behind
+GET /api/contacts/search.
+
+Runs against a TEMP table in the configured PostgreSQL database, sized like
+the 600k-contact org assumed by storage_calculator.py, so nothing persistent
+is created.
+
+Usage:
+    python scripts/benchmark_search.py
+    python scripts/benchmark_search.py --contacts 100000 --queries 50
+"""
+
+import argparse
+import io
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from sqlalchemy import create_engine, text
+
+# Add app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.database_utils import DatabaseUtils
+from services.search_service import prefix_tsquery
+
+# Names are built from syllables so prefixes are about as selective as real
+# surnames (tens of thousands of distinct values) rather than a short list
+SYLLABLES = [
+    "an", "ber", "cal", "da", "el", "fen", "gar", "ha", "is", "jo", "ka", "lin",
+    "mar", "no", "or", "pe", "qui", "ros", "sa", "ten", "u", "van", "wil", "xi",
+    "ya", "zo", "chen", "dro", "kow", "mi",
+]
+SPECIALTIES = [
+    "Cardiology", "Oncology", "Orthopedic Surgery", "Internal Medicine", "Neurology",
+    "Family Medicine", "Gastroenterology", "Urology", None,
+]
+
+# Same expression as idx_sf_contact_search (migration 9a4c6e1f7b25)
+SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, coalesce(name, '') || ' ' || coalesce(first_name, '') "
+    "|| ' ' || coalesce(last_name, '') || ' ' || coalesce(specialty, '') "
+    "|| ' ' || coalesce(email, '') || ' ' || coalesce(npi, ''))"
+)
+
+ILIKE_SQL = (
+    "SELECT id FROM search_benchmark_contacts "
+    "WHERE name ILIKE :pattern OR first_name ILIKE :pattern "
+    "OR last_name ILIKE :pattern OR specialty ILIKE :pattern"
+)
+FULL_TEXT_SQL = (
+    f"SELECT id FROM search_benchmark_contacts "
+    f"WHERE {SEARCH_DOCUMENT} @@ to_tsquery('simple'::regconfig, :query)"
+)
+TYPEAHEAD_SQL = (
+    f"SELECT id, name FROM search_benchmark_contacts "
+    f"WHERE {SEARCH_DOCUMENT} @@ to_tsquery('simple'::regconfig, :query) "
+    f"ORDER BY ts_rank({SEARCH_DOCUMENT}, to_tsquery('simple'::regconfig, :query)) DESC, name "
+    f"LIMIT 10"
+)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def time_queries(fn: Callable[[str], list], terms: List[str]) -> Tuple[float, float, float]:
+    """Return (median ms, p95 ms, mean result size) for a query function."""
+    timings = []
+    sizes = []
+    for term in terms:
+        started = time.perf_counter()
+        sizes.append(len(fn(term)))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), percentile(timings, 0.95), statistics.mean(sizes)
+
+
+def load_contacts(connection, count: int, rng: random.Random) -> None:
+    """Load generated contacts into a TEMP table with the contact search index."""
+    connection.execute(text("DROP TABLE IF EXISTS search_benchmark_contacts"))
+    connection.execute(text(
+        "CREATE TEMP TABLE search_benchmark_contacts ("
+        "id uuid PRIMARY KEY, name varchar(121), first_name varchar(40), "
+        "last_name varchar(80), specialty varchar(255), email varchar(80), npi varchar(10))"
+    ))
+    lines = []
+    for i in range(count):
+        first = random_name(rng, 2)
+        last = random_name(rng, rng.choice((2, 3)))
+        specialty = rng.choice(SPECIALTIES)
+        lines.append("\t".join([
+            str(uuid.uuid4()),
+            f"{first} {last}",
+            first,
+            last,
+            specialty if specialty else "\\N",
+            f"{first.lower()}.{last.lower()}{i}@example.org",
+            f"{1_000_000_000 + i}",
+        ]))
+    raw = connection.connection.dbapi_connection
+    with raw.cursor() as cursor:
+        cursor.copy_expert(
+            "COPY search_benchmark_contacts (id, name, first_name, last_name, specialty, email, npi) FROM STDIN",
+            io.StringIO("\n".join(lines))
+        )
+
+    started = time.perf_counter()
+    connection.execute(text(
+        f"CREATE INDEX search_benchmark_contacts_search ON search_benchmark_contacts USING gin ({SEARCH_DOCUMENT})"
+    ))
+    print(f"# search index built in {(time.perf_counter() - started) * 1000:,.0f} ms")
+    connection.execute(text("ANALYZE search_benchmark_contacts"))
+
+
+def random_name(rng: random.Random, syllables: int) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize()
+
+
+def sample_terms(rng: random.Random, count: int, length: int) -> List[str]:
+    """Typeahead-style terms: the first ``length`` letters of a generated name."""
+    return [random_name(rng, 3)[:length] for _ in range(count)]
+
+
+def run_benchmark(contact_count: int, query_count: int, database_url: str) -> None:
+    rng = random.Random(42)
+    engine = create_engine(database_url)
+
+    with engine.connect() as connection:
+        started = time.perf_counter()
+        load_contacts(connection, contact_count, rng)
+        print(f"# {contact_count:,} contacts loaded in {(time.perf_counter() - started):,.1f} s")
+
+        def ilike(term: str):
+            return connection.execute(text(ILIKE_SQL), {"pattern": f"%{term}%"}).all()
+
+        def full_text(term: str):
+            return connection.execute(text(FULL_TEXT_SQL), {"query": prefix_tsquery(term)}).all()
+
+        def typeahead(term: str):
+            return connection.execute(text(TYPEAHEAD_SQL), {"query": prefix_tsquery(term)}).all()
+
+        print(f"{'term':>5} {'ilike hits':>10} {'fts hits':>9} {'ilike p50':>10} {'ilike p95':>10} "
+              f"{'fts p50':>9} {'fts p95':>9} {'top10 p50':>10} {'top10 p95':>10} {'speedup':>8}")
+
+        for length in (2, 3, 5, 8):
+            terms = sample_terms(rng, query_count, length)
+            ilike_p50, ilike_p95, ilike_hits = time_queries(ilike, terms)
+            fts_p50, fts_p95, fts_hits = time_queries(full_text, terms)
+            top_p50, top_p95, _ = time_queries(typeahead, terms)
+            print(
+                f"{length:>5} {ilike_hits:>10,.0f} {fts_hits:>9,.0f} "
+                f"{ilike_p50:>9.1f}m {ilike_p95:>9.1f}m {fts_p50:>8.1f}m {fts_p95:>8.1f}m "
+                f"{top_p50:>9.1f}m {top_p95:>9.1f}m {ilike_p50 / max(top_p50, 1e-6):>7.1f}x"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark contact ILIKE search against the full-text search index")
+    parser.add_argument("--contacts", type=int, default=600_000, help="Number of generated contacts")
+    parser.add_argument("--queries", type=int, default=30, help="Search terms per term length")
+    parser.add_argument("--database-url", default=DatabaseUtils.get_connection_string())
+    args = parser.parse_args()
+
+    run_benchmark(args.contacts, args.queries, args.database_url)
+
+
+if __name__ == "__main__":
+    main()
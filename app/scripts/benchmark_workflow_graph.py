@@ -0,0 +1,92 @@
+"""
+Workflow Graph Benchmark
+
+Generates chain workflows of increasing size (every node a no-op that leads
+to the next) and measures what the workflow graph costs:
+
+- compile: validating and compiling the schema, paid once per class,
+- construct: creating another workflow of an already compiled class,
+- next node: finding the node that follows, paid at every step of a run.
+
+Usage:
+    python scripts/benchmark_workflow_graph.py
+    python scripts/benchmark_workflow_graph.py --sizes 100 1000 5000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+# Add app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Workflows configure logfire, which would print every span to the console
+os.environ.setdefault("LOGFIRE_CONSOLE", "false")
+
+from core.graph import WorkflowGraph
+from core.nodes.base import Node
+from core.schema import NodeConfig, WorkflowSchema
+from core.task import TaskContext
+from core.workflow import Workflow
+
+
+class EmptyEvent(BaseModel):
+    pass
+
+
+def no_op(self, task_context: TaskContext) -> TaskContext:
+    return task_context
+
+
+def chain_workflow(size: int) -> type:
+    """Builds a workflow class of `size` nodes connected one after another."""
+    steps = [type(f"Step{i}", (Node,), {"process": no_op}) for i in range(size)]
+    schema = WorkflowSchema(
+        event_schema=EmptyEvent,
+        start=steps[0],
+        nodes=[
+            NodeConfig(node=step, connections=steps[i + 1 : i + 2])
+            for i, step in enumerate(steps)
+        ],
+    )
+    return type(f"Chain{size}Workflow", (Workflow,), {"workflow_schema": schema})
+
+
+def timed(function, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the workflow graph")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(f"{'nodes':>6} {'compile ms':>11} {'construct ms':>13} {'next node us':>13}")
+    for size in args.sizes:
+        workflow_class = chain_workflow(size)
+        compile_seconds = timed(lambda: WorkflowGraph(workflow_class.workflow_schema), 5)
+        workflow = workflow_class()
+        construct_seconds = timed(workflow_class, 20)
+
+        steps = list(workflow.nodes)
+        task_context = TaskContext(event=EmptyEvent())
+        step_seconds = timed(
+            lambda: [workflow._get_next_node_class(step, task_context) for step in steps], 5
+        ) / size
+        print(
+            f"{size:>6} {compile_seconds * 1e3:>11.2f} {construct_seconds * 1e3:>13.3f}"
+            f" {step_seconds * 1e6:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Workflow Per-Run Overhead Benchmark
+
+Runs a small agent workflow (agent node -> router -> agent node) many times
+against a stubbed model that answers instantly, so what is measured is the
+workflow's own overhead per run, and compares:
+
+- fresh nodes: every step constructs its node (and routers are constructed
+  again to route), each AgentNode building a new HTTP client, provider,
+  model and pydantic-ai Agent, as Workflow.run used to,
+- shared nodes: node instances, models and HTTP clients are created once
+  per process and reused by every run.
+
+Nothing calls an LLM; OPENAI_API_KEY is set to a placeholder if missing.
+
+Usage:
+    python scripts/benchmark_workflow_overhead.py
+    python scripts/benchmark_workflow_overhead.py --runs 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+from httpx import AsyncClient
+from pydantic import BaseModel
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.models.openai import OpenAIModel
+from pydantic_ai.providers.openai import OpenAIProvider
+
+# Add app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+# Workflows configure logfire, which would print every span to the console
+os.environ.setdefault("LOGFIRE_CONSOLE", "false")
+
+import core.nodes.agent as agent_module
+from core.event_loop import run_coroutine
+from core.nodes.agent import AgentConfig, AgentNode, ModelProvider
+from core.nodes.router import BaseRouter, RouterNode
+from core.schema import NodeConfig, WorkflowSchema
+from core.task import TaskContext
+from core.workflow import Workflow
+
+
+def instant_model(messages, info):
+    return ModelResponse(parts=[TextPart("stubbed answer")])
+
+
+STUB_MODEL = FunctionModel(instant_model)
+
+
+class QuestionEvent(BaseModel):
+    question: str
+
+
+class BenchmarkAgentNode(AgentNode):
+    def __init__(self):
+        super().__init__()
+        # Answer from the stub; the configured model (and its client) is
+        # still built, as a real node's would be
+        self.agent.model = STUB_MODEL
+
+    def get_agent_config(self) -> AgentConfig:
+        return AgentConfig(
+            system_prompt="Answer the question.",
+            output_type=str,
+            deps_type=None,
+            model_provider=ModelProvider.OPENAI,
+            model_name="gpt-4.1",
+        )
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        result = await self.agent.run(user_prompt=task_context.event.question)
+        task_context.update_node(node_name=self.node_name, result=result.output)
+        return task_context
+
+
+class ClassifyNode(BenchmarkAgentNode):
+    pass
+
+
+class AnswerNode(BenchmarkAgentNode):
+    pass
+
+
+class EscalateNode(BenchmarkAgentNode):
+    pass
+
+
+class NeedsEscalation(RouterNode):
+    def determine_next_node(self, task_context: TaskContext):
+        return EscalateNode.get_instance() if "urgent" in task_context.event.question else None
+
+
+class AnswerRouter(BaseRouter):
+    def __init__(self):
+        self.routes = [NeedsEscalation()]
+        self.fallback = AnswerNode.get_instance()
+
+
+class BenchmarkWorkflow(Workflow):
+    workflow_schema = WorkflowSchema(
+        event_schema=QuestionEvent,
+        start=ClassifyNode,
+        nodes=[
+            NodeConfig(node=ClassifyNode, connections=[AnswerRouter]),
+            NodeConfig(
+                node=AnswerRouter, connections=[AnswerNode, EscalateNode], is_router=True
+            ),
+        ],
+    )
+
+
+def fresh_model(provider: ModelProvider, model_name: str):
+    """What every AgentNode used to build for itself."""
+    return OpenAIModel(model_name, provider=OpenAIProvider(http_client=AsyncClient()))
+
+
+def set_mode(shared: bool) -> None:
+    for node_class in [ClassifyNode, AnswerNode, EscalateNode, AnswerRouter]:
+        node_class.reuse_instance = shared
+    agent_module.get_model = agent_module_get_model if shared else fresh_model
+
+
+agent_module_get_model = agent_module.get_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-run workflow overhead")
+    parser.add_argument("--runs", type=int, default=500, help="Workflow runs per mode")
+    args = parser.parse_args()
+
+    # The workflow logs every node; keep the table readable
+    logging.disable(logging.WARNING)
+    workflow = BenchmarkWorkflow()
+    events = [{"question": "urgent" if i % 2 else "routine"} for i in range(args.runs)]
+
+    print(f"# {args.runs:,} runs of a 3-step agent workflow against a stubbed model")
+    print(f"{'mode':<14} {'entry point':<12} {'ms/run':>8}")
+    for label, shared in [("fresh nodes", False), ("shared nodes", True)]:
+        set_mode(shared)
+        for entry_point in ["run", "arun"]:
+            # Warm up: first-use construction is not per-run overhead
+            workflow.run(events[0])
+            started = time.perf_counter()
+            if entry_point == "run":
+                for event in events:
+                    workflow.run(event)
+            else:
+                for event in events:
+                    run_coroutine(workflow.arun(event))
+            per_run = (time.perf_counter() - started) / args.runs
+            print(f"{label:<14} {entry_point:<12} {per_run * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Workflow Tracing Overhead Benchmark
+
+Runs a workflow whose event carries thousands of structured activities (like
+the monthly activity summary) through a few nodes that each take a fixed
+time, once with the workflow's tracer and once with a no-op tracer, and
+reports what tracing adds per node, absolutely and as a share of node time.
+It also reports the cost of constructing a workflow, which includes getting
+the tracer.
+
+No spans leave the process unless OTEL_EXPORTER_OTLP_ENDPOINT is set.
+
+Usage:
+    python scripts/benchmark_workflow_tracing.py
+    python scripts/benchmark_workflow_tracing.py --activities 20000 --node-ms 20
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+from opentelemetry.trace import NoOpTracer
+from pydantic import BaseModel
+
+# Add app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Workflows configure logfire, which would print every span to the console
+os.environ.setdefault("LOGFIRE_CONSOLE", "false")
+
+from core.nodes.base import Node
+from core.schema import NodeConfig, WorkflowSchema
+from core.task import TaskContext
+from core.workflow import Workflow
+
+NODES = 5
+
+
+class Activity(BaseModel):
+    id: str
+    subject: str
+    description: str
+    activity_date: date
+    owner: str
+    contact_ids: List[str]
+
+
+class ActivitiesEvent(BaseModel):
+    user_id: str
+    activities: List[Activity]
+
+
+class TimedNode(Node):
+    """Stands in for a node's real work (a query, an LLM call) with a sleep."""
+
+    seconds = 0.05
+
+    def process(self, task_context: TaskContext) -> TaskContext:
+        time.sleep(self.seconds)
+        activities = task_context.event.activities
+        task_context.update_node(
+            node_name=self.node_name,
+            count=len(activities),
+            sample=[activity.subject for activity in activities[:20]],
+        )
+        return task_context
+
+
+steps = [type(f"Step{i}", (TimedNode,), {}) for i in range(NODES)]
+
+
+class TracedWorkflow(Workflow):
+    workflow_schema = WorkflowSchema(
+        event_schema=ActivitiesEvent,
+        start=steps[0],
+        nodes=[
+            NodeConfig(node=step, connections=steps[i + 1 : i + 2])
+            for i, step in enumerate(steps)
+        ],
+    )
+
+
+def make_event(activities: int) -> dict:
+    start = date(2025, 1, 1)
+    return {
+        "user_id": "005000000000001",
+        "activities": [
+            {
+                "id": f"00T{i:015d}",
+                "subject": f"Follow-up call {i}",
+                "description": "Discussed referral volumes and next steps. " * 4,
+                "activity_date": start + timedelta(days=i % 365),
+                "owner": "Jane Doe",
+                "contact_ids": [f"003{i:015d}", f"003{i + 1:015d}"],
+            }
+            for i in range(activities)
+        ],
+    }
+
+
+def seconds_per_run(workflow: Workflow, event: dict, runs: int) -> float:
+    started = time.perf_counter()
+    for _ in range(runs):
+        workflow.run(event)
+    return (time.perf_counter() - started) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark workflow tracing overhead")
+    parser.add_argument("--activities", type=int, default=5000)
+    parser.add_argument("--node-ms", type=float, default=50.0, help="Work per node")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    TimedNode.seconds = args.node_ms / 1000
+    event = make_event(args.activities)
+
+    started = time.perf_counter()
+    for _ in range(20):
+        TracedWorkflow()
+    construct_ms = (time.perf_counter() - started) / 20 * 1000
+
+    traced = TracedWorkflow()
+    untraced = TracedWorkflow()
+    untraced.tracer = NoOpTracer()
+    traced.run(event)
+    untraced.run(event)
+    traced_seconds = seconds_per_run(traced, event, args.runs)
+    untraced_seconds = seconds_per_run(untraced, event, args.runs)
+
+    overhead_ms = (traced_seconds - untraced_seconds) / NODES * 1000
+    print(f"# {args.activities:,} activities, {NODES} nodes of {args.node_ms:g} ms, {args.runs} runs")
+    print(f"construct workflow      {construct_ms:8.2f} ms")
+    print(f"untraced run            {untraced_seconds * 1000:8.1f} ms")
+    print(f"traced run              {traced_seconds * 1000:8.1f} ms")
+    print(f"tracing per node        {overhead_ms:8.2f} ms ({overhead_ms / args.node_ms:.1%} of node time)")
+
+
+if __name__ == "__main__":
+    main()
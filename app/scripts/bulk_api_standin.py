@@ -0,0 +1,199 @@
+"""
+Bulk API 2.0 Stand-in Server
+
+A local HTTP server implementing just enough of the Salesforce OAuth and
+Bulk API 2.0 query endpoints for BulkSalesforceService to run against it
+offline: token, create job, job status (always JobComplete), locator-paged
+CSV results and limits. Results are generated Contact rows.
+
+Each results request waits --latency-ms before the first byte, like Salesforce
+preparing a page, and the body is sent at --bandwidth-mbps. HTTP/1.1
+keep-alive is supported, and the server counts the TCP connections it
+accepted so connection reuse is visible.
+
+Usage:
+    python scripts/bulk_api_standin.py --port 8765 --records 600000
+    # then point BulkSalesforceService.login_url at
+    # http://127.0.0.1:8765/services/oauth2/token
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+CONTACT_COLUMNS = [
+    "Id", "FirstName", "LastName", "Email", "Phone", "MailingCity",
+    "MailingState", "Specialty__c", "NPI__c", "LastModifiedDate",
+]
+SPECIALTIES = ["Cardiology", "Oncology", "Orthopedic Surgery", "Internal Medicine", ""]
+
+JOB_ID = "750STANDIN000001"
+DEFAULT_PAGE_SIZE = 50_000
+SEND_CHUNK_SIZE = 64 * 1024
+
+_RESULTS_PATH = re.compile(r"^/services/data/v[\d.]+/jobs/query/(?P<job_id>[^/]+)/results$")
+_JOB_PATH = re.compile(r"^/services/data/v[\d.]+/jobs/query/(?P<job_id>[^/]+)$")
+
+
+class BulkApiStandin(ThreadingHTTPServer):
+    """Threaded HTTP server holding the stand-in settings and counters."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address,
+        records: int,
+        latency_ms: float = 0,
+        bandwidth_mbps: Optional[float] = None,
+    ):
+        super().__init__(address, BulkApiHandler)
+        self.records = records
+        self.latency = latency_ms / 1000
+        self.bandwidth = bandwidth_mbps * 125_000 if bandwidth_mbps else None
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, connection: bool = False) -> None:
+        with self._lock:
+            if connection:
+                self.connections += 1
+            else:
+                self.requests += 1
+
+
+class BulkApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: BulkApiStandin
+
+    def setup(self):
+        super().setup()
+        self.server.count(connection=True)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.server.count()
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urlparse(self.path).path
+
+        if path == "/services/oauth2/token":
+            self._send_json({"access_token": "standin-token", "instance_url": self.server.base_url})
+        elif path.endswith("/jobs/query"):
+            self._send_json({"id": JOB_ID, "state": "UploadComplete"})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def do_GET(self):
+        self.server.count()
+        url = urlparse(self.path)
+
+        results = _RESULTS_PATH.match(url.path)
+        job = _JOB_PATH.match(url.path)
+        if results:
+            self._send_results(parse_qs(url.query))
+        elif job:
+            self._send_json({
+                "id": job.group("job_id"),
+                "state": "JobComplete",
+                "numberRecordsProcessed": self.server.records,
+            })
+        elif url.path.endswith("/limits"):
+            self._send_json({"DailyApiRequests": {"Max": 100000, "Remaining": 99000}})
+        else:
+            self._send_json({"error": "not found"}, status=404)
+
+    def _send_results(self, query):
+        offset = int(query.get("locator", ["0"])[0])
+        page_size = int(query.get("maxRecords", [DEFAULT_PAGE_SIZE])[0])
+        end = min(offset + page_size, self.server.records)
+        body = render_contacts(offset, end).encode()
+
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Sforce-Locator", str(end) if end < self.server.records else "null")
+        self.send_header("Sforce-NumberOfRecords", str(end - offset))
+        self.end_headers()
+
+        for start in range(0, len(body), SEND_CHUNK_SIZE):
+            chunk = body[start:start + SEND_CHUNK_SIZE]
+            self.wfile.write(chunk)
+            if self.server.bandwidth:
+                time.sleep(len(chunk) / self.server.bandwidth)
+
+    def _send_json(self, payload, status: int = 200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def render_contacts(start: int, end: int) -> str:
+    """CSV for generated contacts start..end-1, header included, as Bulk API sends it."""
+    lines = [",".join(f'"{column}"' for column in CONTACT_COLUMNS)]
+    for i in range(start, end):
+        values = [
+            f"003{i:015d}",
+            f"First{i % 977}",
+            f"Last{i % 7919}",
+            f"contact{i}@example.org",
+            f"(555) {i % 1000:03d}-{i % 10000:04d}",
+            "Los Angeles",
+            "CA",
+            SPECIALTIES[i % len(SPECIALTIES)],
+            f"{1_000_000_000 + i}",
+            "2025-01-15T08:30:00.000Z",
+        ]
+        lines.append(",".join(f'"{value}"' for value in values))
+    return "\n".join(lines) + "\n"
+
+
+def start_standin(
+    records: int,
+    latency_ms: float = 0,
+    bandwidth_mbps: Optional[float] = None,
+    port: int = 0,
+) -> BulkApiStandin:
+    """Start the stand-in on a background thread; call shutdown() when done."""
+    server = BulkApiStandin(("127.0.0.1", port), records, latency_ms, bandwidth_mbps)
+    threading.Thread(target=server.serve_forever, name="bulk-api-standin", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the Salesforce Bulk API 2.0 query endpoints")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--records", type=int, default=600_000, help="Records returned by every query job")
+    parser.add_argument("--latency-ms", type=float, default=200, help="Delay before each result page")
+    parser.add_argument("--bandwidth-mbps", type=float, default=None, help="Throttle result bodies (default: unthrottled)")
+    args = parser.parse_args()
+
+    server = BulkApiStandin(("127.0.0.1", args.port), args.records, args.latency_ms, args.bandwidth_mbps)
+    print(f"Bulk API stand-in listening on {server.base_url} ({args.records:,} records per job)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"{server.requests:,} requests over {server.connections:,} connections")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
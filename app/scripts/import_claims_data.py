@@ -19,6 +19,9 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from database.database_utils import DatabaseUtils
 from database.data_models.claims_data import ClaimsProvider, SiteOfService, ClaimsVisit
+from services.claims_aggregate_service import ClaimsAggregateService
+from services.claims_statistics_service import ClaimsStatisticsCache
+from services.filter_options_cache import FilterOptionsCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -330,6 +333,20 @@ class ClaimsDataImporter:
             return parts[0].strip()
         return legacy_id
     
+    def refresh_aggregates(self) -> None:
+        """Rebuild the precomputed claims aggregates and invalidate cached filter options and statistics"""
+        session = self.SessionLocal()
+        try:
+            ClaimsAggregateService(session).refresh_all()
+            session.commit()
+            FilterOptionsCache.invalidate(session, FilterOptionsCache.CLAIMS)
+            ClaimsStatisticsCache.invalidate(session)
+        except Exception as e:
+            logger.error(f"Error refreshing claims aggregates: {e}")
+            session.rollback()
+        finally:
+            session.close()
+    
     def run_import(self) -> None:
         """Run the complete import process"""
         logger.info("Starting complete claims data import...")
@@ -339,6 +356,9 @@ class ClaimsDataImporter:
         self.import_sites()
         self.import_visits()
         
+        # Rebuild aggregates so the map and site endpoints see the new visits
+        self.refresh_aggregates()
+        
         logger.info("Claims data import complete!")
 
 
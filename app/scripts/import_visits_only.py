@@ -13,6 +13,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from database.database_utils import DatabaseUtils
 from database.data_models.claims_data import ClaimsProvider, SiteOfService, ClaimsVisit
+from services.claims_aggregate_service import ClaimsAggregateService
+from services.claims_statistics_service import ClaimsStatisticsCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -131,6 +133,11 @@ def import_visits_only():
         session.commit()
         logger.info(f"Visit import complete. Imported: {imported_count}, Skipped: {skipped_count}")
         
+        # Rebuild aggregates so the map and site endpoints see the new visits
+        ClaimsAggregateService(session).refresh_all()
+        session.commit()
+        ClaimsStatisticsCache.invalidate(session)
+        
     except Exception as e:
         logger.error(f"Error during visit import: {e}")
         session.rollback()
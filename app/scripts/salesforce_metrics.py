@@ -0,0 +1,55 @@
+"""
+Salesforce Sync Metrics Report
+
+Reports on the telemetry snapshots the Salesforce services write next to
+their API log (see services/salesforce_files/salesforce_telemetry.py): per
+operation and object, calls, errors, where the time went, latency
+percentiles, rows/sec and MB downloaded, plus the last API-limit headroom
+each process saw. Snapshots are rewritten every few seconds, so a sync that
+is still running can be watched as it goes.
+
+Usage:
+    python scripts/salesforce_metrics.py
+    python scripts/salesforce_metrics.py --date 20250115 --all
+    python scripts/salesforce_metrics.py --format prometheus > /var/lib/node_exporter/salesforce.prom
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.salesforce_files.salesforce_telemetry import (
+    format_prometheus,
+    format_report,
+    load_snapshots,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report Salesforce sync telemetry")
+    parser.add_argument("--log-dir", default="logs", help="Directory the services log to")
+    parser.add_argument("--date", help="Day to report on as YYYYMMDD (default today)")
+    parser.add_argument("--all", action="store_true", help="Report every process that day, not just the latest")
+    parser.add_argument("--format", choices=["table", "json", "prometheus"], default="table")
+    args = parser.parse_args()
+
+    snapshots = load_snapshots(args.log_dir, args.date)
+    if not snapshots:
+        raise SystemExit(f"No Salesforce telemetry snapshots in {args.log_dir} for that day")
+    if not args.all:
+        snapshots = snapshots[:1]
+
+    if args.format == "json":
+        print(json.dumps(snapshots, indent=2))
+    elif args.format == "prometheus":
+        print(format_prometheus(snapshots), end="")
+    else:
+        print("\n\n".join(format_report(snapshot) for snapshot in snapshots))
+
+
+if __name__ == "__main__":
+    main()
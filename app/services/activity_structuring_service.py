@@ -20,6 +20,7 @@ from database.data_models.salesforce_data import (
     SfActivityStructured,
     SfUser,
 )
+from services.filter_options_cache import FilterOptionsCache
 from workflows.salesforce_data_analyzer.analyzers import (
     MonthlyActivitySummaryAnalyzer,
 )
@@ -178,6 +179,8 @@ class ActivityStructuringService:
                     )
 
             db_session.commit()
+            if results["successful"]:
+                FilterOptionsCache.invalidate(db_session, FilterOptionsCache.ACTIVITIES)
             self.logger.info(f"Batch processing complete: {results}")
 
         except Exception as e:
@@ -0,0 +1,54 @@
+"""
+Cache Versions Service
+
+Helpers for the ``cache_versions`` table, which lets API processes notice
+that an import or sync running in another process made their in-memory
+caches stale. Writers bump a named version after committing; readers compare
+it with the version their cached copy was built from.
+"""
+
+import logging
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from database.data_models.cache_versions import CacheVersion
+
+logger = logging.getLogger(__name__)
+
+
+def get_cache_version(session: Session, name: str) -> int:
+    """Return the current version for ``name`` (0 if it was never bumped)."""
+    version = session.execute(
+        select(CacheVersion.version).where(CacheVersion.name == name)
+    ).scalar()
+    return version or 0
+
+
+def bump_cache_versions(session: Session, names: Iterable[str]) -> bool:
+    """Increment the version of every cache in ``names`` and commit.
+
+    Failures are logged rather than raised so a missing cache table never
+    fails an import or sync. Returns True if the bump was committed.
+    """
+    try:
+        for name in names:
+            statement = insert(CacheVersion).values(name=name, version=1)
+            session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[CacheVersion.name],
+                    set_={
+                        "version": CacheVersion.version + 1,
+                        "updated_at": statement.excluded.updated_at,
+                    },
+                )
+            )
+        session.commit()
+        return True
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.warning(f"Could not record cache invalidation: {str(e)}")
+        return False
@@ -0,0 +1,192 @@
+"""
+Claims Aggregate Service
+
+Maintains the precomputed claims rollup tables that back the Market Explorer
+map and list endpoints. The aggregates are rebuilt wholesale after each claims
+import so request handlers can read them without touching claims_visits.
+"""
+
+import logging
+from datetime import datetime
+
+from sqlalchemy import case, delete, distinct, func, insert, select
+from sqlalchemy.orm import Session
+
+from database.data_models.claims_data import (
+    ClaimsProvider,
+    ClaimsProviderGroupAggregate,
+    ClaimsSiteAggregate,
+    ClaimsSiteProviderGroupAggregate,
+    ClaimsVisit,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ClaimsAggregateService:
+    """Service for rebuilding claims aggregate tables.
+
+    The rebuilds do not commit; callers commit once they are done, so a
+    refresh is atomic with whatever else they wrote in the same transaction.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_site_aggregates(self) -> int:
+        """
+        Rebuild claims_site_aggregates from claims_visits.
+
+        The delete and insert run in the caller's transaction, so readers see
+        either the old or the new rollup, never a partially rebuilt table.
+
+        Returns the number of site aggregate rows written.
+        """
+        logger.info("Refreshing claims site aggregates...")
+
+        rollup = select(
+            ClaimsVisit.site_id,
+            func.coalesce(func.sum(ClaimsVisit.visits), 0),
+            func.count(distinct(ClaimsVisit.provider_id)),
+            func.coalesce(func.sum(case((ClaimsVisit.has_oncology, ClaimsVisit.visits), else_=0)), 0),
+            func.coalesce(func.sum(case((ClaimsVisit.has_surgery, ClaimsVisit.visits), else_=0)), 0),
+            func.coalesce(func.sum(case((ClaimsVisit.has_inpatient, ClaimsVisit.visits), else_=0)), 0),
+            func.coalesce(func.bool_or(ClaimsVisit.has_oncology), False),
+            func.coalesce(func.bool_or(ClaimsVisit.has_surgery), False),
+            func.coalesce(func.bool_or(ClaimsVisit.has_inpatient), False),
+            func.now(),
+        ).group_by(ClaimsVisit.site_id)
+
+        self.db.execute(delete(ClaimsSiteAggregate))
+        result = self.db.execute(
+            insert(ClaimsSiteAggregate).from_select(
+                [
+                    ClaimsSiteAggregate.site_id,
+                    ClaimsSiteAggregate.total_visits,
+                    ClaimsSiteAggregate.provider_count,
+                    ClaimsSiteAggregate.oncology_visits,
+                    ClaimsSiteAggregate.surgery_visits,
+                    ClaimsSiteAggregate.inpatient_visits,
+                    ClaimsSiteAggregate.has_oncology,
+                    ClaimsSiteAggregate.has_surgery,
+                    ClaimsSiteAggregate.has_inpatient,
+                    ClaimsSiteAggregate.refreshed_at,
+                ],
+                rollup,
+            )
+        )
+
+        row_count = result.rowcount or 0
+        logger.info(f"Claims site aggregates refreshed at {datetime.now().isoformat()}: {row_count} sites")
+        return row_count
+
+    def refresh_provider_group_aggregates(self) -> int:
+        """
+        Rebuild claims_provider_group_aggregates from claims_providers and claims_visits.
+
+        Provider counts, visit totals, specialties and geomarkets are taken from
+        the providers themselves so each provider counts once; site counts come
+        from the group's visits.
+
+        Returns the number of provider group rows written.
+        """
+        logger.info("Refreshing claims provider group aggregates...")
+
+        site_counts = (
+            select(
+                ClaimsProvider.provider_group,
+                func.count(distinct(ClaimsVisit.site_id)).label("site_count"),
+            )
+            .join(ClaimsVisit, ClaimsVisit.provider_id == ClaimsProvider.id)
+            .where(ClaimsProvider.provider_group.isnot(None))
+            .group_by(ClaimsProvider.provider_group)
+            .subquery()
+        )
+        rollup = (
+            select(
+                ClaimsProvider.provider_group,
+                func.count(ClaimsProvider.id),
+                func.coalesce(func.sum(ClaimsProvider.total_visits), 0),
+                func.coalesce(func.max(site_counts.c.site_count), 0),
+                _distinct_values(ClaimsProvider.specialty),
+                _distinct_values(ClaimsProvider.geomarket),
+                func.now(),
+            )
+            .outerjoin(site_counts, site_counts.c.provider_group == ClaimsProvider.provider_group)
+            .where(ClaimsProvider.provider_group.isnot(None))
+            .group_by(ClaimsProvider.provider_group)
+        )
+
+        self.db.execute(delete(ClaimsProviderGroupAggregate))
+        result = self.db.execute(
+            insert(ClaimsProviderGroupAggregate).from_select(
+                [
+                    ClaimsProviderGroupAggregate.provider_group,
+                    ClaimsProviderGroupAggregate.provider_count,
+                    ClaimsProviderGroupAggregate.total_visits,
+                    ClaimsProviderGroupAggregate.site_count,
+                    ClaimsProviderGroupAggregate.specialties,
+                    ClaimsProviderGroupAggregate.geomarkets,
+                    ClaimsProviderGroupAggregate.refreshed_at,
+                ],
+                rollup,
+            )
+        )
+
+        row_count = result.rowcount or 0
+        logger.info(f"Claims provider group aggregates refreshed: {row_count} groups")
+        return row_count
+
+    def refresh_site_provider_group_aggregates(self) -> int:
+        """
+        Rebuild claims_site_provider_group_aggregates from claims_visits.
+
+        Returns the number of (site, provider group) rows written.
+        """
+        logger.info("Refreshing claims site provider group aggregates...")
+
+        rollup = (
+            select(
+                ClaimsVisit.site_id,
+                ClaimsProvider.provider_group,
+                func.count(distinct(ClaimsProvider.id)),
+                func.coalesce(func.sum(ClaimsVisit.visits), 0),
+                _distinct_values(ClaimsProvider.specialty),
+                _distinct_values(ClaimsProvider.geomarket),
+                func.now(),
+            )
+            .join(ClaimsProvider, ClaimsVisit.provider_id == ClaimsProvider.id)
+            .where(ClaimsProvider.provider_group.isnot(None))
+            .group_by(ClaimsVisit.site_id, ClaimsProvider.provider_group)
+        )
+
+        self.db.execute(delete(ClaimsSiteProviderGroupAggregate))
+        result = self.db.execute(
+            insert(ClaimsSiteProviderGroupAggregate).from_select(
+                [
+                    ClaimsSiteProviderGroupAggregate.site_id,
+                    ClaimsSiteProviderGroupAggregate.provider_group,
+                    ClaimsSiteProviderGroupAggregate.provider_count,
+                    ClaimsSiteProviderGroupAggregate.total_visits,
+                    ClaimsSiteProviderGroupAggregate.specialties,
+                    ClaimsSiteProviderGroupAggregate.geomarkets,
+                    ClaimsSiteProviderGroupAggregate.refreshed_at,
+                ],
+                rollup,
+            )
+        )
+
+        row_count = result.rowcount or 0
+        logger.info(f"Claims site provider group aggregates refreshed: {row_count} rows")
+        return row_count
+
+    def refresh_all(self) -> None:
+        """Rebuild every claims aggregate table in the caller's transaction."""
+        self.refresh_site_aggregates()
+        self.refresh_provider_group_aggregates()
+        self.refresh_site_provider_group_aggregates()
+
+
+def _distinct_values(column):
+    """Distinct non-NULL values of ``column`` within a group, as an array."""
+    return func.array_remove(func.array_agg(distinct(column)), None)
@@ -0,0 +1,281 @@
+"""
+Claims Statistics Service
+
+Backs the site and provider statistics endpoints opened from the Market
+Explorer detail drawer on every marker click. Each lookup is a single
+CTE-based statement: the per-provider (or per-site) visit rollup is computed
+once and the totals and top-N lists are read from it, with the lists folded
+into JSON arrays so the whole response comes back in one row.
+
+Results are held in a process-wide LRU keyed by (kind, id). Claims imports
+call ``ClaimsStatisticsCache.invalidate`` after rebuilding the aggregates;
+other processes pick the change up through ``cache_versions``.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from database.data_models.claims_data import (
+    ClaimsProvider,
+    ClaimsSiteAggregate,
+    ClaimsVisit,
+    SiteOfService,
+)
+from schemas.claims_schema import ProviderStatistics, SiteStatistics, VisitStatistics
+from services.cache_versions import bump_cache_versions, get_cache_version
+
+# Maximum number of site/provider statistics kept per process
+CLAIMS_STATISTICS_CACHE_SIZE = int(os.getenv("CLAIMS_STATISTICS_CACHE_SIZE", "4096"))
+
+# How often the cache checks cache_versions for an out-of-process invalidation
+VERSION_CHECK_INTERVAL_SECONDS = 5
+
+TOP_SPECIALTIES_LIMIT = 5
+TOP_PROVIDERS_LIMIT = 10
+TOP_SITES_LIMIT = 10
+
+
+class ClaimsStatisticsCache:
+    """Process-wide LRU cache of site and provider statistics.
+
+    Example:
+        stats = ClaimsStatisticsCache.get(
+            session, ("site", site_id), lambda: load_site_statistics(session, site_id)
+        )
+    """
+
+    VERSION_KEY = "claims_statistics"
+
+    _lock = threading.Lock()
+    _entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+    _version: Optional[int] = None
+    _checked_at: float = 0.0
+
+    @classmethod
+    def get(cls, session: Session, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, calling ``loader`` on a miss.
+
+        None results (unknown ids) are not cached.
+        """
+        cls._check_version(session)
+        with cls._lock:
+            if key in cls._entries:
+                cls._entries.move_to_end(key)
+                return cls._entries[key]
+
+        value = loader()
+        if value is not None:
+            with cls._lock:
+                cls._entries[key] = value
+                cls._entries.move_to_end(key)
+                while len(cls._entries) > CLAIMS_STATISTICS_CACHE_SIZE:
+                    cls._entries.popitem(last=False)
+        return value
+
+    @classmethod
+    def invalidate(cls, session: Session) -> None:
+        """Drop cached statistics here and mark them stale in every other process."""
+        cls.clear()
+        bump_cache_versions(session, [cls.VERSION_KEY])
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached entry in this process."""
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def _check_version(cls, session: Session) -> None:
+        now = time.monotonic()
+        if cls._version is not None and now - cls._checked_at < VERSION_CHECK_INTERVAL_SECONDS:
+            return
+        version = get_cache_version(session, cls.VERSION_KEY)
+        with cls._lock:
+            if version != cls._version:
+                cls._entries.clear()
+                cls._version = version
+            cls._checked_at = now
+
+
+def load_site_statistics(session: Session, site_id: UUID) -> Optional[SiteStatistics]:
+    """Load statistics for one site in a single statement; None if the site does not exist."""
+    provider_visits = (
+        select(
+            ClaimsProvider.id,
+            ClaimsProvider.name,
+            ClaimsProvider.specialty,
+            func.sum(ClaimsVisit.visits).label("visits")
+        )
+        .join(ClaimsVisit, ClaimsVisit.provider_id == ClaimsProvider.id)
+        .where(ClaimsVisit.site_id == site_id)
+        .group_by(ClaimsProvider.id, ClaimsProvider.name, ClaimsProvider.specialty)
+        .cte("provider_visits")
+    )
+    top_specialties = (
+        select(
+            provider_visits.c.specialty,
+            func.sum(provider_visits.c.visits).label("visits")
+        )
+        .group_by(provider_visits.c.specialty)
+        .order_by(func.sum(provider_visits.c.visits).desc(), provider_visits.c.specialty)
+        .limit(TOP_SPECIALTIES_LIMIT)
+        .cte("top_specialties")
+    )
+    top_providers = (
+        select(provider_visits)
+        .order_by(provider_visits.c.visits.desc(), provider_visits.c.name, provider_visits.c.id)
+        .limit(TOP_PROVIDERS_LIMIT)
+        .cte("top_providers")
+    )
+
+    statement = (
+        select(
+            SiteOfService.id,
+            func.coalesce(ClaimsSiteAggregate.total_visits, 0).label("total_visits"),
+            func.coalesce(ClaimsSiteAggregate.oncology_visits, 0).label("oncology_visits"),
+            func.coalesce(ClaimsSiteAggregate.surgery_visits, 0).label("surgery_visits"),
+            func.coalesce(ClaimsSiteAggregate.inpatient_visits, 0).label("inpatient_visits"),
+            func.coalesce(ClaimsSiteAggregate.provider_count, 0).label("provider_count"),
+            _json_list(
+                top_specialties,
+                [top_specialties.c.visits.desc(), top_specialties.c.specialty],
+                specialty=top_specialties.c.specialty,
+                visits=top_specialties.c.visits
+            ).label("top_specialties"),
+            _json_list(
+                top_providers,
+                [top_providers.c.visits.desc(), top_providers.c.name, top_providers.c.id],
+                name=top_providers.c.name,
+                specialty=top_providers.c.specialty,
+                visits=top_providers.c.visits
+            ).label("top_providers"),
+        )
+        .outerjoin(ClaimsSiteAggregate, ClaimsSiteAggregate.site_id == SiteOfService.id)
+        .where(SiteOfService.id == site_id)
+    )
+
+    row = session.execute(statement).first()
+    if row is None:
+        return None
+
+    return SiteStatistics(
+        site_id=row.id,
+        visit_stats=_visit_statistics(row),
+        provider_count=row.provider_count,
+        top_specialties=[
+            {"specialty": item["specialty"], "visits": int(item["visits"])}
+            for item in row.top_specialties
+        ],
+        top_providers=[
+            {"name": item["name"], "specialty": item["specialty"], "visits": int(item["visits"])}
+            for item in row.top_providers
+        ]
+    )
+
+
+def load_provider_statistics(session: Session, provider_id: UUID) -> Optional[ProviderStatistics]:
+    """Load statistics for one provider in a single statement; None if the provider does not exist."""
+    site_visits = (
+        select(
+            ClaimsVisit.site_id,
+            func.sum(ClaimsVisit.visits).label("visits"),
+            func.sum(case((ClaimsVisit.has_oncology, ClaimsVisit.visits), else_=0)).label("oncology_visits"),
+            func.sum(case((ClaimsVisit.has_surgery, ClaimsVisit.visits), else_=0)).label("surgery_visits"),
+            func.sum(case((ClaimsVisit.has_inpatient, ClaimsVisit.visits), else_=0)).label("inpatient_visits")
+        )
+        .where(ClaimsVisit.provider_id == provider_id)
+        .group_by(ClaimsVisit.site_id)
+        .cte("site_visits")
+    )
+    totals = (
+        select(
+            func.coalesce(func.sum(site_visits.c.visits), 0).label("total_visits"),
+            func.coalesce(func.sum(site_visits.c.oncology_visits), 0).label("oncology_visits"),
+            func.coalesce(func.sum(site_visits.c.surgery_visits), 0).label("surgery_visits"),
+            func.coalesce(func.sum(site_visits.c.inpatient_visits), 0).label("inpatient_visits"),
+            func.count(site_visits.c.site_id).label("site_count")
+        )
+        .cte("totals")
+    )
+    top_sites = (
+        select(SiteOfService.id, SiteOfService.name, SiteOfService.city, site_visits.c.visits)
+        .join(site_visits, site_visits.c.site_id == SiteOfService.id)
+        .order_by(site_visits.c.visits.desc(), SiteOfService.name, SiteOfService.id)
+        .limit(TOP_SITES_LIMIT)
+        .cte("top_sites")
+    )
+
+    statement = (
+        select(
+            ClaimsProvider.id,
+            totals.c.total_visits,
+            totals.c.oncology_visits,
+            totals.c.surgery_visits,
+            totals.c.inpatient_visits,
+            totals.c.site_count,
+            _json_list(
+                top_sites,
+                [top_sites.c.visits.desc(), top_sites.c.name, top_sites.c.id],
+                name=top_sites.c.name,
+                city=top_sites.c.city,
+                visits=top_sites.c.visits
+            ).label("top_sites"),
+        )
+        .join(totals, true())
+        .where(ClaimsProvider.id == provider_id)
+    )
+
+    row = session.execute(statement).first()
+    if row is None:
+        return None
+
+    return ProviderStatistics(
+        provider_id=row.id,
+        visit_stats=_visit_statistics(row),
+        site_count=row.site_count,
+        top_sites=[
+            {"name": item["name"], "city": item["city"], "visits": int(item["visits"])}
+            for item in row.top_sites
+        ]
+    )
+
+
+def _json_list(source, order_by, **fields):
+    """Scalar subquery folding ``source`` rows into a JSON array in ``order_by`` order.
+
+    ``order_by`` must end in a unique key, so equal visit counts come out in
+    the same order every time; the arrays are cached and served with ETags.
+    """
+    pairs = []
+    for name, column in fields.items():
+        pairs.extend([name, column])
+    return (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(func.json_build_object(*pairs), *order_by)),
+                func.json_build_array()
+            )
+        )
+        .select_from(source)
+        .scalar_subquery()
+    )
+
+
+def _visit_statistics(row) -> VisitStatistics:
+    total_visits = int(row.total_visits or 0)
+    inpatient_visits = int(row.inpatient_visits or 0)
+    return VisitStatistics(
+        total_visits=total_visits,
+        oncology_visits=int(row.oncology_visits or 0),
+        surgery_visits=int(row.surgery_visits or 0),
+        inpatient_visits=inpatient_visits,
+        outpatient_visits=total_visits - inpatient_visits
+    )
@@ -0,0 +1,123 @@
+"""
+Columnar Response Service
+
+Opt-in compact encodings for the map endpoints, which return tens of
+thousands of points per request. Instead of one JSON object per marker the
+payload carries one array per field, built straight from the query rows, so
+no per-row response models are constructed and field names are written once.
+
+Clients opt in with the Accept header:
+
+* ``application/vnd.apache.arrow.stream`` - Arrow IPC stream with a single
+  record batch; response metadata is stored as JSON under the ``meta`` key of
+  the schema metadata. Requires pyarrow, which is an optional dependency.
+* ``application/vnd.columnar+json`` - ``{"length": n, "columns": {...}}``
+  plus the endpoint's metadata fields at the top level.
+
+Any other Accept value keeps the regular row-oriented JSON response.
+"""
+
+import json
+from typing import Any, Dict, Optional, Sequence
+
+from fastapi import HTTPException, Request, Response
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.columnar+json"
+
+COLUMNAR_MEDIA_TYPES = (ARROW_STREAM_MEDIA_TYPE, COLUMNAR_JSON_MEDIA_TYPE)
+
+
+def arrow_available() -> bool:
+    """Return True if pyarrow is installed and Arrow responses can be served."""
+    return pa is not None
+
+
+def negotiate_columnar_format(request: Request) -> Optional[str]:
+    """Pick a columnar media type from the Accept header.
+
+    Returns None when the client did not ask for a columnar format, so the
+    endpoint falls back to its regular JSON response. Types are tried in the
+    order the client listed them; Arrow is skipped when pyarrow is missing and
+    a 406 is raised if it was the only columnar type requested.
+    """
+    accept = request.headers.get("accept")
+    if not accept:
+        return None
+
+    requested = []
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip().lower()
+        if media_type in COLUMNAR_MEDIA_TYPES and "q=0" not in params.replace(" ", "").split(";"):
+            requested.append(media_type)
+
+    for media_type in requested:
+        if media_type == ARROW_STREAM_MEDIA_TYPE and not arrow_available():
+            continue
+        return media_type
+
+    if requested:
+        raise HTTPException(
+            status_code=406,
+            detail=f"{ARROW_STREAM_MEDIA_TYPE} is not available on this server; "
+                   f"accept {COLUMNAR_JSON_MEDIA_TYPE} instead"
+        )
+    return None
+
+
+def columnar_response(
+    media_type: str,
+    columns: Dict[str, Sequence[Any]],
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Response:
+    """Encode parallel column arrays in the negotiated columnar format.
+
+    Args:
+        media_type: One of COLUMNAR_MEDIA_TYPES, as returned by negotiate_columnar_format
+        columns: Field name to values; every column must have the same length
+        metadata: JSON-serializable response fields that are not per row
+            (totals, bounds, zoom)
+    """
+    metadata = metadata or {}
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    length = lengths.pop() if lengths else 0
+
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        return Response(
+            content=_encode_arrow(columns, metadata),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+            headers={"Vary": "Accept"}
+        )
+
+    body = {**metadata, "length": length, "columns": {name: list(values) for name, values in columns.items()}}
+    return Response(
+        content=json.dumps(body, separators=(",", ":"), allow_nan=False).encode("utf-8"),
+        media_type=COLUMNAR_JSON_MEDIA_TYPE,
+        headers={"Vary": "Accept"}
+    )
+
+
+def _encode_arrow(columns: Dict[str, Sequence[Any]], metadata: Dict[str, Any]) -> bytes:
+    table = pa.table(
+        {name: _arrow_array(values) for name, values in columns.items()}
+    ).replace_schema_metadata({"meta": json.dumps(metadata, separators=(",", ":"))})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _arrow_array(values: Sequence[Any]):
+    """Convert one column, dictionary-encoding low-cardinality strings (site types, cities)."""
+    array = pa.array(list(values))
+    if pa.types.is_string(array.type) and len(set(values)) * 2 <= len(values):
+        return array.dictionary_encode()
+    return array
@@ -0,0 +1,182 @@
+"""
+Filter Options Cache
+
+Process-wide cache for the dropdown values served by the claims, contacts,
+activities and relationships ``/filter-options`` endpoints. Those lists are
+built from DISTINCT scans over large tables but only change when an import,
+sync or seeding run writes new data, so each one is computed once, held for
+a TTL and served with an ETag so browsers can revalidate with If-None-Match
+instead of downloading the lists again.
+
+Writers call ``FilterOptionsCache.invalidate`` after committing. Because
+imports and syncs run in their own processes, invalidation bumps a row in
+``cache_versions``; API processes compare against it at most once every
+VERSION_CHECK_INTERVAL_SECONDS and reload when it moved.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from services.cache_versions import bump_cache_versions, get_cache_version
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long cached options are served without a reload
+FILTER_OPTIONS_TTL_SECONDS = int(os.getenv("FILTER_OPTIONS_TTL_SECONDS", "900"))
+
+# How often a cached entry checks cache_versions for an out-of-process invalidation
+VERSION_CHECK_INTERVAL_SECONDS = 5
+
+
+@dataclass
+class CachedOptions:
+    """One cached filter-options payload and its validators."""
+
+    payload: Dict[str, Any]
+    version: int
+    etag: str
+    loaded_at: float = field(default_factory=time.monotonic)
+    checked_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Response headers that let the browser revalidate instead of refetching."""
+        return {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """Return True if an If-None-Match header already names this payload."""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == self.etag for tag in candidates
+        )
+
+
+class FilterOptionsCache:
+    """Process-wide holder for cached filter options.
+
+    Example:
+        options = FilterOptionsCache.get(FilterOptionsCache.CLAIMS, session, load_filter_options)
+        return filter_options_response(request, options)
+    """
+
+    CLAIMS = "claims"
+    CONTACTS = "contacts"
+    ACTIVITIES = "activities"
+    RELATIONSHIPS = "relationships"
+
+    # Guards the dictionaries below; loads hold the per-name lock instead
+    _lock = threading.Lock()
+    _load_locks: Dict[str, threading.Lock] = {}
+    _entries: Dict[str, CachedOptions] = {}
+
+    @classmethod
+    def get(
+        cls,
+        name: str,
+        session: Session,
+        loader: Callable[[Session], Any],
+    ) -> CachedOptions:
+        """Return cached options for ``name``, calling ``loader`` when stale.
+
+        The loader's result is converted to plain JSON types once, so cache hits
+        skip both the queries and response model validation.
+        """
+        entry = cls._entries.get(name)
+        version = cls._fresh_version(entry, session, name)
+        if version is None:
+            return entry
+
+        # One load per name at a time: concurrent misses wait for the first
+        # one's result instead of each running the loader, and a slow load
+        # of one name does not hold up the others
+        with cls._load_lock(name):
+            current = cls._entries.get(name)
+            if current is not entry:
+                # Reloaded (or invalidated) while this request waited
+                version = cls._fresh_version(current, session, name)
+                if version is None:
+                    return current
+
+            payload = jsonable_encoder(loader(session))
+            digest = hashlib.sha1(
+                json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+            entry = CachedOptions(
+                payload=payload,
+                version=version,
+                etag=f'"{name}-{digest[:20]}"'
+            )
+            with cls._lock:
+                cls._entries[name] = entry
+            return entry
+
+    @classmethod
+    def _fresh_version(
+        cls, entry: Optional[CachedOptions], session: Session, name: str
+    ) -> Optional[int]:
+        """Return None if ``entry`` can be served, else the version to load."""
+        now = time.monotonic()
+        if entry is not None and now - entry.loaded_at < FILTER_OPTIONS_TTL_SECONDS:
+            if now - entry.checked_at < VERSION_CHECK_INTERVAL_SECONDS:
+                return None
+            version = cls._get_version(session, name)
+            if version == entry.version:
+                entry.checked_at = now
+                return None
+            return version
+        return cls._get_version(session, name)
+
+    @classmethod
+    def _load_lock(cls, name: str) -> threading.Lock:
+        with cls._lock:
+            return cls._load_locks.setdefault(name, threading.Lock())
+
+    @classmethod
+    def invalidate(cls, session: Session, *names: str) -> None:
+        """Mark cached options stale in this and every other process.
+
+        Called by imports and syncs after their data is committed. Failures are
+        logged rather than raised so a missing cache table never fails a sync;
+        the TTL still bounds how stale other processes can get.
+        """
+        names = names or (cls.CLAIMS, cls.CONTACTS, cls.ACTIVITIES, cls.RELATIONSHIPS)
+        with cls._lock:
+            for name in names:
+                cls._entries.pop(name, None)
+
+        if bump_cache_versions(session, [cls._key(name) for name in names]):
+            logger.info(f"Invalidated filter options: {', '.join(names)}")
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached entry in this process."""
+        with cls._lock:
+            cls._entries.clear()
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return f"filter_options:{name}"
+
+    @classmethod
+    def _get_version(cls, session: Session, name: str) -> int:
+        return get_cache_version(session, cls._key(name))
+
+
+def filter_options_response(request: Request, options: CachedOptions) -> Response:
+    """Return 304 Not Modified if the client already has these options, else the JSON payload."""
+    if options.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=options.headers)
+    return JSONResponse(options.payload, headers=options.headers)
@@ -0,0 +1,392 @@
+"""
+Geo Index Service
+
+In-process spatial indexes over site of service and contact coordinates.
+Points are bucketed into Web Mercator grid cells (and, for sites, rolled up
+into a per-zoom cluster pyramid), so viewport queries and map clustering touch
+a bounded number of cells instead of every row in the table. Bounding box
+queries return ID sets that the API layer hands to SQL in place of lat/lng
+BETWEEN predicates, which the composite coordinate B-tree serves poorly.
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from database.data_models.claims_data import SiteOfService, ClaimsSiteAggregate
+from database.data_models.salesforce_data import SfContact
+
+logger = logging.getLogger(__name__)
+
+# Grid cells per 256px map tile side, i.e. 64px clusters on screen
+CELLS_PER_TILE = 4
+
+# Zoom level at and above which individual markers are returned
+MAX_CLUSTER_ZOOM = 14
+
+# Web Mercator latitude limit
+MAX_LATITUDE = 85.05112878
+
+# How often a cached index checks the database for a newer import or sync
+INDEX_CHECK_INTERVAL_SECONDS = 60
+
+# Largest ID set handed to SQL; beyond this a coordinate range scan is cheaper
+MAX_ID_FILTER_SIZE = 5000
+
+Cell = Tuple[int, int]
+BBox = Tuple[float, float, float, float]  # (south, west, north, east)
+
+
+def cell_for(latitude: float, longitude: float, zoom: int) -> Cell:
+    """Return the grid cell containing a coordinate at the given zoom level."""
+    scale = CELLS_PER_TILE * (1 << zoom)
+    lat = max(min(latitude, MAX_LATITUDE), -MAX_LATITUDE)
+    sin_lat = math.sin(math.radians(lat))
+    x = (longitude + 180.0) / 360.0
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return (
+        min(max(int(x * scale), 0), scale - 1),
+        min(max(int(y * scale), 0), scale - 1),
+    )
+
+
+@dataclass(slots=True)
+class SitePoint:
+    """A site of service with its precomputed visit rollup."""
+
+    id: UUID
+    name: str
+    latitude: float
+    longitude: float
+    site_type: Optional[str] = None
+    city: Optional[str] = None
+    county: Optional[str] = None
+    geomarket: Optional[str] = None
+    total_visits: int = 0
+    provider_count: int = 0
+    has_oncology: bool = False
+    has_surgery: bool = False
+    has_inpatient: bool = False
+
+
+@dataclass(slots=True)
+class ContactPoint:
+    """A Salesforce contact mailing location."""
+
+    id: UUID
+    latitude: float
+    longitude: float
+
+
+@dataclass(slots=True)
+class Cluster:
+    """Running rollup of the sites that fall into one grid cell."""
+
+    site_count: int = 0
+    total_visits: int = 0
+    provider_count: int = 0
+    latitude_sum: float = 0.0
+    longitude_sum: float = 0.0
+    north: float = -90.0
+    south: float = 90.0
+    east: float = -180.0
+    west: float = 180.0
+    point: Optional[SitePoint] = None
+
+    @property
+    def latitude(self) -> float:
+        return self.latitude_sum / self.site_count
+
+    @property
+    def longitude(self) -> float:
+        return self.longitude_sum / self.site_count
+
+    def add_point(self, point: SitePoint) -> None:
+        self.point = point if self.site_count == 0 else None
+        self.site_count += 1
+        self.total_visits += point.total_visits
+        self.provider_count += point.provider_count
+        self.latitude_sum += point.latitude
+        self.longitude_sum += point.longitude
+        self.north = max(self.north, point.latitude)
+        self.south = min(self.south, point.latitude)
+        self.east = max(self.east, point.longitude)
+        self.west = min(self.west, point.longitude)
+
+    def merge(self, other: "Cluster") -> None:
+        self.point = other.point if self.site_count == 0 else None
+        self.site_count += other.site_count
+        self.total_visits += other.total_visits
+        self.provider_count += other.provider_count
+        self.latitude_sum += other.latitude_sum
+        self.longitude_sum += other.longitude_sum
+        self.north = max(self.north, other.north)
+        self.south = min(self.south, other.south)
+        self.east = max(self.east, other.east)
+        self.west = min(self.west, other.west)
+
+
+def _cells_in_bbox(cells: Dict[Cell, object], bbox: BBox, zoom: int) -> Iterable[Cell]:
+    """Yield the occupied cells overlapping a bounding box.
+
+    Walks the cell range covered by the box when it is smaller than the number
+    of occupied cells, otherwise scans the occupied cells directly, so the cost
+    is bounded by whichever is smaller.
+    """
+    south, west, north, east = bbox
+    min_x, min_y = cell_for(north, west, zoom)
+    max_x, max_y = cell_for(south, east, zoom)
+    if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(cells):
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                if (x, y) in cells:
+                    yield (x, y)
+    else:
+        for x, y in cells:
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                yield (x, y)
+
+
+def _in_bbox(point, bbox: BBox) -> bool:
+    south, west, north, east = bbox
+    return south <= point.latitude <= north and west <= point.longitude <= east
+
+
+def cluster_points(points: Iterable[SitePoint], zoom: int) -> List[Cluster]:
+    """Group an arbitrary set of points into grid clusters at a zoom level."""
+    clusters: Dict[Cell, Cluster] = {}
+    for point in points:
+        cell = cell_for(point.latitude, point.longitude, zoom)
+        cluster = clusters.get(cell)
+        if cluster is None:
+            cluster = clusters[cell] = Cluster()
+        cluster.add_point(point)
+    return list(clusters.values())
+
+
+class GeoGridIndex:
+    """Grid index and optional cluster pyramid over a fixed set of points.
+
+    Points are any objects with ``id``, ``latitude`` and ``longitude``
+    attributes, bucketed into cells at ``max_zoom``. When ``build_clusters``
+    is set (site points only), coarser zoom levels are built bottom-up by
+    merging each 2x2 block of cells into its parent, so clusters for any zoom
+    are looked up rather than computed per request.
+    """
+
+    def __init__(self, points: Iterable, max_zoom: int = MAX_CLUSTER_ZOOM, build_clusters: bool = True):
+        self.max_zoom = max_zoom
+        self.points: List = list(points)
+        self._cells: Dict[Cell, List] = {}
+        self._pyramid: Dict[int, Dict[Cell, Cluster]] = {}
+
+        for point in self.points:
+            cell = cell_for(point.latitude, point.longitude, max_zoom)
+            self._cells.setdefault(cell, []).append(point)
+
+        if not build_clusters:
+            return
+
+        level: Dict[Cell, Cluster] = {}
+        for cell, cell_points in self._cells.items():
+            cluster = level[cell] = Cluster()
+            for point in cell_points:
+                cluster.add_point(point)
+        self._pyramid[max_zoom] = level
+
+        for zoom in range(max_zoom - 1, -1, -1):
+            parent_level: Dict[Cell, Cluster] = {}
+            for (x, y), child in level.items():
+                parent = parent_level.get((x >> 1, y >> 1))
+                if parent is None:
+                    parent = parent_level[(x >> 1, y >> 1)] = Cluster()
+                parent.merge(child)
+            self._pyramid[zoom] = parent_level
+            level = parent_level
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def query_bbox(self, bbox: Optional[BBox] = None) -> List:
+        """Return the points inside a bounding box (all points when None)."""
+        if bbox is None:
+            return list(self.points)
+        results = []
+        for cell in _cells_in_bbox(self._cells, bbox, self.max_zoom):
+            results.extend(p for p in self._cells[cell] if _in_bbox(p, bbox))
+        return results
+
+    def ids_in_bbox(self, bbox: BBox, limit: Optional[int] = None) -> Optional[List[UUID]]:
+        """Return the IDs of points inside a bounding box.
+
+        When ``limit`` is given and more points match, returns None early so
+        callers can fall back to a range scan without materializing the set.
+        """
+        ids = []
+        for cell in _cells_in_bbox(self._cells, bbox, self.max_zoom):
+            ids.extend(p.id for p in self._cells[cell] if _in_bbox(p, bbox))
+            if limit is not None and len(ids) > limit:
+                return None
+        return ids
+
+    def clusters(self, zoom: int, bbox: Optional[BBox] = None) -> List[Cluster]:
+        """Return the precomputed clusters for a zoom level within a bounding box."""
+        zoom = min(max(zoom, 0), self.max_zoom)
+        level = self._pyramid[zoom]
+        if bbox is None:
+            return list(level.values())
+        return [level[cell] for cell in _cells_in_bbox(level, bbox, zoom)]
+
+
+def bbox_id_filter(id_column, index: GeoGridIndex, bbox: BBox):
+    """Build an ``id IN (...)`` predicate for the points inside a bounding box.
+
+    Returns None when the box holds more than MAX_ID_FILTER_SIZE points; at
+    that selectivity a coordinate range scan is the cheaper plan.
+    """
+    ids = index.ids_in_bbox(bbox, limit=MAX_ID_FILTER_SIZE)
+    if ids is None:
+        return None
+    return id_column.in_(ids)
+
+
+class GeoIndexManager:
+    """Process-wide holder for the site and contact geo indexes.
+
+    Each index is built lazily on first use and rebuilt when its source table
+    changes, which is checked at most once every INDEX_CHECK_INTERVAL_SECONDS
+    so steady-state requests never hit the database for it. Claims imports
+    and Salesforce contact syncs run in separate processes, so the fingerprint
+    check (rather than an in-process callback) is what picks up their writes;
+    ``invalidate`` forces an immediate rebuild within the current process.
+
+    Example:
+        index = GeoIndexManager.get_site_index(session)
+        clusters = index.clusters(zoom=8, bbox=(33.5, -118.7, 34.4, -117.6))
+    """
+
+    SITES = "sites"
+    CONTACTS = "contacts"
+
+    _lock = threading.Lock()
+    _indexes: Dict[str, GeoGridIndex] = {}
+    _versions: Dict[str, tuple] = {}
+    _checked_at: Dict[str, float] = {}
+
+    @classmethod
+    def get_site_index(cls, session: Session) -> GeoGridIndex:
+        """Return the current site index, rebuilding it if the data changed."""
+        return cls._get_index(cls.SITES, session, cls._get_site_version, cls._build_site_index)
+
+    @classmethod
+    def get_contact_index(cls, session: Session) -> GeoGridIndex:
+        """Return the current contact index, rebuilding it if the data changed."""
+        return cls._get_index(cls.CONTACTS, session, cls._get_contact_version, cls._build_contact_index)
+
+    @classmethod
+    def invalidate(cls, name: Optional[str] = None) -> None:
+        """Drop one cached index (or all of them) so the next request rebuilds it."""
+        with cls._lock:
+            names = [name] if name else list(cls._indexes)
+            for key in names:
+                cls._indexes.pop(key, None)
+                cls._versions.pop(key, None)
+                cls._checked_at.pop(key, None)
+
+    @classmethod
+    def _get_index(cls, name: str, session: Session, version_fn, build_fn) -> GeoGridIndex:
+        now = time.monotonic()
+        index = cls._indexes.get(name)
+        if index is not None and now - cls._checked_at.get(name, 0.0) < INDEX_CHECK_INTERVAL_SECONDS:
+            return index
+
+        with cls._lock:
+            index = cls._indexes.get(name)
+            if index is not None and now - cls._checked_at.get(name, 0.0) < INDEX_CHECK_INTERVAL_SECONDS:
+                return index
+
+            version = version_fn(session)
+            if index is None or version != cls._versions.get(name):
+                index = cls._indexes[name] = build_fn(session)
+                cls._versions[name] = version
+            cls._checked_at[name] = now
+            return index
+
+    @staticmethod
+    def _get_site_version(session: Session) -> tuple:
+        """Cheap fingerprint of the site and aggregate tables."""
+        return tuple(session.execute(
+            select(
+                select(func.count(SiteOfService.id)).scalar_subquery(),
+                select(func.max(SiteOfService.updated_at)).scalar_subquery(),
+                select(func.max(ClaimsSiteAggregate.refreshed_at)).scalar_subquery(),
+            )
+        ).one())
+
+    @staticmethod
+    def _get_contact_version(session: Session) -> tuple:
+        """Cheap fingerprint of the contact table."""
+        return tuple(session.execute(
+            select(func.count(SfContact.id), func.max(SfContact.last_synced_at))
+        ).one())
+
+    @staticmethod
+    def _build_site_index(session: Session) -> GeoGridIndex:
+        started = time.perf_counter()
+        rows = session.query(
+            SiteOfService.id,
+            SiteOfService.name,
+            SiteOfService.latitude,
+            SiteOfService.longitude,
+            SiteOfService.site_type,
+            SiteOfService.city,
+            SiteOfService.county,
+            SiteOfService.geomarket,
+            func.coalesce(ClaimsSiteAggregate.total_visits, 0),
+            func.coalesce(ClaimsSiteAggregate.provider_count, 0),
+            func.coalesce(ClaimsSiteAggregate.has_oncology, False),
+            func.coalesce(ClaimsSiteAggregate.has_surgery, False),
+            func.coalesce(ClaimsSiteAggregate.has_inpatient, False),
+        ).outerjoin(
+            ClaimsSiteAggregate,
+            ClaimsSiteAggregate.site_id == SiteOfService.id
+        ).filter(
+            SiteOfService.latitude.isnot(None),
+            SiteOfService.longitude.isnot(None)
+        ).all()
+
+        index = GeoGridIndex(SitePoint(*row) for row in rows)
+        logger.info(
+            f"Built site geo index with {len(index)} sites in "
+            f"{(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+        return index
+
+    @staticmethod
+    def _build_contact_index(session: Session) -> GeoGridIndex:
+        started = time.perf_counter()
+        rows = session.execute(
+            select(
+                SfContact.id,
+                SfContact.mailing_latitude,
+                SfContact.mailing_longitude,
+            ).where(
+                SfContact.is_deleted.is_(False),
+                SfContact.mailing_latitude.isnot(None),
+                SfContact.mailing_longitude.isnot(None),
+            )
+        ).all()
+
+        index = GeoGridIndex((ContactPoint(*row) for row in rows), build_clusters=False)
+        logger.info(
+            f"Built contact geo index with {len(index)} contacts in "
+            f"{(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+        return index
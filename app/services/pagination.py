@@ -0,0 +1,224 @@
+"""
+Pagination Service
+
+Shared keyset (cursor) pagination for the list endpoints. A page is fetched
+with ``WHERE (sort_key, id) > (last_sort_key, last_id)`` instead of OFFSET, so
+deep pages cost the same as the first one. Cursors are opaque URL-safe tokens
+that carry the last row's sort values plus a signature of the sort they were
+issued for.
+
+Totals are optional: ``exact`` keeps the full COUNT(*), ``estimate`` counts
+up to ESTIMATE_COUNT_CAP rows and falls back to the planner's row estimate
+beyond that, and ``none`` skips counting entirely.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, false, func, or_, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, ColumnElement, Executable
+
+T = TypeVar("T")
+
+COUNT_MODE_PATTERN = "^(exact|estimate|none)$"
+
+# Rows counted exactly in "estimate" mode before switching to the planner estimate
+ESTIMATE_COUNT_CAP = 10000
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token is malformed or was issued for another sort."""
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a keyset sort, in ORDER BY order."""
+
+    column: ColumnElement
+    descending: bool = False
+
+    def order_by(self) -> ColumnElement:
+        return self.column.desc() if self.descending else self.column.asc()
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results plus what the caller needs for pagination metadata."""
+
+    items: List[T]
+    total: Optional[int]
+    total_is_estimate: bool
+    has_next: bool
+    next_cursor: Optional[str]
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) wrapper that keeps the inner statement's bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def encode_cursor(signature: str, values: Sequence[Any]) -> str:
+    """Encode the sort values of the last row on a page as an opaque token."""
+    payload = json.dumps({"s": signature, "k": jsonable_encoder(list(values))}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, signature: str, keys: Sequence[SortKey]) -> List[Any]:
+    """Decode a cursor token back into typed sort values for ``keys``."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["k"]
+        token_signature = payload["s"]
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise InvalidCursorError("Malformed cursor") from e
+
+    if token_signature != signature or len(values) != len(keys):
+        raise InvalidCursorError("Cursor does not match the requested sort order")
+
+    try:
+        return [_coerce(key.column, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Malformed cursor value") from e
+
+
+def keyset_condition(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """Build the predicate selecting rows strictly after ``values`` in ``keys`` order.
+
+    Expands to ``k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...`` so mixed sort
+    directions and NULL sort values (PostgreSQL sorts NULLs last ascending and
+    first descending) are handled.
+    """
+    clauses = []
+    for i, (key, value) in enumerate(zip(keys, values)):
+        equal_prefix = [_equals(k.column, v) for k, v in zip(keys[:i], values[:i])]
+        clauses.append(and_(*equal_prefix, _after(key, value)))
+    return or_(*clauses)
+
+
+def count_rows(session: Session, query, mode: str) -> Tuple[Optional[int], bool]:
+    """Count the rows of an ORM query or Core select according to ``mode``.
+
+    Returns (total, is_estimate). ``total`` is None when mode is "none".
+    """
+    if mode == "none":
+        return None, False
+
+    unordered = query.order_by(None)
+    if mode == "exact":
+        total = session.execute(select(func.count()).select_from(unordered.subquery())).scalar()
+        return total or 0, False
+
+    capped = session.execute(
+        select(func.count()).select_from(unordered.limit(ESTIMATE_COUNT_CAP + 1).subquery())
+    ).scalar() or 0
+    if capped <= ESTIMATE_COUNT_CAP:
+        return capped, False
+
+    statement = unordered.statement if isinstance(unordered, Query) else unordered
+    plan = session.execute(_Explain(statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    return max(estimate, capped), True
+
+
+def paginate(
+    session: Session,
+    query,
+    keys: Sequence[SortKey],
+    signature: str,
+    row_key: Callable[[Any], Sequence[Any]],
+    page: int,
+    per_page: int,
+    cursor: Optional[str] = None,
+    count_mode: str = "exact",
+    having: bool = False,
+) -> Page:
+    """Fetch one page of a query in offset or keyset mode.
+
+    Args:
+        session: Session to run the count and page queries on
+        query: Filtered ORM query or Core select without ordering or pagination.
+            ORM queries return their rows as-is; Core selects are executed with
+            ``Session.scalars``
+        keys: Sort keys; the last one must be unique (normally the primary key)
+        signature: Identifies the sort so cursors cannot be replayed against another
+        row_key: Extracts the sort values from a result row
+        page: Page number used when no cursor is given
+        per_page: Page size
+        cursor: Token from a previous page's next_cursor
+        count_mode: "exact", "estimate" or "none"
+        having: Apply the keyset predicate as HAVING (for sorts on aggregates)
+    """
+    total, is_estimate = count_rows(session, query, count_mode)
+
+    query = query.order_by(None).order_by(*[key.order_by() for key in keys])
+    if cursor:
+        condition = keyset_condition(keys, decode_cursor(cursor, signature, keys))
+        query = query.having(condition) if having else query.filter(condition)
+    else:
+        query = query.offset((page - 1) * per_page)
+
+    query = query.limit(per_page + 1)
+    rows = query.all() if isinstance(query, Query) else session.scalars(query).all()
+    has_next = len(rows) > per_page
+    rows = rows[:per_page]
+    next_cursor = encode_cursor(signature, row_key(rows[-1])) if has_next else None
+
+    return Page(
+        items=rows,
+        total=total,
+        total_is_estimate=is_estimate,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
+
+
+def _equals(column: ColumnElement, value: Any) -> ColumnElement:
+    return column.is_(None) if value is None else column == value
+
+
+def _after(key: SortKey, value: Any) -> ColumnElement:
+    if key.descending:
+        # NULLS FIRST: after a NULL come all non-NULL values
+        return key.column.isnot(None) if value is None else key.column < value
+    # NULLS LAST: nothing sorts after a NULL
+    return false() if value is None else or_(key.column > value, key.column.is_(None))
+
+
+def _coerce(column: ColumnElement, value: Any) -> Any:
+    """Turn a JSON cursor value back into the column's Python type."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    if python_type is Decimal:
+        return Decimal(str(value))
+    return value
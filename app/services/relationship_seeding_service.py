@@ -18,6 +18,7 @@ from database.session import SessionLocal
 from database.data_models.relationship_management import Relationships
 from database.data_models.crm_lookups import RelationshipStatusTypes, LoyaltyStatusTypes, EntityTypes
 from database.data_models.salesforce_data import SfUser, SfContact
+from services.filter_options_cache import FilterOptionsCache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -348,6 +349,7 @@ class RelationshipSeedingService:
                     created_count += 1
             
             self.db.commit()
+            FilterOptionsCache.invalidate(self.db, FilterOptionsCache.RELATIONSHIPS)
             logger.info(f"Created {created_count} new relationships, updated {updated_count} existing")
             
             logger.info(f"Successfully created/updated {len(records_to_insert)} relationships")
@@ -6,9 +6,9 @@ and related data retrieval.
 """
 
 from datetime import datetime, date, timedelta, timezone
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any
 from uuid import UUID
-from sqlalchemy import select, func, and_, or_, text
+from sqlalchemy import select, func, and_, or_, text, exists
 from sqlalchemy.orm import Session, selectinload, joinedload
 
 from database.data_models.relationship_management import (
@@ -26,6 +26,7 @@ from schemas.relationship_schema import (
     EntityTypeInfo, RelationshipStatusInfo, LoyaltyStatusInfo,
     ActivityLogItem, CampaignInfo
 )
+from services.pagination import Page, SortKey, paginate
 
 
 class RelationshipService:
@@ -40,12 +41,18 @@ class RelationshipService:
         page: int = 1,
         page_size: int = 50,
         sort_by: str = "last_activity_date",
-        sort_order: str = "desc"
-    ) -> Tuple[List[RelationshipListItem], int]:
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        count_mode: str = "exact"
+    ) -> Page[RelationshipListItem]:
         """
         List relationships with filtering and pagination.
         
-        Returns tuple of (items, total_count)
+        Pages by offset, or by keyset when a cursor from a previous page's
+        next_cursor is given. count_mode is "exact", "estimate" or "none".
+        Raises InvalidCursorError for a cursor issued for another sort.
+        
+        Returns a Page of list items with total and next_cursor
         """
         # Base query with eager loading
         query = self.db.query(Relationships).options(
@@ -58,19 +65,26 @@ class RelationshipService:
         # Apply filters
         query = self._apply_filters(query, filters)
         
-        # Get total count
-        total_count = query.count()
-        
-        # Apply sorting
-        sort_column = getattr(Relationships, sort_by, Relationships.last_activity_date)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
-        else:
-            query = query.order_by(sort_column.asc())
-            
-        # Apply pagination
-        offset = (page - 1) * page_size
-        relationships = query.offset(offset).limit(page_size).all()
+        # Sort with relationship_id as tie-breaker, then page by offset or cursor
+        if not hasattr(Relationships, sort_by):
+            sort_by = "last_activity_date"
+        sort_column = getattr(Relationships, sort_by)
+        descending = sort_order == "desc"
+        result = paginate(
+            self.db,
+            query,
+            keys=[
+                SortKey(sort_column, descending=descending),
+                SortKey(Relationships.relationship_id, descending=descending)
+            ],
+            signature=f"relationships:{sort_by}:{sort_order}",
+            row_key=lambda rel: (getattr(rel, sort_by), rel.relationship_id),
+            page=page,
+            per_page=page_size,
+            cursor=cursor,
+            count_mode=count_mode
+        )
+        relationships = result.items
         
         # Convert to response items
         items = []
@@ -130,8 +144,9 @@ class RelationshipService:
                 updated_at=rel.updated_at
             )
             items.append(item)
-            
-        return items, total_count
+        
+        result.items = items
+        return result
     
     def get_relationship_detail(self, relationship_id: UUID) -> Optional[RelationshipDetail]:
         """Get detailed information for a specific relationship."""
@@ -306,14 +321,16 @@ class RelationshipService:
         specialties = self.db.query(
             func.distinct(SfContact.mn_specialty_group)
         ).filter(
-            SfContact.mn_specialty_group.isnot(None)
+            SfContact.mn_specialty_group.isnot(None),
+            SfContact.is_deleted.is_(False)
         ).all()
         
         # Get unique geographies
         geographies = self.db.query(
             func.distinct(SfContact.mn_primary_geography)
         ).filter(
-            SfContact.mn_primary_geography.isnot(None)
+            SfContact.mn_primary_geography.isnot(None),
+            SfContact.is_deleted.is_(False)
         ).all()
         
         return {
@@ -342,6 +359,12 @@ class RelationshipService:
     # Private helper methods
     def _apply_filters(self, query, filters: RelationshipFilters):
         """Apply filters to the query."""
+        # Leave out relationships with contacts deleted in Salesforce
+        query = query.filter(~exists().where(
+            SfContact.id == Relationships.linked_entity_id,
+            SfContact.is_deleted.is_(True)
+        ))
+        
         if filters.user_ids:
             query = query.filter(Relationships.user_id.in_(filters.user_ids))
             
@@ -1,26 +1,146 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Set, Tuple
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 import logging
+import os
+import time
 
 from app.database.data_models.salesforce_data import SfActivity, SfContact
 from app.services.salesforce_files.activity_sync.rest_activity_service import (
     RestActivityService,
 )
+from app.services.salesforce_files.field_mapping import (
+    RECORD,
+    Field,
+    FieldMap,
+    parse_activity_date,
+    parse_datetime,
+)
+from app.services.salesforce_files.salesforce_telemetry import telemetry
+from app.services.salesforce_files.savepoint_writes import write_bisecting
 
 logger = logging.getLogger(__name__)
 
 
-class ActivitySyncService:
-    """Service for synchronizing Salesforce activities (Tasks and Events) with local database."""
+# Activities written per INSERT ... ON CONFLICT statement
+ACTIVITY_SYNC_BATCH_SIZE = int(os.getenv("ACTIVITY_SYNC_BATCH_SIZE", "500"))
+
+# Activities written per transaction
+ACTIVITY_SYNC_COMMIT_EVERY = int(os.getenv("ACTIVITY_SYNC_COMMIT_EVERY", "5000"))
+
+# Salesforce Task and Event fields and the sf_activities columns they are stored in
+ACTIVITY_FIELDS = [
+    Field("salesforce_id", "Id", required=True),
+    Field("subject", "Subject"),
+    Field("description", "Description"),
+    # Standard fields
+    Field("who_count", "WhoCount"),
+    Field("what_count", "WhatCount"),
+    Field("activity_date", "ActivityDate", parse_activity_date),
+    Field("status", "Status", default="Not Started"),  # Default required
+    Field("priority", "Priority", default="Normal"),  # Default required
+    Field("is_high_priority", "IsHighPriority", default=False),
+    Field("is_deleted", "IsDeleted", default=False),
+    Field("is_closed", "IsClosed", default=False),
+    Field("is_archived", "IsArchived", default=False),
+    Field("task_subtype", "TaskSubtype"),
+    Field("completed_datetime", "CompletedDateTime", parse_datetime),
+    # Custom fields
+    Field("mno_subtype", "MNO_Subtype_c__c"),
+    Field("mno_primary_attendees_id", "MNO_Primary_Attendees_ID__c"),
+    Field("mno_type", "MNO_Type__c"),
+    Field("mn_tags", "MN_Tags__c"),
+    Field("mno_setting", "MNO_Setting__c"),
+    Field("attendees_concatenation", "Attendees_Concatenation__c"),
+    Field("comments_short", "Comments_Short__c"),
+    # Relationship fields
+    Field("who_id", "WhoId"),
+    Field("what_id", "WhatId"),
+    Field("owner_id", "OwnerId"),
+    Field("account_id", "AccountId"),
+    Field("created_by_id", "CreatedById"),
+    Field("last_modified_by_id", "LastModifiedById"),
+    # System fields
+    Field("sf_created_date", "CreatedDate", parse_datetime),
+    Field("sf_last_modified_date", "LastModifiedDate", parse_datetime),
+    Field("sf_system_modstamp", "SystemModstamp", parse_datetime),
+]
+
+# Event-specific fields
+EVENT_ONLY_FIELDS = [
+    Field("start_datetime", "StartDateTime", parse_datetime),
+    Field("end_datetime", "EndDateTime", parse_datetime),
+    Field("duration_minutes", "DurationInMinutes"),
+    Field("location", "Location"),
+    Field("show_as", "ShowAs"),
+    Field("is_all_day_event", "IsAllDayEvent"),
+    Field("is_private", "IsPrivate"),
+]
+
+EVENT_FIELDS = [field.column for field in EVENT_ONLY_FIELDS]
+
+# Columns owned by the app rather than Salesforce, never overwritten by a sync
+LOCAL_FIELDS = ["id", "salesforce_id", "created_at", "analysis_results", "last_analyzed_at"]
+
+
+def _activity_metadata(activity_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Names of the related Account, Who and What, kept in additional_data."""
+    account = activity_data.get("Account") or {}
+    who = activity_data.get("Who") or {}
+    what = activity_data.get("What") or {}
+    return {
+        "Account": {"Name": account.get("Name")},
+        "Who": {"Name": who.get("Name"), "Type": who.get("Type")},
+        "What": {"Name": what.get("Name"), "Type": what.get("Type")},
+    }
+
+
+def _activity_field_map(activity_type: str) -> FieldMap:
+    is_event = activity_type == "Event"
+    return FieldMap([
+        Field("type", default=activity_type),
+        *ACTIVITY_FIELDS,
+        # Tasks carry no event fields
+        *(field if is_event else Field(field.column) for field in EVENT_ONLY_FIELDS),
+        # Store additional metadata
+        Field("additional_data", RECORD, _activity_metadata),
+    ])
+
+
+ACTIVITY_FIELD_MAPS = {
+    activity_type: _activity_field_map(activity_type)
+    for activity_type in ("Task", "Event")
+}
 
-    def __init__(self, db_session: Session, salesforce_service: RestActivityService):
+
+class ActivitySyncService:
+    """Service for synchronizing Salesforce activities (Tasks and Events) with local database.
+
+    Activities are written in batches with one INSERT ... ON CONFLICT DO UPDATE
+    per batch, after resolving every WhoId in the batch to a local contact with
+    a single query. Each batch runs in a savepoint and the transaction is
+    committed every ``commit_every`` rows; a batch that fails is bisected (see
+    savepoint_writes) so one bad record only costs itself.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        salesforce_service: RestActivityService,
+        batch_size: int = ACTIVITY_SYNC_BATCH_SIZE,
+        commit_every: int = ACTIVITY_SYNC_COMMIT_EVERY,
+    ):
         self.db = db_session
         self.sf = salesforce_service
+        self.batch_size = max(1, batch_size)
+        self.commit_every = max(1, commit_every)
 
     def sync_activities(
         self, modified_since: Optional[datetime] = None, limit: Optional[int] = None
-    ) -> Dict[str, int]:
+    ) -> Dict[str, Any]:
         """
         Sync both Tasks and Events from Salesforce to local database.
 
@@ -38,6 +158,9 @@ class ActivitySyncService:
             "new_records": 0,
             "updated_records": 0,
             "errors": 0,
+            "rows_written": 0,
+            "write_seconds": 0.0,
+            "rows_per_second": 0.0,
         }
 
         logger.info(
@@ -55,22 +178,7 @@ class ActivitySyncService:
                 tasks_data = tasks_data[:limit]
 
             logger.info("Processing Tasks...")
-            for i, task_data in enumerate(tasks_data, 1):
-                try:
-                    activity = self._upsert_activity(task_data, "Task")
-                    if activity.id:  # Existing record
-                        stats["updated_records"] += 1
-                    else:
-                        stats["new_records"] += 1
-
-                    if i % 100 == 0:  # Log progress every 100 records
-                        logger.info(f"Processed {i}/{len(tasks_data)} tasks")
-
-                except Exception as e:
-                    logger.error(
-                        f"Error syncing task {task_data.get('Id', 'Unknown')}: {str(e)}"
-                    )
-                    stats["errors"] += 1
+            self._sync_records(tasks_data, "Task", stats)
 
             # Sync Events
             logger.info("Fetching Events from Salesforce...")
@@ -82,22 +190,7 @@ class ActivitySyncService:
                 events_data = events_data[:limit]
 
             logger.info("Processing Events...")
-            for i, event_data in enumerate(events_data, 1):
-                try:
-                    activity = self._upsert_activity(event_data, "Event")
-                    if activity.id:  # Existing record
-                        stats["updated_records"] += 1
-                    else:
-                        stats["new_records"] += 1
-
-                    if i % 100 == 0:  # Log progress every 100 records
-                        logger.info(f"Processed {i}/{len(events_data)} events")
-
-                except Exception as e:
-                    logger.error(
-                        f"Error syncing event {event_data.get('Id', 'Unknown')}: {str(e)}"
-                    )
-                    stats["errors"] += 1
+            self._sync_records(events_data, "Event", stats)
 
             stats["total_retrieved"] = (
                 stats["tasks_retrieved"] + stats["events_retrieved"]
@@ -110,155 +203,162 @@ class ActivitySyncService:
             logger.info(f"New records: {stats['new_records']}")
             logger.info(f"Updated records: {stats['updated_records']}")
             logger.info(f"Errors: {stats['errors']}")
+            logger.info(f"Write rate: {stats['rows_per_second']:,.0f} rows/second")
 
             return stats
 
         except Exception as e:
             logger.error(f"Error during activity sync: {str(e)}")
+            self.db.rollback()
             stats["errors"] += 1
             return stats
 
-    def _upsert_activity(
-        self, activity_data: Dict[str, Any], activity_type: str
-    ) -> SfActivity:
-        """Create or update an activity in the local database."""
+    def _sync_records(
+        self, records: List[Dict[str, Any]], activity_type: str, stats: Dict[str, Any]
+    ) -> None:
+        """Upsert records of one activity type in batches, updating stats in place."""
+        started = time.perf_counter()
+        rows_written = 0
+        uncommitted = 0
+
+        for i in range(0, len(records), self.batch_size):
+            batch = records[i : i + self.batch_size]
+            rows = self._map_batch(batch, activity_type, stats)
+            if not rows:
+                continue
+
+            with telemetry.timer("db_upsert", activity_type) as measurement:
+                new, updated, failed = self._write_batch(rows, activity_type)
+                measurement.records = new + updated
+            stats["new_records"] += new
+            stats["updated_records"] += updated
+            stats["errors"] += len(failed)
+            rows_written += new + updated
+            uncommitted += new + updated
+
+            if uncommitted >= self.commit_every:
+                self.db.commit()
+                uncommitted = 0
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    f"Processed {i + len(batch)}/{len(records)} {activity_type.lower()}s "
+                    f"({rows_written / elapsed:,.0f} rows/second)"
+                )
 
-        # Check if activity exists
-        activity = (
-            self.db.query(SfActivity)
-            .filter_by(salesforce_id=activity_data["Id"])
-            .first()
-        )
+        self.db.commit()
 
-        is_new = False
-        if not activity:
-            activity = SfActivity(salesforce_id=activity_data["Id"])
-            is_new = True
-
-        # Set basic fields
-        activity.type = activity_type
-        activity.subject = activity_data.get("Subject")
-        activity.description = activity_data.get("Description")
-
-        # Map standard fields
-        activity.who_count = activity_data.get("WhoCount")
-        activity.what_count = activity_data.get("WhatCount")
-        activity.activity_date = self._parse_date(activity_data.get("ActivityDate"))
-        activity.status = activity_data.get("Status", "Not Started")  # Default required
-        activity.priority = activity_data.get("Priority", "Normal")  # Default required
-        activity.is_high_priority = activity_data.get("IsHighPriority", False)
-        activity.is_deleted = activity_data.get("IsDeleted", False)
-        activity.is_closed = activity_data.get("IsClosed", False)
-        activity.is_archived = activity_data.get("IsArchived", False)
-        activity.task_subtype = activity_data.get("TaskSubtype")
-        activity.completed_datetime = self._parse_datetime(
-            activity_data.get("CompletedDateTime")
-        )
+        stats["rows_written"] += rows_written
+        stats["write_seconds"] += time.perf_counter() - started
+        if stats["write_seconds"]:
+            stats["rows_per_second"] = stats["rows_written"] / stats["write_seconds"]
 
-        # Map custom fields
-        activity.mno_subtype = activity_data.get("MNO_Subtype_c__c")
-        activity.mno_primary_attendees_id = activity_data.get(
-            "MNO_Primary_Attendees_ID__c"
-        )
-        activity.mno_type = activity_data.get("MNO_Type__c")
-        activity.mn_tags = activity_data.get("MN_Tags__c")
-        activity.mno_setting = activity_data.get("MNO_Setting__c")
-        activity.attendees_concatenation = activity_data.get(
-            "Attendees_Concatenation__c"
-        )
-        activity.comments_short = activity_data.get("Comments_Short__c")
-
-        # Map relationship fields
-        activity.who_id = activity_data.get("WhoId")
-        activity.what_id = activity_data.get("WhatId")
-        activity.owner_id = activity_data.get("OwnerId")
-        activity.account_id = activity_data.get("AccountId")
-        activity.created_by_id = activity_data.get("CreatedById")
-        activity.last_modified_by_id = activity_data.get("LastModifiedById")
-
-        # Map system fields
-        activity.sf_created_date = self._parse_datetime(
-            activity_data.get("CreatedDate")
-        )
-        activity.sf_last_modified_date = self._parse_datetime(
-            activity_data.get("LastModifiedDate")
-        )
-        activity.sf_system_modstamp = self._parse_datetime(
-            activity_data.get("SystemModstamp")
-        )
+    def write_page(
+        self, records: List[Dict[str, Any]], activity_type: str
+    ) -> Tuple[int, int, List[str]]:
+        """Upsert one page of raw Salesforce Tasks or Events and commit it.
 
-        # Map Event-specific fields
-        if activity_type == "Event":
-            activity.start_datetime = self._parse_datetime(
-                activity_data.get("StartDateTime")
-            )
-            activity.end_datetime = self._parse_datetime(
-                activity_data.get("EndDateTime")
-            )
-            activity.duration_minutes = activity_data.get("DurationInMinutes")
-            activity.location = activity_data.get("Location")
-            activity.show_as = activity_data.get("ShowAs")
-            activity.is_all_day_event = activity_data.get("IsAllDayEvent")
-            activity.is_private = activity_data.get("IsPrivate")
-
-        # Map related object fields
-        if activity_data.get("WhoId"):
-            related_contact = (
-                self.db.query(SfContact)
-                .filter_by(salesforce_id=activity_data["WhoId"])
-                .first()
+        Args:
+            records: Raw Salesforce records of one activity type
+            activity_type: "Task" or "Event"
+
+        Returns:
+            (new, updated, Ids of the records that could not be mapped or
+            written)
+        """
+        rows = self._map_batch(records, activity_type, {"errors": 0})
+        new, updated, failed = self._write_batch(rows, activity_type) if rows else (0, 0, [])
+        self.db.commit()
+
+        mapped = {row["salesforce_id"] for row in rows}
+        unmapped = [record.get("Id") for record in records if record.get("Id") not in mapped]
+        return new, updated, unmapped + failed
+
+    def _map_batch(
+        self, batch: List[Dict[str, Any]], activity_type: str, stats: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Map a batch of Salesforce records to rows, resolving WhoIds in one query."""
+        mapped, failures = ACTIVITY_FIELD_MAPS[activity_type].map_records(batch)
+        for activity_data, e in failures:
+            logger.error(
+                f"Error mapping {activity_type.lower()} {activity_data.get('Id', 'Unknown')}: {str(e)}"
             )
-            if related_contact:
-                activity.contact_id = related_contact.id
+            stats["errors"] += 1
 
-        # Store additional metadata
-        activity.additional_data = {
-            "Account": {
-                "Name": activity_data.get("Account", {}).get("Name")
-                if activity_data.get("Account")
-                else None,
-            },
-            "Who": {
-                "Name": activity_data.get("Who", {}).get("Name")
-                if activity_data.get("Who")
-                else None,
-                "Type": activity_data.get("Who", {}).get("Type")
-                if activity_data.get("Who")
-                else None,
-            },
-            "What": {
-                "Name": activity_data.get("What", {}).get("Name")
-                if activity_data.get("What")
-                else None,
-                "Type": activity_data.get("What", {}).get("Type")
-                if activity_data.get("What")
-                else None,
-            },
-        }
+        # Column onupdate hooks do not fire for ON CONFLICT DO UPDATE
+        now = datetime.now()
+        rows = {}
+        for row in mapped:
+            row["last_synced_at"] = now
+            # ON CONFLICT cannot update the same row twice in one statement
+            rows[row["salesforce_id"]] = row
 
-        # Save to database
-        if is_new:
-            self.db.add(activity)
+        contact_ids = self._resolve_contact_ids(
+            {row["who_id"] for row in rows.values() if row["who_id"]}
+        )
+        for row in rows.values():
+            row["contact_id"] = contact_ids.get(row["who_id"])
+
+        return list(rows.values())
+
+    def _resolve_contact_ids(self, who_ids: Set[str]) -> Dict[str, Any]:
+        """Map Salesforce WhoIds to local contact ids with a single query."""
+        if not who_ids:
+            return {}
+        return dict(
+            self.db.execute(
+                select(SfContact.salesforce_id, SfContact.id).where(
+                    SfContact.salesforce_id.in_(who_ids)
+                )
+            ).all()
+        )
 
-        self.db.commit()
-        return activity
+    def _write_batch(
+        self, rows: List[Dict[str, Any]], activity_type: str
+    ) -> Tuple[int, int, List[str]]:
+        """Upsert rows in a savepoint; returns (new, updated, failed salesforce_ids).
 
-    def _parse_datetime(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse Salesforce datetime string to Python datetime."""
-        if not date_str:
-            return None
-        try:
-            # Remove 'Z' suffix and parse
-            return datetime.fromisoformat(date_str.rstrip("Z"))
-        except:
-            return None
-
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse Salesforce date string to Python date."""
-        if not date_str:
-            return None
-        try:
-            # Remove 'Z' suffix and parse
-            return datetime.fromisoformat(date_str.rstrip("Z")).date()
-        except:
-            return None
+        If the batch fails as a whole it is bisected, so only the offending
+        rows fail.
+        """
+        failed = []
+
+        def on_error(row: Dict[str, Any], error: str) -> None:
+            logger.error(
+                f"Error syncing {activity_type.lower()} {row['salesforce_id']}: {error}"
+            )
+            failed.append(row["salesforce_id"])
+
+        results = write_bisecting(
+            self.db, rows, lambda chunk: self._upsert(chunk, activity_type), on_error
+        )
+        inserted = [flag for result in results for flag in result]
+        new = sum(1 for flag in inserted if flag)
+        return new, len(inserted) - new, failed
+
+    def _upsert(self, rows: List[Dict[str, Any]], activity_type: str) -> List[bool]:
+        """INSERT ... ON CONFLICT DO UPDATE; returns whether each row was inserted."""
+        # executemany form: the statement compiles once per activity type and
+        # SQLAlchemy batches the rows into multi-row VALUES ("insertmanyvalues")
+        result = self.db.connection().execute(self._upsert_statement(activity_type), rows)
+        return list(result.scalars())
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _upsert_statement(activity_type: str):
+        table = SfActivity.__table__
+        stmt = insert(table)
+        set_ = {
+            column.name: stmt.excluded[column.name]
+            for column in table.columns
+            if column.name not in LOCAL_FIELDS
+            # Tasks carry no event fields, leave whatever is stored
+            and (activity_type == "Event" or column.name not in EVENT_FIELDS)
+        }
+        # Keep a previously resolved contact if the WhoId is not synced yet
+        set_["contact_id"] = func.coalesce(stmt.excluded.contact_id, table.c.contact_id)
+        return stmt.on_conflict_do_update(
+            index_elements=["salesforce_id"], set_=set_
+        ).returning(
+            # xmax is 0 only for rows this statement inserted
+            literal_column("xmax = 0")
+        )
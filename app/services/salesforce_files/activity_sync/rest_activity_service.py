@@ -19,15 +19,20 @@ class RestActivityService:
     while ensuring no write operations can occur.
     """
 
-    def __init__(self, config: Optional[SalesforceConfig] = None):
-        """Initialize the REST activity service using the base ReadOnlySalesforceService."""
+    def __init__(
+        self,
+        config: Optional[SalesforceConfig] = None,
+        sf_service: Optional[ReadOnlySalesforceService] = None,
+    ):
+        """Initialize the REST activity service using the base ReadOnlySalesforceService.
+
+        Pass ``sf_service`` to share one logged-in client between services.
+        """
         # Use the existing ReadOnlySalesforceService as our base
-        self._sf_service = ReadOnlySalesforceService(config)
+        self._sf_service = sf_service or ReadOnlySalesforceService(config)
         self.monitoring = self._sf_service.monitoring
 
-    def get_tasks_query(
-        self, modified_since: Optional[datetime] = None, offset: int = 0
-    ) -> str:
+    def get_tasks_query(self, modified_since: Optional[datetime] = None) -> str:
         """Build the SOQL query for Task data."""
         fields = [
             # Standard Fields
@@ -81,12 +86,9 @@ class RestActivityService:
             FROM Task
             {where_clause}
             ORDER BY LastModifiedDate DESC
-            LIMIT 200 OFFSET {offset}
         """
 
-    def get_events_query(
-        self, modified_since: Optional[datetime] = None, offset: int = 0
-    ) -> str:
+    def get_events_query(self, modified_since: Optional[datetime] = None) -> str:
         """Build the SOQL query for Event data."""
         fields = [
             # Standard Fields from Task
@@ -142,44 +144,27 @@ class RestActivityService:
             FROM Event
             {where_clause}
             ORDER BY LastModifiedDate DESC
-            LIMIT 200 OFFSET {offset}
         """
 
     def _get_paginated_results(
-        self,
-        query_builder,
-        modified_since: Optional[datetime] = None,
-        batch_size: int = 200,
+        self, query_builder, modified_since: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """
-        Helper method to handle paginated queries.
+        Helper method to read every page of a query through its query cursor.
 
         Args:
             query_builder: Function that builds the SOQL query
             modified_since: Optional datetime filter
-            batch_size: Number of records per page
 
         Returns:
             List of all records across all pages
         """
-        all_records = []
-        offset = 0
-
-        while True:
-            query = query_builder(modified_since=modified_since, offset=offset)
-            batch = self._sf_service.query(query)
-
-            if not batch:  # No more records
-                break
-
-            all_records.extend(batch)
-
-            if len(batch) < batch_size:  # Last page
-                break
-
-            offset += batch_size
-
-        return all_records
+        query = query_builder(modified_since=modified_since)
+        return [
+            record
+            for page in self._sf_service.iter_query_pages(query)
+            for record in page
+        ]
 
     def get_tasks(
         self, modified_since: Optional[datetime] = None
@@ -6,6 +6,8 @@ import argparse
 
 from app.database.session import db_session
 from app.services.salesforce_files.activity_sync.activity_sync_service import (
+    ACTIVITY_SYNC_BATCH_SIZE,
+    ACTIVITY_SYNC_COMMIT_EVERY,
     ActivitySyncService,
 )
 from app.services.salesforce_files.activity_sync.rest_activity_service import (
@@ -56,6 +58,8 @@ def run_activity_sync(
     days_back: Optional[int] = 30,
     start_date: Optional[datetime] = None,
     limit: Optional[int] = None,
+    batch_size: int = ACTIVITY_SYNC_BATCH_SIZE,
+    commit_every: int = ACTIVITY_SYNC_COMMIT_EVERY,
 ) -> None:
     """
     Run the activity sync process to sync Salesforce Tasks and Events to local database.
@@ -66,6 +70,8 @@ def run_activity_sync(
         days_back: For recent mode, number of days to look back
         start_date: For custom mode, specific start date
         limit: Optional limit on number of records to sync
+        batch_size: Activities written per upsert statement
+        commit_every: Activities written per transaction
     """
     try:
         logger.info(f"Starting activity sync at {datetime.now()}")
@@ -80,7 +86,9 @@ def run_activity_sync(
 
         # Initialize services
         rest_service = RestActivityService()
-        sync_service = ActivitySyncService(db_session, rest_service)
+        sync_service = ActivitySyncService(
+            db_session, rest_service, batch_size=batch_size, commit_every=commit_every
+        )
 
         # Check API limits before starting
         api_limits = rest_service.get_api_limits()
@@ -100,6 +108,10 @@ def run_activity_sync(
         logger.info(f"New records: {stats['new_records']:,}")
         logger.info(f"Updated records: {stats['updated_records']:,}")
         logger.info(f"Errors: {stats['errors']:,}")
+        logger.info(
+            f"Rows written: {stats['rows_written']:,} in {stats['write_seconds']:.1f}s "
+            f"({stats['rows_per_second']:,.0f} rows/second)"
+        )
 
         # Check final API usage
         final_limits = rest_service.get_api_limits()
@@ -132,6 +144,18 @@ if __name__ == "__main__":
     parser.add_argument(
         "--limit", type=int, help="Optional limit on number of records to sync"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=ACTIVITY_SYNC_BATCH_SIZE,
+        help="Activities written per upsert statement",
+    )
+    parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=ACTIVITY_SYNC_COMMIT_EVERY,
+        help="Activities written per transaction",
+    )
 
     args = parser.parse_args()
 
@@ -155,6 +179,8 @@ if __name__ == "__main__":
             days_back=args.days,
             start_date=custom_start_date,
             limit=args.limit,
+            batch_size=args.batch_size,
+            commit_every=args.commit_every,
         )
     except Exception as e:
         logger.error(f"Failed to run activity sync: {str(e)}", exc_info=True)
@@ -0,0 +1,337 @@
+"""
+Bulk Job Manager
+
+Runs several Bulk API 2.0 query jobs at once on an asyncio event loop.
+Jobs are submitted, polled (with exponential backoff and jitter) and
+downloaded up to ``max_concurrent_jobs`` at a time. Each job's results are
+handed back as soon as that job completes, so a targeted sync split into
+many ID chunks takes about as long as its slowest job rather than the sum
+of all of them.
+
+The Salesforce clients are synchronous (requests over the pooled session
+in http_session), so each HTTP call runs in a worker thread through
+``asyncio.to_thread``; the event loop only schedules the polling.
+Synchronous callers such as the sync services use ``iter_completed``,
+which runs the loop on a background thread.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from .bulk_salesforce_service import BulkSalesforceService
+
+logger = logging.getLogger(__name__)
+
+# Query jobs a manager keeps open in Salesforce at once
+BULK_MAX_CONCURRENT_JOBS = int(os.getenv("BULK_MAX_CONCURRENT_JOBS", "10"))
+
+# Job status polling backoff bounds
+BULK_POLL_INITIAL_SECONDS = 1.0
+BULK_POLL_MAX_SECONDS = 30.0
+
+JOB_COMPLETE = "JobComplete"
+JOB_FAILED = "Failed"
+JOB_ABORTED = "Aborted"
+JOB_TIMEOUT = "Timeout"
+FINAL_STATES = {JOB_COMPLETE, JOB_FAILED, JOB_ABORTED}
+
+_DONE = object()
+
+
+def poll_delays(
+    initial: float = BULK_POLL_INITIAL_SECONDS,
+    maximum: float = BULK_POLL_MAX_SECONDS,
+    factor: float = 2.0,
+    rng: Optional[random.Random] = None,
+) -> Iterator[float]:
+    """Endless job status poll delays: exponential backoff with jitter.
+
+    The n-th delay is drawn from [d/2, d] with d = initial * factor**n capped
+    at maximum, so jobs submitted together do not poll in lockstep.
+    """
+    rng = rng or random.Random()
+    delay = initial
+    while True:
+        yield rng.uniform(delay / 2, delay)
+        delay = min(delay * factor, maximum)
+
+
+@dataclass
+class BulkJobOutcome:
+    """Final state of one managed query job and, if it completed, its records."""
+
+    key: Hashable
+    job_id: Optional[str]
+    state: str
+    records: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.state == JOB_COMPLETE
+
+
+@dataclass
+class BulkJobProgress:
+    """Aggregated progress over every job of a manager run."""
+
+    total: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    records_processed: int = 0
+
+    @property
+    def running(self) -> int:
+        return self.submitted - self.completed - self.failed
+
+
+class BulkJobManager:
+    """Submit, poll and collect many bulk query jobs concurrently.
+
+    Example:
+        manager = BulkJobManager(sf_bulk)
+        for outcome in manager.iter_completed({1: query_a, 2: query_b}, "Contact"):
+            if outcome.succeeded:
+                save(outcome.records)
+    """
+
+    def __init__(
+        self,
+        bulk_service: "BulkSalesforceService",
+        max_concurrent_jobs: int = BULK_MAX_CONCURRENT_JOBS,
+        max_wait_time: float = 3600,
+        initial_poll_interval: float = BULK_POLL_INITIAL_SECONDS,
+        max_poll_interval: float = BULK_POLL_MAX_SECONDS,
+        on_progress: Optional[Callable[[BulkJobProgress], None]] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        self.bulk_service = bulk_service
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs)
+        self.max_wait_time = max_wait_time
+        self.initial_poll_interval = initial_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.on_progress = on_progress or _log_progress
+        self.rng = rng or random.Random()
+        self.progress = BulkJobProgress()
+        self._records_processed: Dict[Hashable, int] = {}
+
+    async def run(
+        self, queries: Mapping[Hashable, str], object_name: str = "Contact"
+    ) -> AsyncIterator[BulkJobOutcome]:
+        """Run one job per query, yielding each outcome as soon as its job finishes.
+
+        Args:
+            queries: SOQL query per caller-chosen key (echoed back on the outcome)
+            object_name: Salesforce object the queries select from
+
+        Yields:
+            One BulkJobOutcome per query, in completion order
+        """
+        self.progress = BulkJobProgress(total=len(queries))
+        self._records_processed = {}
+        if not queries:
+            return
+
+        if not self.bulk_service.session_id:
+            if not await asyncio.to_thread(self.bulk_service.authenticate):
+                for key in queries:
+                    yield BulkJobOutcome(key, None, JOB_FAILED, error="Authentication failed")
+                return
+
+        slots = asyncio.Semaphore(self.max_concurrent_jobs)
+        tasks = [
+            asyncio.create_task(self._run_job(key, query, object_name, slots))
+            for key, query in queries.items()
+        ]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def iter_completed(
+        self, queries: Mapping[Hashable, str], object_name: str = "Contact"
+    ) -> Iterator[BulkJobOutcome]:
+        """Synchronous version of run: the event loop runs on a background thread.
+
+        Outcomes are yielded while the remaining jobs keep being polled, so
+        the caller can write each job's records as soon as they arrive.
+        """
+        outcomes: "queue.Queue[Any]" = queue.Queue()
+        loop = asyncio.new_event_loop()
+
+        async def drain():
+            try:
+                async with contextlib.aclosing(self.run(queries, object_name)) as results:
+                    async for outcome in results:
+                        outcomes.put(outcome)
+            except Exception as e:
+                outcomes.put(e)
+            finally:
+                outcomes.put(_DONE)
+
+        task = loop.create_task(drain())
+
+        def run_loop():
+            try:
+                loop.run_until_complete(task)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                loop.run_until_complete(loop.shutdown_default_executor())
+                loop.close()
+
+        thread = threading.Thread(target=run_loop, name="bulk-job-manager", daemon=True)
+        thread.start()
+        finished = False
+        try:
+            while True:
+                item = outcomes.get()
+                if item is _DONE:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not finished:
+                # The caller stopped early: cancel the jobs still being polled
+                try:
+                    loop.call_soon_threadsafe(task.cancel)
+                except RuntimeError:
+                    pass  # the loop already finished and closed
+            thread.join()
+
+    async def _run_job(
+        self, key: Hashable, query: str, object_name: str, slots: asyncio.Semaphore
+    ) -> BulkJobOutcome:
+        started = time.monotonic()
+        # The slot is held through the download too, so at most
+        # max_concurrent_jobs results are being downloaded and held at once
+        async with slots:
+            self.progress.submitted += 1
+            job_id = await asyncio.to_thread(
+                self.bulk_service.create_bulk_query_job, query, object_name
+            )
+            if not job_id:
+                self._finish(failed=True)
+                return BulkJobOutcome(
+                    key, None, JOB_FAILED, error="Job could not be created",
+                    duration=time.monotonic() - started,
+                )
+
+            state, error = await self._poll(key, job_id)
+            if state != JOB_COMPLETE:
+                self._finish(failed=True)
+                return BulkJobOutcome(
+                    key, job_id, state, error=error, duration=time.monotonic() - started
+                )
+
+            try:
+                records = await asyncio.to_thread(self._download, job_id)
+            except Exception as e:
+                self._finish(failed=True)
+                return BulkJobOutcome(
+                    key, job_id, JOB_FAILED, error=f"Results download failed: {str(e)}",
+                    duration=time.monotonic() - started,
+                )
+
+        self._finish(failed=False)
+        return BulkJobOutcome(
+            key, job_id, JOB_COMPLETE, records=records, duration=time.monotonic() - started
+        )
+
+    async def _poll(self, key: Hashable, job_id: str):
+        """Poll until the job reaches a final state; returns (state, error message)."""
+        monitoring = self.bulk_service.monitoring
+        delays = poll_delays(
+            self.initial_poll_interval, self.max_poll_interval, rng=self.rng
+        )
+        started = time.monotonic()
+        deadline = started + self.max_wait_time
+
+        while True:
+            status = await asyncio.to_thread(self.bulk_service.check_job_status, job_id)
+            if not status:
+                return JOB_FAILED, "Job status unavailable"
+
+            state = status.get("state", "")
+            self._update_records(key, status.get("numberRecordsProcessed", 0))
+
+            if state == JOB_COMPLETE:
+                monitoring.log_api_call(
+                    "bulk_job_complete",
+                    {
+                        "job_id": job_id,
+                        "total_records": status.get("numberRecordsProcessed", 0),
+                        "duration": time.monotonic() - started,
+                    },
+                )
+                return state, None
+            if state in FINAL_STATES:
+                error = status.get("stateMessage") or f"Job {state.lower()}"
+                monitoring.log_api_call(
+                    "bulk_job_failed" if state == JOB_FAILED else "bulk_job_aborted",
+                    {"job_id": job_id, "error": error},
+                )
+                return state, error
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                monitoring.log_api_call(
+                    "bulk_job_timeout", {"job_id": job_id, "timeout": self.max_wait_time}
+                )
+                return JOB_TIMEOUT, f"Job did not complete within {self.max_wait_time} seconds"
+            await asyncio.sleep(min(next(delays), remaining))
+
+    def _download(self, job_id: str) -> List[Dict[str, Any]]:
+        return [
+            record
+            for batch in self.bulk_service.iter_job_results(job_id)
+            for record in batch
+        ]
+
+    def _update_records(self, key: Hashable, records_processed: int) -> None:
+        if self._records_processed.get(key) == records_processed:
+            return
+        self._records_processed[key] = records_processed
+        self.progress.records_processed = sum(self._records_processed.values())
+        self.on_progress(self.progress)
+
+    def _finish(self, failed: bool) -> None:
+        if failed:
+            self.progress.failed += 1
+        else:
+            self.progress.completed += 1
+        self.on_progress(self.progress)
+
+
+def _log_progress(progress: BulkJobProgress) -> None:
+    logger.info(
+        f"Bulk jobs: {progress.completed}/{progress.total} complete, "
+        f"{progress.failed} failed, {progress.running} running, "
+        f"{progress.records_processed:,} records processed"
+    )
@@ -0,0 +1,243 @@
+"""
+Bulk API 2.0 Query Results
+
+Parsing and concurrent fetching of the result pages of a completed bulk
+query job. Pages form a chain: each page's Sforce-Locator header names the
+next one. The header arrives before the body, so BulkResultFetcher requests
+page N+1 as soon as page N starts downloading and keeps up to
+``concurrency`` pages downloading or parsed and waiting. The consumer gets
+the pages back in order, so downloads and CSV parsing overlap with whatever
+it does with each batch (usually database writes), while memory stays
+bounded by concurrency x page size.
+"""
+
+import codecs
+import csv
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+import requests
+
+from .salesforce_telemetry import telemetry
+
+if TYPE_CHECKING:
+    from .bulk_salesforce_service import BulkSalesforceService
+
+# Bytes read from the result stream at a time
+BULK_RESULTS_CHUNK_SIZE = 1024 * 1024
+
+# How often the dispatcher thread checks whether the consumer went away
+_POLL_SECONDS = 0.1
+
+
+class BulkResultFetcher:
+    """Download the result pages of a bulk query job with bounded concurrency.
+
+    Iterating yields one deque of record batches per result page, in page
+    order. Download errors are raised from the iteration when the failed page
+    is reached.
+
+    Example:
+        for batches in BulkResultFetcher(sf_bulk, job_id, concurrency=4):
+            for batch in batches:
+                write(batch)
+    """
+
+    def __init__(
+        self,
+        bulk_service: "BulkSalesforceService",
+        job_id: str,
+        max_records: int,
+        batch_size: int,
+        concurrency: int,
+    ):
+        self.bulk_service = bulk_service
+        self.job_id = job_id
+        self.max_records = max_records
+        self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
+
+    def __iter__(self) -> Iterator[Deque[List[Dict[str, Any]]]]:
+        pages: "queue.Queue[Optional[Future]]" = queue.Queue()
+        # A slot is held from the page request until the consumer is done with it
+        slots = threading.Semaphore(self.concurrency)
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="bulk-results"
+        )
+        dispatcher = threading.Thread(
+            target=self._dispatch,
+            args=(executor, pages, slots, stop),
+            name="bulk-results-dispatch",
+            daemon=True,
+        )
+        dispatcher.start()
+
+        try:
+            while True:
+                page = pages.get()
+                if page is None:
+                    break
+                try:
+                    yield page.result()
+                finally:
+                    slots.release()
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(
+        self,
+        executor: ThreadPoolExecutor,
+        pages: "queue.Queue[Optional[Future]]",
+        slots: threading.Semaphore,
+        stop: threading.Event,
+    ) -> None:
+        """Walk the locator chain, submitting each page once a slot is free."""
+        locator = None
+        try:
+            while not stop.is_set():
+                if not slots.acquire(timeout=_POLL_SECONDS):
+                    continue
+
+                next_locator: Future = Future()
+                try:
+                    page = executor.submit(self._fetch_page, locator, next_locator)
+                except RuntimeError:
+                    # The consumer stopped and shut the executor down
+                    return
+                pages.put(page)
+
+                locator = self._wait_for_locator(next_locator, stop)
+                if is_last_page(locator):
+                    return
+        finally:
+            pages.put(None)
+
+    @staticmethod
+    def _wait_for_locator(next_locator: Future, stop: threading.Event) -> Optional[str]:
+        """The next page's locator; None if the page failed or the consumer stopped."""
+        while not stop.is_set():
+            try:
+                return next_locator.result(timeout=_POLL_SECONDS)
+            except FutureTimeoutError:
+                continue
+            except Exception:
+                # The page's own future carries the error to the consumer
+                return None
+        return None
+
+    def _fetch_page(
+        self, locator: Optional[str], next_locator: Future
+    ) -> Deque[List[Dict[str, Any]]]:
+        try:
+            with self.bulk_service.open_results_page(
+                self.job_id, locator, self.max_records
+            ) as response:
+                next_locator.set_result(response.headers.get("Sforce-Locator"))
+                return deque(
+                    iter_result_batches(response, self.batch_size, self.job_id)
+                )
+        except Exception as e:
+            if not next_locator.done():
+                next_locator.set_exception(e)
+            raise
+
+
+def is_last_page(locator: Optional[str]) -> bool:
+    """Whether a Sforce-Locator header marks the last result page.
+
+    Salesforce sends the literal string "null" after the last page.
+    """
+    return not locator or locator == "null"
+
+
+def iter_result_batches(
+    response: requests.Response, batch_size: int, job_id: Optional[str] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """Parse a streamed result page into batches of at most batch_size records.
+
+    Once the page is read, its records, bytes and the time spent downloading
+    and parsing it (not the time the consumer held each batch) are observed
+    as a "bulk_download" in the telemetry registry.
+    """
+    download = _Download()
+    lines = _iter_lines(
+        download.count(response.iter_content(chunk_size=BULK_RESULTS_CHUNK_SIZE)),
+        # Bulk API 2.0 results are always UTF-8
+        "utf-8",
+    )
+    batch = []
+    resumed = time.perf_counter()
+    error = False
+    try:
+        for record in iter_records(lines):
+            batch.append(record)
+            if len(batch) >= batch_size:
+                download.seconds += time.perf_counter() - resumed
+                download.records += len(batch)
+                yield batch
+                resumed = time.perf_counter()
+                batch = []
+        download.seconds += time.perf_counter() - resumed
+        download.records += len(batch)
+        if batch:
+            yield batch
+    except Exception:
+        error = True
+        raise
+    finally:
+        telemetry.observe(
+            "bulk_download",
+            seconds=download.seconds,
+            records=download.records,
+            byte_count=download.bytes,
+            error=error,
+            job_id=job_id,
+        )
+
+
+def iter_records(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Parse CSV lines into records.
+
+    Empty strings and "null" become None for proper database handling.
+    """
+    for row in csv.DictReader(lines):
+        yield {
+            key: None if value == "" or value == "null" else value
+            for key, value in row.items()
+        }
+
+
+class _Download:
+    """Running totals of one result page download."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.records = 0
+        self.bytes = 0
+
+    def count(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.bytes += len(chunk)
+            yield chunk
+
+
+def _iter_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """Decode a byte stream and split it into lines, keeping line endings."""
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        # The last piece is the start of a line still being downloaded
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
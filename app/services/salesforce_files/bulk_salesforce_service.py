@@ -1,16 +1,34 @@
 import requests
 import json
 import time
-import csv
 import io
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
 import os
 from dotenv import load_dotenv
+from .bulk_job_manager import poll_delays
+from .bulk_results import (
+    BulkResultFetcher,
+    is_last_page,
+    iter_records,
+    iter_result_batches,
+)
+from .http_session import get_http_session
 from .salesforce_monitoring import SalesforceMonitoring
 
 load_dotenv()
 
+# Records per parsed batch yielded by iter_job_results
+BULK_RESULTS_BATCH_SIZE = 1000
+
+# Result pages downloaded ahead of the database writes during a sync. Each
+# page is held parsed in memory (BULK_RESULTS_PAGE_SIZE records), so the
+# default of 1 streams instead; raise it only where that memory is available.
+BULK_RESULTS_CONCURRENCY = int(os.getenv("BULK_RESULTS_CONCURRENCY", "1"))
+
+# Records per result page when pages are buffered by BulkResultFetcher
+BULK_RESULTS_PAGE_SIZE = int(os.getenv("BULK_RESULTS_PAGE_SIZE", "50000"))
+
 
 class BulkSalesforceService:
     """Service class for Salesforce Bulk API operations.
@@ -27,6 +45,7 @@ class BulkSalesforceService:
         client_id: str = None,
         client_secret: str = None,
         sandbox: bool = False,
+        http_session: Optional[requests.Session] = None,
     ):
         """
         Initialize Salesforce Bulk API client
@@ -38,6 +57,7 @@ class BulkSalesforceService:
             client_id: Salesforce connected app client ID (defaults to env var)
             client_secret: Salesforce connected app client secret (defaults to env var)
             sandbox: True if using sandbox environment
+            http_session: Session to send requests with (defaults to the shared pooled session)
         """
         self.username = username or os.getenv("SALESFORCE_USERNAME", "")
         self.password = password or os.getenv("SALESFORCE_PASSWORD", "")
@@ -59,6 +79,7 @@ class BulkSalesforceService:
         self.session_id = None
         self.instance_url = None
         self.headers = None
+        self.http = http_session or get_http_session()
 
         # Initialize monitoring
         self.monitoring = SalesforceMonitoring()
@@ -94,7 +115,7 @@ class BulkSalesforceService:
             }
 
             # Make authentication request
-            response = requests.post(self.login_url, data=auth_data)
+            response = self.http.post(self.login_url, data=auth_data)
             response.raise_for_status()
 
             auth_result = response.json()
@@ -144,7 +165,7 @@ class BulkSalesforceService:
             }
 
             url = f"{self.instance_url}/services/data/{self.api_version}/jobs/query"
-            response = requests.post(url, headers=self.headers, json=job_data)
+            response = self.http.post(url, headers=self.headers, json=job_data)
 
             if response.status_code != 200:
                 error_detail = response.json()
@@ -196,7 +217,7 @@ class BulkSalesforceService:
         """
         try:
             url = f"{self.instance_url}/services/data/{self.api_version}/jobs/query/{job_id}"
-            response = requests.get(url, headers=self.headers)
+            response = self.http.get(url, headers=self.headers)
             response.raise_for_status()
 
             return response.json()
@@ -209,6 +230,11 @@ class BulkSalesforceService:
         """
         Wait for a bulk job to complete
 
+        Status checks back off exponentially with jitter (see poll_delays), so
+        short jobs are noticed within a second or two and long ones are not
+        polled every few seconds. Use BulkJobManager to wait for several jobs
+        at once.
+
         Args:
             job_id: The job ID to monitor
             max_wait_time: Maximum time to wait in seconds
@@ -218,6 +244,7 @@ class BulkSalesforceService:
         """
         start_time = time.time()
         last_update = 0
+        delays = poll_delays()
 
         while time.time() - start_time < max_wait_time:
             job_status = self.check_job_status(job_id)
@@ -262,7 +289,8 @@ class BulkSalesforceService:
                 return False
 
             # Wait before checking again
-            time.sleep(10)
+            remaining = max_wait_time - (time.time() - start_time)
+            time.sleep(max(0, min(next(delays), remaining)))
 
         print(f"⏰ Job {job_id} did not complete within {max_wait_time} seconds")
         self.monitoring.log_api_call(
@@ -272,7 +300,10 @@ class BulkSalesforceService:
 
     def get_job_results(self, job_id: str) -> str:
         """
-        Get the results of a completed bulk query job as CSV string
+        Get the first page of results of a completed bulk query job as CSV string
+
+        Large jobs are split into several result pages; use iter_job_results to
+        read all of them.
 
         Args:
             job_id: The completed job ID
@@ -282,7 +313,7 @@ class BulkSalesforceService:
         """
         try:
             url = f"{self.instance_url}/services/data/{self.api_version}/jobs/query/{job_id}/results"
-            response = requests.get(url, headers=self.headers)
+            response = self.http.get(url, headers=self.headers)
             response.raise_for_status()
 
             # The response contains CSV data
@@ -299,6 +330,120 @@ class BulkSalesforceService:
             )
             return ""
 
+    def iter_job_results(
+        self,
+        job_id: str,
+        max_records: Optional[int] = None,
+        batch_size: int = BULK_RESULTS_BATCH_SIZE,
+        concurrency: int = 1,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream the results of a completed bulk query job in parsed batches
+
+        Follows the Sforce-Locator header across result pages. With the default
+        concurrency of 1 each page is parsed while it downloads, so memory use is
+        bounded by batch_size. With a higher concurrency up to that many pages are
+        downloaded and parsed ahead of the consumer (see BulkResultFetcher), so
+        memory is bounded by concurrency x max_records instead.
+
+        Args:
+            job_id: The completed job ID
+            max_records: Records per result page requested from Salesforce
+                (defaults to Salesforce's own page size, or to
+                BULK_RESULTS_PAGE_SIZE when fetching concurrently)
+            batch_size: Records per yielded batch
+            concurrency: Result pages downloaded ahead of the consumer
+
+        Yields:
+            Lists of at most batch_size record dictionaries
+
+        Raises:
+            requests.RequestException: If a result page cannot be downloaded
+        """
+        if concurrency > 1:
+            pages = BulkResultFetcher(
+                self,
+                job_id,
+                max_records=max_records or BULK_RESULTS_PAGE_SIZE,
+                batch_size=batch_size,
+                concurrency=concurrency,
+            )
+        else:
+            pages = self._iter_result_pages(job_id, max_records, batch_size)
+
+        page = 0
+        total_records = 0
+        try:
+            for batches in pages:
+                page += 1
+                page_records = 0
+                for batch in batches:
+                    page_records += len(batch)
+                    yield batch
+
+                total_records += page_records
+                self.monitoring.log_api_call(
+                    "bulk_get_results",
+                    {"job_id": job_id, "page": page, "records": page_records},
+                )
+
+        except requests.RequestException as e:
+            print(f"❌ Failed to get job results: {str(e)}")
+            self.monitoring.log_api_call(
+                "bulk_get_results",
+                {"job_id": job_id, "page": page + 1, "success": False, "error": str(e)},
+            )
+            raise
+
+        print(f"✅ Streamed {total_records:,} records in {page} result page(s)")
+
+    def open_results_page(
+        self, job_id: str, locator: Optional[str] = None, max_records: Optional[int] = None
+    ) -> requests.Response:
+        """
+        Start downloading one result page of a completed bulk query job
+
+        The returned response is streamed; its Sforce-Locator header names the
+        next page ("null" after the last one). Close it when done, e.g. by using
+        it as a context manager.
+
+        Args:
+            job_id: The completed job ID
+            locator: Locator of the page to fetch (None for the first page)
+            max_records: Records per result page
+
+        Raises:
+            requests.RequestException: If the page cannot be requested
+        """
+        url = f"{self.instance_url}/services/data/{self.api_version}/jobs/query/{job_id}/results"
+        params = {}
+        if max_records:
+            params["maxRecords"] = max_records
+        if locator:
+            params["locator"] = locator
+
+        response = self.http.get(
+            url, headers={**self.headers, "Accept": "text/csv"}, params=params, stream=True
+        )
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            response.close()
+            raise
+        return response
+
+    def _iter_result_pages(
+        self, job_id: str, max_records: Optional[int], batch_size: int
+    ) -> Iterator[Iterator[List[Dict[str, Any]]]]:
+        """Yield each result page in turn as a lazily parsed stream of batches."""
+        locator = None
+        while True:
+            with self.open_results_page(job_id, locator, max_records) as response:
+                locator = response.headers.get("Sforce-Locator")
+                yield iter_result_batches(response, batch_size, job_id)
+            if is_last_page(locator):
+                break
+
     def parse_csv_results(self, csv_data: str) -> List[Dict[str, Any]]:
         """
         Parse CSV results into list of dictionaries
@@ -310,19 +455,7 @@ class BulkSalesforceService:
             List of dictionaries representing records
         """
         try:
-            # Use CSV reader to parse the data
-            csv_reader = csv.DictReader(io.StringIO(csv_data))
-            records = []
-
-            for row in csv_reader:
-                # Convert empty strings to None for proper database handling
-                processed_row = {}
-                for key, value in row.items():
-                    if value == "" or value == "null":
-                        processed_row[key] = None
-                    else:
-                        processed_row[key] = value
-                records.append(processed_row)
+            records = list(iter_records(io.StringIO(csv_data)))
 
             print(f"✅ Parsed {len(records):,} records from CSV")
             return records
@@ -337,6 +470,9 @@ class BulkSalesforceService:
         """
         Execute a complete bulk query operation
 
+        Loads every record into memory; prefer execute_bulk_query_batches for
+        large objects.
+
         Args:
             query: SOQL query to execute
             object_name: Salesforce object name
@@ -344,37 +480,72 @@ class BulkSalesforceService:
         Returns:
             List of dictionaries representing records
         """
+        records = []
+        try:
+            for batch in self.execute_bulk_query_batches(query, object_name):
+                records.extend(batch)
+        except requests.RequestException:
+            print("❌ No data received from job")
+            return []
+
+        print(
+            f"✅ Bulk query completed successfully! Retrieved {len(records):,} records"
+        )
+        return records
+
+    def execute_bulk_query_batches(
+        self,
+        query: str,
+        object_name: str = "Contact",
+        batch_size: int = BULK_RESULTS_BATCH_SIZE,
+        max_records: Optional[int] = None,
+        concurrency: int = BULK_RESULTS_CONCURRENCY,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a complete bulk query operation, yielding records in batches
+
+        By default results are streamed, so memory use is bounded by batch_size.
+        With a concurrency above 1 result pages are fetched ahead of the
+        consumer, so downloading and parsing overlap with whatever the caller
+        does with each batch, at the cost of holding up to concurrency parsed
+        pages (of max_records, or BULK_RESULTS_PAGE_SIZE, each) in memory.
+        Yields nothing if authentication, job creation or the job itself fails.
+
+        Args:
+            query: SOQL query to execute
+            object_name: Salesforce object name
+            batch_size: Records per yielded batch
+            max_records: Records per result page requested from Salesforce
+            concurrency: Result pages downloaded ahead of the consumer
+                (BULK_RESULTS_CONCURRENCY, 1 unless set, streams)
+
+        Yields:
+            Lists of at most batch_size record dictionaries
+        """
         print(f"🚀 Starting bulk query for {object_name}")
         print(f"📋 Query: {query[:100]}...")
 
         # Step 1: Authenticate
         if not self.authenticate():
-            return []
+            return
 
         # Step 2: Create bulk query job
         job_id = self.create_bulk_query_job(query, object_name)
         if not job_id:
-            return []
+            return
 
         # Step 3: Wait for job completion
         if not self.wait_for_job_completion(job_id):
-            return []
+            return
 
-        # Step 4: Get results
+        # Step 4: Stream and parse results
         print(f"📥 Downloading results...")
-        csv_data = self.get_job_results(job_id)
-
-        if not csv_data:
-            print("❌ No data received from job")
-            return []
-
-        # Step 5: Parse results
-        records = self.parse_csv_results(csv_data)
-
-        print(
-            f"✅ Bulk query completed successfully! Retrieved {len(records):,} records"
+        yield from self.iter_job_results(
+            job_id,
+            max_records=max_records,
+            batch_size=batch_size,
+            concurrency=concurrency,
         )
-        return records
 
     def get_api_limits(self) -> Dict[str, Any]:
         """Get current API usage and limits (if available)"""
@@ -383,7 +554,7 @@ class BulkSalesforceService:
                 return {}
 
             url = f"{self.instance_url}/services/data/{self.api_version}/limits"
-            response = requests.get(url, headers=self.headers)
+            response = self.http.get(url, headers=self.headers)
             response.raise_for_status()
 
             limits = response.json()
@@ -393,3 +564,4 @@ class BulkSalesforceService:
         except Exception as e:
             print(f"❌ Failed to get API limits: {str(e)}")
             return {}
+
@@ -1,14 +1,146 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
+import io
+import json
 import logging
+import os
+import uuid
 
 from app.database.data_models.salesforce_data import SfContact
 from app.services.salesforce_files.bulk_salesforce_service import BulkSalesforceService
+from app.services.salesforce_files.field_mapping import (
+    RECORD,
+    Field,
+    FieldMap,
+    convert_column,
+    parse_boolean,
+    parse_boolean_default_true,
+    parse_date,
+    parse_datetime,
+    parse_float,
+    to_rows,
+)
+from app.services.salesforce_files.salesforce_telemetry import telemetry
+from app.services.salesforce_files.savepoint_writes import write_bisecting
+from app.services.filter_options_cache import FilterOptionsCache
 
 logger = logging.getLogger(__name__)
 
+# Contacts COPYed into the staging table before each merge into sf_contacts;
+# the transaction stays open (holding its snapshot) until the merge commits
+BULK_CONTACT_MERGE_EVERY = int(os.getenv("BULK_CONTACT_MERGE_EVERY", "50000"))
+
+# Session-private staging table; temp tables are never WAL-logged and
+# ON COMMIT DELETE ROWS empties it with every merge
+STAGING_TABLE = "sf_contacts_staging"
+
+# Columns owned by the app rather than Salesforce, never overwritten by a merge
+MERGE_PRESERVED_FIELDS = ["id", "salesforce_id", "created_at"]
+
+# Salesforce Contact fields and the sf_contacts columns they are stored in
+CONTACT_FIELDS = FieldMap([
+    # Required fields
+    Field("salesforce_id", "Id", required=True),
+    Field("last_name", "LastName"),
+    # Standard Fields - Core Identity
+    Field("first_name", "FirstName"),
+    Field("salutation", "Salutation"),
+    Field("middle_name", "MiddleName"),
+    Field("suffix", "Suffix"),
+    Field("name", "Name"),
+    # Standard Fields - Contact Information
+    Field("email", "Email"),
+    Field("phone", "Phone"),
+    Field("fax", "Fax"),
+    Field("mobile_phone", "MobilePhone"),
+    Field("home_phone", "HomePhone"),
+    Field("other_phone", "OtherPhone"),
+    Field("title", "Title"),
+    # Standard Fields - Mailing Address
+    Field("mailing_street", "MailingStreet"),
+    Field("mailing_city", "MailingCity"),
+    Field("mailing_state", "MailingState"),
+    Field("mailing_postal_code", "MailingPostalCode"),
+    Field("mailing_country", "MailingCountry"),
+    Field("mailing_latitude", "MailingLatitude", parse_float),
+    Field("mailing_longitude", "MailingLongitude", parse_float),
+    Field("mailing_geocode_accuracy", "MailingGeocodeAccuracy"),
+    # Standard Fields - Activity Tracking
+    Field("last_activity_date", "LastActivityDate", parse_date),
+    Field("last_viewed_date", "LastViewedDate", parse_datetime),
+    Field("last_referenced_date", "LastReferencedDate", parse_datetime),
+    # Custom Fields - Identity & Classification
+    Field("external_id", "External_ID__c"),
+    Field("full_name", "FullName__c"),
+    Field("npi", "NPI__c"),
+    Field("specialty", "Specialty__c"),
+    Field("is_physician", "Is_Physician__c", parse_boolean),
+    Field("is_my_contact", "isMyContact__c", parse_boolean),
+    Field("active", "Active__c", parse_boolean_default_true),
+    # Custom Fields - Provider Information
+    Field("days_since_last_visit", "Days_Since_Last_Visit__c", parse_float),
+    Field("contact_account_name", "Contact_Account_Name__c"),
+    Field("last_visited_by_rep_id", "Last_Visited_By_Rep__c"),
+    # Custom Fields - Business Entity & Location
+    Field("business_entity_id", "Business_Entity__c"),
+    Field("mailing_address_compound", "Mailing_Address_Compound__c"),
+    Field("other_address_compound", "Other_Address_Compound__c"),
+    # Custom Fields - Minnesota Specific
+    Field("employment_status_mn", "Employment_Status_MN__c"),
+    Field("epic_id", "Epic_ID__c"),
+    Field("geography", "Geography__c"),
+    Field("mn_physician", "MN_Physician__c", parse_boolean),
+    Field("npi_mn", "NPI_MN__c"),
+    Field("network_id", "Network__c"),
+    Field("network_picklist", "Network_picklist__c"),
+    Field("onboarding_tasks", "Onboarding_Tasks__c", parse_boolean),
+    Field("outreach_focus", "Outreach_Focus__c", parse_boolean),
+    Field("panel_status", "Panel_Status__c"),
+    Field("primary_address", "Primary_Address__c"),
+    Field("primary_geography", "Primary_Geography__c"),
+    Field("primary_mgma_specialty", "Primary_MGMA_Specialty__c"),
+    Field("primary_practice_location_id", "Primary_Practice_Location__c"),
+    Field("mn_primary_sos_id", "MN_Primary_SoS__c"),
+    Field("provider_participation", "Provider_Participation__c"),
+    Field("provider_start_date", "Provider_Start_Date__c", parse_date),
+    Field("provider_term_date", "Provider_Term_Date__c", parse_date),
+    Field("provider_type", "Provider_Type__c"),
+    Field("secondary_practice_location_id", "Secondary_Practice_Location__c"),
+    Field("specialty_group", "Specialty_Group__c"),
+    Field("sub_network", "Sub_Network__c"),
+    Field("sub_specialty", "Sub_Specialty__c"),
+    Field("mn_primary_geography", "MN_Primary_Geography__c"),
+    # Custom Fields - MN Address Components
+    Field("mn_address_street", "MN_Address__Street__s"),
+    Field("mn_address_city", "MN_Address__City__s"),
+    Field("mn_address_postal_code", "MN_Address__PostalCode__s"),
+    Field("mn_address_state_code", "MN_Address__StateCode__s"),
+    Field("mn_address_country_code", "MN_Address__CountryCode__s"),
+    Field("mn_address_latitude", "MN_Address__Latitude__s", parse_float),
+    Field("mn_address_longitude", "MN_Address__Longitude__s", parse_float),
+    Field("mn_address_geocode_accuracy", "MN_Address__GeocodeAccuracy__s"),
+    # Custom Fields - Additional MN Data
+    Field("last_outreach_activity_date", "Last_Outreach_Activity_Date__c", parse_date),
+    Field("mn_secondary_sos_id", "MN_Secondary_SoS__c"),
+    Field("mn_mgma_specialty", "MN_MGMA_Specialty__c"),
+    Field("mn_specialty_group", "MN_Specialty_Group__c"),
+    Field("mn_provider_summary", "MN_Provider_Summary__c"),
+    Field("mn_provider_detailed_notes", "MN_Provider_Detailed_Notes__c"),
+    Field("mn_tasks_count", "MN_Tasks_Count__c", parse_float),
+    Field("mn_name_specialty_network", "MN_Name_Specialty_Network__c"),
+    # Salesforce System Fields
+    Field("sf_created_date", "CreatedDate", parse_datetime),
+    Field("sf_last_modified_date", "LastModifiedDate", parse_datetime),
+    Field("sf_system_modstamp", "SystemModstamp", parse_datetime),
+    Field("sf_last_modified_by_id", "LastModifiedById"),
+    Field("is_deleted", "IsDeleted", parse_boolean),
+    # Store raw data for reference
+    Field("additional_data", RECORD),
+])
+
 
 class BulkContactSyncService:
     """Service for bulk synchronizing Salesforce Contact data with local SfContact model.
@@ -18,10 +150,17 @@ class BulkContactSyncService:
     """
 
     def __init__(
-        self, db_session: Session, bulk_salesforce_service: BulkSalesforceService
+        self,
+        db_session: Session,
+        bulk_salesforce_service: BulkSalesforceService,
+        merge_every: int = BULK_CONTACT_MERGE_EVERY,
     ):
         self.db = db_session
         self.sf_bulk = bulk_salesforce_service
+        self.merge_every = max(1, merge_every)
+        # staged_seq range of the rows waiting in the staging table
+        self._staged_from = self._staged_to = 0
+        self._copy_columns: Optional[List[str]] = None
 
     def get_contact_query(self, modified_since: Optional[datetime] = None) -> str:
         """Build the SOQL query for Contact data optimized for bulk operations."""
@@ -138,13 +277,22 @@ class BulkContactSyncService:
         return query
 
     def bulk_sync_contacts(
-        self, modified_since: Optional[datetime] = None, batch_size: int = 1000
+        self,
+        modified_since: Optional[datetime] = None,
+        batch_size: int = 1000,
+        use_copy: bool = True,
     ) -> Dict[str, int]:
         """Bulk sync all contacts from Salesforce to local database.
 
         Args:
             modified_since: Only sync contacts modified since this datetime
             batch_size: Number of records to process in each database batch
+            use_copy: COPY batches into a staging table and merge them into
+                sf_contacts every ``merge_every`` rows, instead of one
+                INSERT ... ON CONFLICT per batch. The staging table is
+                emptied on commit, so one transaction stays open from the
+                first staged batch to the merge, across the Salesforce
+                downloads in between; lower merge_every to shorten it
 
         Returns:
             Dictionary with sync statistics
@@ -162,44 +310,209 @@ class BulkContactSyncService:
             # Get the query
             query = self.get_contact_query(modified_since)
 
-            # Execute bulk query
+            # Stream the bulk query results and upsert them batch by batch, so
+            # only one batch of contacts is held in memory at a time
             logger.info("Starting bulk contact extraction from Salesforce...")
-            contacts_data = self.sf_bulk.execute_bulk_query(query, "Contact")
+            logger.info(f"Processing contacts in batches of {batch_size}")
+
+            batches = self.sf_bulk.execute_bulk_query_batches(
+                query, "Contact", batch_size=batch_size
+            )
+            for batch_number, batch in enumerate(batches, start=1):
+                stats["total_retrieved"] += len(batch)
+                if use_copy:
+                    with telemetry.timer("db_copy_stage", "Contact") as measurement:
+                        batch_stats = self._stage_contact_batch(batch)
+                        measurement.records = len(batch)
+                    if self._staged_to - self._staged_from >= self.merge_every:
+                        self._add_batch_stats(stats, self._timed_merge())
+                else:
+                    with telemetry.timer("db_upsert", "Contact") as measurement:
+                        batch_stats = self._process_contact_batch(batch)
+                        measurement.records = len(batch)
+
+                # Update overall stats
+                self._add_batch_stats(stats, batch_stats)
+
+                logger.info(
+                    f"Processed batch {batch_number}: {len(batch)} records"
+                )
+
+            if use_copy:
+                self._add_batch_stats(stats, self._timed_merge())
 
-            if not contacts_data:
+            if not stats["total_retrieved"]:
                 logger.warning("No contacts retrieved from Salesforce")
                 return stats
 
-            stats["total_retrieved"] = len(contacts_data)
             logger.info(
                 f"Retrieved {stats['total_retrieved']:,} contacts from Salesforce"
             )
 
-            # Process in batches for efficient database operations
-            logger.info(f"Processing contacts in batches of {batch_size}")
-
-            for i in range(0, len(contacts_data), batch_size):
-                batch = contacts_data[i : i + batch_size]
-                batch_stats = self._process_contact_batch(batch)
-
-                # Update overall stats
-                stats["total_processed"] += batch_stats["processed"]
-                stats["new_records"] += batch_stats["new"]
-                stats["updated_records"] += batch_stats["updated"]
-                stats["errors"] += batch_stats["errors"]
-
-                logger.info(
-                    f"Processed batch {i // batch_size + 1}: {batch_stats['processed']} records"
-                )
+            FilterOptionsCache.invalidate(
+                self.db, FilterOptionsCache.CONTACTS, FilterOptionsCache.RELATIONSHIPS
+            )
 
             logger.info(f"Bulk sync completed: {stats}")
             return stats
 
         except Exception as e:
             logger.error(f"Error during bulk sync: {str(e)}")
+            self.db.rollback()
+            self._staged_from = self._staged_to = 0
             stats["errors"] += 1
             return stats
 
+    @staticmethod
+    def _add_batch_stats(stats: Dict[str, int], batch_stats: Dict[str, int]) -> None:
+        stats["total_processed"] += batch_stats["processed"]
+        stats["new_records"] += batch_stats["new"]
+        stats["updated_records"] += batch_stats["updated"]
+        stats["errors"] += batch_stats["errors"]
+
+    def _timed_merge(self) -> Dict[str, int]:
+        with telemetry.timer("db_merge", "Contact") as measurement:
+            batch_stats = self._merge_staged_contacts()
+            measurement.records = batch_stats["processed"]
+        return batch_stats
+
+    def _stage_contact_batch(self, batch: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Map a batch of contacts and COPY it into the staging table.
+
+        Nothing is written to sf_contacts until _merge_staged_contacts; the
+        returned stats only count mapping errors.
+        """
+        batch_stats = {"processed": 0, "new": 0, "updated": 0, "errors": 0}
+
+        columns = self._map_contact_columns(batch, batch_stats)
+        count = len(columns["salesforce_id"])
+        if not count:
+            return batch_stats
+
+        if self._copy_columns is None:
+            self._copy_columns = ["id", *columns, "staged_seq"]
+        if self._staged_to == self._staged_from:
+            self._create_staging_table()
+
+        staged_seq = range(self._staged_to + 1, self._staged_to + count + 1)
+        self._staged_to += count
+        values = [[uuid.uuid4() for _ in staged_seq], *columns.values(), staged_seq]
+        # Encode column by column: repeated values are only encoded once
+        encoded = [convert_column(_copy_text, column) for column in values]
+        buffer = io.StringIO()
+        buffer.write("\n".join(map("\t".join, zip(*encoded))))
+        buffer.write("\n")
+        buffer.seek(0)
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE} ({', '.join(self._copy_columns)}) FROM STDIN",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+        return batch_stats
+
+    def _create_staging_table(self) -> None:
+        self.db.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} ON COMMIT DELETE ROWS AS "
+                f"SELECT *, CAST(0 AS bigint) AS staged_seq FROM {SfContact.__tablename__} "
+                f"WITH NO DATA"
+            )
+        )
+
+    def _merge_staged_contacts(self) -> Dict[str, int]:
+        """Merge the staged contacts into sf_contacts and commit.
+
+        One INSERT ... SELECT ... ON CONFLICT merges the whole staging table.
+        If it fails, the staged range is bisected in savepoints so only the
+        offending rows are skipped and counted as errors.
+        """
+        batch_stats = {"processed": 0, "new": 0, "updated": 0, "errors": 0}
+        if self._staged_to == self._staged_from:
+            return batch_stats
+
+        self._merge_range(self._staged_from + 1, self._staged_to, batch_stats)
+        self.db.commit()
+        self._staged_from = self._staged_to = 0
+
+        logger.info(
+            f"Merged {batch_stats['processed']:,} staged contacts: "
+            f"{batch_stats['new']:,} new, {batch_stats['updated']:,} updated"
+        )
+        return batch_stats
+
+    def _merge_range(self, first: int, last: int, batch_stats: Dict[str, int]) -> None:
+        def merge(staged_seq: range):
+            return self.db.execute(
+                text(self._merge_sql()), {"first": staged_seq[0], "last": staged_seq[-1]}
+            ).one()
+
+        def on_error(staged_seq: int, error: str) -> None:
+            salesforce_id = self.db.execute(
+                text(f"SELECT salesforce_id FROM {STAGING_TABLE} WHERE staged_seq = :seq"),
+                {"seq": staged_seq},
+            ).scalar()
+            logger.error(f"Error merging contact {salesforce_id}: {error}")
+            batch_stats["errors"] += 1
+
+        for inserted, merged in write_bisecting(
+            self.db, range(first, last + 1), merge, on_error
+        ):
+            batch_stats["processed"] += merged
+            batch_stats["new"] += inserted
+            batch_stats["updated"] += merged - inserted
+
+    def _merge_sql(self) -> str:
+        columns = [column for column in self._copy_columns if column != "staged_seq"]
+        updates = ", ".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in columns
+            if column not in MERGE_PRESERVED_FIELDS
+        )
+        column_list = ", ".join(columns)
+        # The same contact staged twice keeps its latest copy; one statement
+        # cannot update a row twice
+        return f"""
+            WITH merged AS (
+                INSERT INTO {SfContact.__tablename__} ({column_list})
+                SELECT {column_list} FROM (
+                    SELECT DISTINCT ON (salesforce_id) *
+                    FROM {STAGING_TABLE}
+                    WHERE staged_seq BETWEEN :first AND :last
+                    ORDER BY salesforce_id, staged_seq DESC
+                ) AS staged
+                ON CONFLICT (salesforce_id) DO UPDATE SET {updates}
+                RETURNING xmax = 0 AS inserted
+            )
+            SELECT count(*) FILTER (WHERE inserted), count(*) FROM merged
+        """
+
+    def write_page(self, records: List[Dict[str, Any]]) -> Tuple[int, int, List[str]]:
+        """Upsert one page of raw Salesforce contacts and commit it.
+
+        Contacts that cannot be mapped are skipped; a page that cannot be
+        written raises, so the caller can retry it.
+
+        Args:
+            records: Raw Salesforce contact records
+
+        Returns:
+            (new, updated, Ids of the contacts that could not be mapped)
+        """
+        contact_data = self._map_contacts(records, {"errors": 0})
+        new = updated = 0
+        if contact_data:
+            new, updated = self._upsert_contacts(contact_data)
+        self.db.commit()
+
+        mapped = {d["salesforce_id"] for d in contact_data}
+        failed = [contact.get("Id") for contact in records if contact.get("Id") not in mapped]
+        return new, updated, failed
+
     def _process_contact_batch(self, batch: List[Dict[str, Any]]) -> Dict[str, int]:
         """Process a batch of contacts with efficient database operations.
 
@@ -213,61 +526,19 @@ class BulkContactSyncService:
         batch_stats = {"processed": 0, "new": 0, "updated": 0, "errors": 0}
 
         try:
-            # Prepare data for upsert
-            contact_data = []
-            salesforce_ids = []
-
-            for contact_raw in batch:
-                try:
-                    # Convert Salesforce data to database format
-                    contact_dict = self._map_contact_data(contact_raw)
-                    contact_data.append(contact_dict)
-                    salesforce_ids.append(contact_raw["Id"])
-
-                except Exception as e:
-                    logger.error(
-                        f"Error mapping contact {contact_raw.get('Id', 'Unknown')}: {str(e)}"
-                    )
-                    batch_stats["errors"] += 1
-                    continue
+            # Convert Salesforce data to database format
+            contact_data = self._map_contacts(batch, batch_stats)
 
             if not contact_data:
                 return batch_stats
 
-            # Get existing contacts to determine which are new vs updated
-            existing_contacts = (
-                self.db.query(SfContact.salesforce_id)
-                .filter(SfContact.salesforce_id.in_(salesforce_ids))
-                .all()
-            )
-            existing_ids = {contact.salesforce_id for contact in existing_contacts}
-
-            # Perform bulk upsert using PostgreSQL's ON CONFLICT
-            stmt = insert(SfContact).values(contact_data)
-
-            # Define what to do on conflict (existing record)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["salesforce_id"],
-                set_={
-                    # Update all fields except id, salesforce_id, and created_at
-                    column.name: stmt.excluded[column.name]
-                    for column in SfContact.__table__.columns
-                    if column.name not in ["id", "salesforce_id", "created_at"]
-                },
-            )
-
-            # Execute the upsert
-            self.db.execute(stmt)
+            new, updated = self._upsert_contacts(contact_data)
             self.db.commit()
 
             # Calculate statistics
             batch_stats["processed"] = len(contact_data)
-            batch_stats["new"] = len(
-                [d for d in contact_data if d["salesforce_id"] not in existing_ids]
-            )
-            batch_stats["updated"] = len(
-                [d for d in contact_data if d["salesforce_id"] in existing_ids]
-            )
+            batch_stats["new"] = new
+            batch_stats["updated"] = updated
 
             return batch_stats
 
@@ -277,190 +548,84 @@ class BulkContactSyncService:
             batch_stats["errors"] = len(batch)
             return batch_stats
 
-    def _map_contact_data(self, contact_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Map Salesforce contact data to database format.
-
-        Args:
-            contact_data: Raw contact data from Salesforce
-
-        Returns:
-            Dictionary formatted for database insertion
+    def _upsert_contacts(self, contact_data: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Upsert mapped contacts with one statement; returns (new, updated)."""
+        salesforce_ids = [d["salesforce_id"] for d in contact_data]
+
+        # Get existing contacts to determine which are new vs updated
+        existing_contacts = (
+            self.db.query(SfContact.salesforce_id)
+            .filter(SfContact.salesforce_id.in_(salesforce_ids))
+            .all()
+        )
+        existing_ids = {contact.salesforce_id for contact in existing_contacts}
+
+        # Perform bulk upsert using PostgreSQL's ON CONFLICT
+        stmt = insert(SfContact).values(contact_data)
+
+        # Define what to do on conflict (existing record)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["salesforce_id"],
+            set_={
+                # Update all fields except id, salesforce_id, and created_at
+                column.name: stmt.excluded[column.name]
+                for column in SfContact.__table__.columns
+                if column.name not in ["id", "salesforce_id", "created_at"]
+            },
+        )
+
+        # Execute the upsert
+        self.db.execute(stmt)
+
+        new = len([d for d in contact_data if d["salesforce_id"] not in existing_ids])
+        return new, len(contact_data) - new
+
+    def _map_contacts(
+        self, batch: List[Dict[str, Any]], batch_stats: Dict[str, int]
+    ) -> List[Dict[str, Any]]:
+        """Map a batch of Salesforce contacts to database rows."""
+        return to_rows(self._map_contact_columns(batch, batch_stats))
+
+    def _map_contact_columns(
+        self, batch: List[Dict[str, Any]], batch_stats: Dict[str, int]
+    ) -> Dict[str, Sequence[Any]]:
+        """Map a batch of Salesforce contacts to database columns.
+
+        Records that cannot be mapped are logged and counted in
+        batch_stats["errors"].
         """
-
-        mapped_data = {
-            # Required fields
-            "salesforce_id": contact_data["Id"],
-            "last_name": contact_data.get("LastName"),
-            # Standard Fields - Core Identity
-            "first_name": contact_data.get("FirstName"),
-            "salutation": contact_data.get("Salutation"),
-            "middle_name": contact_data.get("MiddleName"),
-            "suffix": contact_data.get("Suffix"),
-            "name": contact_data.get("Name"),
-            # Standard Fields - Contact Information
-            "email": contact_data.get("Email"),
-            "phone": contact_data.get("Phone"),
-            "fax": contact_data.get("Fax"),
-            "mobile_phone": contact_data.get("MobilePhone"),
-            "home_phone": contact_data.get("HomePhone"),
-            "other_phone": contact_data.get("OtherPhone"),
-            "title": contact_data.get("Title"),
-            # Standard Fields - Mailing Address
-            "mailing_street": contact_data.get("MailingStreet"),
-            "mailing_city": contact_data.get("MailingCity"),
-            "mailing_state": contact_data.get("MailingState"),
-            "mailing_postal_code": contact_data.get("MailingPostalCode"),
-            "mailing_country": contact_data.get("MailingCountry"),
-            "mailing_latitude": self._parse_float(contact_data.get("MailingLatitude")),
-            "mailing_longitude": self._parse_float(
-                contact_data.get("MailingLongitude")
-            ),
-            "mailing_geocode_accuracy": contact_data.get("MailingGeocodeAccuracy"),
-            # Standard Fields - Activity Tracking
-            "last_activity_date": self._parse_date(
-                contact_data.get("LastActivityDate")
-            ),
-            "last_viewed_date": self._parse_datetime(
-                contact_data.get("LastViewedDate")
-            ),
-            "last_referenced_date": self._parse_datetime(
-                contact_data.get("LastReferencedDate")
-            ),
-            # Custom Fields - Identity & Classification
-            "external_id": contact_data.get("External_ID__c"),
-            "full_name": contact_data.get("FullName__c"),
-            "npi": contact_data.get("NPI__c"),
-            "specialty": contact_data.get("Specialty__c"),
-            "is_physician": self._parse_boolean(contact_data.get("Is_Physician__c")),
-            "is_my_contact": self._parse_boolean(contact_data.get("isMyContact__c")),
-            "active": self._parse_boolean(contact_data.get("Active__c"), default=True),
-            # Custom Fields - Provider Information
-            "days_since_last_visit": self._parse_float(
-                contact_data.get("Days_Since_Last_Visit__c")
-            ),
-            "contact_account_name": contact_data.get("Contact_Account_Name__c"),
-            "last_visited_by_rep_id": contact_data.get("Last_Visited_By_Rep__c"),
-            # Custom Fields - Business Entity & Location
-            "business_entity_id": contact_data.get("Business_Entity__c"),
-            "mailing_address_compound": contact_data.get("Mailing_Address_Compound__c"),
-            "other_address_compound": contact_data.get("Other_Address_Compound__c"),
-            # Custom Fields - Minnesota Specific
-            "employment_status_mn": contact_data.get("Employment_Status_MN__c"),
-            "epic_id": contact_data.get("Epic_ID__c"),
-            "geography": contact_data.get("Geography__c"),
-            "mn_physician": self._parse_boolean(contact_data.get("MN_Physician__c")),
-            "npi_mn": contact_data.get("NPI_MN__c"),
-            "network_id": contact_data.get("Network__c"),
-            "network_picklist": contact_data.get("Network_picklist__c"),
-            "onboarding_tasks": self._parse_boolean(
-                contact_data.get("Onboarding_Tasks__c")
-            ),
-            "outreach_focus": self._parse_boolean(
-                contact_data.get("Outreach_Focus__c")
-            ),
-            "panel_status": contact_data.get("Panel_Status__c"),
-            "primary_address": contact_data.get("Primary_Address__c"),
-            "primary_geography": contact_data.get("Primary_Geography__c"),
-            "primary_mgma_specialty": contact_data.get("Primary_MGMA_Specialty__c"),
-            "primary_practice_location_id": contact_data.get(
-                "Primary_Practice_Location__c"
-            ),
-            "mn_primary_sos_id": contact_data.get("MN_Primary_SoS__c"),
-            "provider_participation": contact_data.get("Provider_Participation__c"),
-            "provider_start_date": self._parse_date(
-                contact_data.get("Provider_Start_Date__c")
-            ),
-            "provider_term_date": self._parse_date(
-                contact_data.get("Provider_Term_Date__c")
-            ),
-            "provider_type": contact_data.get("Provider_Type__c"),
-            "secondary_practice_location_id": contact_data.get(
-                "Secondary_Practice_Location__c"
-            ),
-            "specialty_group": contact_data.get("Specialty_Group__c"),
-            "sub_network": contact_data.get("Sub_Network__c"),
-            "sub_specialty": contact_data.get("Sub_Specialty__c"),
-            "mn_primary_geography": contact_data.get("MN_Primary_Geography__c"),
-            # Custom Fields - MN Address Components
-            "mn_address_street": contact_data.get("MN_Address__Street__s"),
-            "mn_address_city": contact_data.get("MN_Address__City__s"),
-            "mn_address_postal_code": contact_data.get("MN_Address__PostalCode__s"),
-            "mn_address_state_code": contact_data.get("MN_Address__StateCode__s"),
-            "mn_address_country_code": contact_data.get("MN_Address__CountryCode__s"),
-            "mn_address_latitude": self._parse_float(
-                contact_data.get("MN_Address__Latitude__s")
-            ),
-            "mn_address_longitude": self._parse_float(
-                contact_data.get("MN_Address__Longitude__s")
-            ),
-            "mn_address_geocode_accuracy": contact_data.get(
-                "MN_Address__GeocodeAccuracy__s"
-            ),
-            # Custom Fields - Additional MN Data
-            "last_outreach_activity_date": self._parse_date(
-                contact_data.get("Last_Outreach_Activity_Date__c")
-            ),
-            "mn_secondary_sos_id": contact_data.get("MN_Secondary_SoS__c"),
-            "mn_mgma_specialty": contact_data.get("MN_MGMA_Specialty__c"),
-            "mn_specialty_group": contact_data.get("MN_Specialty_Group__c"),
-            "mn_provider_summary": contact_data.get("MN_Provider_Summary__c"),
-            "mn_provider_detailed_notes": contact_data.get(
-                "MN_Provider_Detailed_Notes__c"
-            ),
-            "mn_tasks_count": self._parse_float(contact_data.get("MN_Tasks_Count__c")),
-            "mn_name_specialty_network": contact_data.get(
-                "MN_Name_Specialty_Network__c"
-            ),
-            # Salesforce System Fields
-            "sf_created_date": self._parse_datetime(contact_data.get("CreatedDate")),
-            "sf_last_modified_date": self._parse_datetime(
-                contact_data.get("LastModifiedDate")
-            ),
-            "sf_system_modstamp": self._parse_datetime(
-                contact_data.get("SystemModstamp")
-            ),
-            "sf_last_modified_by_id": contact_data.get("LastModifiedById"),
-            # Store raw data for reference
-            "additional_data": contact_data,
-            # Local metadata
-            "last_synced_at": datetime.now(),
-            "created_at": datetime.now(),
-        }
-
-        return mapped_data
-
-    def _parse_datetime(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse Salesforce datetime string to Python datetime."""
-        if not date_str:
-            return None
-        try:
-            # Remove 'Z' suffix and parse
-            return datetime.fromisoformat(date_str.rstrip("Z"))
-        except:
-            return None
-
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse Salesforce date string to Python date."""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str).date()
-        except:
-            return None
-
-    def _parse_boolean(self, value: Optional[str], default: bool = False) -> bool:
-        """Parse string boolean value."""
-        if value is None:
-            return default
-        if isinstance(value, bool):
-            return value
-        return str(value).lower() in ("true", "1", "yes", "on")
-
-    def _parse_float(self, value: Optional[str]) -> Optional[float]:
-        """Parse string float value."""
-        if not value:
-            return None
-        try:
-            return float(value)
-        except:
-            return None
+        columns, failures = CONTACT_FIELDS.map_columns(batch)
+        for contact_raw, e in failures:
+            logger.error(
+                f"Error mapping contact {contact_raw.get('Id', 'Unknown')}: {str(e)}"
+            )
+            batch_stats["errors"] += 1
+
+        # Local metadata
+        now = [datetime.now()] * len(columns["salesforce_id"])
+        columns["last_synced_at"] = now
+        columns["created_at"] = now
+        return columns
+
+
+def _copy_text(value: Any) -> str:
+    """A value in COPY's text format: \\N for NULL, with \\, tab and newlines escaped."""
+    if value is None:
+        return "\\N"
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif not isinstance(value, str):
+        value = str(value)
+    if value.isprintable() and "\\" not in value:
+        # Nothing to escape, the common case
+        return value
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
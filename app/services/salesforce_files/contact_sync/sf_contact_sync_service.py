@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.database.data_models.salesforce_data import SfContact
 from app.services.salesforce_files.salesforce_service import ReadOnlySalesforceService
+from app.services.filter_options_cache import FilterOptionsCache
 
 
 class SfContactSyncService:
@@ -159,6 +160,11 @@ class SfContactSyncService:
                     f"Error syncing contact {contact_data.get('Id', 'Unknown')}: {str(e)}"
                 )
 
+        if synced_contacts:
+            FilterOptionsCache.invalidate(
+                self.db, FilterOptionsCache.CONTACTS, FilterOptionsCache.RELATIONSHIPS
+            )
+
         print(f"Successfully synced {len(synced_contacts)} contacts")
         return synced_contacts
 
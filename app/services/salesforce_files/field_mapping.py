@@ -0,0 +1,241 @@
+"""
+Salesforce Field Mapping
+
+Declarative maps from Salesforce fields to table columns, applied a batch
+of records at a time. A FieldMap reads every mapped field of a batch with a
+single itemgetter pass, turns the rows into columns and runs each column's
+converter once per distinct value in the batch (dates, flags and counts
+repeat heavily). Callers that write columns anyway, like a COPY, take the
+columns as they are; everyone else gets them zipped back into row dicts.
+Records that do not fit that fast path, such as ones missing a field the
+first record had, are mapped one at a time so a bad record only costs
+itself.
+
+Example:
+    CONTACT_FIELDS = FieldMap([
+        Field("salesforce_id", "Id", required=True),
+        Field("last_activity_date", "LastActivityDate", parse_date),
+        Field("active", "Active__c", parse_boolean_default_true),
+    ])
+    rows, failures = CONTACT_FIELDS.map_records(batch)
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Converter = Callable[[Any], Any]
+
+# Field.source that stands for the whole record rather than one of its fields
+RECORD = "*"
+
+# Types whose equal values are interchangeable, so can share one conversion
+_SHAREABLE = {str, type(None)}
+
+
+@dataclass(frozen=True)
+class Field:
+    """One column of a mapped row.
+
+    Attributes:
+        column: Column name in the mapped row
+        source: Salesforce field to read; RECORD for the record itself, None
+            for a column that always holds ``default``
+        convert: Applied to the field value (or to ``default`` when the field
+            is absent); None keeps the value as is
+        default: Value used when the record does not have the field at all
+        required: Records without the field fail to map instead
+    """
+
+    column: str
+    source: Optional[str] = None
+    convert: Optional[Converter] = None
+    default: Any = None
+    required: bool = False
+
+
+class FieldMap:
+    """Map Salesforce records to row dicts with a fixed list of Fields."""
+
+    def __init__(self, fields: Sequence[Field]):
+        self.fields = tuple(fields)
+        self.columns = tuple(field.column for field in self.fields)
+
+    def map_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a single record; raises KeyError if a required field is missing."""
+        row = {}
+        for field in self.fields:
+            if field.source is None:
+                row[field.column] = field.default
+                continue
+            if field.source == RECORD:
+                value = record
+            elif field.required:
+                value = record[field.source]
+            else:
+                value = record.get(field.source, field.default)
+            row[field.column] = field.convert(value) if field.convert else value
+        return row
+
+    def map_records(
+        self, records: Sequence[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], Exception]]]:
+        """Map a batch of records to row dicts.
+
+        Returns:
+            The mapped rows, in record order, and (record, error) for every
+            record that could not be mapped
+        """
+        columns, failures = self.map_columns(records)
+        return to_rows(columns), failures
+
+    def map_columns(
+        self, records: Sequence[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Sequence[Any]], List[Tuple[Dict[str, Any], Exception]]]:
+        """Map a batch of records to columns, skipping the per-row dicts.
+
+        Returns:
+            One sequence per column, in field order, holding the mapped
+            records' values in record order, and (record, error) for every
+            record that could not be mapped
+        """
+        if records:
+            try:
+                return self._map_columns(records), []
+            except Exception:
+                # Some record lacks a field the first one has or fails to
+                # convert; map them one by one to find out which
+                pass
+
+        rows = []
+        failures = []
+        for record in records:
+            try:
+                rows.append(self.map_record(record))
+            except Exception as e:
+                failures.append((record, e))
+        columns = {column: [row[column] for row in rows] for column in self.columns}
+        return columns, failures
+
+    def _map_columns(self, records: Sequence[Dict[str, Any]]) -> Dict[str, Sequence[Any]]:
+        first = records[0]
+        sources = [field.source for field in self.fields if field.source not in (None, RECORD)]
+        present = [source for source in sources if source in first]
+        absent = set(sources) - set(present)
+        if absent:
+            # Fields the first record lacks must be missing from every record
+            for record in records:
+                if not record.keys().isdisjoint(absent):
+                    raise KeyError(f"{sorted(absent)} missing from some records only")
+
+        values: Dict[str, Sequence[Any]] = {}
+        if present:
+            getter = itemgetter(*present)
+            records_values = map(getter, records)
+            if len(present) == 1:
+                records_values = ((value,) for value in records_values)
+            values = dict(zip(present, zip(*records_values)))
+
+        count = len(records)
+        columns = {}
+        for field in self.fields:
+            if field.source is None:
+                column = [field.default] * count
+            elif field.source == RECORD:
+                column = list(map(field.convert, records)) if field.convert else list(records)
+            elif field.source in values:
+                column = values[field.source]
+                if field.convert:
+                    column = convert_column(field.convert, column)
+            elif field.required:
+                raise KeyError(field.source)
+            else:
+                value = field.convert(field.default) if field.convert else field.default
+                column = [value] * count
+            columns[field.column] = column
+        return columns
+
+
+def to_rows(columns: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Turn columns (as returned by FieldMap.map_columns) into row dicts."""
+    names = tuple(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def convert_column(convert: Converter, column: Sequence[Any]) -> List[Any]:
+    """Apply convert to every value of a column, once per distinct value."""
+    try:
+        converted = dict.fromkeys(column)
+    except TypeError:
+        # Unhashable values (nested objects) are converted one by one
+        return list(map(convert, column))
+    if len(converted) > len(column) // 2:
+        # Mostly distinct values, nothing to gain
+        return list(map(convert, column))
+    if not _SHAREABLE.issuperset(map(type, converted)) and len(
+        set(map(id, column))
+    ) != len(converted):
+        # Equal values that are not the same object, such as 1 and True or one
+        # instant in two time zones, may not convert alike
+        return list(map(convert, column))
+    if len(converted) == 1:
+        return [convert(next(iter(converted)))] * len(column)
+    for value in converted:
+        converted[value] = convert(value)
+    return list(map(converted.__getitem__, column))
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Salesforce datetime string; None if empty or invalid."""
+    if not value:
+        return None
+    try:
+        # Remove 'Z' suffix and parse
+        return datetime.fromisoformat(value.rstrip("Z"))
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse a Salesforce date string; None if empty or invalid."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_activity_date(value: Optional[str]) -> Optional[date]:
+    """Like parse_date, but drops a trailing 'Z' first, as activities always have."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.rstrip("Z")).date()
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_boolean(value: Any, default: bool = False) -> bool:
+    """Parse a string boolean; default if the value is None."""
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("true", "1", "yes", "on")
+
+
+def parse_boolean_default_true(value: Any) -> bool:
+    """parse_boolean for fields that count as true when not set."""
+    return parse_boolean(value, default=True)
+
+
+def parse_float(value: Optional[str]) -> Optional[float]:
+    """Parse a string float; None if empty or invalid."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
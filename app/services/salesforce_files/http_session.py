@@ -0,0 +1,57 @@
+"""
+Salesforce HTTP Session
+
+One pooled ``requests.Session`` shared by every Salesforce client in the
+process (Bulk API, REST and the simple_salesforce based read-only service),
+so repeated calls reuse keep-alive connections instead of paying a TCP and
+TLS handshake per request. Idempotent GETs are retried on transient gateway
+errors; POSTs are never retried so a bulk job is not created twice.
+"""
+
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept open per host; should cover the result fetcher's concurrency
+SALESFORCE_HTTP_POOL_SIZE = int(os.getenv("SALESFORCE_HTTP_POOL_SIZE", "10"))
+
+# Retries for idempotent requests failing with a transient gateway error
+SALESFORCE_HTTP_RETRIES = int(os.getenv("SALESFORCE_HTTP_RETRIES", "3"))
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+
+
+def get_http_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_http_session()
+    return _session
+
+
+def create_http_session(
+    pool_size: int = SALESFORCE_HTTP_POOL_SIZE, retries: int = SALESFORCE_HTTP_RETRIES
+) -> requests.Session:
+    """Build a session with a connection pool of ``pool_size`` per host."""
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,363 @@
+"""
+Incremental Salesforce Sync
+
+Runs the User, Contact, Task, Event and TaskWhoRelation syncs in dependency
+order and only pulls the records that changed since the previous run.
+
+Each object keeps a SystemModstamp high-watermark in the ``salesforce_sync``
+table (one row per object, ``entity_type = "watermark:<Object>"``). Records
+are read in SystemModstamp order with queryAll, so deleted records come back
+with IsDeleted = true and are stored as soft deletes, and the watermark is
+advanced after every committed page. A run that dies half way resumes from
+the last committed page; records at the watermark itself are read again,
+which the idempotent upserts absorb. The watermark never passes a record
+that failed to write (say, a relation to a Task not synced yet): it stays
+at the oldest one, so the next run reads that record again, along with
+everything after it, until it syncs.
+
+Records purged from the Salesforce recycle bin never show up in queryAll
+and are not detected.
+"""
+
+import logging
+import os
+import re
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.database.data_models.relationship_management import SalesforceSync
+from app.services.filter_options_cache import FilterOptionsCache
+from app.services.salesforce_files.activity_sync.activity_sync_service import (
+    ActivitySyncService,
+)
+from app.services.salesforce_files.activity_sync.rest_activity_service import (
+    RestActivityService,
+)
+from app.services.salesforce_files.contact_sync.bulk_contact_sync_service import (
+    BulkContactSyncService,
+)
+from app.services.salesforce_files.contact_sync.sf_contact_sync_service import (
+    SfContactSyncService,
+)
+from app.services.salesforce_files.salesforce_service import ReadOnlySalesforceService
+from app.services.salesforce_files.taskwhorelation_sync.rest_taskwhorelation_service import (
+    RestTaskWhoRelationService,
+)
+from app.services.salesforce_files.taskwhorelation_sync.taskwhorelation_sync_service import (
+    TaskWhoRelationSyncService,
+)
+from app.services.salesforce_files.user_sync.rest_user_service import RestUserService
+from app.services.salesforce_files.user_sync.user_sync_service import UserSyncService
+
+logger = logging.getLogger(__name__)
+
+# Re-read this much before each watermark, for records whose SystemModstamp
+# was assigned before the previous run but committed after it
+SALESFORCE_SYNC_OVERLAP_SECONDS = int(os.getenv("SALESFORCE_SYNC_OVERLAP_SECONDS", "300"))
+
+WATERMARK_ENTITY_PREFIX = "watermark:"
+
+STATUS_RUNNING = "running"
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class SyncObject:
+    """How one Salesforce object is queried and written."""
+
+    name: str
+    # SELECT list of the object's existing sync query
+    fields: List[str]
+    # The sync service's write_page: writes one page of raw Salesforce
+    # records and commits it, returning (new, updated, Ids of the records
+    # that failed on their own); a page that cannot be written at all raises
+    write: Callable[[List[Dict[str, Any]]], Tuple[int, int, List[str]]]
+    # Whether the object has IsDeleted (User does not)
+    deletable: bool = True
+    # Filter option caches built from this object
+    caches: Sequence[str] = ()
+
+
+@dataclass
+class ObjectSyncResult:
+    """Outcome of syncing one object."""
+
+    name: str
+    watermark_from: Optional[datetime] = None
+    watermark_to: Optional[datetime] = None
+    retrieved: int = 0
+    new: int = 0
+    updated: int = 0
+    deleted: int = 0
+    errors: int = 0
+    # SystemModstamp of the oldest record that failed to write, if any
+    failed_since: Optional[datetime] = None
+    status: str = STATUS_RUNNING
+    error: Optional[str] = None
+    skipped: bool = False
+
+
+@dataclass
+class IncrementalSyncResult:
+    """Outcome of a coordinator run, one entry per object in sync order."""
+
+    objects: List[ObjectSyncResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return all(result.status == STATUS_SUCCESS for result in self.objects)
+
+
+class IncrementalSyncService:
+    """Sync the Salesforce objects we mirror, incrementally and in dependency order.
+
+    Users come first (records reference their creators), then Contacts,
+    Tasks and Events, and TaskWhoRelations last since they reference all
+    of them. If an object fails, the objects after it are skipped so they
+    are not synced against missing parents; the failed object's watermark
+    stays at its last committed page.
+
+    Example:
+        sf_service = ReadOnlySalesforceService()
+        coordinator = IncrementalSyncService(db, sf_service)
+        result = coordinator.run()
+    """
+
+    OBJECT_ORDER = ["User", "Contact", "Task", "Event", "TaskWhoRelation"]
+
+    def __init__(
+        self,
+        db_session: Session,
+        sf_service: ReadOnlySalesforceService,
+        overlap_seconds: int = SALESFORCE_SYNC_OVERLAP_SECONDS,
+    ):
+        self.db = db_session
+        self.sf_service = sf_service
+        self.overlap = timedelta(seconds=max(0, overlap_seconds))
+        self.sync_objects = self._build_sync_objects()
+
+    def run(self, objects: Optional[Sequence[str]] = None) -> IncrementalSyncResult:
+        """Sync the given objects (default: all of them) in dependency order."""
+        selected = set(objects or self.OBJECT_ORDER)
+        unknown = selected - set(self.OBJECT_ORDER)
+        if unknown:
+            raise ValueError(f"Unknown Salesforce objects: {', '.join(sorted(unknown))}")
+
+        result = IncrementalSyncResult()
+        failed = False
+        for name in self.OBJECT_ORDER:
+            if name not in selected:
+                continue
+            if failed:
+                logger.warning(f"Skipping {name}: an object it depends on failed to sync")
+                result.objects.append(
+                    ObjectSyncResult(name, status=STATUS_FAILED, skipped=True)
+                )
+                continue
+
+            object_result = self.sync_object(self.sync_objects[name])
+            result.objects.append(object_result)
+            failed = object_result.status != STATUS_SUCCESS
+
+        return result
+
+    def sync_object(self, sync_object: SyncObject) -> ObjectSyncResult:
+        """Sync the records of one object changed since its watermark."""
+        state = self.get_watermark(sync_object.name)
+        result = ObjectSyncResult(sync_object.name, watermark_from=_as_utc(state.last_synced_at))
+        result.watermark_to = result.watermark_from
+
+        state.sync_status = STATUS_RUNNING
+        state.error_message = None
+        self.db.commit()
+
+        since = result.watermark_from - self.overlap if result.watermark_from else None
+        query = self.build_query(sync_object, since)
+        logger.info(
+            f"Syncing {sync_object.name} records modified since "
+            f"{since.isoformat() if since else 'the beginning'}"
+        )
+
+        try:
+            pages = self.sf_service.iter_query_pages(
+                query, include_deleted=sync_object.deletable
+            )
+            for page in pages:
+                self._sync_page(sync_object, page, state, result)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"{sync_object.name} sync failed: {str(e)}")
+            result.status = STATUS_FAILED
+            result.error = str(e)
+            state = self.get_watermark(sync_object.name)
+            state.sync_status = STATUS_FAILED
+            state.error_message = str(e)
+            self.db.commit()
+            return result
+
+        state.sync_status = STATUS_SUCCESS
+        if result.errors:
+            state.error_message = (
+                f"{result.errors} records failed to sync; they are retried from "
+                f"{result.failed_since.isoformat()}"
+            )
+        self.db.commit()
+        result.status = STATUS_SUCCESS
+
+        if result.new or result.updated:
+            for cache in sync_object.caches:
+                FilterOptionsCache.invalidate(self.db, cache)
+
+        logger.info(
+            f"{sync_object.name}: {result.retrieved} retrieved, {result.new} new, "
+            f"{result.updated} updated, {result.deleted} deleted, {result.errors} errors; "
+            f"watermark {result.watermark_to.isoformat() if result.watermark_to else 'unset'}"
+        )
+        return result
+
+    def _sync_page(
+        self,
+        sync_object: SyncObject,
+        page: List[Dict[str, Any]],
+        state: SalesforceSync,
+        result: ObjectSyncResult,
+    ) -> None:
+        new, updated, failed = sync_object.write(page)
+
+        if failed and result.failed_since is None:
+            # Hold the watermark at the oldest failed record, so the next run
+            # reads it again
+            failed_ids = set(failed)
+            oldest = next((r for r in page if r.get("Id") in failed_ids), page[0])
+            result.failed_since = _parse_modstamp(oldest["SystemModstamp"])
+            state.last_synced_at = result.failed_since
+        if result.failed_since is None:
+            # Pages arrive in SystemModstamp order, so the last record is the newest
+            last = page[-1]
+            state.last_synced_at = _parse_modstamp(last["SystemModstamp"])
+            state.sf_id = last["Id"]
+        self.db.commit()
+
+        result.retrieved += len(page)
+        result.new += new
+        result.updated += updated
+        result.errors += len(failed)
+        result.deleted += sum(1 for record in page if record.get("IsDeleted"))
+        result.watermark_to = _as_utc(state.last_synced_at)
+
+    def get_watermark(self, name: str) -> SalesforceSync:
+        """The watermark row of an object, created (without a watermark) if missing."""
+        entity_type = f"{WATERMARK_ENTITY_PREFIX}{name}"
+        local_id = uuid.uuid5(uuid.NAMESPACE_URL, f"salesforce-sync/{entity_type}")
+        state = (
+            self.db.query(SalesforceSync)
+            .filter(
+                SalesforceSync.entity_type == entity_type,
+                SalesforceSync.local_id == local_id,
+            )
+            .one_or_none()
+        )
+        if state is None:
+            # sf_id holds the Id of the last record synced; none yet
+            state = SalesforceSync(entity_type=entity_type, local_id=local_id, sf_id="")
+            self.db.add(state)
+            self.db.flush()
+        return state
+
+    def reset_watermarks(self, objects: Optional[Sequence[str]] = None) -> None:
+        """Forget the watermarks so the next run pulls the objects in full."""
+        for name in objects or self.OBJECT_ORDER:
+            state = self.get_watermark(name)
+            state.last_synced_at = None
+            state.sf_id = ""
+            state.sync_status = None
+            state.error_message = None
+        self.db.commit()
+
+    @staticmethod
+    def build_query(sync_object: SyncObject, since: Optional[datetime]) -> str:
+        """SOQL for the object's records modified since a point in time, oldest first."""
+        fields = list(sync_object.fields)
+        for required in ["Id", "SystemModstamp"] + (["IsDeleted"] if sync_object.deletable else []):
+            if required not in fields:
+                fields.append(required)
+
+        where_clause = ""
+        if since:
+            where_clause = f"WHERE SystemModstamp >= {_soql_datetime(since)}"
+
+        return (
+            f"SELECT {', '.join(fields)} FROM {sync_object.name} {where_clause} "
+            f"ORDER BY SystemModstamp ASC, Id ASC"
+        )
+
+    def _build_sync_objects(self) -> Dict[str, SyncObject]:
+        """Reuse each object's sync service for its field list and page writer."""
+        sf = self.sf_service
+        users = UserSyncService(self.db, RestUserService(sf_service=sf))
+        contacts = BulkContactSyncService(self.db, bulk_salesforce_service=None)
+        activities = ActivitySyncService(self.db, RestActivityService(sf_service=sf))
+        relations = TaskWhoRelationSyncService(
+            self.db, RestTaskWhoRelationService(sf_service=sf)
+        )
+
+        return {
+            "User": SyncObject(
+                "User",
+                _select_fields(users.rest_service.get_users_query()),
+                users.write_page,
+                deletable=False,
+                caches=[FilterOptionsCache.RELATIONSHIPS],
+            ),
+            "Contact": SyncObject(
+                "Contact",
+                _select_fields(SfContactSyncService(self.db, sf).get_contact_query()),
+                contacts.write_page,
+                caches=[FilterOptionsCache.CONTACTS, FilterOptionsCache.RELATIONSHIPS],
+            ),
+            "Task": SyncObject(
+                "Task",
+                _select_fields(activities.sf.get_tasks_query()),
+                partial(activities.write_page, activity_type="Task"),
+            ),
+            "Event": SyncObject(
+                "Event",
+                _select_fields(activities.sf.get_events_query()),
+                partial(activities.write_page, activity_type="Event"),
+            ),
+            "TaskWhoRelation": SyncObject(
+                "TaskWhoRelation",
+                _select_fields(relations.rest_service.get_taskwhorelations_query()),
+                relations.write_page,
+            ),
+        }
+
+
+def _select_fields(soql: str) -> List[str]:
+    """The field list of a SELECT ... FROM query."""
+    select = re.search(r"SELECT\s+(.*?)\s+FROM\s", soql, re.S | re.I)
+    return [name.strip() for name in select.group(1).split(",")]
+
+
+def _soql_datetime(value: datetime) -> str:
+    """A SOQL datetime literal in UTC, e.g. 2025-01-02T03:04:05Z."""
+    return _as_utc(value).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_modstamp(value: str) -> datetime:
+    """Parse a Salesforce datetime (2025-01-02T03:04:05.000+0000) as aware UTC."""
+    return _as_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,105 @@
+from datetime import datetime
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.database.session import db_session
+from app.services.salesforce_files.incremental_sync.incremental_sync_service import (
+    IncrementalSyncResult,
+    IncrementalSyncService,
+)
+from app.services.salesforce_files.salesforce_service import ReadOnlySalesforceService
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.FileHandler("incremental_sync.log"), logging.StreamHandler()],
+)
+logger = logging.getLogger(__name__)
+
+
+def run_incremental_sync(
+    db_session: Session,
+    objects: Optional[List[str]] = None,
+    full: bool = False,
+) -> IncrementalSyncResult:
+    """
+    Sync every changed Salesforce record since the last run, object by object.
+
+    Args:
+        db_session: SQLAlchemy database session
+        objects: Salesforce objects to sync (default: all, in dependency order)
+        full: Forget the stored watermarks first and pull the objects in full
+    """
+    logger.info(f"Starting incremental Salesforce sync at {datetime.now()}")
+
+    sf_service = ReadOnlySalesforceService()
+    coordinator = IncrementalSyncService(db_session, sf_service)
+
+    if full:
+        logger.info("Resetting watermarks: performing a full sync")
+        coordinator.reset_watermarks(objects)
+
+    result = coordinator.run(objects)
+
+    logger.info("Final Statistics:")
+    for object_result in result.objects:
+        if object_result.skipped:
+            logger.info(f"{object_result.name}: skipped")
+            continue
+        logger.info(
+            f"{object_result.name}: {object_result.status}, "
+            f"{object_result.retrieved:,} retrieved, {object_result.new:,} new, "
+            f"{object_result.updated:,} updated, {object_result.deleted:,} deleted, "
+            f"{object_result.errors:,} errors"
+        )
+        if object_result.error:
+            logger.info(f"{object_result.name} error: {object_result.error}")
+
+    final_limits = sf_service.get_api_limits()
+    daily = final_limits.get("DailyApiRequests", {})
+    logger.info(
+        f"Remaining daily API requests: {daily.get('Remaining', 0):,}/{daily.get('Max', 0):,}"
+    )
+
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Incrementally sync Salesforce Users, Contacts, Tasks, Events and TaskWhoRelations"
+    )
+    parser.add_argument(
+        "--objects",
+        nargs="+",
+        choices=IncrementalSyncService.OBJECT_ORDER,
+        help="Only sync these objects (they still run in dependency order)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the stored watermarks and pull every record",
+    )
+
+    args = parser.parse_args()
+
+    # Get database session
+    session_generator = db_session()
+    session = next(session_generator)
+
+    try:
+        result = run_incremental_sync(session, objects=args.objects, full=args.full)
+    except Exception as e:
+        logger.error(f"Failed to run incremental sync: {str(e)}", exc_info=True)
+        raise
+    finally:
+        try:
+            next(session_generator)  # This will trigger the commit
+        except StopIteration:
+            pass  # Expected when generator is exhausted
+
+    sys.exit(0 if result.succeeded else 1)
@@ -1,44 +1,68 @@
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 import logging
 import json
 import os
+import time
+
+from .salesforce_telemetry import telemetry
 
 logger = logging.getLogger(__name__)
 
 
 class SalesforceMonitoring:
-    """Wrapper for monitoring Salesforce API usage."""
+    """Wrapper for monitoring Salesforce API usage.
+
+    Calls are recorded in the process-wide telemetry registry, which writes
+    the daily API log in the background (see salesforce_telemetry).
+    """
 
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = log_dir
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
+        # Calls are written later, possibly from another working directory
+        self._log_path = os.path.abspath(log_dir)
+        telemetry.add_log_dir(self._log_path)
 
     def log_api_call(self, operation: str, details: Dict[str, Any] = None):
-        """Log API call details for monitoring."""
-        timestamp = datetime.now().isoformat()
-        log_entry = {
-            "timestamp": timestamp,
-            "operation": operation,
-            "details": details or {},
-        }
+        """Log API call details for monitoring.
 
-        # Log to file
-        log_file = os.path.join(
-            self.log_dir, f"salesforce_api_{datetime.now().strftime('%Y%m%d')}.log"
-        )
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        A ``duration`` (seconds), ``records`` and ``data_size`` in the details
+        feed the latency and throughput metrics.
+        """
+        telemetry.record_api_call(self._log_path, operation, details or {})
 
         # Log to console
         logger.info(f"Salesforce API call: {operation}")
 
+    @contextmanager
+    def track_api_call(
+        self, operation: str, details: Dict[str, Any] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Log an API call made inside the block, with its duration.
+
+        Yields the details dict, so the block can add e.g. the records the
+        call returned. A call that raises is logged as failed.
+        """
+        details = dict(details or {})
+        started = time.perf_counter()
+        try:
+            yield details
+        except Exception as e:
+            details.update(success=False, error=str(e))
+            raise
+        finally:
+            details["duration"] = time.perf_counter() - started
+            self.log_api_call(operation, details)
+
     def check_api_limits(self, current_limits: Dict[str, Any]) -> bool:
         """
         Check if we're approaching API limits.
         Returns True if usage is safe, False if we're approaching limits.
         """
+        telemetry.set_api_limits(current_limits)
         daily_limit = current_limits.get("DailyApiRequests", {})
         remaining = daily_limit.get("Remaining", 0)
         maximum = daily_limit.get("Max", 0)
@@ -57,7 +81,12 @@ class SalesforceMonitoring:
         return True
 
     def get_usage_report(self, start_date: str = None) -> Dict[str, Any]:
-        """Generate usage report from logs."""
+        """Generate usage report from logs.
+
+        For latencies and throughput, see salesforce_telemetry.format_report.
+        """
+        # Write out this process's queued calls first
+        telemetry.flush()
         if not start_date:
             start_date = datetime.now().strftime("%Y%m%d")
 
@@ -1,9 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from simple_salesforce import Salesforce
 from pydantic import BaseModel, Field
 import os
 from dotenv import load_dotenv
+from .http_session import get_http_session
 from .salesforce_monitoring import SalesforceMonitoring
+from .salesforce_telemetry import soql_object
 
 load_dotenv()
 
@@ -43,30 +45,36 @@ class ReadOnlySalesforceService:
             password=config.password,
             security_token=config.security_token,
             domain=config.domain,
+            session=get_http_session(),
         )
 
         # Initialize monitoring
         self.monitoring = SalesforceMonitoring()
 
+        # Last known API limits, in the shape returned by the limits resource
+        self._api_limits: Dict[str, Any] = {}
+
         # Check API limits on startup
-        self._check_api_limits()
+        self.get_api_limits()
 
     def _check_api_limits(self):
-        """Check current API usage limits."""
-        limits = self._sf.limits()
-        self.monitoring.check_api_limits(limits)
-
-    def query(self, soql_query: str) -> List[Dict[str, Any]]:
-        """
-        Execute a read-only SOQL query and return results.
+        """Check current API usage limits against the cached values.
 
-        Args:
-            soql_query: SOQL query string (must be SELECT only)
-
-        Raises:
-            ValueError: If query contains any modification operations
+        Every REST response carries a ``Sforce-Limit-Info`` header, which
+        simple_salesforce parses into ``api_usage``; the cache is refreshed
+        from it so checking the limits costs no extra API call.
         """
-        # Validate query is read-only
+        usage = self._sf.api_usage.get("api-usage")
+        if usage is not None:
+            self._api_limits["DailyApiRequests"] = {
+                "Max": usage.total,
+                "Remaining": usage.total - usage.used,
+            }
+        self.monitoring.check_api_limits(self._api_limits)
+
+    @staticmethod
+    def _validate_query(soql_query: str) -> None:
+        """Raise ValueError unless the query is a SELECT."""
         query_lower = soql_query.lower().strip()
         if not query_lower.startswith("select "):
             raise ValueError("Only SELECT queries are allowed")
@@ -80,15 +88,71 @@ class ReadOnlySalesforceService:
         ):
             raise ValueError("Only SELECT queries are allowed")
 
+    def query(self, soql_query: str) -> List[Dict[str, Any]]:
+        """
+        Execute a read-only SOQL query and return the first page of results.
+
+        Use iter_query_pages to read every record of a larger result.
+
+        Args:
+            soql_query: SOQL query string (must be SELECT only)
+
+        Raises:
+            ValueError: If query contains any modification operations
+        """
+        self._validate_query(soql_query)
+
         try:
             # Log the API call
-            self.monitoring.log_api_call("query", {"soql": soql_query})
+            with self.monitoring.track_api_call("query", {"soql": soql_query}) as call:
+                result = self._sf.query(soql_query)
+                call["records"] = len(result.get("records", []))
+            self._check_api_limits()
+            return result.get("records", [])
+        except Exception as e:
+            raise Exception(f"Error executing Salesforce query: {str(e)}")
 
-            # Check limits before making call
+    def iter_query_pages(
+        self, soql_query: str, include_deleted: bool = False
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a read-only SOQL query and yield every page of its results.
+
+        Follows the query cursor (``nextRecordsUrl``) with queryMore calls, so
+        the query runs once server-side, pages hold up to 2,000 records and
+        there is no OFFSET ceiling.
+
+        Args:
+            soql_query: SOQL query string (must be SELECT only)
+            include_deleted: Run as queryAll, which also returns deleted and
+                archived records (IsDeleted = true)
+
+        Raises:
+            ValueError: If query contains any modification operations
+        """
+        self._validate_query(soql_query)
+        object_name = soql_object(soql_query)
+
+        try:
+            with self.monitoring.track_api_call("query", {"soql": soql_query}) as call:
+                result = self._sf.query(soql_query, include_deleted=include_deleted)
+                call["records"] = len(result.get("records", []))
             self._check_api_limits()
 
-            result = self._sf.query(soql_query)
-            return result.get("records", [])
+            while True:
+                records = result.get("records", [])
+                if records:
+                    yield records
+                if result.get("done", True):
+                    break
+
+                next_records_url = result["nextRecordsUrl"]
+                with self.monitoring.track_api_call(
+                    "query_more", {"next_records_url": next_records_url, "object": object_name}
+                ) as call:
+                    result = self._sf.query_more(next_records_url, identifier_is_url=True)
+                    call["records"] = len(result.get("records", []))
+                self._check_api_limits()
         except Exception as e:
             raise Exception(f"Error executing Salesforce query: {str(e)}")
 
@@ -140,9 +204,11 @@ class ReadOnlySalesforceService:
             raise Exception(f"Error describing Salesforce object: {str(e)}")
 
     def get_api_limits(self) -> Dict[str, Any]:
-        """Get current API usage and limits."""
+        """Fetch current API usage and limits from Salesforce and cache them."""
         limits = self._sf.limits()
         self.monitoring.log_api_call("get_limits", limits)
+        self._api_limits = dict(limits)
+        self.monitoring.check_api_limits(self._api_limits)
         return limits
 
     def get_usage_report(self, date: str = None) -> Dict[str, Any]:
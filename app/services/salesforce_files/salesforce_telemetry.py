@@ -0,0 +1,438 @@
+"""
+Salesforce API Telemetry
+
+An in-process registry of what the Salesforce syncs spend their time on:
+call and error counters, latency histograms, records and bytes moved, per
+operation and Salesforce object, plus the last API-limit headroom seen.
+Recording a call only updates the registry and queues its log line under a
+lock; a background thread appends the queued lines to the daily API log and
+writes a snapshot of the registry every few seconds (and at exit), so no
+file is opened on the call path.
+
+Snapshots land next to the API log as
+``salesforce_metrics_YYYYMMDD_<pid>.json``, one per process, which is how a
+sync that runs as a script is reported on from outside it (see
+scripts/salesforce_metrics.py).
+
+Example:
+    with telemetry.timer("db_merge", "Contact") as measurement:
+        measurement.records = merge_rows()
+    print(format_report(telemetry.snapshot()))
+"""
+
+import atexit
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from glob import glob
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background flushes of the API log and the metrics snapshot
+SALESFORCE_TELEMETRY_FLUSH_SECONDS = float(
+    os.getenv("SALESFORCE_TELEMETRY_FLUSH_SECONDS", "5")
+)
+
+# Queued log lines that trigger a flush before the interval is up
+SALESFORCE_TELEMETRY_FLUSH_LINES = int(
+    os.getenv("SALESFORCE_TELEMETRY_FLUSH_LINES", "1000")
+)
+
+# Upper bounds (seconds) of the latency histogram buckets; anything slower
+# falls in a final +Inf bucket. Wide enough for bulk job waits.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900)
+
+# Object name of a SOQL query, for calls logged with their SOQL only
+_SOQL_OBJECT = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+
+
+class Measurement:
+    """Counts filled in by the caller while a timer() block runs."""
+
+    __slots__ = ("records", "bytes")
+
+    def __init__(self):
+        self.records = 0
+        self.bytes = 0
+
+
+class OperationStats:
+    """Counters and latency histogram of one (operation, object) pair."""
+
+    __slots__ = ("calls", "errors", "seconds", "timed", "records", "bytes", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.timed = 0
+        self.records = 0
+        self.bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(
+        self, seconds: Optional[float], records: int, byte_count: int, error: bool
+    ) -> None:
+        self.calls += 1
+        self.errors += error
+        self.records += records
+        self.bytes += byte_count
+        if seconds is not None:
+            self.timed += 1
+            self.seconds += seconds
+            self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def to_dict(self, operation: str, object_name: Optional[str]) -> Dict[str, Any]:
+        return {
+            "operation": operation,
+            "object": object_name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "seconds": self.seconds,
+            "timed": self.timed,
+            "records": self.records,
+            "bytes": self.bytes,
+            "buckets": list(self.buckets),
+        }
+
+
+class SalesforceTelemetry:
+    """Process-wide Salesforce call metrics with batched, background log writes."""
+
+    def __init__(
+        self,
+        flush_seconds: float = SALESFORCE_TELEMETRY_FLUSH_SECONDS,
+        flush_lines: int = SALESFORCE_TELEMETRY_FLUSH_LINES,
+    ):
+        self.flush_seconds = flush_seconds
+        self.flush_lines = flush_lines
+        self._lock = threading.Lock()
+        # Serializes flushes, so lines reach the log in the order they were queued
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        # (log dir, day, entry) of every log line not written yet
+        self._pending: List[Tuple[str, str, Dict[str, Any]]] = []
+        self._log_dirs: Set[str] = set()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every metric recorded so far (queued log lines are kept)."""
+        with self._lock:
+            self.started_at = time.time()
+            self._stats: Dict[Tuple[str, Optional[str]], OperationStats] = {}
+            self._api_limits: Dict[str, Dict[str, int]] = {}
+            self._job_objects: Dict[str, str] = {}
+
+    def observe(
+        self,
+        operation: str,
+        object_name: Optional[str] = None,
+        seconds: Optional[float] = None,
+        records: int = 0,
+        byte_count: int = 0,
+        error: bool = False,
+        job_id: Optional[str] = None,
+    ) -> None:
+        """Record one call or unit of work.
+
+        Args:
+            operation: What was done, e.g. "query" or "bulk_download"
+            object_name: Salesforce object it concerned; looked up from
+                job_id when omitted
+            seconds: How long it took, if timed
+            records: Records it returned or wrote
+            byte_count: Bytes it downloaded
+            error: Whether it failed
+            job_id: Bulk job it belongs to; a job's object is remembered
+                from the first call that names both
+        """
+        with self._lock:
+            if job_id:
+                if object_name:
+                    self._job_objects.setdefault(job_id, object_name)
+                else:
+                    object_name = self._job_objects.get(job_id)
+            key = (operation, object_name)
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = OperationStats()
+            stats.observe(seconds, records, byte_count, error)
+
+    @contextmanager
+    def timer(
+        self, operation: str, object_name: Optional[str] = None, job_id: Optional[str] = None
+    ) -> Iterator[Measurement]:
+        """Time a block and observe it, counting it as an error if it raises."""
+        measurement = Measurement()
+        started = time.perf_counter()
+        error = True
+        try:
+            yield measurement
+            error = False
+        finally:
+            self.observe(
+                operation,
+                object_name,
+                time.perf_counter() - started,
+                measurement.records,
+                measurement.bytes,
+                error,
+                job_id,
+            )
+
+    def record_api_call(
+        self, log_dir: str, operation: str, details: Dict[str, Any]
+    ) -> None:
+        """Observe an API call from its logged details and queue its log line.
+
+        Understands the detail keys the Salesforce services log: object (or a
+        SOQL query to take it from), job_id, duration, records, data_size or
+        bytes, success and error.
+        """
+        object_name = details.get("object")
+        if not object_name and "soql" in details:
+            object_name = soql_object(details["soql"])
+        self.observe(
+            operation,
+            object_name if isinstance(object_name, str) else None,
+            details.get("duration"),
+            details.get("records") or 0,
+            details.get("data_size") or details.get("bytes") or 0,
+            details.get("success") is False or "error" in details,
+            details.get("job_id"),
+        )
+        self.queue_log_line(
+            log_dir,
+            {
+                "timestamp": datetime.now().isoformat(),
+                "operation": operation,
+                "details": details,
+            },
+        )
+
+    def set_api_limits(self, limits: Dict[str, Any]) -> None:
+        """Keep the Max/Remaining pairs of the latest limits response."""
+        headroom = {
+            name: {"Max": limit.get("Max", 0), "Remaining": limit.get("Remaining", 0)}
+            for name, limit in limits.items()
+            if isinstance(limit, dict) and "Max" in limit
+        }
+        with self._lock:
+            self._api_limits = headroom
+
+    def add_log_dir(self, log_dir: str) -> None:
+        """Write the API log and metrics snapshots to log_dir (too) from now on."""
+        with self._lock:
+            self._log_dirs.add(log_dir)
+        self._ensure_flusher()
+
+    def queue_log_line(self, log_dir: str, entry: Dict[str, Any]) -> None:
+        """Queue a JSON line for the daily API log in log_dir."""
+        with self._lock:
+            self._log_dirs.add(log_dir)
+            self._pending.append((log_dir, entry["timestamp"][:10], entry))
+            backlog = len(self._pending)
+        self._ensure_flusher()
+        if backlog >= self.flush_lines:
+            self._wake.set()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """The registry as plain data, as written to the snapshot files."""
+        with self._lock:
+            operations = [
+                stats.to_dict(operation, object_name)
+                for (operation, object_name), stats in self._stats.items()
+            ]
+            api_limits = {name: dict(limit) for name, limit in self._api_limits.items()}
+        now = time.time()
+        return {
+            "pid": os.getpid(),
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+            "updated_at": datetime.fromtimestamp(now).isoformat(),
+            "uptime_seconds": now - self.started_at,
+            "latency_buckets": list(LATENCY_BUCKETS),
+            "operations": operations,
+            "api_limits": api_limits,
+        }
+
+    def flush(self) -> None:
+        """Write queued log lines and a fresh snapshot to every log directory."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                log_dirs = list(self._log_dirs)
+
+            files: Dict[str, List[str]] = {}
+            for log_dir, day, entry in pending:
+                log_file = os.path.join(
+                    log_dir, f"salesforce_api_{day.replace('-', '')}.log"
+                )
+                files.setdefault(log_file, []).append(json.dumps(entry, default=str))
+            for log_file, lines in files.items():
+                os.makedirs(os.path.dirname(log_file), exist_ok=True)
+                with open(log_file, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+
+            if log_dirs:
+                snapshot = self.snapshot()
+                for log_dir in log_dirs:
+                    _write_snapshot(log_dir, snapshot)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="salesforce-telemetry", daemon=True
+            )
+            self._flusher.start()
+        atexit.register(self.flush)
+
+    def _run_flusher(self) -> None:
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush Salesforce telemetry: {str(e)}")
+
+
+def soql_object(soql: str) -> Optional[str]:
+    """The object a SOQL query selects from, if it can be told."""
+    match = _SOQL_OBJECT.search(soql)
+    return match.group(1) if match else None
+
+
+def _write_snapshot(log_dir: str, snapshot: Dict[str, Any]) -> None:
+    day = snapshot["updated_at"][:10].replace("-", "")
+    path = os.path.join(log_dir, f"salesforce_metrics_{day}_{snapshot['pid']}.json")
+    os.makedirs(log_dir, exist_ok=True)
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(temporary, path)
+
+
+def load_snapshots(log_dir: str = "logs", day: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Read the snapshots processes wrote for day (YYYYMMDD, default today), newest first."""
+    day = day or datetime.now().strftime("%Y%m%d")
+    snapshots = []
+    for path in glob(os.path.join(log_dir, f"salesforce_metrics_{day}_*.json")):
+        with open(path) as f:
+            snapshots.append(json.load(f))
+    return sorted(snapshots, key=lambda snapshot: snapshot["updated_at"], reverse=True)
+
+
+def latency_quantile(buckets: List[int], quantile: float) -> Optional[float]:
+    """Upper bound of the histogram bucket holding the given quantile."""
+    total = sum(buckets)
+    if not total:
+        return None
+    rank = quantile * total
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), buckets):
+        seen += count
+        if seen >= rank:
+            return bound
+    return float("inf")
+
+
+def format_report(snapshot: Dict[str, Any]) -> str:
+    """Render a snapshot as a table, slowest operations first."""
+    operations = sorted(snapshot["operations"], key=lambda op: op["seconds"], reverse=True)
+    timed_seconds = sum(op["seconds"] for op in operations) or 1.0
+    lines = [
+        f"Salesforce telemetry for pid {snapshot['pid']}, "
+        f"{snapshot['started_at']} to {snapshot['updated_at']} "
+        f"({snapshot['uptime_seconds']:,.0f}s)",
+        "",
+        f"{'operation':<22} {'object':<18} {'calls':>7} {'errors':>6} "
+        f"{'seconds':>9} {'share':>6} {'p50':>6} {'p95':>6} "
+        f"{'records':>10} {'rows/s':>9} {'MB':>8}",
+    ]
+    for op in operations:
+        p50 = latency_quantile(op["buckets"], 0.5)
+        p95 = latency_quantile(op["buckets"], 0.95)
+        rows_per_second = (
+            f"{op['records'] / op['seconds']:,.0f}" if op["records"] and op["seconds"] else "-"
+        )
+        lines.append(
+            f"{op['operation']:<22} {op['object'] or '-':<18} {op['calls']:>7,} "
+            f"{op['errors']:>6,} {op['seconds']:>9,.1f} "
+            f"{op['seconds'] / timed_seconds:>6.0%} {_bound(p50):>6} {_bound(p95):>6} "
+            f"{op['records']:>10,} {rows_per_second:>9} "
+            f"{op['bytes'] / 1_000_000:>8,.1f}"
+        )
+
+    if snapshot["api_limits"]:
+        lines += ["", f"{'API limit':<34} {'remaining':>12} {'max':>12} {'headroom':>9}"]
+        for name, limit in sorted(snapshot["api_limits"].items()):
+            if not limit["Max"]:
+                continue
+            lines.append(
+                f"{name:<34} {limit['Remaining']:>12,} {limit['Max']:>12,} "
+                f"{limit['Remaining'] / limit['Max']:>9.0%}"
+            )
+    return "\n".join(lines)
+
+
+def format_prometheus(snapshots: List[Dict[str, Any]]) -> str:
+    """Render snapshots in the Prometheus text format, one pid label per process."""
+    lines = [
+        "# TYPE salesforce_calls_total counter",
+        "# TYPE salesforce_errors_total counter",
+        "# TYPE salesforce_records_total counter",
+        "# TYPE salesforce_bytes_total counter",
+        "# TYPE salesforce_seconds histogram",
+        "# TYPE salesforce_api_limit_remaining gauge",
+        "# TYPE salesforce_api_limit_max gauge",
+    ]
+    for snapshot in snapshots:
+        pid = snapshot["pid"]
+        for op in snapshot["operations"]:
+            labels = f'pid="{pid}",operation="{op["operation"]}",object="{op["object"] or ""}"'
+            lines += [
+                f"salesforce_calls_total{{{labels}}} {op['calls']}",
+                f"salesforce_errors_total{{{labels}}} {op['errors']}",
+                f"salesforce_records_total{{{labels}}} {op['records']}",
+                f"salesforce_bytes_total{{{labels}}} {op['bytes']}",
+            ]
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), op["buckets"]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else bound
+                lines.append(f'salesforce_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines += [
+                f"salesforce_seconds_sum{{{labels}}} {op['seconds']}",
+                f"salesforce_seconds_count{{{labels}}} {op['timed']}",
+            ]
+        for name, limit in sorted(snapshot["api_limits"].items()):
+            labels = f'pid="{pid}",limit="{name}"'
+            lines += [
+                f"salesforce_api_limit_remaining{{{labels}}} {limit['Remaining']}",
+                f"salesforce_api_limit_max{{{labels}}} {limit['Max']}",
+            ]
+    return "\n".join(lines) + "\n"
+
+
+def _bound(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds == float("inf"):
+        return f">{LATENCY_BUCKETS[-1]}"
+    return f"{seconds:g}"
+
+
+# The registry every Salesforce service in this process records into
+telemetry = SalesforceTelemetry()
@@ -0,0 +1,68 @@
+"""
+Savepoint Writes
+
+Shared fallback of the sync services' batched writes. A batch is written
+with one statement in a savepoint; if that fails, only the savepoint is
+rolled back and the batch is split in half and retried, down to single
+records. A bad record (say, one that references a Task not synced yet)
+then costs about log2(batch size) extra statements and is the only record
+lost, instead of the whole batch or the whole transaction.
+"""
+
+import logging
+from typing import Callable, List, Sequence, TypeVar
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def write_bisecting(
+    session: Session,
+    items: Sequence[T],
+    write: Callable[[Sequence[T]], R],
+    on_error: Callable[[T, str], None],
+) -> List[R]:
+    """Write items in a savepoint, bisecting on failure down to single items.
+
+    Args:
+        session: Session whose transaction the savepoints are nested in
+        items: Rows to write, or any sliceable sequence (such as a range of
+            staging sequence numbers)
+        write: Writes a slice of items with one statement
+        on_error: Called with each item that cannot be written on its own and
+            the database's error message
+
+    Returns:
+        What write returned for each slice that was written
+    """
+    results: List[R] = []
+    _write(session, items, write, on_error, results)
+    return results
+
+
+def _write(session, items, write, on_error, results) -> None:
+    if not items:
+        return
+    try:
+        with session.begin_nested():
+            result = write(items)
+    except SQLAlchemyError as e:
+        if len(items) == 1:
+            on_error(items[0], error_message(e))
+            return
+        logger.debug(f"Write of {len(items)} rows failed, bisecting: {error_message(e)}")
+        middle = len(items) // 2
+        _write(session, items[:middle], write, on_error, results)
+        _write(session, items[middle:], write, on_error, results)
+        return
+    results.append(result)
+
+
+def error_message(error: Exception) -> str:
+    """The database's own message, without the statement and parameters."""
+    return str(getattr(error, "orig", None) or error).strip()
@@ -6,12 +6,14 @@ import os
 from dotenv import load_dotenv
 
 try:
+    from ..http_session import get_http_session
     from ..salesforce_monitoring import SalesforceMonitoring
 except ImportError:
     import sys
     import os
 
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from http_session import get_http_session
     from salesforce_monitoring import SalesforceMonitoring
 
 load_dotenv()
@@ -32,6 +34,7 @@ class RestSalesforceService:
         client_id: str = None,
         client_secret: str = None,
         sandbox: bool = False,
+        http_session: Optional[requests.Session] = None,
     ):
         """Initialize Salesforce REST API client"""
         self.username = username or os.getenv("SALESFORCE_USERNAME", "")
@@ -54,6 +57,7 @@ class RestSalesforceService:
         self.session_id = None
         self.instance_url = None
         self.headers = None
+        self.http = http_session or get_http_session()
 
         # Initialize monitoring
         self.monitoring = SalesforceMonitoring()
@@ -89,7 +93,7 @@ class RestSalesforceService:
             }
 
             # Make authentication request
-            response = requests.post(self.login_url, data=auth_data)
+            response = self.http.post(self.login_url, data=auth_data)
             response.raise_for_status()
 
             auth_result = response.json()
@@ -130,10 +134,10 @@ class RestSalesforceService:
             while True:
                 if next_url:
                     # Use the next records URL for pagination
-                    response = requests.get(next_url, headers=self.headers)
+                    response = self.http.get(next_url, headers=self.headers)
                 else:
                     # Initial query
-                    response = requests.get(url, headers=self.headers, params=params)
+                    response = self.http.get(url, headers=self.headers, params=params)
 
                 response.raise_for_status()
                 result = response.json()
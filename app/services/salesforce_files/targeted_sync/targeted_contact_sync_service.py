@@ -3,13 +3,14 @@ from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 import logging
-import math
 
 from app.database.data_models.salesforce_data import SfContact
+from app.services.filter_options_cache import FilterOptionsCache
 
 try:
+    from ..bulk_job_manager import BulkJobManager
     from ..bulk_salesforce_service import BulkSalesforceService
-    from ..bulk_contact_sync_service import BulkContactSyncService
+    from ..contact_sync.bulk_contact_sync_service import BulkContactSyncService
     from .rest_salesforce_service import RestSalesforceService
 except ImportError:
     # Handle when running directly from the targeted_sync directory
@@ -19,8 +20,9 @@ except ImportError:
     parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     sys.path.insert(0, parent_dir)
 
+    from bulk_job_manager import BulkJobManager
     from bulk_salesforce_service import BulkSalesforceService
-    from bulk_contact_sync_service import BulkContactSyncService
+    from contact_sync.bulk_contact_sync_service import BulkContactSyncService
     from rest_salesforce_service import RestSalesforceService
 
 logger = logging.getLogger(__name__)
@@ -159,48 +161,52 @@ class TargetedContactSyncService:
             stats["active_contacts_found"] = len(contact_ids)
             logger.info(f"Found {len(contact_ids):,} contacts with activities")
 
-            # Step 2: Handle large ID lists by batching
+            # Step 2: Split the IDs into chunks, one bulk job per chunk
             # Salesforce has limits on IN() clause size (~1000 items)
             max_ids_per_query = 800  # Conservative limit
+            id_chunks = [
+                contact_ids[i : i + max_ids_per_query]
+                for i in range(0, len(contact_ids), max_ids_per_query)
+            ]
+            total_batches = len(id_chunks)
+            queries = {
+                batch_num: self.get_targeted_contact_query(batch_ids, modified_since)
+                for batch_num, batch_ids in enumerate(id_chunks, start=1)
+            }
 
-            if len(contact_ids) > max_ids_per_query:
-                logger.info(
-                    f"Large dataset detected, will process in batches of {max_ids_per_query} IDs"
-                )
-
-                # Process in batches
-                for i in range(0, len(contact_ids), max_ids_per_query):
-                    batch_ids = contact_ids[i : i + max_ids_per_query]
-                    batch_num = (i // max_ids_per_query) + 1
-                    total_batches = math.ceil(len(contact_ids) / max_ids_per_query)
-
-                    logger.info(
-                        f"Processing ID batch {batch_num}/{total_batches} ({len(batch_ids)} IDs)"
+            # Step 3: Run the jobs concurrently and write each job's contacts
+            # as soon as it completes
+            logger.info(
+                f"Submitting {total_batches} bulk jobs of up to {max_ids_per_query} IDs"
+            )
+            job_manager = BulkJobManager(self.sf_bulk)
+            for outcome in job_manager.iter_completed(queries, "Contact"):
+                batch_ids = id_chunks[outcome.key - 1]
+                if not outcome.succeeded:
+                    logger.error(
+                        f"Bulk job for ID batch {outcome.key}/{total_batches} "
+                        f"({len(batch_ids)} IDs) {outcome.state}: {outcome.error}"
                     )
+                    stats["errors"] += len(batch_ids)
+                    continue
 
-                    batch_stats = self._sync_contact_batch_by_ids(
-                        batch_ids, modified_since, batch_size
-                    )
+                batch_stats = self._process_contacts(outcome.records, batch_size)
 
-                    # Accumulate stats
-                    stats["total_retrieved"] += batch_stats["total_retrieved"]
-                    stats["total_processed"] += batch_stats["total_processed"]
-                    stats["new_records"] += batch_stats["new_records"]
-                    stats["updated_records"] += batch_stats["updated_records"]
-                    stats["errors"] += batch_stats["errors"]
+                # Accumulate stats
+                stats["total_retrieved"] += batch_stats["total_retrieved"]
+                stats["total_processed"] += batch_stats["total_processed"]
+                stats["new_records"] += batch_stats["new_records"]
+                stats["updated_records"] += batch_stats["updated_records"]
+                stats["errors"] += batch_stats["errors"]
 
-                    logger.info(
-                        f"Batch {batch_num} completed: {batch_stats['total_processed']} contacts processed"
-                    )
-            else:
-                # Small dataset, process all at once
-                logger.info("Processing all contacts in single query")
-                batch_stats = self._sync_contact_batch_by_ids(
-                    contact_ids, modified_since, batch_size
+                logger.info(
+                    f"Batch {outcome.key}/{total_batches} completed in {outcome.duration:.1f}s: "
+                    f"{batch_stats['total_processed']} contacts processed"
                 )
 
-                # Copy stats
-                stats.update(batch_stats)
+            FilterOptionsCache.invalidate(
+                self.db, FilterOptionsCache.CONTACTS, FilterOptionsCache.RELATIONSHIPS
+            )
 
             logger.info(f"Targeted sync completed: {stats}")
             return stats
@@ -210,68 +216,38 @@ class TargetedContactSyncService:
             stats["errors"] += 1
             return stats
 
-    def _sync_contact_batch_by_ids(
-        self,
-        contact_ids: List[str],
-        modified_since: Optional[datetime] = None,
-        batch_size: int = 1000,
+    def _process_contacts(
+        self, contacts_data: List[Dict[str, Any]], batch_size: int = 1000
     ) -> Dict[str, int]:
-        """Sync a specific batch of contacts by their IDs.
+        """Upsert contacts retrieved by one bulk job.
 
         Args:
-            contact_ids: List of Contact IDs to sync
-            modified_since: Optional filter for recently modified contacts
+            contacts_data: Contact records from Salesforce
             batch_size: Number of records to process in each database batch
 
         Returns:
             Dictionary with sync statistics
         """
         stats = {
-            "total_retrieved": 0,
+            "total_retrieved": len(contacts_data),
             "total_processed": 0,
             "new_records": 0,
             "updated_records": 0,
             "errors": 0,
         }
 
-        try:
-            # Build targeted query
-            query = self.get_targeted_contact_query(contact_ids, modified_since)
-
-            # Execute bulk query
-            logger.info(f"Executing bulk query for {len(contact_ids)} contacts...")
-            contacts_data = self.sf_bulk.execute_bulk_query(query, "Contact")
-
-            if not contacts_data:
-                logger.warning("No contacts retrieved from Salesforce")
-                return stats
-
-            stats["total_retrieved"] = len(contacts_data)
-            logger.info(f"Retrieved {len(contacts_data):,} contacts from Salesforce")
-
-            # Process contacts in batches using existing sync logic
-            logger.info(f"Processing contacts in batches of {batch_size}")
-
-            for i in range(0, len(contacts_data), batch_size):
-                batch = contacts_data[i : i + batch_size]
-                batch_stats = self.bulk_sync_service._process_contact_batch(batch)
+        # Process contacts in batches using existing sync logic
+        for i in range(0, len(contacts_data), batch_size):
+            batch = contacts_data[i : i + batch_size]
+            batch_stats = self.bulk_sync_service._process_contact_batch(batch)
 
-                # Update overall stats
-                stats["total_processed"] += batch_stats["processed"]
-                stats["new_records"] += batch_stats["new"]
-                stats["updated_records"] += batch_stats["updated"]
-                stats["errors"] += batch_stats["errors"]
-
-                logger.info(
-                    f"Processed batch {i // batch_size + 1}: {batch_stats['processed']} records"
-                )
+            # Update overall stats
+            stats["total_processed"] += batch_stats["processed"]
+            stats["new_records"] += batch_stats["new"]
+            stats["updated_records"] += batch_stats["updated"]
+            stats["errors"] += batch_stats["errors"]
 
-            return stats
-
-        except Exception as e:
-            logger.error(f"Error syncing contact batch: {str(e)}")
-            stats["errors"] += len(contact_ids)
-            return stats
+        return stats
 
     def get_activity_statistics(self) -> Dict[str, Any]:
         """Get statistics about activities in the Salesforce org.
@@ -19,9 +19,16 @@ class RestTaskWhoRelationService:
     while ensuring no write operations can occur.
     """
 
-    def __init__(self, config: Optional[SalesforceConfig] = None):
-        """Initialize the REST TaskWhoRelation service using the base ReadOnlySalesforceService."""
-        self._sf_service = ReadOnlySalesforceService(config)
+    def __init__(
+        self,
+        config: Optional[SalesforceConfig] = None,
+        sf_service: Optional[ReadOnlySalesforceService] = None,
+    ):
+        """Initialize the REST TaskWhoRelation service using the base ReadOnlySalesforceService.
+
+        Pass ``sf_service`` to share one logged-in client between services.
+        """
+        self._sf_service = sf_service or ReadOnlySalesforceService(config)
         self.monitoring = self._sf_service.monitoring
 
     def get_taskwhorelations_query(
@@ -64,58 +71,36 @@ class RestTaskWhoRelationService:
             FROM TaskWhoRelation
             {where_clause}
             ORDER BY Id ASC
-            LIMIT 200
         """
 
     def _get_paginated_results(
-        self,
-        query_builder,
-        modified_since: Optional[datetime] = None,
-        batch_size: int = 200,
+        self, query_builder, modified_since: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """
-        Helper method to handle paginated queries using cursor-based pagination.
+        Helper method to read every page of a query through its query cursor.
+
+        The query runs once and its pages (up to 2,000 records each) are
+        fetched with queryMore, instead of re-running it per page.
 
         Args:
             query_builder: Function that builds the SOQL query
             modified_since: Optional datetime filter
-            batch_size: Number of records per page
 
         Returns:
             List of all records across all pages
         """
         all_records = []
-        last_id = None
-        page = 1
-
-        while True:
-            try:
-                query = query_builder(modified_since=modified_since, last_id=last_id)
-                print(f"Fetching page {page} with query: {query}")  # Debug logging
-
-                batch = self._sf_service.query(query)
-
-                if not batch:  # No more records
-                    print(f"No more records found after page {page - 1}")
-                    break
-
-                records_count = len(batch)
-                print(f"Retrieved {records_count} records in page {page}")
+        query = query_builder(modified_since=modified_since)
+        print(f"Fetching records with query: {query}")  # Debug logging
 
+        page = 0
+        try:
+            for page, batch in enumerate(self._sf_service.iter_query_pages(query), 1):
                 all_records.extend(batch)
-
-                if records_count < batch_size:  # Last page
-                    print(f"Last page reached (page {page})")
-                    break
-
-                last_id = batch[-1][
-                    "Id"
-                ]  # Use the last ID as the cursor for the next batch
-                page += 1
-
-            except Exception as e:
-                print(f"Error fetching page {page}: {str(e)}")
-                raise
+                print(f"Retrieved {len(batch)} records in page {page}")
+        except Exception as e:
+            print(f"Error fetching page {page + 1}: {str(e)}")
+            raise
 
         print(f"Total records retrieved: {len(all_records)}")
         return all_records
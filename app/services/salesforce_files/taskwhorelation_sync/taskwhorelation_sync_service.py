@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import logging
 import json
 import os
+from sqlalchemy import literal_column
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 
@@ -10,22 +12,45 @@ from app.database.data_models.salesforce_data import SfTaskWhoRelation
 from app.services.salesforce_files.taskwhorelation_sync.rest_taskwhorelation_service import (
     RestTaskWhoRelationService,
 )
+from app.services.salesforce_files.savepoint_writes import write_bisecting
 
 logger = logging.getLogger(__name__)
 
+# TaskWhoRelations written and committed per INSERT ... ON CONFLICT statement
+TASKWHORELATION_SYNC_BATCH_SIZE = int(os.getenv("TASKWHORELATION_SYNC_BATCH_SIZE", "1000"))
+
+# Columns refreshed from Salesforce when a relation already exists
+UPDATE_FIELDS = [
+    "is_deleted",
+    "type",
+    "relation_id",
+    "task_id",
+    "created_by_id",
+    "last_modified_by_id",
+    "sf_last_modified_date",
+    "sf_system_modstamp",
+]
+
 
 class TaskWhoRelationSyncService:
     """Service for syncing Salesforce TaskWhoRelation records with local database."""
 
-    def __init__(self, db_session: Session, rest_service: RestTaskWhoRelationService):
+    def __init__(
+        self,
+        db_session: Session,
+        rest_service: RestTaskWhoRelationService,
+        batch_size: int = TASKWHORELATION_SYNC_BATCH_SIZE,
+    ):
         """Initialize the TaskWhoRelation sync service.
 
         Args:
             db_session: SQLAlchemy database session
             rest_service: REST service for Salesforce TaskWhoRelation operations
+            batch_size: Records upserted and committed together
         """
         self.db_session = db_session
         self.rest_service = rest_service
+        self.batch_size = max(1, batch_size)
         self.sync_results = {
             "successful_records": [],
             "failed_records": [],
@@ -59,57 +84,29 @@ class TaskWhoRelationSyncService:
             "sf_system_modstamp": sf_relation["SystemModstamp"],
         }
 
-    def _upsert_single_taskwhorelation(self, relation_data: Dict) -> Dict[str, any]:
-        """Upsert a single TaskWhoRelation record into the database.
+    def write_page(self, records: List[Dict]) -> Tuple[int, int, List[str]]:
+        """Upsert one page of raw Salesforce TaskWhoRelation records and commit it.
 
         Args:
-            relation_data: Transformed TaskWhoRelation data
+            records: Raw Salesforce TaskWhoRelation records
 
         Returns:
-            Dictionary with result status and details
+            (inserted, updated, Ids of the records that failed)
         """
-        result = {
-            "success": False,
-            "salesforce_id": relation_data.get("salesforce_id"),
-            "task_id": relation_data.get("task_id"),
-            "relation_id": relation_data.get("relation_id"),
-            "error": None,
-            "action": None,  # 'inserted' or 'updated'
-        }
-
-        try:
-            stmt = insert(SfTaskWhoRelation).values(relation_data)
-            stmt = stmt.on_conflict_do_update(
-                constraint="sf_taskwhorelations_salesforce_id_key",
-                set_={
-                    "is_deleted": stmt.excluded.is_deleted,
-                    "type": stmt.excluded.type,
-                    "relation_id": stmt.excluded.relation_id,
-                    "task_id": stmt.excluded.task_id,
-                    "created_by_id": stmt.excluded.created_by_id,
-                    "last_modified_by_id": stmt.excluded.last_modified_by_id,
-                    "sf_last_modified_date": stmt.excluded.sf_last_modified_date,
-                    "sf_system_modstamp": stmt.excluded.sf_system_modstamp,
-                },
-            )
-
-            db_result = self.db_session.execute(stmt)
-            self.db_session.commit()
-
-            result["success"] = True
-            result["action"] = "inserted" if db_result.rowcount > 0 else "updated"
-
-        except Exception as e:
-            logger.error(
-                f"Error upserting TaskWhoRelation {relation_data.get('salesforce_id')}: {str(e)}"
-            )
-            result["error"] = str(e)
-            self.db_session.rollback()
-
-        return result
+        successful, failed = self._write_batch(
+            [self._transform_taskwhorelation_data(record) for record in records]
+        )
+        inserted = sum(1 for result in successful if result["action"] == "inserted")
+        return inserted, len(successful) - inserted, [result["salesforce_id"] for result in failed]
 
     def _process_batch(self, relations_data: List[Dict]) -> Dict[str, int]:
-        """Process a batch of TaskWhoRelation records individually.
+        """Upsert a batch of TaskWhoRelation records and commit it.
+
+        The whole batch is written with one INSERT ... ON CONFLICT DO UPDATE in
+        a savepoint. Only if that fails is the batch bisected, so a bad record
+        (typically a Task or Contact that is not synced yet) costs about
+        log2(batch size) extra statements and ends up alone in
+        ``sync_results["failed_records"]``.
 
         Args:
             relations_data: List of transformed TaskWhoRelation data
@@ -117,38 +114,78 @@ class TaskWhoRelationSyncService:
         Returns:
             Dictionary with batch statistics
         """
+        batch_successful, batch_failed = self._write_batch(relations_data)
+
+        inserted = sum(1 for result in batch_successful if result["action"] == "inserted")
         batch_stats = {
-            "processed": 0,
-            "successful": 0,
-            "failed": 0,
-            "inserted": 0,
-            "updated": 0,
+            "processed": len(batch_successful) + len(batch_failed),
+            "successful": len(batch_successful),
+            "failed": len(batch_failed),
+            "inserted": inserted,
+            "updated": len(batch_successful) - inserted,
         }
 
-        batch_successful = []
-        batch_failed = []
-
-        for relation_data in relations_data:
-            batch_stats["processed"] += 1
-            result = self._upsert_single_taskwhorelation(relation_data)
-
-            if result["success"]:
-                batch_stats["successful"] += 1
-                if result["action"] == "inserted":
-                    batch_stats["inserted"] += 1
-                else:
-                    batch_stats["updated"] += 1
-                batch_successful.append(result)
-            else:
-                batch_stats["failed"] += 1
-                batch_failed.append(result)
-
         # Add to overall sync results
         self.sync_results["successful_records"].extend(batch_successful)
         self.sync_results["failed_records"].extend(batch_failed)
 
         return batch_stats
 
+    def _write_batch(self, relations_data: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Upsert transformed records and commit; returns the (successful, failed) results."""
+        # Salesforce can page the same record twice; one INSERT ... ON CONFLICT
+        # may not touch a row twice, so keep (and count) the last copy of each
+        rows = list({row["salesforce_id"]: row for row in relations_data}.values())
+
+        successful = []
+        failed = []
+        self._write_rows(rows, successful, failed)
+        self.db_session.commit()
+        return successful, failed
+
+    def _write_rows(
+        self, rows: List[Dict], successful: List[Dict], failed: List[Dict]
+    ) -> None:
+        """Upsert rows in a savepoint, bisecting on failure down to single rows."""
+
+        def on_error(row: Dict, error: str) -> None:
+            logger.error(
+                f"Error upserting TaskWhoRelation {row.get('salesforce_id')}: {error}"
+            )
+            failed.append(self._record_result(row, error=error))
+
+        actions = {}
+        for result in write_bisecting(self.db_session, rows, self._upsert, on_error):
+            actions.update(result)
+        successful.extend(
+            self._record_result(row, action=actions[row["salesforce_id"]])
+            for row in rows
+            if row["salesforce_id"] in actions
+        )
+
+    def _upsert(self, rows: List[Dict]) -> Dict[str, str]:
+        """INSERT ... ON CONFLICT DO UPDATE; returns 'inserted' or 'updated' per salesforce_id."""
+        # executemany form: the statement compiles once and SQLAlchemy batches
+        # the rows into multi-row VALUES ("insertmanyvalues")
+        result = self.db_session.connection().execute(_upsert_statement(), rows)
+        return {
+            salesforce_id: "inserted" if inserted else "updated"
+            for salesforce_id, inserted in result
+        }
+
+    @staticmethod
+    def _record_result(
+        relation_data: Dict, action: Optional[str] = None, error: Optional[str] = None
+    ) -> Dict[str, any]:
+        return {
+            "success": error is None,
+            "salesforce_id": relation_data.get("salesforce_id"),
+            "task_id": relation_data.get("task_id"),
+            "relation_id": relation_data.get("relation_id"),
+            "error": error,
+            "action": action,  # 'inserted' or 'updated'
+        }
+
     def _write_sync_results_to_file(self, sync_mode: str) -> str:
         """Write sync results to a markdown file.
 
@@ -259,7 +296,7 @@ class TaskWhoRelationSyncService:
                 return stats
 
             # Process records in batches
-            batch_size = 200
+            batch_size = self.batch_size
             for i in range(0, len(relations), batch_size):
                 batch = relations[i : i + batch_size]
                 batch_number = (i // batch_size) + 1
@@ -301,3 +338,17 @@ class TaskWhoRelationSyncService:
             stats["total_failed"] += 1
 
         return stats
+
+
+@lru_cache(maxsize=None)
+def _upsert_statement():
+    stmt = insert(SfTaskWhoRelation.__table__)
+    return stmt.on_conflict_do_update(
+        constraint="sf_taskwhorelations_salesforce_id_key",
+        set_={field: stmt.excluded[field] for field in UPDATE_FIELDS},
+    ).returning(
+        stmt.table.c.salesforce_id,
+        # xmax is 0 only for rows this statement inserted
+        literal_column("xmax = 0"),
+    )
+
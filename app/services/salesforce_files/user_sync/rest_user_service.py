@@ -19,14 +19,19 @@ class RestUserService:
     while ensuring no write operations can occur.
     """
 
-    def __init__(self, config: Optional[SalesforceConfig] = None):
-        """Initialize the REST user service using the base ReadOnlySalesforceService."""
-        self._sf_service = ReadOnlySalesforceService(config)
+    def __init__(
+        self,
+        config: Optional[SalesforceConfig] = None,
+        sf_service: Optional[ReadOnlySalesforceService] = None,
+    ):
+        """Initialize the REST user service using the base ReadOnlySalesforceService.
+
+        Pass ``sf_service`` to share one logged-in client between services.
+        """
+        self._sf_service = sf_service or ReadOnlySalesforceService(config)
         self.monitoring = self._sf_service.monitoring
 
-    def get_users_query(
-        self, modified_since: Optional[datetime] = None, offset: int = 0
-    ) -> str:
+    def get_users_query(self, modified_since: Optional[datetime] = None) -> str:
         """Build the SOQL query for User data."""
         fields = [
             # Required Fields
@@ -64,44 +69,27 @@ class RestUserService:
             FROM User
             {where_clause}
             ORDER BY LastModifiedDate DESC
-            LIMIT 200 OFFSET {offset}
         """
 
     def _get_paginated_results(
-        self,
-        query_builder,
-        modified_since: Optional[datetime] = None,
-        batch_size: int = 200,
+        self, query_builder, modified_since: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """
-        Helper method to handle paginated queries.
+        Helper method to read every page of a query through its query cursor.
 
         Args:
             query_builder: Function that builds the SOQL query
             modified_since: Optional datetime filter
-            batch_size: Number of records per page
 
         Returns:
             List of all records across all pages
         """
-        all_records = []
-        offset = 0
-
-        while True:
-            query = query_builder(modified_since=modified_since, offset=offset)
-            batch = self._sf_service.query(query)
-
-            if not batch:  # No more records
-                break
-
-            all_records.extend(batch)
-
-            if len(batch) < batch_size:  # Last page
-                break
-
-            offset += batch_size
-
-        return all_records
+        query = query_builder(modified_since=modified_since)
+        return [
+            record
+            for page in self._sf_service.iter_query_pages(query)
+            for record in page
+        ]
 
     def get_users(
         self, modified_since: Optional[datetime] = None
@@ -1,11 +1,13 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
+from sqlalchemy import literal_column
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
 
 from app.database.data_models.salesforce_data import SfUser
 from app.services.salesforce_files.user_sync.rest_user_service import RestUserService
+from app.services.filter_options_cache import FilterOptionsCache
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,29 @@ class UserSyncService:
             "sf_system_modstamp": sf_user["SystemModstamp"],
         }
 
+    def write_page(self, records: List[Dict]) -> Tuple[int, int, List[str]]:
+        """Upsert one page of raw Salesforce users and commit it.
+
+        Unlike sync_users, a page that cannot be written raises, so the
+        caller can retry it.
+
+        Args:
+            records: Raw Salesforce user records
+
+        Returns:
+            (new, updated, Ids of the records that failed); a page is
+            written as a whole, so no record fails on its own
+        """
+        users_data = [self._transform_user_data(record) for record in records]
+        new = 0
+        if users_data:
+            result = self.db_session.execute(
+                self._upsert_statement(users_data).returning(literal_column("xmax = 0"))
+            )
+            new = sum(1 for (inserted,) in result if inserted)
+        self.db_session.commit()
+        return new, len(users_data) - new, []
+
     def _upsert_users(self, users_data: List[Dict]) -> Dict[str, int]:
         """Upsert users into the database.
 
@@ -78,28 +103,8 @@ class UserSyncService:
             if not users_data:
                 return stats
 
-            # Prepare the upsert statement
-            stmt = insert(SfUser).values(users_data)
-            stmt = stmt.on_conflict_do_update(
-                constraint="sf_users_salesforce_id_key",
-                set_={
-                    "username": stmt.excluded.username,
-                    "first_name": stmt.excluded.first_name,
-                    "last_name": stmt.excluded.last_name,
-                    "middle_name": stmt.excluded.middle_name,
-                    "suffix": stmt.excluded.suffix,
-                    "name": stmt.excluded.name,
-                    "email": stmt.excluded.email,
-                    "is_profile_photo_active": stmt.excluded.is_profile_photo_active,
-                    "address": stmt.excluded.address,
-                    "external_id": stmt.excluded.external_id,
-                    "sf_last_modified_date": stmt.excluded.sf_last_modified_date,
-                    "sf_system_modstamp": stmt.excluded.sf_system_modstamp,
-                },
-            )
-
             # Execute the upsert
-            result = self.db_session.execute(stmt)
+            result = self.db_session.execute(self._upsert_statement(users_data))
             self.db_session.commit()
 
             # Update stats based on the result
@@ -113,6 +118,27 @@ class UserSyncService:
 
         return stats
 
+    @staticmethod
+    def _upsert_statement(users_data: List[Dict]):
+        stmt = insert(SfUser).values(users_data)
+        return stmt.on_conflict_do_update(
+            constraint="sf_users_salesforce_id_key",
+            set_={
+                "username": stmt.excluded.username,
+                "first_name": stmt.excluded.first_name,
+                "last_name": stmt.excluded.last_name,
+                "middle_name": stmt.excluded.middle_name,
+                "suffix": stmt.excluded.suffix,
+                "name": stmt.excluded.name,
+                "email": stmt.excluded.email,
+                "is_profile_photo_active": stmt.excluded.is_profile_photo_active,
+                "address": stmt.excluded.address,
+                "external_id": stmt.excluded.external_id,
+                "sf_last_modified_date": stmt.excluded.sf_last_modified_date,
+                "sf_system_modstamp": stmt.excluded.sf_system_modstamp,
+            },
+        )
+
     def sync_users(
         self, modified_since: Optional[datetime] = None, limit: Optional[int] = None
     ) -> Dict[str, int]:
@@ -162,6 +188,9 @@ class UserSyncService:
                     f"Processed batch {i // batch_size + 1} of {(len(users) + batch_size - 1) // batch_size}"
                 )
 
+            # User names and relationship counts feed the relationship filters
+            FilterOptionsCache.invalidate(self.db_session, FilterOptionsCache.RELATIONSHIPS)
+
         except Exception as e:
             logger.error(f"Error during user sync: {str(e)}", exc_info=True)
             stats["errors"] += 1
@@ -0,0 +1,125 @@
+"""
+Search Service
+
+Index-backed name search for contacts and claims. Each searchable table has
+a ``to_tsvector('simple', ...)`` expression over its name columns with a GIN
+index on exactly that expression (migration 9a4c6e1f7b25), so search terms
+become prefix tsqueries (``smi`` -> ``smi:*``) that the planner serves from
+the index instead of the sequential scans behind ``ILIKE '%term%'``.
+
+The 'simple' configuration lowercases tokens without stemming, which suits
+names, emails and NPIs. Matching is per word prefix: "smi" finds "Smith" and
+"john smi" finds "John Smith", but an infix like "mith" no longer matches.
+Terms without any word characters fall back to the old ILIKE predicates.
+
+The document expressions below must stay identical to the indexed ones in
+the migration, otherwise PostgreSQL will not use the indexes.
+"""
+
+import re
+from typing import Optional, Sequence
+
+from sqlalchemy import and_, case, func, literal, literal_column, or_
+from sqlalchemy.sql.expression import ColumnElement
+
+from database.data_models.claims_data import ClaimsProvider, SiteOfService
+from database.data_models.salesforce_data import SfContact
+
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+# Columns of each indexed search document, in index expression order
+CONTACT_SEARCH_COLUMNS = (
+    SfContact.name,
+    SfContact.first_name,
+    SfContact.last_name,
+    SfContact.specialty,
+    SfContact.email,
+    SfContact.npi,
+)
+# The columns each contact list endpoint has always searched; both are
+# subsets of the indexed document, which narrows the rows first
+CONTACT_MAP_SEARCH_COLUMNS = (
+    SfContact.name,
+    SfContact.first_name,
+    SfContact.last_name,
+    SfContact.specialty,
+)
+CONTACT_LIST_SEARCH_COLUMNS = (
+    SfContact.name,
+    SfContact.first_name,
+    SfContact.last_name,
+    SfContact.email,
+    SfContact.npi,
+)
+PROVIDER_SEARCH_COLUMNS = (ClaimsProvider.name,)
+PROVIDER_GROUP_SEARCH_COLUMNS = (ClaimsProvider.provider_group,)
+SITE_SEARCH_COLUMNS = (SiteOfService.name,)
+
+TYPEAHEAD_DEFAULT_LIMIT = 10
+TYPEAHEAD_MAX_LIMIT = 50
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def prefix_tsquery(term: Optional[str]) -> Optional[str]:
+    """Turn user input into a prefix tsquery string, e.g. "John Sm" -> "john:* & sm:*".
+
+    Returns None when the term has no word characters.
+    """
+    words = _WORD_PATTERN.findall((term or "").lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
+
+def search_document(columns: Sequence[ColumnElement]) -> ColumnElement:
+    """The indexed tsvector expression over ``columns``."""
+    text = func.coalesce(columns[0], "")
+    for column in columns[1:]:
+        text = text + " " + func.coalesce(column, "")
+    return func.to_tsvector(SEARCH_CONFIG, text)
+
+
+def search_query(term: str) -> Optional[ColumnElement]:
+    """The tsquery for ``term``, or None if it has no searchable words."""
+    query = prefix_tsquery(term)
+    if query is None:
+        return None
+    return func.to_tsquery(SEARCH_CONFIG, query)
+
+
+def search_condition(
+    columns: Sequence[ColumnElement],
+    term: str,
+    indexed_columns: Optional[Sequence[ColumnElement]] = None,
+) -> ColumnElement:
+    """Index-backed match of ``term`` against the search document over ``columns``.
+
+    When ``columns`` is only part of an indexed document, pass the indexed
+    document's columns as ``indexed_columns``: the index then finds the
+    candidate rows and the match over ``columns`` is rechecked on those.
+    """
+    query = search_query(term)
+    if query is None:
+        pattern = f"%{term}%"
+        return or_(*[column.ilike(pattern) for column in columns])
+    condition = search_document(columns).op("@@")(query)
+    if indexed_columns is not None and indexed_columns is not columns:
+        condition = and_(search_document(indexed_columns).op("@@")(query), condition)
+    return condition
+
+
+def search_rank(columns: Sequence[ColumnElement], term: str) -> ColumnElement:
+    """Relevance of a matching row for ``term``.
+
+    Whole-word matches outrank prefix-only ones ("Smith" before "Smithson"
+    for "smith"), and names that start with the whole term get a further boost.
+    """
+    query = search_query(term)
+    if query is None:
+        rank = literal(0.0)
+    else:
+        document = search_document(columns)
+        rank = func.ts_rank(document, query) + func.ts_rank(document, func.plainto_tsquery(SEARCH_CONFIG, term))
+    starts_with = func.lower(func.coalesce(columns[0], "")).startswith((term or "").strip().lower(), autoescape=True)
+    return rank + case((starts_with, 1.0), else_=0.0)
@@ -29,17 +29,18 @@ from database.data_models.crm_lookups import (
 from database.data_models.claims_data import ClaimsProvider, SiteOfService
 
 
-# Test database URL - uses SQLite for speed in testing
-TEST_DATABASE_URL = "sqlite:///./test.db"
+# Test database URL - uses SQLite for speed in testing; set TEST_DATABASE_URL
+# to a PostgreSQL database to also run the tests that need PostgreSQL
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL", "sqlite:///./test.db")
 
 
 @pytest.fixture(scope="session")
 def engine():
     """Create a test database engine."""
-    engine = create_engine(
-        TEST_DATABASE_URL, 
-        connect_args={"check_same_thread": False}  # Needed for SQLite
-    )
+    connect_args = {}
+    if TEST_DATABASE_URL.startswith("sqlite"):
+        connect_args["check_same_thread"] = False  # Needed for SQLite
+    engine = create_engine(TEST_DATABASE_URL, connect_args=connect_args)
     # Create all tables
     Base.metadata.create_all(bind=engine)
     yield engine
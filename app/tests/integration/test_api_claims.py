@@ -0,0 +1,204 @@
+"""
+Integration tests for Market Explorer claims API endpoints.
+
+These tests guard the query shape of the site drill-down and statistics
+endpoints so that large sites do not regress into per-provider queries.
+
+The claims models and the statistics statements use PostgreSQL types and
+functions (JSONB, json_agg, aggregate ORDER BY), so the tests only run when
+TEST_DATABASE_URL points at a PostgreSQL database.
+"""
+import os
+import uuid
+
+import pytest
+from sqlalchemy import event
+from fastapi.testclient import TestClient
+
+from main import app
+from database.session import db_session as get_db_session
+from database.data_models.claims_data import ClaimsProvider, ClaimsVisit, SiteOfService
+from services.claims_aggregate_service import ClaimsAggregateService
+from services.claims_statistics_service import ClaimsStatisticsCache
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL", "").startswith("postgresql"),
+    reason="needs PostgreSQL: set TEST_DATABASE_URL",
+)
+
+
+@pytest.fixture(scope="function")
+def claims_client(db_session) -> TestClient:
+    """Test client bound to the test session."""
+    def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db_session] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def site_with_providers(db_session):
+    """Create a site with several providers and multiple visit rows each."""
+    site = SiteOfService(id=uuid.uuid4(), legacy_id="SITE-N1", name="Large Hospital", city="Boston")
+    providers = [
+        ClaimsProvider(
+            id=uuid.uuid4(),
+            npi=f"{i:010d}",
+            name=f"Dr. Provider {i:02d}",
+            specialty="Cardiology"
+        )
+        for i in range(12)
+    ]
+    db_session.add_all([site, *providers])
+    db_session.flush()
+
+    for i, provider in enumerate(providers):
+        for visits in (i + 1, 10):
+            db_session.add(ClaimsVisit(
+                id=uuid.uuid4(),
+                provider_id=provider.id,
+                site_id=site.id,
+                visits=visits
+            ))
+    # Flush only, so the per-test rollback removes the rows again
+    db_session.flush()
+    return site, providers
+
+
+def count_statements(db_session):
+    """Attach a cursor listener and return the list it appends statements to."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", before_cursor_execute)
+    return statements, lambda: event.remove(
+        db_session.get_bind(), "before_cursor_execute", before_cursor_execute
+    )
+
+
+class TestSiteProvidersEndpoint:
+    """Test the GET /api/claims/sites/{site_id}/providers endpoint."""
+
+    def test_returns_visit_totals_per_provider(self, claims_client, site_with_providers):
+        site, providers = site_with_providers
+
+        response = claims_client.get(f"/api/claims/sites/{site.id}/providers?per_page=100")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["meta"]["total_items"] == len(providers)
+        totals = {item["name"]: item["total_visits"] for item in data["items"]}
+        assert totals == {p.name: i + 1 + 10 for i, p in enumerate(providers)}
+        assert [item["name"] for item in data["items"]] == sorted(totals)
+
+    def test_statement_count_is_constant_per_page(self, claims_client, db_session, site_with_providers):
+        site, _ = site_with_providers
+        counts = []
+
+        for per_page in (2, 10):
+            statements, stop = count_statements(db_session)
+            try:
+                response = claims_client.get(
+                    f"/api/claims/sites/{site.id}/providers?per_page={per_page}"
+                )
+            finally:
+                stop()
+            assert response.status_code == 200
+            assert len(response.json()["items"]) == per_page
+            counts.append(len(statements))
+
+        # Site lookup and the page query, which also carries the total
+        assert counts[0] == counts[1] <= 2
+
+    def test_total_is_reported_past_the_last_page(self, claims_client, site_with_providers):
+        site, providers = site_with_providers
+
+        response = claims_client.get(f"/api/claims/sites/{site.id}/providers?page=3&per_page=10")
+
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+        assert response.json()["meta"]["total_items"] == len(providers)
+
+
+class TestSitesEndpoint:
+    """Test the GET /api/claims/sites endpoint."""
+
+    def test_statistics_summarize_the_matched_site_aggregates(self, claims_client, db_session, site_with_providers):
+        site, providers = site_with_providers
+        small_site = SiteOfService(id=uuid.uuid4(), legacy_id="SITE-N2", name="Small Clinic", city="Boston")
+        db_session.add(small_site)
+        db_session.flush()
+        db_session.add(ClaimsVisit(id=uuid.uuid4(), provider_id=providers[0].id, site_id=small_site.id, visits=5))
+        db_session.flush()
+        ClaimsAggregateService(db_session).refresh_site_aggregates()
+
+        statistics = claims_client.get("/api/claims/sites").json()["statistics"]
+        assert (statistics["total_visits"], statistics["total_sites"], statistics["total_providers"]) == (203, 2, 12)
+
+        statements, stop = count_statements(db_session)
+        try:
+            response = claims_client.get("/api/claims/sites?min_site_visits=100")
+        finally:
+            stop()
+
+        # The summary covers the same sites as the rows, without summing visits
+        assert [item["name"] for item in response.json()["items"]] == [site.name]
+        statistics = response.json()["statistics"]
+        assert (statistics["total_visits"], statistics["total_sites"], statistics["total_providers"]) == (198, 1, 12)
+        assert not any("sum(claims_visits.visits)" in statement for statement in statements)
+
+
+class TestProviderStatisticsEndpoint:
+    """Test the GET /api/claims/providers/{provider_id}/statistics endpoint."""
+
+    def test_statistics_come_from_one_cached_statement(self, claims_client, db_session, site_with_providers):
+        site, providers = site_with_providers
+        provider = providers[3]
+        ClaimsStatisticsCache.clear()
+
+        statements, stop = count_statements(db_session)
+        try:
+            first = claims_client.get(f"/api/claims/providers/{provider.id}/statistics")
+            misses = len(statements)
+            second = claims_client.get(f"/api/claims/providers/{provider.id}/statistics")
+        finally:
+            stop()
+
+        assert first.status_code == 200
+        data = first.json()
+        assert data["visit_stats"]["total_visits"] == 4 + 10
+        assert data["site_count"] == 1
+        assert data["top_sites"] == [{"name": site.name, "city": site.city, "visits": 14}]
+
+        # Cache version check plus the statistics statement, then served from cache
+        assert misses <= 2
+        assert len(statements) == misses
+        assert second.json() == data
+
+    def test_sites_with_equal_visits_are_listed_by_name(self, claims_client, db_session, site_with_providers):
+        _, providers = site_with_providers
+        provider = providers[0]
+        sites = [
+            SiteOfService(id=uuid.uuid4(), legacy_id=f"SITE-T{i}", name=name, city="Boston")
+            for i, name in enumerate(["Clinic C", "Clinic A", "Clinic B"])
+        ]
+        db_session.add_all(sites)
+        db_session.flush()
+        db_session.add_all(
+            ClaimsVisit(id=uuid.uuid4(), provider_id=provider.id, site_id=site.id, visits=20)
+            for site in sites
+        )
+        db_session.flush()
+        ClaimsStatisticsCache.clear()
+
+        response = claims_client.get(f"/api/claims/providers/{provider.id}/statistics")
+
+        assert [site["name"] for site in response.json()["top_sites"]][:3] == ["Clinic A", "Clinic B", "Clinic C"]
+
+    def test_unknown_provider_returns_404(self, claims_client):
+        response = claims_client.get(f"/api/claims/providers/{uuid.uuid4()}/statistics")
+        assert response.status_code == 404
@@ -0,0 +1,152 @@
+"""
+Test the asyncio bulk job manager: concurrent submission, backoff polling
+and delivering each job's results as soon as it completes.
+"""
+import random
+import threading
+import time
+
+import pytest
+
+from services.salesforce_files.bulk_job_manager import (
+    JOB_COMPLETE,
+    JOB_FAILED,
+    BulkJobManager,
+    poll_delays,
+)
+from services.salesforce_files.salesforce_monitoring import SalesforceMonitoring
+
+
+class FakeBulkService:
+    """Jobs finish after a per-query duration; the query text is the duration."""
+
+    def __init__(self, failing=()):
+        self.session_id = "token"
+        self.monitoring = SalesforceMonitoring()
+        self.failing = set(failing)
+        self.jobs = {}
+        self.open_jobs = 0
+        self.max_open_jobs = 0
+        self.downloads = 0
+        self.max_downloads = 0
+        self._lock = threading.Lock()
+
+    def authenticate(self):
+        return True
+
+    def create_bulk_query_job(self, query, object_name="Contact"):
+        with self._lock:
+            job_id = f"750{len(self.jobs):03d}"
+            self.jobs[job_id] = (time.monotonic() + float(query), query)
+            self.open_jobs += 1
+            self.max_open_jobs = max(self.max_open_jobs, self.open_jobs)
+        return job_id
+
+    def check_job_status(self, job_id):
+        finishes_at, query = self.jobs[job_id]
+        if time.monotonic() < finishes_at:
+            return {"state": "InProgress", "numberRecordsProcessed": 0}
+        with self._lock:
+            self.open_jobs -= 1
+            self.jobs[job_id] = (float("inf"), query)
+        if query in self.failing:
+            return {"state": JOB_FAILED, "stateMessage": "INVALID_FIELD"}
+        return {"state": JOB_COMPLETE, "numberRecordsProcessed": 2}
+
+    def iter_job_results(self, job_id):
+        with self._lock:
+            self.downloads += 1
+            self.max_downloads = max(self.max_downloads, self.downloads)
+        try:
+            yield [{"Id": f"{job_id}-1"}]
+            time.sleep(0.05)
+            yield [{"Id": f"{job_id}-2"}]
+        finally:
+            with self._lock:
+                self.downloads -= 1
+
+
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def make_manager(service, **kwargs):
+    return BulkJobManager(
+        service,
+        initial_poll_interval=0.02,
+        max_poll_interval=0.05,
+        rng=random.Random(7),
+        **kwargs,
+    )
+
+
+def test_poll_delays_back_off_with_jitter():
+    delays = poll_delays(1.0, 8.0, rng=random.Random(1))
+    first = [next(delays) for _ in range(6)]
+
+    for delay, cap in zip(first, [1, 2, 4, 8, 8, 8]):
+        assert cap / 2 <= delay <= cap
+
+
+def test_jobs_run_concurrently_and_arrive_as_they_complete():
+    service = FakeBulkService()
+    manager = make_manager(service)
+    queries = {"slow": "0.4", "fast": "0.05", "medium": "0.2"}
+
+    started = time.monotonic()
+    outcomes = list(manager.iter_completed(queries))
+    elapsed = time.monotonic() - started
+
+    assert [outcome.key for outcome in outcomes] == ["fast", "medium", "slow"]
+    assert all(outcome.succeeded for outcome in outcomes)
+    assert [record["Id"][-2:] for record in outcomes[0].records] == ["-1", "-2"]
+    # About the slowest job (0.4s), not the sum (0.65s)
+    assert elapsed < 0.6
+    assert manager.progress.completed == 3
+    assert manager.progress.records_processed == 6
+
+
+def test_concurrent_jobs_are_bounded():
+    service = FakeBulkService()
+    manager = make_manager(service, max_concurrent_jobs=2)
+
+    outcomes = list(manager.iter_completed({i: "0.05" for i in range(6)}))
+
+    assert len(outcomes) == 6
+    assert service.max_open_jobs == 2
+
+
+def test_concurrent_downloads_are_bounded():
+    service = FakeBulkService()
+    manager = make_manager(service, max_concurrent_jobs=2)
+
+    outcomes = list(manager.iter_completed({i: "0.01" for i in range(6)}))
+
+    assert all(outcome.succeeded for outcome in outcomes)
+    assert service.max_downloads == 2
+
+
+def test_failed_job_is_reported_without_stopping_others():
+    service = FakeBulkService(failing={"0.01"})
+    manager = make_manager(service)
+
+    outcomes = {outcome.key: outcome for outcome in manager.iter_completed({"bad": "0.01", "good": "0.05"})}
+
+    assert outcomes["bad"].state == JOB_FAILED
+    assert outcomes["bad"].error == "INVALID_FIELD"
+    assert outcomes["bad"].records == []
+    assert outcomes["good"].succeeded
+    assert (manager.progress.completed, manager.progress.failed) == (1, 1)
+
+
+def test_stopping_early_cancels_remaining_jobs():
+    service = FakeBulkService()
+    manager = make_manager(service)
+
+    outcomes = manager.iter_completed({"fast": "0.01", "stuck": "60"})
+    assert next(outcomes).key == "fast"
+
+    started = time.monotonic()
+    outcomes.close()
+    assert time.monotonic() - started < 1
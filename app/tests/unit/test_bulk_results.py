@@ -0,0 +1,134 @@
+"""
+Test streaming Bulk API 2.0 query results across Sforce-Locator pages,
+serially and through the concurrent result fetcher.
+"""
+import threading
+import time
+
+import pytest
+import requests
+
+from services.salesforce_files.bulk_results import _iter_lines
+from services.salesforce_files.bulk_salesforce_service import BulkSalesforceService
+
+
+class FakeResultPage:
+    """A streamed result page as returned by requests.get(..., stream=True)."""
+
+    def __init__(self, body: bytes, locator: str, chunk_size: int = 7, delay: float = 0):
+        self.body = body
+        self.headers = {"Sforce-Locator": locator}
+        self.chunk_size = chunk_size
+        self.delay = delay
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        time.sleep(self.delay)
+        for start in range(0, len(self.body), self.chunk_size):
+            yield self.body[start:start + self.chunk_size]
+
+
+class FakeSession:
+    """Serves result pages by locator and records the requests made."""
+
+    def __init__(self, pages=None, error=None):
+        self.pages = pages or {}
+        self.error = error
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, params=None, stream=False):
+        assert stream
+        if self.error:
+            raise self.error
+        with self._lock:
+            self.calls.append(params)
+        return self.pages[params.get("locator")]
+
+
+@pytest.fixture
+def make_service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def make(http_session):
+        sf_bulk = BulkSalesforceService(
+            username="user", password="pass", client_id="id", client_secret="secret",
+            http_session=http_session,
+        )
+        sf_bulk.instance_url = "https://example.my.salesforce.com"
+        sf_bulk.headers = {"Authorization": "Bearer token"}
+        return sf_bulk
+
+    return make
+
+
+def test_iter_lines_splits_across_chunks():
+    chunks = [b"Id,Na", b"me\n1,Jos", "é".encode()[:1], "é".encode()[1:], b"\n2,Ann"]
+
+    assert list(_iter_lines(chunks, "utf-8")) == ["Id,Name\n", "1,José\n", "2,Ann"]
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_follows_locators_and_batches_records(make_service, concurrency):
+    session = FakeSession({
+        None: FakeResultPage(b'"Id","Name"\n"1","Smith"\n"2",""\n"3","Jo\nnes"\n', "abc"),
+        "abc": FakeResultPage(b'"Id","Name"\n"4","null"\n"5","Lee"\n', "null"),
+    })
+
+    batches = list(make_service(session).iter_job_results(
+        "750xx", max_records=3, batch_size=2, concurrency=concurrency
+    ))
+
+    assert [len(batch) for batch in batches] == [2, 1, 2]
+    records = [record for batch in batches for record in batch]
+    assert records == [
+        {"Id": "1", "Name": "Smith"},
+        {"Id": "2", "Name": None},
+        {"Id": "3", "Name": "Jo\nnes"},
+        {"Id": "4", "Name": None},
+        {"Id": "5", "Name": "Lee"},
+    ]
+    assert session.calls == [{"maxRecords": 3}, {"maxRecords": 3, "locator": "abc"}]
+
+
+def test_concurrent_pages_overlap_and_keep_order(make_service):
+    page_count = 6
+    session = FakeSession({
+        (f"p{i}" if i else None): FakeResultPage(
+            f'"Id"\n"{i}"\n'.encode(),
+            f"p{i + 1}" if i + 1 < page_count else "null",
+            # Later pages finish first if they are downloaded in parallel
+            delay=0.05 * (page_count - i),
+        )
+        for i in range(page_count)
+    })
+
+    started = time.perf_counter()
+    records = [
+        record["Id"]
+        for batch in make_service(session).iter_job_results("750xx", concurrency=page_count)
+        for record in batch
+    ]
+
+    assert records == [str(i) for i in range(page_count)]
+    # Serially the delays add up to 1.05s; overlapped they are bounded by the first
+    assert time.perf_counter() - started < 0.6
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_download_failure_is_raised(make_service, concurrency):
+    session = FakeSession(error=requests.ConnectionError("connection reset"))
+
+    with pytest.raises(requests.ConnectionError):
+        list(make_service(session).iter_job_results("750xx", concurrency=concurrency))
@@ -0,0 +1,82 @@
+"""
+Test Accept negotiation and encoding for the columnar map formats.
+"""
+import json
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from services import columnar_response
+from services.columnar_response import (
+    ARROW_STREAM_MEDIA_TYPE,
+    COLUMNAR_JSON_MEDIA_TYPE,
+    columnar_response as build_response,
+    negotiate_columnar_format,
+)
+
+
+def make_request(accept: str = None) -> Request:
+    headers = [(b"accept", accept.encode())] if accept else []
+    return Request({"type": "http", "headers": headers})
+
+
+class TestNegotiation:
+    """Test picking a columnar media type from the Accept header."""
+
+    def test_regular_json_by_default(self):
+        assert negotiate_columnar_format(make_request()) is None
+        assert negotiate_columnar_format(make_request("application/json, */*")) is None
+
+    def test_columnar_json(self):
+        request = make_request(f"{COLUMNAR_JSON_MEDIA_TYPE};q=0.9, application/json")
+        assert negotiate_columnar_format(request) == COLUMNAR_JSON_MEDIA_TYPE
+
+    def test_refused_type_is_ignored(self):
+        assert negotiate_columnar_format(make_request(f"{COLUMNAR_JSON_MEDIA_TYPE}; q=0")) is None
+
+    def test_arrow_falls_back_or_406_without_pyarrow(self, monkeypatch):
+        monkeypatch.setattr(columnar_response, "pa", None)
+
+        request = make_request(f"{ARROW_STREAM_MEDIA_TYPE}, {COLUMNAR_JSON_MEDIA_TYPE}")
+        assert negotiate_columnar_format(request) == COLUMNAR_JSON_MEDIA_TYPE
+
+        with pytest.raises(HTTPException) as exc_info:
+            negotiate_columnar_format(make_request(ARROW_STREAM_MEDIA_TYPE))
+        assert exc_info.value.status_code == 406
+
+
+class TestEncoding:
+    """Test the encoded payloads."""
+
+    def test_columnar_json_body(self):
+        response = build_response(
+            COLUMNAR_JSON_MEDIA_TYPE,
+            {"id": ["a", "b"], "latitude": [34.0, 34.1]},
+            {"total": 2},
+        )
+
+        assert response.media_type == COLUMNAR_JSON_MEDIA_TYPE
+        assert json.loads(response.body) == {
+            "total": 2,
+            "length": 2,
+            "columns": {"id": ["a", "b"], "latitude": [34.0, 34.1]},
+        }
+
+    def test_rejects_ragged_columns(self):
+        with pytest.raises(ValueError):
+            build_response(COLUMNAR_JSON_MEDIA_TYPE, {"id": ["a", "b"], "latitude": [34.0]})
+
+    def test_arrow_round_trip(self):
+        pa = pytest.importorskip("pyarrow")
+
+        response = build_response(
+            ARROW_STREAM_MEDIA_TYPE,
+            {"id": ["a", "b", "c", "d"], "city": ["LA", "LA", "LA", None]},
+            {"total": 4},
+        )
+        table = pa.ipc.open_stream(response.body).read_all()
+
+        assert table.column("id").to_pylist() == ["a", "b", "c", "d"]
+        assert table.column("city").to_pylist() == ["LA", "LA", "LA", None]
+        assert json.loads(table.schema.metadata[b"meta"]) == {"total": 4}
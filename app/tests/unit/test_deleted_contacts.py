@@ -0,0 +1,76 @@
+"""
+Test that contacts deleted in Salesforce stay in sf_contacts, flagged by the
+incremental sync, but no longer show up in the contact list, map, filter
+options or geo index.
+"""
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.contacts import load_filter_options, router
+from database.data_models.salesforce_data import SfContact
+from database.session import db_session
+from services.geo_index import GeoIndexManager
+
+
+def contact(name, specialty, is_deleted=False):
+    return SfContact(
+        id=uuid.uuid4(),
+        salesforce_id=f"003{uuid.uuid4().hex[:15]}",
+        first_name=name,
+        last_name=name,
+        name=name,
+        specialty=specialty,
+        mailing_latitude=34.05,
+        mailing_longitude=-118.25,
+        active=True,
+        is_deleted=is_deleted,
+    )
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SfContact.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([contact("Live", "Cardiology"), contact("Gone", "Oncology", is_deleted=True)])
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+    app.include_router(router, prefix="/contacts")
+    app.dependency_overrides[db_session] = lambda: session
+    return TestClient(app)
+
+
+def test_deleted_contacts_are_not_listed(client):
+    response = client.get("/contacts/")
+
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["items"]] == ["Live"]
+    assert response.json()["total"] == 1
+
+
+def test_deleted_contacts_are_not_on_the_map(client):
+    response = client.get("/contacts/map-data")
+
+    assert response.status_code == 200
+    assert [marker["name"] for marker in response.json()["markers"]] == ["Live"]
+
+
+def test_deleted_contacts_are_left_out_of_filter_options_and_the_geo_index(session):
+    assert load_filter_options(session).specialties == ["Cardiology"]
+
+    index = GeoIndexManager._build_contact_index(session)
+    assert len(index) == 1
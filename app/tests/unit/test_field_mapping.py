@@ -0,0 +1,113 @@
+"""
+Test mapping Salesforce records to rows with a declarative FieldMap, column
+by column, against mapping them one record at a time.
+"""
+from datetime import date, datetime
+
+from services.salesforce_files.field_mapping import (
+    RECORD,
+    Field,
+    FieldMap,
+    convert_column,
+    parse_boolean,
+    parse_boolean_default_true,
+    parse_date,
+    parse_datetime,
+    parse_float,
+)
+
+FIELDS = FieldMap([
+    Field("salesforce_id", "Id", required=True),
+    Field("type", default="Task"),
+    Field("status", "Status", default="Not Started"),
+    Field("active", "Active__c", parse_boolean_default_true),
+    Field("latitude", "Latitude", parse_float),
+    Field("activity_date", "ActivityDate", parse_date),
+    Field("modstamp", "SystemModstamp", parse_datetime),
+    Field("id_length", RECORD, lambda record: len(record["Id"])),
+])
+
+
+def records(count):
+    return [
+        {
+            "Id": f"00T{i:05d}",
+            "Status": "Completed" if i % 2 else None,
+            "Active__c": ["true", "false", None][i % 3],
+            "Latitude": f"{34 + i / 100:.2f}" if i % 4 else "",
+            "ActivityDate": "2025-01-10" if i % 2 else "not a date",
+            "SystemModstamp": "2025-01-15T08:30:00.000Z",
+        }
+        for i in range(count)
+    ]
+
+
+def test_columns_match_record_by_record_mapping():
+    batch = records(50)
+
+    rows, failures = FIELDS.map_records(batch)
+
+    assert failures == []
+    assert rows == [FIELDS.map_record(record) for record in batch]
+    assert rows[1] == {
+        "salesforce_id": "00T00001",
+        "type": "Task",
+        "status": "Completed",
+        "active": False,
+        "latitude": 34.01,
+        "activity_date": date(2025, 1, 10),
+        "modstamp": datetime(2025, 1, 15, 8, 30),
+        "id_length": 8,
+    }
+    columns, _ = FIELDS.map_columns(batch)
+    assert list(columns) == list(FIELDS.columns)
+    assert list(columns["active"][:3]) == [True, False, True]
+
+
+def test_fields_absent_from_every_record_take_their_default():
+    batch = [{"Id": "00T1"}, {"Id": "00T2"}]
+
+    rows, failures = FIELDS.map_records(batch)
+
+    assert failures == []
+    assert rows == [FIELDS.map_record(record) for record in batch]
+    assert rows[0]["status"] == "Not Started"
+    assert rows[0]["active"] is True
+
+
+def test_field_missing_from_some_records_only_is_not_defaulted():
+    batch = records(4)
+    del batch[0]["Status"]
+
+    rows, failures = FIELDS.map_records(batch)
+
+    assert failures == []
+    assert [row["status"] for row in rows] == ["Not Started", "Completed", None, "Completed"]
+
+
+def test_records_without_a_required_field_fail_alone():
+    batch = records(5)
+    del batch[2]["Id"]
+
+    rows, failures = FIELDS.map_records(batch)
+
+    assert [row["salesforce_id"] for row in rows] == ["00T00000", "00T00001", "00T00003", "00T00004"]
+    assert len(failures) == 1
+    assert failures[0][0] is batch[2]
+    assert isinstance(failures[0][1], KeyError)
+
+
+def test_convert_column_only_shares_results_between_interchangeable_values():
+    assert convert_column(str, [1, True, 1, True]) == ["1", "True", "1", "True"]
+    assert convert_column(str, [0.0, -0.0, 0.0, -0.0]) == ["0.0", "-0.0", "0.0", "-0.0"]
+    assert convert_column(parse_float, ["1.5", None, "1.5", "x"]) == [1.5, None, 1.5, None]
+    assert convert_column(len, [{"a": 1}, {}]) == [1, 0]
+
+
+def test_parsers():
+    assert parse_boolean("TRUE") is True
+    assert parse_boolean(None) is False
+    assert parse_boolean_default_true(None) is True
+    assert parse_float("") is None
+    assert parse_date("2025-01-10Z") is None
+    assert parse_datetime("2025-01-15T08:30:00Z") == datetime(2025, 1, 15, 8, 30)
@@ -0,0 +1,60 @@
+"""
+Test the filter options cache: concurrent misses share one load, and loads
+of different options do not wait on each other.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.filter_options_cache import FilterOptionsCache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(FilterOptionsCache, "_get_version", classmethod(lambda cls, session, name: 1))
+    FilterOptionsCache.clear()
+    yield
+    FilterOptionsCache.clear()
+
+
+def test_concurrent_misses_run_the_loader_once():
+    calls = []
+
+    def loader(session):
+        calls.append(threading.get_ident())
+        time.sleep(0.2)
+        return {"specialties": ["Cardiology"]}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        entries = list(executor.map(
+            lambda _: FilterOptionsCache.get(FilterOptionsCache.CONTACTS, None, loader), range(8)
+        ))
+
+    assert len(calls) == 1
+    assert {entry.etag for entry in entries} == {entries[0].etag}
+    assert entries[0].payload == {"specialties": ["Cardiology"]}
+
+
+def test_a_slow_load_does_not_block_other_options():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_loader(session):
+        started.set()
+        release.wait(5)
+        return {"geomarkets": []}
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow = executor.submit(FilterOptionsCache.get, FilterOptionsCache.CLAIMS, None, slow_loader)
+        started.wait(5)
+        try:
+            entry = FilterOptionsCache.get(
+                FilterOptionsCache.RELATIONSHIPS, None, lambda session: {"statuses": []}
+            )
+            assert entry.payload == {"statuses": []}
+            assert not slow.done()
+        finally:
+            release.set()
+        assert slow.result().payload == {"geomarkets": []}
@@ -0,0 +1,66 @@
+"""
+Test the in-process site geo index used for map clustering.
+
+Focus on the invariants the map relies on: clusters never lose or
+double-count sites, and bounding box queries match a brute-force scan.
+"""
+import random
+import uuid
+
+from services.geo_index import GeoGridIndex, SitePoint, cluster_points
+
+
+def make_points(count: int, seed: int = 7) -> list[SitePoint]:
+    rng = random.Random(seed)
+    return [
+        SitePoint(
+            id=uuid.uuid4(),
+            name=f"Site {i}",
+            latitude=33.5 + rng.random(),
+            longitude=-118.5 + rng.random(),
+            total_visits=rng.randint(0, 500),
+            provider_count=rng.randint(0, 20)
+        )
+        for i in range(count)
+    ]
+
+
+class TestGeoGridIndex:
+    """Test grid index queries and the cluster pyramid."""
+
+    def test_pyramid_preserves_totals_at_every_zoom(self):
+        points = make_points(2000)
+        index = GeoGridIndex(points)
+
+        for zoom in range(0, index.max_zoom + 1):
+            clusters = index.clusters(zoom)
+            assert sum(c.site_count for c in clusters) == len(points)
+            assert sum(c.total_visits for c in clusters) == sum(p.total_visits for p in points)
+            assert sum(c.provider_count for c in clusters) == sum(p.provider_count for p in points)
+
+    def test_pyramid_matches_on_the_fly_clustering(self):
+        points = make_points(500)
+        index = GeoGridIndex(points)
+
+        precomputed = sorted((c.site_count, c.total_visits) for c in index.clusters(9))
+        computed = sorted((c.site_count, c.total_visits) for c in cluster_points(points, 9))
+        assert precomputed == computed
+
+    def test_query_bbox_matches_brute_force(self):
+        points = make_points(2000)
+        index = GeoGridIndex(points)
+        bbox = (33.8, -118.2, 34.1, -117.9)
+
+        expected = {
+            p.id for p in points
+            if bbox[0] <= p.latitude <= bbox[2] and bbox[1] <= p.longitude <= bbox[3]
+        }
+        assert {p.id for p in index.query_bbox(bbox)} == expected
+
+    def test_single_site_cluster_keeps_its_point(self):
+        point = make_points(1)[0]
+        index = GeoGridIndex([point])
+
+        clusters = index.clusters(5)
+        assert len(clusters) == 1
+        assert clusters[0].point is point
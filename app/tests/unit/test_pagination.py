@@ -0,0 +1,86 @@
+"""
+Test the keyset pagination helpers shared by the list endpoints.
+
+Covers the cursor round trip and the keyset predicate against an in-memory
+SQLite table; SQLite sorts NULLs like PostgreSQL does once the order is
+spelled out with NULLS FIRST/LAST, so the predicate is checked that way.
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy import Column, Date, Integer, String, create_engine, select
+from sqlalchemy.orm import declarative_base
+
+from services.pagination import (
+    InvalidCursorError,
+    SortKey,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "pagination_rows"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    day = Column(Date)
+
+
+class TestCursor:
+    """Test cursor encoding."""
+
+    def test_round_trip_restores_types(self):
+        keys = [SortKey(Row.day), SortKey(Row.id)]
+        token = encode_cursor("rows:day", [date(2024, 3, 1), 42])
+
+        assert decode_cursor(token, "rows:day", keys) == [date(2024, 3, 1), 42]
+
+    def test_rejects_cursor_from_another_sort(self):
+        token = encode_cursor("rows:name", ["b", 1])
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token, "rows:day", [SortKey(Row.day), SortKey(Row.id)])
+
+    def test_rejects_garbage(self):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor", "rows:day", [SortKey(Row.day), SortKey(Row.id)])
+
+
+class TestKeysetCondition:
+    """Walking pages with the keyset predicate must match a plain ordered scan."""
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_pages_match_ordered_scan_with_nulls(self, descending):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        names = ["a", None, "b", "a", None, "c", "b", "a"]
+        with engine.begin() as conn:
+            conn.execute(Row.__table__.insert(), [
+                {"id": i + 1, "name": name} for i, name in enumerate(names)
+            ])
+
+        keys = [SortKey(Row.name, descending), SortKey(Row.id, descending)]
+        name_order = Row.name.desc().nulls_first() if descending else Row.name.asc().nulls_last()
+        id_order = Row.id.desc() if descending else Row.id.asc()
+        ordered = select(Row.id, Row.name).order_by(name_order, id_order)
+
+        with engine.connect() as conn:
+            expected = [row.id for row in conn.execute(ordered)]
+
+            seen = []
+            last = None
+            while True:
+                query = ordered.limit(3)
+                if last is not None:
+                    query = query.where(keyset_condition(keys, last))
+                rows = conn.execute(query).all()
+                if not rows:
+                    break
+                seen.extend(row.id for row in rows)
+                last = [rows[-1].name, rows[-1].id]
+
+        assert seen == expected
@@ -0,0 +1,203 @@
+"""
+Test the branch scheduler behind ParallelNode: concurrent branches, branches
+that depend on other branches, isolated branch contexts and the merge.
+"""
+import asyncio
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from core.event_loop import run_coroutine
+from core.nodes.base import Node
+from core.nodes.parallel import ParallelNode
+from core.schema import NodeConfig, WorkflowSchema
+from core.task import TaskContext
+from core.workflow import Workflow
+
+CHECK_SECONDS = 0.3
+
+
+class MessageEvent(BaseModel):
+    text: str
+
+
+class ToxicityCheck(Node):
+    """Synchronous branch: runs on the shared branch pool."""
+
+    def process(self, task_context: TaskContext) -> TaskContext:
+        time.sleep(CHECK_SECONDS)
+        task_context.update_node(
+            node_name=self.node_name,
+            passed="idiot" not in task_context.event.text,
+            saw=sorted(task_context.nodes),
+        )
+        return task_context
+
+
+class PiiCheck(Node):
+    """Asynchronous branch: runs on the event loop."""
+
+    def process(self, task_context: TaskContext) -> TaskContext:
+        raise NotImplementedError
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        await asyncio.sleep(CHECK_SECONDS)
+        if task_context.event.text == "fail":
+            raise RuntimeError("PII service unavailable")
+        task_context.update_node(node_name=self.node_name, passed="@" not in task_context.event.text)
+        task_context.metadata["checked_pii"] = True
+        return task_context
+
+
+class Normalize(Node):
+    def process(self, task_context: TaskContext) -> TaskContext:
+        task_context.update_node(node_name=self.node_name, text=task_context.event.text.strip())
+        return task_context
+
+
+class LengthCheck(Node):
+    """Depends on Normalize, through Normalize's connections."""
+
+    def process(self, task_context: TaskContext) -> TaskContext:
+        text = task_context.nodes["Normalize"]["text"]
+        task_context.update_node(node_name=self.node_name, passed=len(text) < 20)
+        return task_context
+
+
+class GuardrailNode(ParallelNode):
+    def process(self, task_context: TaskContext) -> TaskContext:
+        self.execute_nodes_in_parallel(task_context)
+        checks = ["ToxicityCheck", "PiiCheck", "LengthCheck"]
+        task_context.update_node(
+            node_name=self.node_name,
+            passed=all(task_context.nodes[check]["passed"] for check in checks),
+        )
+        return task_context
+
+
+class GuardrailWorkflow(Workflow):
+    workflow_schema = WorkflowSchema(
+        event_schema=MessageEvent,
+        start=GuardrailNode,
+        nodes=[
+            NodeConfig(
+                node=GuardrailNode,
+                parallel_nodes=[ToxicityCheck, LengthCheck, PiiCheck, Normalize],
+            ),
+            NodeConfig(node=Normalize, connections=[LengthCheck]),
+        ],
+    )
+
+
+def test_branches_take_as_long_as_the_slowest():
+    workflow = GuardrailWorkflow()
+
+    started = time.perf_counter()
+    result = workflow.run({"text": "  hello there  "})
+    elapsed = time.perf_counter() - started
+
+    assert result.nodes["GuardrailNode"]["passed"] is True
+    assert result.nodes["Normalize"] == {"text": "hello there"}
+    assert result.metadata["checked_pii"] is True
+    # Each branch works on its own copy: the toxicity check saw no other branch
+    assert result.nodes["ToxicityCheck"]["saw"] == []
+    assert elapsed < 2 * CHECK_SECONDS
+
+
+def test_concurrent_runs_share_the_scheduler():
+    workflow = GuardrailWorkflow()
+
+    async def run_all():
+        return await asyncio.gather(
+            *(workflow.arun({"text": f"mail {i}@example.com"}) for i in range(10))
+        )
+
+    started = time.perf_counter()
+    results = run_coroutine(run_all())
+    elapsed = time.perf_counter() - started
+
+    assert [r.nodes["PiiCheck"]["passed"] for r in results] == [False] * 10
+    assert [r.nodes["Normalize"]["text"] for r in results] == [
+        f"mail {i}@example.com" for i in range(10)
+    ]
+    assert elapsed < 4 * CHECK_SECONDS
+
+
+def test_branch_failure_is_raised_without_merging():
+    task_context = TaskContext(event=MessageEvent(text="fail"))
+    task_context.metadata["nodes"] = GuardrailWorkflow().nodes
+
+    with pytest.raises(RuntimeError, match="PII service unavailable"):
+        GuardrailNode.get_instance().execute_nodes_in_parallel(task_context)
+
+    assert task_context.nodes == {}
+
+
+def test_branches_depending_on_each_other_in_a_cycle_are_rejected():
+    class CyclicWorkflow(Workflow):
+        workflow_schema = WorkflowSchema(
+            event_schema=MessageEvent,
+            start=GuardrailNode,
+            nodes=[
+                NodeConfig(node=GuardrailNode, parallel_nodes=[Normalize, LengthCheck]),
+                NodeConfig(node=Normalize, connections=[LengthCheck]),
+                NodeConfig(node=LengthCheck, connections=[Normalize]),
+            ],
+        )
+
+    with pytest.raises(ValueError, match="cycle"):
+        CyclicWorkflow()
+
+
+class AsyncChecks(ParallelNode):
+    """Nested fan-out, awaited on the event loop."""
+
+    def process(self, task_context: TaskContext) -> TaskContext:
+        raise NotImplementedError
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        await self.aexecute_nodes_in_parallel(task_context)
+        passed = task_context.nodes["ToxicityCheck"]["passed"] and task_context.nodes["PiiCheck"]["passed"]
+        task_context.update_node(node_name=self.node_name, passed=passed)
+        return task_context
+
+
+class SyncChecks(ParallelNode):
+    def process(self, task_context: TaskContext) -> TaskContext:
+        self.execute_nodes_in_parallel(task_context)
+        return task_context
+
+
+class OuterNode(ParallelNode):
+    def process(self, task_context: TaskContext) -> TaskContext:
+        self.execute_nodes_in_parallel(task_context)
+        return task_context
+
+
+def nested_schema(inner):
+    return WorkflowSchema(
+        event_schema=MessageEvent,
+        start=OuterNode,
+        nodes=[
+            NodeConfig(node=OuterNode, parallel_nodes=[inner, Normalize]),
+            NodeConfig(node=inner, parallel_nodes=[ToxicityCheck, PiiCheck]),
+        ],
+    )
+
+
+def test_nested_fan_outs_run_on_the_event_loop():
+    workflow_class = type("NestedWorkflow", (Workflow,), {"workflow_schema": nested_schema(AsyncChecks)})
+
+    result = workflow_class().run({"text": "hello"})
+
+    assert result.nodes["AsyncChecks"] == {"passed": True}
+    assert result.nodes["PiiCheck"]["passed"] is True
+    assert result.nodes["Normalize"] == {"text": "hello"}
+
+
+def test_nested_synchronous_fan_outs_are_rejected():
+    workflow_class = type("NestedWorkflow", (Workflow,), {"workflow_schema": nested_schema(SyncChecks)})
+
+    with pytest.raises(ValueError, match="SyncChecks of OuterNode is a synchronous ParallelNode"):
+        workflow_class()
@@ -0,0 +1,82 @@
+"""
+Test reading SOQL results through the query cursor (nextRecordsUrl) and
+caching API limits from the Sforce-Limit-Info header.
+"""
+import logging
+
+import pytest
+from simple_salesforce.util import Usage
+
+from services.salesforce_files import salesforce_service
+from services.salesforce_files.salesforce_service import ReadOnlySalesforceService
+
+
+class FakeSalesforce:
+    """Serves a query as pages linked by nextRecordsUrl and counts the calls made."""
+
+    pages = []
+
+    def __init__(self, **kwargs):
+        self.calls = []
+        self.api_usage = {}
+
+    def limits(self):
+        self.calls.append("limits")
+        return {"DailyApiRequests": {"Max": 1000, "Remaining": 990}}
+
+    def query(self, soql, include_deleted=False):
+        self.calls.append("query")
+        return self._page(0)
+
+    def query_more(self, next_records_url, identifier_is_url=False):
+        assert identifier_is_url
+        self.calls.append("query_more")
+        return self._page(int(next_records_url.rsplit("-", 1)[1]))
+
+    def _page(self, index):
+        # Every response reports the usage so far, like Sforce-Limit-Info
+        self.api_usage = {"api-usage": Usage(used=900 + len(self.calls), total=1000)}
+        page = {"records": self.pages[index], "done": index == len(self.pages) - 1}
+        if not page["done"]:
+            page["nextRecordsUrl"] = f"/services/data/v59.0/query/01gxx-{index + 1}"
+        return page
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(salesforce_service, "Salesforce", FakeSalesforce)
+    FakeSalesforce.pages = [
+        [{"Id": "00T1"}, {"Id": "00T2"}],
+        [{"Id": "00T3"}, {"Id": "00T4"}],
+        [{"Id": "00T5"}],
+    ]
+    return ReadOnlySalesforceService(
+        salesforce_service.SalesforceConfig(username="u", password="p", security_token="t")
+    )
+
+
+def test_iter_query_pages_follows_the_query_cursor(service):
+    pages = list(service.iter_query_pages("SELECT Id FROM Task"))
+
+    assert [[record["Id"] for record in page] for page in pages] == [
+        ["00T1", "00T2"],
+        ["00T3", "00T4"],
+        ["00T5"],
+    ]
+    # One query, then queryMore per page; limits only fetched once at startup
+    assert service._sf.calls == ["limits", "query", "query_more", "query_more"]
+
+
+def test_limits_are_refreshed_from_response_headers(service, caplog):
+    with caplog.at_level(logging.WARNING):
+        service.query("SELECT Id FROM Task")
+
+    assert service._api_limits["DailyApiRequests"] == {"Max": 1000, "Remaining": 98}
+    assert "High API usage" in caplog.text
+    assert service._sf.calls.count("limits") == 1
+
+
+def test_iter_query_pages_rejects_writes(service):
+    with pytest.raises(ValueError):
+        next(service.iter_query_pages("DELETE FROM Task"))
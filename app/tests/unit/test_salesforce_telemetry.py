@@ -0,0 +1,99 @@
+"""
+Test the Salesforce telemetry registry: metrics recorded from logged API
+calls, batched background log writes and the reports built from snapshots.
+"""
+import json
+
+import pytest
+
+from services.salesforce_files.salesforce_monitoring import SalesforceMonitoring
+from services.salesforce_files.salesforce_telemetry import (
+    SalesforceTelemetry,
+    format_prometheus,
+    format_report,
+    latency_quantile,
+    load_snapshots,
+    telemetry,
+)
+
+
+@pytest.fixture
+def registry():
+    # A long interval, so only explicit flushes write anything
+    return SalesforceTelemetry(flush_seconds=3600, flush_lines=10_000)
+
+
+def operation(snapshot, name, object_name):
+    return next(
+        op for op in snapshot["operations"]
+        if (op["operation"], op["object"]) == (name, object_name)
+    )
+
+
+def test_api_calls_are_counted_per_operation_and_object(registry, tmp_path):
+    log_dir = str(tmp_path)
+    registry.record_api_call(log_dir, "query", {"soql": "SELECT Id FROM Contact", "duration": 0.2, "records": 2000})
+    registry.record_api_call(log_dir, "query", {"soql": "select Id from Task", "duration": 3.0, "records": 10})
+    registry.record_api_call(log_dir, "bulk_create_job", {"job_id": "750A", "object": "Contact"})
+    registry.record_api_call(log_dir, "bulk_get_results", {"job_id": "750A", "data_size": 512})
+    registry.record_api_call(log_dir, "bulk_job_failed", {"job_id": "750B", "error": "INVALID_FIELD"})
+    with pytest.raises(ValueError):
+        with registry.timer("db_merge", "Contact") as measurement:
+            measurement.records = 5
+            raise ValueError("conflict")
+
+    snapshot = registry.snapshot()
+
+    contact_query = operation(snapshot, "query", "Contact")
+    assert (contact_query["calls"], contact_query["records"]) == (1, 2000)
+    assert latency_quantile(contact_query["buckets"], 0.5) == 0.25
+    assert operation(snapshot, "query", "Task")["seconds"] == 3.0
+    # The job's object is remembered from the call that created it
+    assert operation(snapshot, "bulk_get_results", "Contact")["bytes"] == 512
+    assert operation(snapshot, "bulk_job_failed", None)["errors"] == 1
+    merge = operation(snapshot, "db_merge", "Contact")
+    assert (merge["errors"], merge["records"], merge["timed"]) == (1, 5, 1)
+
+
+def test_log_lines_are_written_in_batches(registry, tmp_path):
+    log_dir = str(tmp_path)
+    for page in range(3):
+        registry.record_api_call(log_dir, "query_more", {"page": page, "duration": 0.1})
+    assert not list(tmp_path.glob("salesforce_api_*.log"))
+
+    registry.flush()
+
+    [log_file] = tmp_path.glob("salesforce_api_*.log")
+    entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert [entry["details"]["page"] for entry in entries] == [0, 1, 2]
+    assert {entry["operation"] for entry in entries} == {"query_more"}
+    [snapshot] = load_snapshots(log_dir)
+    assert operation(snapshot, "query_more", None)["calls"] == 3
+
+
+def test_reports(registry, tmp_path):
+    registry.record_api_call(str(tmp_path), "query", {"soql": "SELECT Id FROM Contact", "duration": 2.0, "records": 4000})
+    registry.set_api_limits({"DailyApiRequests": {"Max": 100_000, "Remaining": 25_000}, "Other": 1})
+    snapshot = registry.snapshot()
+
+    report = format_report(snapshot)
+    assert "query" in report and "2,000" in report  # rows/s
+    assert "DailyApiRequests" in report and "25%" in report
+
+    exposition = format_prometheus([snapshot])
+    assert 'salesforce_records_total{pid="%d",operation="query",object="Contact"} 4000' % snapshot["pid"] in exposition
+    assert 'le="+Inf"} 1' in exposition
+    assert 'salesforce_api_limit_remaining{pid="%d",limit="DailyApiRequests"} 25000' % snapshot["pid"] in exposition
+
+
+def test_monitoring_tracks_failed_calls(tmp_path):
+    monitoring = SalesforceMonitoring(str(tmp_path))
+    telemetry.reset()
+
+    with pytest.raises(RuntimeError):
+        with monitoring.track_api_call("describe_object", {"object": "Account"}):
+            raise RuntimeError("INVALID_SESSION_ID")
+
+    described = operation(telemetry.snapshot(), "describe_object", "Account")
+    assert (described["calls"], described["errors"], described["timed"]) == (1, 1, 1)
+    assert monitoring.get_usage_report()["operations"] == {"describe_object": 1}
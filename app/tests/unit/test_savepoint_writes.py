@@ -0,0 +1,60 @@
+"""
+Test savepoint writes: a failing batch is bisected so only the bad records
+are lost, and each is reported with the database's own message.
+"""
+import contextlib
+
+from sqlalchemy.exc import IntegrityError
+
+from services.salesforce_files.savepoint_writes import error_message, write_bisecting
+
+
+class FakeSession:
+    def __init__(self):
+        self.savepoints = 0
+
+    @contextlib.contextmanager
+    def begin_nested(self):
+        self.savepoints += 1
+        yield
+
+
+def write_rejecting(bad):
+    def write(rows):
+        rejected = bad & set(rows)
+        if rejected:
+            raise IntegrityError("INSERT ...", {}, Exception(f"violates foreign key ({min(rejected)})"))
+        return list(rows)
+
+    return write
+
+
+def test_only_the_bad_rows_are_lost():
+    session = FakeSession()
+    errors = []
+
+    results = write_bisecting(
+        session, list(range(16)), write_rejecting({5}), lambda row, error: errors.append((row, error))
+    )
+
+    assert sorted(row for result in results for row in result) == [i for i in range(16) if i != 5]
+    assert errors == [(5, "violates foreign key (5)")]
+    # One statement for the batch and two per level of the bisection
+    assert session.savepoints == 1 + 2 * 4
+
+
+def test_ranges_are_bisected_as_ranges():
+    errors = []
+    results = write_bisecting(
+        FakeSession(), range(1, 9), write_rejecting({3, 8}), lambda seq, error: errors.append(seq)
+    )
+
+    assert all(isinstance(result, list) for result in results)
+    assert sorted(seq for result in results for seq in result) == [1, 2, 4, 5, 6, 7]
+    assert errors == [3, 8]
+
+
+def test_error_message_leaves_out_the_statement():
+    error = IntegrityError("INSERT INTO sf_activities ...", {"id": 1}, Exception("duplicate key "))
+
+    assert error_message(error) == "duplicate key"
@@ -0,0 +1,53 @@
+"""
+Test the search term handling in the search service.
+"""
+from sqlalchemy.dialects import postgresql
+
+from services.search_service import (
+    CONTACT_LIST_SEARCH_COLUMNS,
+    CONTACT_MAP_SEARCH_COLUMNS,
+    CONTACT_SEARCH_COLUMNS,
+    prefix_tsquery,
+    search_condition,
+)
+
+
+class TestPrefixTsquery:
+    """Test turning user input into prefix tsqueries."""
+
+    def test_words_become_prefix_terms(self):
+        assert prefix_tsquery("John Sm") == "john:* & sm:*"
+
+    def test_operators_are_dropped(self):
+        assert prefix_tsquery("o'neil & (smith | !x)") == "o:* & neil:* & smith:* & x:*"
+
+    def test_no_words(self):
+        assert prefix_tsquery("  @@ ") is None
+        assert prefix_tsquery(None) is None
+
+
+class TestSearchCondition:
+    """Test the SQL produced for search filters."""
+
+    def test_uses_full_text_match(self):
+        sql = str(search_condition(CONTACT_SEARCH_COLUMNS, "smi").compile(dialect=postgresql.dialect()))
+        assert "@@ to_tsquery('simple'::regconfig" in sql
+        assert "ILIKE" not in sql
+
+    def test_falls_back_to_ilike_without_words(self):
+        sql = str(search_condition(CONTACT_SEARCH_COLUMNS, "@@").compile(dialect=postgresql.dialect()))
+        assert "ILIKE" in sql
+
+    def test_column_subsets_are_narrowed_by_the_indexed_document(self):
+        sql = str(search_condition(
+            CONTACT_MAP_SEARCH_COLUMNS, "smi", CONTACT_SEARCH_COLUMNS
+        ).compile(dialect=postgresql.dialect()))
+        assert sql.count("@@ to_tsquery") == 2
+        assert "sf_contacts.email" in sql  # the indexed document
+
+    def test_ilike_fallback_searches_only_the_subset(self):
+        sql = str(search_condition(
+            CONTACT_LIST_SEARCH_COLUMNS, "@@", CONTACT_SEARCH_COLUMNS
+        ).compile(dialect=postgresql.dialect()))
+        assert "sf_contacts.npi ILIKE" in sql
+        assert "specialty" not in sql
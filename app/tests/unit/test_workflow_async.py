@@ -0,0 +1,137 @@
+"""
+Test running workflows natively on asyncio: Workflow.arun awaiting async
+nodes, the thread shim for synchronous nodes and the sync shim of AgentNode.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+
+from core.event_loop import run_coroutine
+from core.llm_clients import get_model
+from core.nodes.agent import AgentConfig, AgentNode, ModelProvider
+from core.nodes.base import Node
+from core.schema import NodeConfig, WorkflowSchema
+from core.task import TaskContext
+from core.workflow import Workflow
+
+LLM_SECONDS = 0.2
+
+
+async def slow_model(messages, info):
+    await asyncio.sleep(LLM_SECONDS)
+    return ModelResponse(parts=[TextPart(f"answer to {messages[-1].parts[-1].content}")])
+
+
+class QuestionEvent(BaseModel):
+    question: str
+
+
+class AnswerNode(AgentNode):
+    def __init__(self):
+        super().__init__()
+        self.agent = Agent(FunctionModel(slow_model), output_type=str)
+
+    def get_agent_config(self) -> AgentConfig:
+        return AgentConfig(
+            system_prompt="Answer the question.",
+            output_type=str,
+            deps_type=None,
+            model_provider=ModelProvider.OPENAI,
+            model_name="gpt-4.1",
+        )
+
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
+        result = await self.agent.run(user_prompt=task_context.event.question)
+        task_context.update_node(node_name=self.node_name, result=result.output)
+        return task_context
+
+
+class ShoutNode(Node):
+    def process(self, task_context: TaskContext) -> TaskContext:
+        answer = next(iter(task_context.nodes.values()))["result"]
+        task_context.update_node(
+            node_name=self.node_name, result=answer.upper(), thread=threading.get_ident()
+        )
+        return task_context
+
+
+class AnswerWorkflow(Workflow):
+    workflow_schema = WorkflowSchema(
+        event_schema=QuestionEvent,
+        start=AnswerNode,
+        nodes=[
+            NodeConfig(node=AnswerNode, connections=[ShoutNode]),
+            NodeConfig(node=ShoutNode),
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def openai_key(monkeypatch):
+    # The configured provider is built (but never called) by AgentNode.__init__
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+
+def test_arun_drives_concurrent_workflows_on_one_loop():
+    workflow = AnswerWorkflow()
+
+    async def run_all():
+        return await asyncio.gather(
+            *(workflow.arun({"question": f"q{i}"}) for i in range(20))
+        )
+
+    started = time.perf_counter()
+    results = run_coroutine(run_all())
+    elapsed = time.perf_counter() - started
+
+    assert [r.nodes["ShoutNode"]["result"] for r in results] == [
+        f"ANSWER TO Q{i}" for i in range(20)
+    ]
+    assert "nodes" not in results[0].metadata
+    # 20 runs of a 0.2s model call overlap instead of taking 4s
+    assert elapsed < 10 * LLM_SECONDS
+
+
+def test_sync_nodes_run_off_the_event_loop():
+    async def run_all():
+        return threading.get_ident(), await asyncio.gather(
+            *(AnswerWorkflow().arun({"question": "q"}) for _ in range(5))
+        )
+
+    loop_thread, results = run_coroutine(run_all())
+
+    assert {r.nodes["ShoutNode"]["result"] for r in results} == {"ANSWER TO Q"}
+    assert loop_thread not in {r.nodes["ShoutNode"]["thread"] for r in results}
+
+
+def test_run_uses_the_sync_shim_of_async_nodes():
+    result = AnswerWorkflow().run({"question": "q"})
+
+    assert result.nodes["AnswerNode"]["result"] == "answer to q"
+    assert result.nodes["ShoutNode"]["result"] == "ANSWER TO Q"
+
+
+def test_run_coroutine_refuses_to_block_the_loop_thread():
+    async def nested():
+        return run_coroutine(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        run_coroutine(nested())
+
+
+def test_nodes_and_models_are_shared_across_runs():
+    workflow = AnswerWorkflow()
+    first = [workflow.run({"question": "q"}) for _ in range(3)]
+    second = AnswerWorkflow().run({"question": "q2"})
+
+    assert AnswerNode.get_instance() is AnswerNode.get_instance()
+    assert get_model(ModelProvider.OPENAI, "gpt-4.1") is get_model(ModelProvider.OPENAI, "gpt-4.1")
+    # Run state stays in each run's TaskContext, not on the shared nodes
+    assert [r.nodes["ShoutNode"]["result"] for r in first] == ["ANSWER TO Q"] * 3
+    assert list(second.nodes) == ["AnswerNode", "ShoutNode"]
@@ -0,0 +1,111 @@
+"""
+Test compiling workflow schemas: the graph is validated once per class and
+stays linear for generated workflows with many nodes.
+"""
+import pytest
+from pydantic import BaseModel
+
+from core.nodes.base import Node
+from core.nodes.router import BaseRouter, RouterNode
+from core.schema import NodeConfig, WorkflowSchema
+from core.task import TaskContext
+from core.workflow import Workflow
+
+
+class CountEvent(BaseModel):
+    count: int = 0
+
+
+def count_step(self, task_context: TaskContext) -> TaskContext:
+    task_context.event.count += 1
+    return task_context
+
+
+def chain_schema(size: int) -> WorkflowSchema:
+    steps = [type(f"Step{i}", (Node,), {"process": count_step}) for i in range(size)]
+    return WorkflowSchema(
+        event_schema=CountEvent,
+        start=steps[0],
+        nodes=[
+            NodeConfig(node=step, connections=steps[i + 1 : i + 2])
+            for i, step in enumerate(steps)
+        ],
+    )
+
+
+def test_generated_workflows_compile_once_and_run_every_node():
+    # Longer than the recursion limit of a recursive depth-first search
+    workflow_class = type("LongWorkflow", (Workflow,), {"workflow_schema": chain_schema(1500)})
+
+    first, second = workflow_class(), workflow_class()
+
+    assert first.graph is second.graph
+    assert second.run({}).event.count == 1500
+
+
+def test_replacing_the_schema_recompiles():
+    class ShortWorkflow(Workflow):
+        workflow_schema = chain_schema(2)
+
+    graph = ShortWorkflow().graph
+    ShortWorkflow.workflow_schema = chain_schema(3)
+
+    assert ShortWorkflow().graph is not graph
+    assert ShortWorkflow().run({}).event.count == 3
+
+
+class Small(Node):
+    def process(self, task_context: TaskContext) -> TaskContext:
+        task_context.update_node(node_name=self.node_name, size="small")
+        return task_context
+
+
+class Large(Node):
+    def process(self, task_context: TaskContext) -> TaskContext:
+        task_context.update_node(node_name=self.node_name, size="large")
+        return task_context
+
+
+class IsLarge(RouterNode):
+    def determine_next_node(self, task_context: TaskContext):
+        return Large.get_instance() if task_context.event.count > 10 else None
+
+
+class SizeRouter(BaseRouter):
+    def __init__(self):
+        self.routes = [IsLarge()]
+        self.fallback = Small.get_instance()
+
+
+class SizeWorkflow(Workflow):
+    workflow_schema = WorkflowSchema(
+        event_schema=CountEvent,
+        start=SizeRouter,
+        nodes=[NodeConfig(node=SizeRouter, connections=[Small, Large], is_router=True)],
+    )
+
+
+def test_routers_choose_the_next_node():
+    workflow = SizeWorkflow()
+
+    assert list(workflow.run({"count": 50}).nodes) == ["SizeRouter", "Large"]
+    assert list(workflow.run({"count": 5}).nodes) == ["SizeRouter", "Small"]
+
+
+@pytest.mark.parametrize(
+    "nodes, message",
+    [
+        (
+            [NodeConfig(node=Small, connections=[Large]), NodeConfig(node=Large, connections=[Small])],
+            "cycle",
+        ),
+        ([NodeConfig(node=Small), NodeConfig(node=Large)], "unreachable"),
+        ([NodeConfig(node=Small, connections=[Large, SizeRouter])], "not marked as a router"),
+    ],
+)
+def test_invalid_schemas_are_rejected(nodes, message):
+    class InvalidWorkflow(Workflow):
+        workflow_schema = WorkflowSchema(event_schema=CountEvent, start=Small, nodes=nodes)
+
+    with pytest.raises(ValueError, match=message):
+        InvalidWorkflow()
@@ -0,0 +1,57 @@
+"""
+Test workflow tracing: one tracer per process and span attributes that are
+serialized only as far as their byte cap.
+"""
+import json
+from datetime import date
+from typing import List
+
+from opentelemetry.trace import NonRecordingSpan, INVALID_SPAN_CONTEXT
+from pydantic import BaseModel
+
+from core.langfuse_config import LangfuseConfig, serialize_attribute, truncate_attribute
+from core.task import TaskContext
+from core.workflow import Workflow
+
+
+class Activity(BaseModel):
+    subject: str
+    activity_date: date
+
+
+class ActivitiesEvent(BaseModel):
+    activities: List[Activity]
+
+
+def test_large_values_are_cut_short_as_valid_json():
+    event = ActivitiesEvent(
+        activities=[Activity(subject=f"Call {i}", activity_date=date(2025, 1, 1)) for i in range(10_000)]
+    )
+
+    attribute = serialize_attribute({"event": event, "note": "x" * 10_000}, max_bytes=1000)
+
+    assert len(attribute.encode()) < 1200
+    parsed = json.loads(attribute)
+    activities = parsed["event"]["activities"]
+    assert activities[0] == {"subject": "Call 0", "activity_date": "2025-01-01"}
+    assert activities[-1].startswith("... [") and activities[-1].endswith(" more]")
+
+
+def test_small_values_match_pydantic():
+    task_context = TaskContext(event=ActivitiesEvent(activities=[]), nodes={"Node": {"ok": True}})
+
+    assert serialize_attribute(task_context) == task_context.model_dump_json()
+    assert truncate_attribute("é" * 10, max_bytes=5) == "éé... [truncated 15 bytes]"
+
+
+def test_workflows_share_one_tracer_and_skip_unsampled_spans(monkeypatch):
+    assert LangfuseConfig.get_tracer() is LangfuseConfig.get_tracer()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("serialized for a span that does not record")
+
+    monkeypatch.setattr("core.workflow.serialize_attribute", fail)
+    span = NonRecordingSpan(INVALID_SPAN_CONTEXT)
+    task_context = TaskContext(event=ActivitiesEvent(activities=[]))
+    Workflow._set_span_input(None, span, task_context)
+    Workflow._set_span_output(None, span, task_context)
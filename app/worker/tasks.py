@@ -1,5 +1,6 @@
 from contextlib import contextmanager
 
+from core.event_loop import run_coroutine
 from worker.config import celery_app
 from database.event import Event
 from database.repository import GenericRepository
@@ -12,6 +13,10 @@ Workflow Task Processing Module
 This module handles asynchronous processing of workflow events using Celery.
 It manages the lifecycle of event processing from database retrieval through
 workflow execution and result storage.
+
+Workflows run on one shared event loop per worker process (see
+core.event_loop), so with the threads pool each Celery thread only waits on
+its workflow while the loop interleaves the LLM calls of all of them.
 """
 
 
@@ -37,11 +42,16 @@ def process_incoming_event(event_id: str):
         db_event = repository.get(id=event_id)
         if db_event is None:
             raise ValueError(f"Event with id {event_id} not found")
+        workflow_type, event_data = db_event.workflow_type, db_event.data
 
-        # Execute workflow and store results
-        workflow = WorkflowRegistry[db_event.workflow_type].value()
-        task_context = workflow.run(db_event.data).model_dump(mode="json")
+    # Execute workflow on the process-wide event loop, without holding a
+    # database connection while it waits on LLM calls
+    workflow = WorkflowRegistry[workflow_type].value()
+    task_context = run_coroutine(workflow.arun(event_data)).model_dump(mode="json")
 
+    with contextmanager(db_session)() as session:
+        repository = GenericRepository(session=session, model=Event)
+        db_event = repository.get(id=event_id)
         db_event.task_context = task_context
 
         # Update event with processing results
@@ -6,6 +6,17 @@ from schemas.langfuse_tracing_schema import LangfuseTracingEventSchema
 
 
 class ContextSummaryResult(AgentNode):
+    def __init__(self):
+        super().__init__()
+
+        # Registered once: the agent is shared by every run, which passes
+        # its event as deps
+        @self.agent.instructions
+        async def add_context(
+            ctx: RunContext[LangfuseTracingEventSchema],
+        ) -> str:
+            return ctx.deps.model_dump_json()
+
     def get_agent_config(self) -> AgentConfig:
         return AgentConfig(
             system_prompt="Summarize the comment in a concise and concise way.",
@@ -20,16 +31,10 @@ class ContextSummaryResult(AgentNode):
         comment_id: str
         summary: str
 
-    def process(self, task_context: TaskContext) -> TaskContext:
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
         event: LangfuseTracingEventSchema = task_context.event
 
-        @self.agent.instructions
-        async def add_context(
-            ctx: RunContext[LangfuseTracingEventSchema],
-        ) -> str:
-            return event.model_dump_json()
-
-        result = self.agent.run_sync(user_prompt=event.model_dump_json())
+        result = await self.agent.run(user_prompt=event.model_dump_json(), deps=event)
 
         task_context.update_node(node_name=self.node_name, results=result.output)
         return task_context
@@ -8,6 +8,17 @@ from schemas.langfuse_tracing_schema import LangfuseTracingEventSchema
 
 
 class ViolationDetectionNode(AgentNode):
+    def __init__(self):
+        super().__init__()
+
+        # Registered once: the agent is shared by every run, which passes
+        # its event as deps
+        @self.agent.system_prompt
+        async def add_context(
+            ctx: RunContext[LangfuseTracingEventSchema],
+        ) -> str:
+            return ctx.deps.model_dump_json()
+
     def get_agent_config(self) -> AgentConfig:
         return AgentConfig(
             system_prompt="Determine whether the comment is a violation or not. If it is a violation, provide a reason for violation. If it is not a violation, provide a reason for non-violation.",
@@ -23,16 +34,10 @@ class ViolationDetectionNode(AgentNode):
         violation: bool
         reason: Optional[str] = None
 
-    def process(self, task_context: TaskContext) -> TaskContext:
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
         event: LangfuseTracingEventSchema = task_context.event
 
-        @self.agent.system_prompt
-        async def add_context(
-            ctx: RunContext[LangfuseTracingEventSchema],
-        ) -> str:
-            return event.model_dump_json()
-
-        result = self.agent.run_sync(user_prompt=event.model_dump_json())
+        result = await self.agent.run(user_prompt=event.model_dump_json(), deps=event)
 
         task_context.update_node(node_name=self.node_name, results=result.output)
         return task_context
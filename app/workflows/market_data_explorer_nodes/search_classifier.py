@@ -50,14 +50,14 @@ class SearchClassifierNode(AgentNode):
             instrument=True,
         )
 
-    def process(self, task_context: TaskContext) -> TaskContext:
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
         """Process the user query and determine if search is needed."""
         user_query = task_context.event.query
 
         # Capture prompts for tracing
         self._capture_prompts(task_context, user_query)
 
-        result = self.agent.run_sync(user_prompt=user_query)
+        result = await self.agent.run(user_prompt=user_query)
 
         # Store the classification result
         task_context.update_node(node_name=self.node_name, result=result.data)
@@ -80,14 +80,14 @@ class TargetIdentifyNode(AgentNode):
             instrument=True,
         )
 
-    def process(self, task_context: TaskContext) -> TaskContext:
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
         """Process the market data and identify referral targets."""
         market_data = task_context.event.market_data
 
         # Capture prompts for tracing
         self._capture_prompts(task_context, market_data)
 
-        result = self.agent.run_sync(user_prompt=market_data)
+        result = await self.agent.run(user_prompt=market_data)
 
         # Store the identification result
         task_context.update_node(node_name=self.node_name, result=result.data)
@@ -96,7 +96,7 @@ class LLMSummaryNode(AgentNode):
             instrument=True,
         )
 
-    def process(self, task_context: TaskContext) -> TaskContext:
+    async def aprocess(self, task_context: TaskContext) -> TaskContext:
         """
         Generate comprehensive activity summary using OpenAI.
 
@@ -130,7 +130,7 @@ class LLMSummaryNode(AgentNode):
             self._capture_prompts(task_context, user_prompt)
 
             # Generate summary using the agent
-            result = self.agent.run_sync(user_prompt=user_prompt)
+            result = await self.agent.run(user_prompt=user_prompt)
 
             # Store the summary result
             task_context.update_node(node_name=self.node_name, result=result.data)
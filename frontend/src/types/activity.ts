@@ -26,6 +26,8 @@ export interface ActivityListResponse {
   page: number;
   page_size: number;
   total_pages: number;
+  total_is_estimate?: boolean;
+  next_cursor?: string | null;
 }
 
 export interface ActivityFilters {
@@ -111,10 +111,21 @@ export interface MapBounds {
   west: number;
 }
 
+export interface MapCluster {
+  latitude: number;
+  longitude: number;
+  site_count: number;
+  total_visits: number;
+  provider_count: number;
+  bounds: MapBounds;
+}
+
 export interface MapMarkersResponse {
   markers: MapMarker[];
+  clusters?: MapCluster[];
   total_count: number;
   bounds?: MapBounds;
+  zoom?: number;
 }
 
 // Filter types
@@ -176,6 +187,8 @@ export interface PaginationMeta {
   total_pages: number;
   has_next: boolean;
   has_prev: boolean;
+  total_is_estimate?: boolean;
+  next_cursor?: string | null;  // pass back as ?cursor= for keyset paging
 }
 
 export interface ClaimsProvidersResponse {
@@ -73,6 +73,8 @@ export interface RelationshipListResponse {
   page: number;
   page_size: number;
   total_pages: number;
+  total_is_estimate?: boolean;
+  next_cursor?: string | null;
 }
 
 // Detail types